@@ -0,0 +1,90 @@
+"""
+Cold-start import budget.
+
+Imports each module in a fresh interpreter under `python -X importtime` and reports the median
+cumulative time, the time spent in our own modules, and whether heavy dependencies were pulled in.
+Exits non-zero when a module goes over its budget.
+
+    PYTHONPATH=src python benchmarks/bench_import.py [--runs N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import TypedDict
+
+OWN_PACKAGES = ("proschedio", "vultr")
+
+class Budget(TypedDict):
+    own_us: int
+    # Modules that must not be imported as a side effect of importing the target.
+    forbidden: list[str]
+
+BUDGETS: dict[str, Budget] = {
+    "proschedio.const": {"own_us": 25_000, "forbidden": ["aiohttp", "proschedio.route_docs"]},
+    "proschedio.request": {"own_us": 20_000, "forbidden": ["aiohttp", "orjson", "msgspec", "sqlite3"]},
+    "vultr.apis": {"own_us": 5_000, "forbidden": ["aiohttp", "vultr.apis.dns"]},
+}
+
+class Sample(TypedDict):
+    total_us: int
+    own_us: int
+    modules: set[str]
+
+def measure(module: str) -> Sample:
+    """
+    Import `module` in a fresh interpreter and parse its `-X importtime` report.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        check=True,
+    )
+
+    total_us = 0
+    own_us = 0
+    modules: set[str] = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line.removeprefix("import time:").split("|"))
+        modules.add(name)
+        if name.split(".")[0] in OWN_PACKAGES:
+            own_us += int(self_us)
+        if name == module:
+            total_us = int(cumulative_us)
+
+    return Sample(total_us=total_us, own_us=own_us, modules=modules)
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=7, help="Fresh interpreters per module (default: 7).")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'module':<22} {'total ms':>9} {'own ms':>7} {'budget ms':>10}  status")
+    for module, budget in BUDGETS.items():
+        # Warm the bytecode cache so the measurement reflects a normal run, not a first install.
+        subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
+        samples = [measure(module) for _ in range(args.runs)]
+
+        total_ms = statistics.median(sample["total_us"] for sample in samples) / 1000
+        own_ms = statistics.median(sample["own_us"] for sample in samples) / 1000
+        leaked = sorted(name for name in budget["forbidden"] if any(name in sample["modules"] for sample in samples))
+
+        problems: list[str] = []
+        if own_ms * 1000 > budget["own_us"]:
+            problems.append("over budget")
+        if leaked:
+            problems.append(f"imported {', '.join(leaked)}")
+        failed = failed or bool(problems)
+
+        print(f"{module:<22} {total_ms:>9.1f} {own_ms:>7.1f} {budget['own_us'] / 1000:>10.1f}  {'; '.join(problems) or 'ok'}")
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
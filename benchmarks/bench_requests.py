@@ -0,0 +1,263 @@
+"""
+Client overhead benchmarks against the in-process fake Vultr API.
+
+Each scenario drives `proschedio.request.Request` against `proschedio.testing.FakeVultrServer` and
+reports throughput, latency percentiles, peak RSS and per-request allocations. The server runs in
+the same process, so memory and allocation figures include its share; compare runs with each other
+rather than reading them as absolute client costs. Results are appended to a JSON-lines history
+file and compared with the previous run of the same scenario.
+
+    PYTHONPATH=src python benchmarks/bench_requests.py [--requests N] [--scenario NAME ...]
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Iterator
+from http import HTTPMethod
+from typing import TypedDict
+
+from proschedio.codec import JsonCodec
+from proschedio.const import ProviderUrl
+from proschedio.executor import RequestExecutor
+from proschedio.ratelimit import RateLimiter
+from proschedio.request import Request, SessionPool, SingleFlight
+from proschedio.testing import FakeVultrServer
+
+DEFAULT_HISTORY = os.path.join(os.path.dirname(__file__), "history.jsonl")
+
+class Report(TypedDict):
+    scenario: str
+    requests: int
+    requests_per_sec: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    peak_rss_mib: float
+    alloc_kib_per_request: float
+    blocks_per_request: float
+
+class Scenario:
+    """
+    A named benchmark: `setup` prepares the fake server, `make` builds the `Request` for one call,
+    and `concurrency` is how many run at once through `RequestExecutor`.
+    """
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        make: Callable[[], Request],
+        setup: Callable[[FakeVultrServer], None] = lambda server: None,
+        concurrency: int = 1,
+        cold_session: bool = False,
+        single_flight: bool = False,
+    ):
+        self.name = name
+        self.description = description
+        self.make = make
+        self.setup = setup
+        self.concurrency = concurrency
+        self.cold_session = cold_session
+        self.single_flight = single_flight
+
+def _get(route: str) -> Callable[[], Request]:
+    def make() -> Request:
+        return Request(ProviderUrl("vultr").route(route)) \
+            .set_method(HTTPMethod.GET) \
+            .add_header("Authorization", "Bearer benchmark")
+    return make
+
+def _list_page(per_page: int) -> Callable[[], Request]:
+    def make() -> Request:
+        return _get("instances")().add_param("per_page", per_page)
+    return make
+
+def _seed_instances(server: FakeVultrServer) -> None:
+    if not server.items("instances"):
+        server.seed("instances", 500)
+
+SCENARIOS: list[Scenario] = [
+    Scenario("get_small", "Sequential GET of a small object (per-call overhead).", _get("account")),
+    Scenario(
+        "get_small_cold_session",
+        "Sequential GET with a new session per call (the pre-pooling behaviour).",
+        _get("account"),
+        cold_session=True,
+    ),
+    Scenario(
+        "list_page_500",
+        "Sequential GET of a 500-item instance page (JSON decode and payload splitting).",
+        _list_page(500),
+        setup=_seed_instances,
+    ),
+    Scenario(
+        "get_small_concurrent",
+        "GET of a small object, 32 in flight through RequestExecutor.",
+        _get("account"),
+        concurrency=32,
+    ),
+    Scenario(
+        "get_small_concurrent_coalesced",
+        "Identical GETs, 32 in flight, with single-flight coalescing enabled.",
+        _get("account"),
+        concurrency=32,
+        single_flight=True,
+    ),
+]
+
+def _percentile(samples: list[float], percent: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+async def _timed(make: Callable[[], Awaitable[object]], latencies: list[float]) -> None:
+    start = time.perf_counter()
+    await make()
+    latencies.append(time.perf_counter() - start)
+
+async def run_scenario(scenario: Scenario, server: FakeVultrServer, count: int) -> Report:
+    scenario.setup(server)
+    SingleFlight.configure(enabled=scenario.single_flight)
+
+    async def one() -> object:
+        if scenario.cold_session:
+            await SessionPool.close()
+        result = await scenario.make().request()
+        if result.is_err():
+            raise RuntimeError(f"{scenario.name}: {result.unwrap_err()}")
+        return result
+
+    # Warm up connections, caches and lazy imports.
+    for _ in range(min(20, count)):
+        await one()
+
+    latencies: list[float] = []
+    start = time.perf_counter()
+    if scenario.concurrency == 1:
+        for _ in range(count):
+            await _timed(one, latencies)
+    else:
+        executor = RequestExecutor(max_in_flight=scenario.concurrency, max_per_provider=scenario.concurrency)
+        pending: dict[int, float] = {}
+
+        def requests() -> Iterator[Request]:
+            for _ in range(count):
+                request = scenario.make()
+                pending[id(request)] = time.perf_counter()
+                yield request
+
+        async for request, result in executor.as_completed(requests()):
+            if result.is_err():
+                raise RuntimeError(f"{scenario.name}: {result.unwrap_err()}")
+            latencies.append(time.perf_counter() - pending.pop(id(request)))
+    elapsed = time.perf_counter() - start
+
+    # Allocation pass: tracemalloc slows everything down, so it runs separately from the timing pass.
+    samples = min(200, count)
+    tracemalloc.start()
+    peaks: list[int] = []
+    blocks_before = sys.getallocatedblocks()
+    for _ in range(samples):
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        await one()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - baseline)
+    blocks_after = sys.getallocatedblocks()
+    tracemalloc.stop()
+
+    return Report(
+        scenario=scenario.name,
+        requests=count,
+        requests_per_sec=round(count / elapsed, 1),
+        p50_ms=round(_percentile(latencies, 50) * 1000, 3),
+        p95_ms=round(_percentile(latencies, 95) * 1000, 3),
+        p99_ms=round(_percentile(latencies, 99) * 1000, 3),
+        peak_rss_mib=round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        alloc_kib_per_request=round(statistics.mean(peaks) / 1024, 2),
+        blocks_per_request=round((blocks_after - blocks_before) / samples, 2),
+    )
+
+def _git_revision() -> str | None:
+    try:
+        completed = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+def _previous(history_path: str) -> dict[str, Report]:
+    previous: dict[str, Report] = {}
+    if not os.path.exists(history_path):
+        return previous
+    with open(history_path) as history:
+        for line in history:
+            record = json.loads(line)
+            previous[record["scenario"]] = record
+    return previous
+
+def _delta(current: float, previous: float | None) -> str:
+    if not previous:
+        return ""
+    return f" ({(current - previous) / previous:+.0%})"
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per scenario (default: 2000).")
+    parser.add_argument("--scenario", action="append", choices=[scenario.name for scenario in SCENARIOS], help="Run only these scenarios.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of simulated server latency (default: 0).")
+    parser.add_argument("--codec", choices=JsonCodec.available(), help="JSON backend (default: fastest installed).")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON-lines file results are appended to.")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run.")
+    args = parser.parse_args()
+
+    # Measure the client, not the limiter's pacing.
+    RateLimiter.configure(enabled=False)
+    codec = JsonCodec.use(args.codec) if args.codec else JsonCodec.get()
+    previous = _previous(args.history)
+    context = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "latency_ms": args.latency * 1000,
+        "codec": codec.name,
+    }
+
+    reports: list[Report] = []
+    async with FakeVultrServer(latency=args.latency, seed=0) as server:
+        server.install()
+        for scenario in SCENARIOS:
+            if args.scenario and scenario.name not in args.scenario:
+                continue
+            report = await run_scenario(scenario, server, args.requests)
+            reports.append(report)
+
+            before = previous.get(scenario.name)
+            print(f"{scenario.name}: {scenario.description}")
+            print(
+                f"  {report['requests_per_sec']:>9.1f} req/s{_delta(report['requests_per_sec'], before and before['requests_per_sec'])}"
+                f"  p50 {report['p50_ms']:.3f} ms{_delta(report['p50_ms'], before and before['p50_ms'])}"
+                f"  p95 {report['p95_ms']:.3f} ms  p99 {report['p99_ms']:.3f} ms"
+            )
+            print(
+                f"  peak RSS {report['peak_rss_mib']:.1f} MiB"
+                f"  {report['alloc_kib_per_request']:.2f} KiB/request{_delta(report['alloc_kib_per_request'], before and before['alloc_kib_per_request'])}"
+                f"  {report['blocks_per_request']:+.2f} retained blocks/request"
+            )
+        await SessionPool.close()
+
+    if not args.no_history:
+        with open(args.history, "a") as history:
+            for report in reports:
+                history.write(json.dumps({**context, **report}) + "\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -1,15 +1,13 @@
 # src/proschedio/apiV2/actions/instance.py
 # Functions related to specific actions performed on Vultr instances.
 
-import json
 import logging
-import os
 from http import HTTPMethod
 from typing import Literal
 
 from rustipy.result import Result
 
-from ..const import ProviderRegistry, ProviderUrl
+from ..const import ProviderUrl
 from ..request import Request, SuccessResponse, ErrorResponse
 from ..dataclass import instance as instance_structs
 
@@ -29,13 +27,13 @@ class ActionInstance:
         Reinstall a Vultr Instance using an optional `hostname`. (Vultr specific)
         """
         request = (
-            Request(ProviderRegistry.get_url_instance_reinstall(self.provider_url).assign("instance-id", instance_id))
+            Request(ProviderUrl.get_url_instance_reinstall(self.provider_url).assign("instance-id", instance_id))
                 .set_method(HTTPMethod.POST)
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize(self.provider_url.provider)
                 .add_header("Content-Type", "application/json")
         )
         if hostname is not None:
-            request.set_body(json.dumps({"hostname": hostname}))
+            request.set_body({"hostname": hostname})
         
         return await request.request()
 
@@ -44,9 +42,9 @@ class ActionInstance:
         Get bandwidth information about a Vultr Instance. (Vultr specific)
         """
         request = (
-            Request(ProviderRegistry.get_url_instance_bandwidth(self.provider_url).assign("instance-id", instance_id)) \
+            Request(ProviderUrl.get_url_instance_bandwidth(self.provider_url).assign("instance-id", instance_id)) \
                 .set_method(HTTPMethod.GET) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize(self.provider_url.provider)
         )
 
         if date_range is not None:
@@ -59,9 +57,9 @@ class ActionInstance:
         Get a list of other instances in the same location as this Vultr Instance. (Vultr specific)
         """
         return (
-            await Request(ProviderRegistry.get_url_instance_neighbors(self.provider_url).assign("instance-id", instance_id)) \
+            await Request(ProviderUrl.get_url_instance_neighbors(self.provider_url).assign("instance-id", instance_id)) \
                 .set_method(HTTPMethod.GET) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+                .authorize(self.provider_url.provider) \
                 .request()
         )
 
@@ -70,9 +68,9 @@ class ActionInstance:
         list the VPCs for a Vultr Instance. (Vultr specific)
         """
         request = (
-            Request(ProviderRegistry.get_url_instance_vpcs(self.provider_url).assign("instance-id", instance_id)) \
+            Request(ProviderUrl.get_url_instance_vpcs(self.provider_url).assign("instance-id", instance_id)) \
                 .set_method(HTTPMethod.GET) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize(self.provider_url.provider)
         )
         if per_page is not None:
             request.add_param("per_page", per_page)
@@ -86,9 +84,9 @@ class ActionInstance:
         Get the ISO status for a Vultr Instance. (Vultr specific)
         """
         return (
-            await Request(ProviderRegistry.get_url_instance_iso(self.provider_url).assign("instance-id", instance_id)) \
+            await Request(ProviderUrl.get_url_instance_iso(self.provider_url).assign("instance-id", instance_id)) \
                 .set_method(HTTPMethod.GET) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+                .authorize(self.provider_url.provider) \
                 .request()
         )
 
@@ -97,11 +95,11 @@ class ActionInstance:
         Attach an ISO to a Vultr Instance. (Vultr specific)
         """
         return (
-            await Request(ProviderRegistry.get_url_instance_iso_attach(self.provider_url).assign("instance-id", instance_id)) \
+            await Request(ProviderUrl.get_url_instance_iso_attach(self.provider_url).assign("instance-id", instance_id)) \
                 .set_method(HTTPMethod.POST) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+                .authorize(self.provider_url.provider) \
                 .add_header("Content-Type", "application/json") \
-                .set_body(json.dumps({"iso_id": iso_id})) \
+                .set_body({"iso_id": iso_id}) \
                 .request()
         )
 
@@ -110,10 +108,10 @@ class ActionInstance:
         Detach the ISO from a Vultr Instance. (Vultr specific)
         """
         return (
-            await Request(ProviderRegistry.get_url_instance_iso_detach(self.provider_url).assign("instance-id", instance_id)) \
+            await Request(ProviderUrl.get_url_instance_iso_detach(self.provider_url).assign("instance-id", instance_id)) \
                 .set_method(HTTPMethod.POST) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
-                .set_body(json.dumps({})) \
+                .authorize(self.provider_url.provider) \
+                .set_body({}) \
                 .request()
         )
     async def attach_instance_vpc(self, instance_id: str, vpc_id: str) -> Result[SuccessResponse, ErrorResponse]:
@@ -121,11 +119,11 @@ class ActionInstance:
         Attach a VPC to a Vultr Instance. (Vultr specific)
         """
         return (
-            await Request(ProviderRegistry.get_url_instance_vpcs_attach(self.provider_url).assign("instance-id", instance_id)) \
+            await Request(ProviderUrl.get_url_instance_vpcs_attach(self.provider_url).assign("instance-id", instance_id)) \
                 .set_method(HTTPMethod.POST) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+                .authorize(self.provider_url.provider) \
                 .add_header("Content-Type", "application/json") \
-                .set_body(json.dumps({"vpc_id": vpc_id})) \
+                .set_body({"vpc_id": vpc_id}) \
                 .request()
         )
 
@@ -134,11 +132,11 @@ class ActionInstance:
         Detach a VPC from a Vultr Instance. (Vultr specific)
         """
         return (
-            await Request(ProviderRegistry.get_url_instance_vpcs_detach(self.provider_url).assign("instance-id", instance_id)) \
+            await Request(ProviderUrl.get_url_instance_vpcs_detach(self.provider_url).assign("instance-id", instance_id)) \
                 .set_method(HTTPMethod.POST) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+                .authorize(self.provider_url.provider) \
                 .add_header("Content-Type", "application/json") \
-                .set_body(json.dumps({"vpc_id": vpc_id})) \
+                .set_body({"vpc_id": vpc_id}) \
                 .request()
         )
 
@@ -147,9 +145,9 @@ class ActionInstance:
         Get the backup schedule for a Vultr Instance. (Vultr specific)
         """
         return (
-            await Request(ProviderRegistry.get_url_instance_backup_schedule(self.provider_url).assign("instance-id", instance_id)) \
+            await Request(ProviderUrl.get_url_instance_backup_schedule(self.provider_url).assign("instance-id", instance_id)) \
                 .set_method(HTTPMethod.GET) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+                .authorize(self.provider_url.provider) \
                 .request()
         )
 
@@ -158,9 +156,9 @@ class ActionInstance:
         Set the backup schedule for a Vultr Instance. (Vultr specific)
         """
         return (
-            await Request(ProviderRegistry.get_url_instance_backup_schedule(self.provider_url).assign("instance-id", instance_id)) \
+            await Request(ProviderUrl.get_url_instance_backup_schedule(self.provider_url).assign("instance-id", instance_id)) \
                 .set_method(HTTPMethod.POST) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+                .authorize(self.provider_url.provider) \
                 .add_header("Content-Type", "application/json") \
                 .set_body(data.to_json()) \
                 .request()
@@ -171,15 +169,15 @@ class ActionInstance:
         Restore a Vultr Instance from a backup or snapshot. (Vultr specific)
         """
         request = (
-            Request(ProviderRegistry.get_url_instance_restore(self.provider_url).assign("instance-id", instance_id)) \
+            Request(ProviderUrl.get_url_instance_restore(self.provider_url).assign("instance-id", instance_id)) \
                 .set_method(HTTPMethod.POST) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+                .authorize(self.provider_url.provider) \
                 .add_header("Content-Type", "application/json")
         )
         if backup_id is not None:
-            request.set_body(json.dumps({"backup_id": backup_id}))
+            request.set_body({"backup_id": backup_id})
         elif snapshot_id is not None:
-            request.set_body(json.dumps({"snapshot_id": snapshot_id}))
+            request.set_body({"snapshot_id": snapshot_id})
         # else: # Consider raising an error if neither is provided
         #     raise ValueError("Either backup_id or snapshot_id must be provided for restore.")
 
@@ -190,9 +188,9 @@ class ActionInstance:
         list the IPv4 information for a Vultr Instance. (Vultr specific)
         """
         request = (
-            Request(ProviderRegistry.get_url_instance_ipv4(self.provider_url).assign("instance-id", instance_id)) \
+            Request(ProviderUrl.get_url_instance_ipv4(self.provider_url).assign("instance-id", instance_id)) \
                 .set_method(HTTPMethod.GET) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+                .authorize(self.provider_url.provider)
         )
 
         if public_network is not None:
@@ -209,14 +207,14 @@ class ActionInstance:
         Create an IPv4 address for a Vultr Instance. (Vultr specific)
         """
         request = (
-            Request(ProviderRegistry.get_url_instance_ipv4(self.provider_url).assign("instance-id", instance_id)) \
+            Request(ProviderUrl.get_url_instance_ipv4(self.provider_url).assign("instance-id", instance_id)) \
                 .set_method(HTTPMethod.POST) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+                .authorize(self.provider_url.provider) \
                 .add_header("Content-Type", "application/json")
         )
         
         if reboot is not None:
-            request.set_body(json.dumps({"reboot": reboot}))
+            request.set_body({"reboot": reboot})
 
         return await request.request()
 
@@ -225,9 +223,9 @@ class ActionInstance:
         Get the IPv6 information for a Vultr Instance. (Vultr specific)
         """
         return (
-            await Request(ProviderRegistry.get_url_instance_ipv6(self.provider_url).assign("instance-id", instance_id)) \
+            await Request(ProviderUrl.get_url_instance_ipv6(self.provider_url).assign("instance-id", instance_id)) \
                 .set_method(HTTPMethod.GET) \
-                .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+                .authorize(self.provider_url.provider) \
                 .request()
         )
 
@@ -235,78 +233,78 @@ class ActionInstance:
         """
         Create a reverse IPv4 entry for a Vultr Instance. (Vultr specific)
         """
-        return await Request(ProviderRegistry.get_url_instance_ipv4_reverse(self.provider_url).assign("instance-id", instance_id)) \
+        return await Request(ProviderUrl.get_url_instance_ipv4_reverse(self.provider_url).assign("instance-id", instance_id)) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize(self.provider_url.provider) \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"ip": ip, "reverse": reverse})) \
+            .set_body({"ip": ip, "reverse": reverse}) \
             .request()
 
     async def list_instance_reverse_ipv6(self, instance_id: str) -> Result[SuccessResponse, ErrorResponse]:
         """
         list the reverse IPv6 information for a Vultr Instance. (Vultr specific)
         """
-        return await Request(ProviderRegistry.get_url_instance_ipv6_reverse(self.provider_url).assign("instance-id", instance_id)) \
+        return await Request(ProviderUrl.get_url_instance_ipv6_reverse(self.provider_url).assign("instance-id", instance_id)) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize(self.provider_url.provider) \
             .request()
 
     async def create_instance_reverse_ipv6(self, instance_id: str, ip: str, reverse: str) -> Result[SuccessResponse, ErrorResponse]:
         """
         Create a reverse IPv6 entry for a Vultr Instance. (Vultr specific)
         """
-        return await Request(ProviderRegistry.get_url_instance_ipv6_reverse(self.provider_url).assign("instance-id", instance_id)) \
+        return await Request(ProviderUrl.get_url_instance_ipv6_reverse(self.provider_url).assign("instance-id", instance_id)) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize(self.provider_url.provider) \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"ip": ip, "reverse": reverse})) \
+            .set_body({"ip": ip, "reverse": reverse}) \
             .request()
 
     async def set_instance_reverse_ipv4(self, instance_id: str, ip: str) -> Result[SuccessResponse, ErrorResponse]:
         """
         Set a reverse DNS entry for an IPv4 address of a Vultr Instance. (Vultr specific)
         """
-        return await Request(ProviderRegistry.get_url_instance_ipv4_reverse_default(self.provider_url).assign("instance-id", instance_id)) \
+        return await Request(ProviderUrl.get_url_instance_ipv4_reverse_default(self.provider_url).assign("instance-id", instance_id)) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize(self.provider_url.provider) \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"ip": ip})) \
+            .set_body({"ip": ip}) \
             .request()
 
     async def delete_instance_reverse_ipv6(self, instance_id: str, ipv6: str) -> Result[SuccessResponse, ErrorResponse]:
         """
         Delete the reverse IPv6 for a Vultr Instance. (Vultr specific)
         """
-        return await Request(ProviderRegistry.get_url_instance_ipv6_reverse_by_ipv6(self.provider_url).assign("instance-id", instance_id).assign("ipv6", ipv6)) \
+        return await Request(ProviderUrl.get_url_instance_ipv6_reverse_by_ipv6(self.provider_url).assign("instance-id", instance_id).assign("ipv6", ipv6)) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize(self.provider_url.provider) \
             .request()
 
     async def halt_instance(self, instance_id: str) -> Result[SuccessResponse, ErrorResponse]:
         """
         Halt a Vultr Instance. (Vultr specific)
         """
-        return await Request(ProviderRegistry.get_url_instance_halt(self.provider_url).assign("instance-id", instance_id)) \
+        return await Request(ProviderUrl.get_url_instance_halt(self.provider_url).assign("instance-id", instance_id)) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize(self.provider_url.provider) \
             .request()
 
     async def get_instance_user_data(self, instance_id: str) -> Result[SuccessResponse, ErrorResponse]:
         """
         Get the user data for a Vultr Instance. (Vultr specific)
         """
-        return await Request(ProviderRegistry.get_url_instance_user_data(self.provider_url).assign("instance-id", instance_id)) \
+        return await Request(ProviderUrl.get_url_instance_user_data(self.provider_url).assign("instance-id", instance_id)) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize(self.provider_url.provider) \
             .request()
 
-    async def get_instance_upgrades(self, instance_id: str, type: Literal | None"all", "applications", "os", "plans"]]) -> Result[SuccessResponse, ErrorResponse]:
+    async def get_instance_upgrades(self, instance_id: str, type: Literal["all", "applications", "os", "plans"] | None = None) -> Result[SuccessResponse, ErrorResponse]:
         """
         Get available upgrades for a Vultr Instance. (Vultr specific)
         """
-        request = Request(ProviderRegistry.get_url_instance_upgrades(self.provider_url).assign("instance-id", instance_id)) \
+        request = Request(ProviderUrl.get_url_instance_upgrades(self.provider_url).assign("instance-id", instance_id)) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}")
+            .authorize(self.provider_url.provider)
 
         if type is not None:
             request.add_param("type", type)
@@ -317,22 +315,33 @@ class ActionInstance:
         """
         Reboot multiple Vultr Instances. (Vultr specific)
         """
-        return await Request(ProviderRegistry.get_url_instance_reboot()) \
+        return await Request(ProviderUrl.get_url_instances_reboot(self.provider_url)) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize(self.provider_url.provider) \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"instance_ids": instance_ids})) \
+            .set_body({"instance_ids": instance_ids}) \
+            .request()
+
+    async def halt_instances(self, instance_ids: list[str]) -> Result[SuccessResponse, ErrorResponse]:
+        """
+        Halt multiple Vultr Instances. (Vultr specific)
+        """
+        return await Request(ProviderUrl.get_url_instances_halt(self.provider_url)) \
+            .set_method(HTTPMethod.POST) \
+            .authorize(self.provider_url.provider) \
+            .add_header("Content-Type", "application/json") \
+            .set_body({"instance_ids": instance_ids}) \
             .request()
 
     async def start_instances(self, instance_ids: list[str]) -> Result[SuccessResponse, ErrorResponse]:
         """
         Start multiple Vultr Instances. (Vultr specific)
         """
-        return await Request(ProviderRegistry.get_url_instance_start()) \
+        return await Request(ProviderUrl.get_url_instances_start(self.provider_url)) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get('VULTR_API_KEY')}") \
+            .authorize(self.provider_url.provider) \
             .add_header("Content-Type", "application/json") \
-            .set_body(json.dumps({"instance_ids": instance_ids})) \
+            .set_body({"instance_ids": instance_ids}) \
             .request()
 
 # Note: Deprecated functions related to private networks and vpc2 are omitted.
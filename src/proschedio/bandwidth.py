@@ -0,0 +1,285 @@
+import asyncio
+import base64
+import calendar
+import heapq
+import logging
+import os
+from array import array
+from collections.abc import Iterable, Mapping
+from datetime import date, timedelta
+from http import HTTPMethod
+from typing import Any, Literal, TypedDict, cast
+
+from rustipy.result import Err, Ok, Result
+
+from .codec import JsonCodec
+from .const import ProviderUrl
+from .pagination import MAX_PER_PAGE, PaginationError, paginate, request_pages
+from .request import ErrorResponse, Request
+
+logger = logging.getLogger(__name__)
+
+Direction = Literal["incoming", "outgoing", "total"]
+
+# Route of each kind's per-server bandwidth report, and the placeholder of the server id.
+_ROUTES: dict[str, tuple[str, str]] = {
+    "instances": ("instance_bandwidth", "instance-id"),
+    "bare_metals": ("bare_metal_bandwidth", "baremetal-id"),
+}
+MAX_DATE_RANGE = 180
+SERIES_VERSION = 1
+
+class BandwidthSeries:
+    """
+    Daily traffic of one server as two contiguous arrays of unsigned 64-bit byte counts, starting at
+    `start`. Sixteen bytes per day, where a dict of dicts per day costs hundreds.
+    """
+    __slots__ = ("start", "incoming", "outgoing")
+
+    def __init__(self, start: date | None = None, incoming: array | None = None, outgoing: array | None = None):
+        self.start = start
+        self.incoming = incoming if incoming is not None else array("Q")
+        self.outgoing = outgoing if outgoing is not None else array("Q")
+
+    def __len__(self) -> int:
+        return len(self.incoming)
+
+    @property
+    def end(self) -> date | None:
+        """
+        The last day recorded.
+        """
+        if self.start is None or not self.incoming:
+            return None
+        return self.start + timedelta(days=len(self.incoming) - 1)
+
+    def record(self, day: date, incoming: int, outgoing: int) -> None:
+        """
+        Set the traffic of `day`, growing the series (with zero-filled gaps) as needed.
+        """
+        if self.start is None:
+            self.start = day
+        if day < self.start:
+            gap = (self.start - day).days
+            self.incoming[0:0] = array("Q", bytes(8 * gap))
+            self.outgoing[0:0] = array("Q", bytes(8 * gap))
+            self.start = day
+        index = (day - self.start).days
+        if index >= len(self.incoming):
+            gap = index + 1 - len(self.incoming)
+            self.incoming.extend(array("Q", bytes(8 * gap)))
+            self.outgoing.extend(array("Q", bytes(8 * gap)))
+        self.incoming[index] = incoming
+        self.outgoing[index] = outgoing
+
+    def total(self, since: date | None = None, until: date | None = None, direction: Direction = "outgoing") -> int:
+        """
+        Bytes transferred from `since` through `until` (inclusive; default: the whole series).
+        """
+        if self.start is None:
+            return 0
+        first = max(0, (since - self.start).days) if since is not None else 0
+        last = min(len(self.incoming), (until - self.start).days + 1) if until is not None else len(self.incoming)
+        if first >= last:
+            return 0
+        if direction == "incoming":
+            return sum(self.incoming[first:last])
+        if direction == "outgoing":
+            return sum(self.outgoing[first:last])
+        return sum(self.incoming[first:last]) + sum(self.outgoing[first:last])
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "start": self.start.isoformat() if self.start is not None else None,
+            "incoming": base64.b64encode(self.incoming.tobytes()).decode(),
+            "outgoing": base64.b64encode(self.outgoing.tobytes()).decode(),
+        }
+
+    @staticmethod
+    def from_dict(data: Mapping[str, Any]) -> 'BandwidthSeries':
+        incoming, outgoing = array("Q"), array("Q")
+        incoming.frombytes(base64.b64decode(data["incoming"]))
+        outgoing.frombytes(base64.b64decode(data["outgoing"]))
+        start = date.fromisoformat(data["start"]) if data["start"] else None
+        return BandwidthSeries(start, incoming, outgoing)
+
+class Projection(TypedDict):
+    used: int
+    projected: int
+    allowance: int
+    overage: int
+    days_elapsed: int
+    days_in_month: int
+
+class BandwidthCollector:
+    """
+    Collects daily bandwidth for a fleet of instances and bare-metal servers.
+
+    ```python
+    collector = BandwidthCollector(path="bandwidth.json")
+    await collector.collect_fleet()
+    collector.top(10)                                 # [(server id, bytes out), ...]
+    collector.projection(allowance=5 * 1024 ** 4)    # pooled month-end estimate
+    ```
+
+    Servers are swept concurrently (at most `max_concurrency` requests at a time, through the
+    shared rate limiter). A server seen before is asked only for the days since its last recorded
+    day, which is fetched again since it may have been partial.
+    """
+    def __init__(
+        self,
+        provider: str = "vultr",
+        api_key: str | None = None,
+        max_concurrency: int = 16,
+        initial_days: int = 30,
+        path: str | None = None,
+    ):
+        self._provider = provider
+        self._provider_url = ProviderUrl(provider)
+        self._api_key = api_key
+        self._max_concurrency = max_concurrency
+        self._initial_days = initial_days
+        self._path = path
+        self.series: dict[str, BandwidthSeries] = {}
+        self.kinds: dict[str, str] = {}
+        if path is not None:
+            self._load(path)
+
+    # --- Collection ---
+    def _request(self, kind: str, server_id: str) -> Request:
+        route, placeholder = _ROUTES[kind]
+        return Request(self._provider_url.route(route).assign(placeholder, server_id)) \
+            .set_method(HTTPMethod.GET) \
+            .authorize(self._provider, self._api_key)
+
+    async def _collect_one(self, kind: str, server_id: str, today: date) -> Result[int, ErrorResponse]:
+        series = self.series.get(server_id)
+        end = series.end if series is not None else None
+        days = min(MAX_DATE_RANGE, (today - end).days + 1 if end is not None else self._initial_days)
+        request = self._request(kind, server_id)
+        if kind == "instances":
+            request.add_param("date_range", max(1, days))
+        result = await request.request()
+        if result.is_err():
+            return Err(result.unwrap_err())
+
+        data = cast(dict[str, Any], result.unwrap()["data"] or {})
+        if series is None:
+            series = self.series[server_id] = BandwidthSeries()
+            self.kinds[server_id] = kind
+        recorded = 0
+        for day_text, usage in sorted(data.items()):
+            day = date.fromisoformat(day_text)
+            if end is not None and day < end:
+                continue
+            series.record(day, int(usage.get("incoming_bytes") or 0), int(usage.get("outgoing_bytes") or 0))
+            recorded += 1
+        return Ok(recorded)
+
+    async def collect(
+        self,
+        instances: Iterable[str] = (),
+        bare_metals: Iterable[str] = (),
+        today: date | None = None,
+    ) -> dict[str, Result[int, ErrorResponse]]:
+        """
+        Collect the given servers and return, per server, the number of days recorded.
+        """
+        today = today or date.today()
+        targets = [("instances", server_id) for server_id in instances] + [("bare_metals", server_id) for server_id in bare_metals]
+        slots = asyncio.Semaphore(self._max_concurrency)
+
+        async def one(kind: str, server_id: str) -> Result[int, ErrorResponse]:
+            async with slots:
+                return await self._collect_one(kind, server_id, today)
+
+        results = dict(zip((server_id for _, server_id in targets), await asyncio.gather(*(one(kind, server_id) for kind, server_id in targets))))
+        failed = sum(1 for result in results.values() if result.is_err())
+        logger.info("Collected bandwidth of %d servers (%d failed)", len(results), failed)
+        if self._path is not None:
+            self.save(self._path)
+        return results
+
+    async def collect_fleet(self, today: date | None = None) -> Result[dict[str, Result[int, ErrorResponse]], ErrorResponse]:
+        """
+        Collect every instance and bare-metal server of the account.
+        """
+        async def ids(route: str) -> list[str]:
+            url = self._provider_url.route(route)
+            make = lambda: Request(url).set_method(HTTPMethod.GET).authorize(self._provider, self._api_key)
+            return [str(cast(dict[str, Any], item)["id"]) async for item in paginate(request_pages(make), per_page=MAX_PER_PAGE)]
+
+        try:
+            instances, bare_metals = await asyncio.gather(ids("instances"), ids("bare_metals"))
+        except PaginationError as error:
+            logger.error("Listing the fleet failed: %s", error)
+            return Err(error.response)
+        return Ok(await self.collect(instances, bare_metals, today))
+
+    # --- Aggregates ---
+    def top(self, n: int = 10, days: int = 30, direction: Direction = "outgoing", today: date | None = None) -> list[tuple[str, int]]:
+        """
+        The `n` servers that transferred the most over the last `days` days.
+        """
+        since = (today or date.today()) - timedelta(days=days - 1)
+        return heapq.nlargest(n, ((server_id, series.total(since, direction=direction)) for server_id, series in self.series.items()), key=lambda entry: entry[1])
+
+    def projection(
+        self,
+        allowance: int,
+        server_ids: Iterable[str] | None = None,
+        direction: Direction = "outgoing",
+        window: int = 7,
+        today: date | None = None,
+    ) -> Projection:
+        """
+        Month-end usage of the pooled `allowance` (bytes) by the given servers (default: all): usage
+        so far this month plus the average of the last `window` days for each remaining day.
+        """
+        today = today or date.today()
+        month_start = today.replace(day=1)
+        days_in_month = calendar.monthrange(today.year, today.month)[1]
+        selected = [self.series[server_id] for server_id in server_ids if server_id in self.series] if server_ids is not None else list(self.series.values())
+
+        used = sum(series.total(month_start, today, direction) for series in selected)
+        recent = sum(series.total(today - timedelta(days=window - 1), today, direction) for series in selected)
+        projected = used + recent // window * (days_in_month - today.day)
+        return Projection(
+            used=used,
+            projected=projected,
+            allowance=allowance,
+            overage=max(0, projected - allowance),
+            days_elapsed=today.day,
+            days_in_month=days_in_month,
+        )
+
+    # --- Persistence ---
+    def save(self, path: str) -> None:
+        """
+        Write every series to `path` atomically.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        payload = {
+            "version": SERIES_VERSION,
+            "series": {server_id: {"kind": self.kinds.get(server_id, "instances"), **series.to_dict()} for server_id, series in self.series.items()},
+        }
+        with open(temporary, "wb") as file:
+            file.write(JsonCodec.get().encode(payload))
+        os.replace(temporary, path)
+
+    def _load(self, path: str) -> None:
+        try:
+            with open(path, "rb") as file:
+                payload = cast(dict[str, Any], JsonCodec.get().decode(file.read()))
+            if payload.get("version") != SERIES_VERSION:
+                raise ValueError(f"unsupported version {payload.get('version')}")
+            for server_id, data in payload["series"].items():
+                self.series[server_id] = BandwidthSeries.from_dict(data)
+                self.kinds[server_id] = data["kind"]
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            logger.warning("Ignoring unreadable bandwidth store %s: %s", path, error)
+            self.series.clear()
+            self.kinds.clear()
@@ -0,0 +1,264 @@
+import asyncio
+import logging
+import os
+import re
+from collections.abc import Callable, Iterable, Mapping
+from http import HTTPMethod
+from typing import TYPE_CHECKING, Any, TypedDict, cast
+
+from rustipy.result import Err, Ok, Result
+
+from .const import ProviderUrl
+from .pagination import MAX_PER_PAGE, PaginationError, paginate, request_pages
+from .request import ErrorResponse, Request, Url
+
+if TYPE_CHECKING:
+    import sqlite3
+
+logger = logging.getLogger(__name__)
+
+Item = dict[str, Any]
+# Derives `(label, region)` from an invoice item or pending charge.
+Classifier = Callable[[Item], tuple[str, str]]
+
+GROUP_FIELDS: tuple[str, ...] = ("product", "label", "region", "month", "invoice_id", "unit_type")
+# Invoice id under which pending (not yet invoiced) charges are stored.
+PENDING = "pending"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS invoices (
+    id TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    amount REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS charges (
+    invoice_id TEXT NOT NULL,
+    month TEXT NOT NULL,
+    product TEXT NOT NULL,
+    label TEXT NOT NULL,
+    region TEXT NOT NULL,
+    unit_type TEXT NOT NULL,
+    units REAL NOT NULL,
+    total REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS charges_invoice ON charges (invoice_id);
+CREATE INDEX IF NOT EXISTS charges_month ON charges (month, product);
+CREATE TABLE IF NOT EXISTS history (
+    id TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    type TEXT NOT NULL,
+    description TEXT NOT NULL,
+    amount REAL NOT NULL,
+    balance REAL NOT NULL
+);
+"""
+
+_REGION = re.compile(r"\[([a-z]{3}\d?)\]|\(([a-z]{3}\d?)\)")
+
+def classify(item: Item) -> tuple[str, str]:
+    """
+    Default `Classifier`: the label is the description up to its first parenthesis or bracket, the
+    region a three-letter code in brackets or parentheses (`"web-1 (vc2-1c-1gb) [ewr]"`).
+    """
+    description = str(item.get("description") or "")
+    label = re.split(r"\s*[(\[]", description, maxsplit=1)[0].strip()
+    found = _REGION.search(description)
+    region = (found.group(1) or found.group(2)) if found is not None else ""
+    return label, region
+
+class RefreshStats(TypedDict):
+    invoices: int
+    charges: int
+    pending: int
+    history: int
+
+class BillingAnalytics:
+    """
+    Local store of the account's billing data with fast group-by queries.
+
+    ```python
+    billing = BillingAnalytics(path="billing.sqlite3")
+    await billing.refresh()
+    billing.group_by("month", "product")  # [("2025-01", "Cloud Compute", 1234.5), ...]
+    ```
+
+    `refresh()` lists invoices and fetches the items of those not stored yet, many invoices at a
+    time, so after the first run only new invoices cost requests. Pending charges are replaced on
+    every refresh. Charges land in an indexed SQLite table (in memory unless `path` is given), and
+    queries aggregate there instead of in Python. Invoice items carry no label or region, so those
+    are derived from the description by `classifier` (see `classify()`).
+    """
+    def __init__(
+        self,
+        provider: str = "vultr",
+        api_key: str | None = None,
+        path: str = ":memory:",
+        max_concurrency: int = 8,
+        classifier: Classifier = classify,
+    ):
+        self._provider = provider
+        self._provider_url = ProviderUrl(provider)
+        self._api_key = api_key
+        self._path = path
+        self._max_concurrency = max_concurrency
+        self._classifier = classifier
+        self._connection: 'sqlite3.Connection | None' = None
+        self._refresh_lock = asyncio.Lock()
+
+    # --- Storage ---
+    def _db(self) -> 'sqlite3.Connection':
+        import sqlite3
+
+        if self._connection is None:
+            if self._path != ":memory:":
+                os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+            self._connection = sqlite3.connect(self._path)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+        return self._connection
+
+    def _rows(self, invoice_id: str, month: str | None, items: Iterable[Item]) -> list[tuple[object, ...]]:
+        rows: list[tuple[object, ...]] = []
+        for item in items:
+            label, region = self._classifier(item)
+            rows.append((
+                invoice_id,
+                month or str(item.get("start_date") or "")[:7],
+                str(item.get("product") or ""),
+                label,
+                region,
+                str(item.get("unit_type") or ""),
+                float(item.get("units") or 0),
+                float(item.get("total") or 0),
+            ))
+        return rows
+
+    # --- Refresh ---
+    def _request(self, url: Url) -> Request:
+        return Request(url).set_method(HTTPMethod.GET).authorize(self._provider, self._api_key)
+
+    async def _list(self, url: Url) -> list[Item]:
+        return [cast(Item, item) async for item in paginate(request_pages(lambda: self._request(url)), per_page=MAX_PER_PAGE)]
+
+    def known_invoices(self) -> set[str]:
+        return {row[0] for row in self._db().execute("SELECT id FROM invoices")}
+
+    async def refresh(self, history: bool = True) -> Result[RefreshStats, ErrorResponse]:
+        """
+        Fetch new invoices with their items, the pending charges and (with `history`) the billing
+        history. An invoice is stored with its items in one transaction, so a failed refresh leaves
+        no partial invoice behind and the next one picks up where it stopped.
+        """
+        async with self._refresh_lock:
+            try:
+                return Ok(await self._refresh(history))
+            except PaginationError as error:
+                logger.error("Billing refresh failed: %s", error)
+                return Err(error.response)
+
+    async def _refresh(self, history: bool) -> RefreshStats:
+        # Fetches run in task groups: when one fails, its siblings are cancelled before the error
+        # surfaces, so no invoice is written after refresh() has returned.
+        try:
+            return await self._fetch_all(history)
+        except* PaginationError as failed:
+            raise failed.exceptions[0]
+
+    async def _fetch_all(self, history: bool) -> RefreshStats:
+        items_url = self._provider_url.route("billing_invoice_items")
+        async with asyncio.TaskGroup() as group:
+            listing = group.create_task(self._list(self._provider_url.route("billing_invoices")))
+            charges = group.create_task(self._request(self._provider_url.route("billing_pending_charges")).request())
+            if history:
+                listed = group.create_task(self._list(self._provider_url.route("billing_history")))
+        invoices, pending = listing.result(), charges.result()
+        entries = listed.result() if history else []
+        known = self.known_invoices()
+        new = [invoice for invoice in invoices if str(invoice["id"]) not in known]
+        slots = asyncio.Semaphore(self._max_concurrency)
+        stats = RefreshStats(invoices=0, charges=0, pending=0, history=0)
+
+        async def fetch(invoice: Item) -> None:
+            invoice_id = str(invoice["id"])
+            async with slots:
+                items = await self._list(items_url.assign("invoice-id", invoice_id))
+            rows = self._rows(invoice_id, str(invoice.get("date") or "")[:7], items)
+            with self._db() as db:
+                db.execute("DELETE FROM charges WHERE invoice_id = ?", (invoice_id,))
+                db.executemany("INSERT INTO charges VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                db.execute("INSERT OR REPLACE INTO invoices VALUES (?, ?, ?)", (invoice_id, str(invoice.get("date") or ""), float(invoice.get("amount") or 0)))
+            stats["invoices"] += 1
+            stats["charges"] += len(rows)
+
+        async with asyncio.TaskGroup() as group:
+            for invoice in new:
+                group.create_task(fetch(invoice))
+
+        if pending.is_ok():
+            data = pending.unwrap()["data"]
+            rows = self._rows(PENDING, None, cast(list[Item], data if isinstance(data, list) else []))
+            with self._db() as db:
+                db.execute("DELETE FROM charges WHERE invoice_id = ?", (PENDING,))
+                db.executemany("INSERT INTO charges VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            stats["pending"] = len(rows)
+        else:
+            logger.warning("Fetching pending charges failed: %s", pending.unwrap_err()["error"])
+
+        if history:
+            with self._db() as db:
+                before = db.total_changes
+                db.executemany("INSERT OR IGNORE INTO history VALUES (?, ?, ?, ?, ?, ?)", [
+                    (str(entry["id"]), str(entry.get("date") or ""), str(entry.get("type") or ""), str(entry.get("description") or ""),
+                     float(entry.get("amount") or 0), float(entry.get("balance") or 0))
+                    for entry in cast(list[Item], entries)
+                ])
+                stats["history"] = db.total_changes - before
+
+        logger.info("Billing refresh: %d new invoices (%d charges), %d pending charges", stats["invoices"], stats["charges"], stats["pending"])
+        return stats
+
+    # --- Queries ---
+    def group_by(
+        self,
+        *fields: str,
+        where: Mapping[str, str] | None = None,
+        include_pending: bool = False,
+    ) -> list[tuple[Any, ...]]:
+        """
+        Total cost per distinct combination of `fields` (from `GROUP_FIELDS`), largest first, as
+        `(value, ..., total)` tuples. `where` filters on the same fields, e.g. `{"month": "2025-01"}`.
+        """
+        unknown = (set(fields) | set(where or {})) - set(GROUP_FIELDS)
+        if unknown:
+            raise ValueError(f"Cannot group or filter on {sorted(unknown)}; fields are {list(GROUP_FIELDS)}")
+        conditions = [f"{field} = ?" for field in (where or {})]
+        parameters: list[object] = list((where or {}).values())
+        if not include_pending:
+            conditions.append("invoice_id != ?")
+            parameters.append(PENDING)
+        columns = ", ".join(fields)
+        query = f"SELECT {columns + ', ' if fields else ''}ROUND(SUM(total), 2) AS cost FROM charges"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        if fields:
+            query += f" GROUP BY {columns}"
+        query += " ORDER BY cost DESC"
+        return [tuple(row) for row in self._db().execute(query, parameters)]
+
+    def total(self, where: Mapping[str, str] | None = None, include_pending: bool = False) -> float:
+        return self.group_by(where=where, include_pending=include_pending)[0][0] or 0.0
+
+    def history(self, since: str | None = None) -> list[Item]:
+        """
+        Billing history entries (invoices and payments) from `since` (an ISO date) on, oldest first.
+        """
+        rows = self._db().execute(
+            "SELECT id, date, type, description, amount, balance FROM history WHERE date >= ? ORDER BY date",
+            (since or "",),
+        )
+        return [dict(zip(("id", "date", "type", "description", "amount", "balance"), row)) for row in rows]
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
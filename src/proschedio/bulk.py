@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Iterable
+from http import HTTPMethod
+from typing import Any, Literal
+
+from rustipy.result import Err, Ok, Result
+
+from .const import ProviderUrl
+from .readiness import ReadinessWatcher, is_ready
+from .request import ErrorResponse, Request, RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+Item = dict[str, Any]
+PowerAction = Literal["start", "reboot", "halt"]
+
+# Route name prefix and request body field of each collection with bulk power actions.
+_COLLECTIONS: dict[str, tuple[str, str]] = {
+    "instances": ("instances", "instance_ids"),
+    "bare_metals": ("bare_metals", "baremetal_ids"),
+}
+DEFAULT_CHUNK_SIZE = 100
+# Rejections that name bad ids within a chunk, so splitting the chunk isolates them. Anything else
+# (`401`, `403`, or `429`/`5xx` left after retries) would fail every half the same way.
+SPLIT_STATUSES: frozenset[int] = frozenset({400, 404, 422})
+
+def _reached(action: PowerAction, item: Item) -> bool:
+    if action == "halt":
+        return item.get("power_status") == "stopped"
+    return is_ready(item) and item.get("power_status", "running") == "running"
+
+def chunk(ids: list[str], chunk_size: int) -> list[list[str]]:
+    """
+    Split `ids` into as few chunks of at most `chunk_size` as possible, with sizes differing by at
+    most one, so no request is left carrying a small remainder.
+    """
+    if not ids:
+        return []
+    count = math.ceil(len(ids) / chunk_size)
+    size, extra = divmod(len(ids), count)
+    chunks: list[list[str]] = []
+    start = 0
+    for index in range(count):
+        end = start + size + (1 if index < extra else 0)
+        chunks.append(ids[start:end])
+        start = end
+    return chunks
+
+class BulkReport:
+    def __init__(self, action: PowerAction, results: dict[str, Result[Item | None, ErrorResponse]], requests: int, elapsed: float):
+        self.action = action
+        self.results = results
+        self.requests = requests
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return all(result.is_ok() for result in self.results.values())
+
+    def succeeded(self) -> list[str]:
+        return [resource_id for resource_id, result in self.results.items() if result.is_ok()]
+
+    def failed(self) -> dict[str, ErrorResponse]:
+        return {resource_id: result.unwrap_err() for resource_id, result in self.results.items() if result.is_err()}
+
+class BulkPower:
+    """
+    Start, reboot or halt any number of instances or bare-metal servers, with a result per id.
+
+    ```python
+    report = await BulkPower("vultr").halt(instance_ids)
+    for instance_id, error in report.failed().items():
+        ...
+    ```
+
+    Ids are sent in evenly sized chunks of at most `chunk_size` through the bulk endpoints
+    (`instances/halt`, ...), at most `max_concurrency` chunks at a time; every request goes through
+    the shared rate limiter. Bulk requests are marked retry-safe, so `429` and `5xx` answers go
+    through `retry_policy` (default: `RetryPolicy.default`). A chunk rejected for its ids (see
+    `SPLIT_STATUSES`) is split in half and retried until the ids at fault are isolated, so one bad
+    id fails alone; any other rejection fails the whole chunk at once.
+
+    Accepted starts and halts are then verified with one `ReadinessWatcher`, which lists the
+    collection page by page instead of polling each server. Reboots are not verified: a server that
+    was running before the reboot looks the same once it is back, so the listing cannot tell whether
+    the reboot has happened. A reboot succeeds once the API accepts it.
+    """
+    def __init__(
+        self,
+        provider: str = "vultr",
+        api_key: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = 8,
+        watcher: ReadinessWatcher | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        if chunk_size < 1 or max_concurrency < 1:
+            raise ValueError("chunk_size and max_concurrency must be at least 1.")
+        self._provider = provider
+        self._provider_url = ProviderUrl(provider)
+        self._api_key = api_key
+        self._chunk_size = chunk_size
+        self._max_concurrency = max_concurrency
+        self._watcher = watcher
+        self._retry_policy = retry_policy
+
+    async def start(self, ids: Iterable[str], kind: str = "instances", verify: bool = True, timeout: float = 600) -> BulkReport:
+        return await self.run("start", ids, kind, verify, timeout)
+
+    async def reboot(self, ids: Iterable[str], kind: str = "instances", verify: bool = True, timeout: float = 600) -> BulkReport:
+        return await self.run("reboot", ids, kind, verify, timeout)
+
+    async def halt(self, ids: Iterable[str], kind: str = "instances", verify: bool = True, timeout: float = 600) -> BulkReport:
+        return await self.run("halt", ids, kind, verify, timeout)
+
+    async def run(
+        self,
+        action: PowerAction,
+        ids: Iterable[str],
+        kind: str = "instances",
+        verify: bool = True,
+        timeout: float = 600,
+    ) -> BulkReport:
+        """
+        Apply `action` to every id of `kind` (`"instances"` or `"bare_metals"`). With `verify`, a
+        started or halted id succeeds once the server reports the resulting power state, or fails
+        after `timeout` seconds.
+        """
+        if kind not in _COLLECTIONS:
+            raise ValueError(f"Kind '{kind}' has no bulk power actions; expected one of {list(_COLLECTIONS)}")
+        started = time.monotonic()
+        unique = list(dict.fromkeys(ids))
+        results: dict[str, Result[Item | None, ErrorResponse]] = {}
+        slots = asyncio.Semaphore(self._max_concurrency)
+        requests = 0
+
+        async def send(ids: list[str]) -> None:
+            nonlocal requests
+            async with slots:
+                requests += 1
+                result = await self._send(action, kind, ids)
+            if result.is_ok():
+                results.update((resource_id, Ok(None)) for resource_id in ids)
+                return
+            error = result.unwrap_err()
+            if len(ids) == 1 or error["status_code"] not in SPLIT_STATUSES:
+                results.update((resource_id, Err(error)) for resource_id in ids)
+                return
+            middle = len(ids) // 2
+            await asyncio.gather(send(ids[:middle]), send(ids[middle:]))
+
+        await asyncio.gather(*(send(ids) for ids in chunk(unique, self._chunk_size)))
+        accepted = [resource_id for resource_id in unique if results[resource_id].is_ok()]
+        logger.info("Bulk %s of %d %s: %d accepted in %d requests", action, len(unique), kind, len(accepted), requests)
+
+        if verify and accepted and action != "reboot":
+            results.update(await self._verify(action, kind, accepted, timeout))
+        ordered = {resource_id: results[resource_id] for resource_id in unique}
+        return BulkReport(action, ordered, requests, time.monotonic() - started)
+
+    def _request(self, action: PowerAction, kind: str) -> Request:
+        # Power actions are idempotent, so re-sending one after a throttled or failed attempt is safe.
+        request = Request(self._provider_url.route(f"{_COLLECTIONS[kind][0]}_{action}")) \
+            .set_method(HTTPMethod.POST) \
+            .authorize(self._provider, self._api_key) \
+            .retry_safe()
+        if self._retry_policy is not None:
+            request.set_retry(self._retry_policy)
+        return request
+
+    async def _send(self, action: PowerAction, kind: str, ids: list[str]) -> Result[Any, ErrorResponse]:
+        return await self._request(action, kind).set_body({_COLLECTIONS[kind][1]: ids}).request()
+
+    async def _verify(self, action: PowerAction, kind: str, ids: list[str], timeout: float) -> dict[str, Result[Item | None, ErrorResponse]]:
+        watcher = self._watcher if self._watcher is not None else ReadinessWatcher.shared(self._provider, self._api_key)
+
+        async def wait(resource_id: str) -> Result[Item | None, ErrorResponse]:
+            try:
+                return Ok(await watcher.wait(resource_id, kind, timeout, lambda item: _reached(action, item)))
+            except TimeoutError as error:
+                return Err(ErrorResponse(status_code=0, error=str(error)))
+
+        return dict(zip(ids, await asyncio.gather(*(wait(resource_id) for resource_id in ids))))
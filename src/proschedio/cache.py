@@ -0,0 +1,247 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from .codec import JsonCodec
+from .ratelimit import fingerprint
+
+if TYPE_CHECKING:
+    # sqlite3 is imported on first use so importing `proschedio.request` stays cheap.
+    import sqlite3
+
+logger = logging.getLogger(__name__)
+
+# Seconds each slowly-changing catalog route may be served from the cache, keyed by route template.
+DEFAULT_TTLS: dict[str, float] = {
+    "applications": 24 * 60 * 60,
+    "os": 24 * 60 * 60,
+    "plans": 6 * 60 * 60,
+    "plans-metal": 6 * 60 * 60,
+    "regions": 24 * 60 * 60,
+    "regions/{region-id}/availability": 15 * 60,
+    "kubernetes/versions": 6 * 60 * 60,
+    "databases/plans": 6 * 60 * 60,
+    "registry/region/list": 24 * 60 * 60,
+    "vfs/regions": 24 * 60 * 60,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+class CachedResponse(TypedDict):
+    status_code: int
+    data: Any
+    meta: Any
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+
+def default_cache_path() -> str:
+    """
+    `$XDG_CACHE_HOME/proschedio/responses.sqlite3`, falling back to `~/.cache`.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "proschedio", "responses.sqlite3")
+
+class ResponseCache:
+    """
+    Opt-in persistent cache of successful `GET` responses, shared by every `Request` in the process.
+
+    Entries are keyed by method, URL, query parameters and a fingerprint of the `Authorization`
+    header, and live for the TTL of their route (`DEFAULT_TTLS`, `set_route_ttl()`); routes without a
+    TTL are never cached. Expired entries that carried an `ETag` or `Last-Modified` header are
+    revalidated with a conditional request instead of being refetched. The store is an SQLite file
+    capped at `max_bytes`, evicting the least recently used entries first. The stored size is
+    summed once when the file is opened and tracked from then on, so a store does not scan the table.
+
+    The methods block on SQLite. `Request` calls them through `asyncio.to_thread()`, so a slow disk
+    never stalls the event loop; one lock serializes access to the shared connection.
+    """
+    _enabled: bool = False
+    _path: str | None = None
+    _max_bytes: int = 64 * 1024 * 1024
+    _ttls: dict[str, float] = dict(DEFAULT_TTLS)
+    _connection: 'sqlite3.Connection | None' = None
+    _size: int = 0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def configure(
+        enabled: bool | None = None,
+        path: str | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        """
+        Turn the cache on or off and set where it lives (`":memory:"` for a per-process cache).
+        """
+        if path is not None and path != ResponseCache._path:
+            ResponseCache.close()
+            ResponseCache._path = path
+        if max_bytes is not None:
+            ResponseCache._max_bytes = max_bytes
+        if enabled is not None:
+            ResponseCache._enabled = enabled
+
+    @staticmethod
+    def set_route_ttl(route: str, ttl: float | None) -> None:
+        """
+        Cache responses of the route template `route` for `ttl` seconds; `None` stops caching it.
+        """
+        if ttl is None:
+            ResponseCache._ttls.pop(route, None)
+        else:
+            ResponseCache._ttls[route] = ttl
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return ResponseCache._enabled
+
+    @staticmethod
+    def ttl_for(route: str | None) -> float | None:
+        return ResponseCache._ttls.get(route) if route is not None else None
+
+    @staticmethod
+    def key(method: str, url: str, params: Mapping[str, str | int], authorization: str | None) -> str:
+        material = "\n".join([method, url, *(f"{name}={params[name]}" for name in sorted(params)), fingerprint(authorization)])
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    @staticmethod
+    def _db() -> 'sqlite3.Connection':
+        import sqlite3
+
+        if ResponseCache._connection is None:
+            path = ResponseCache._path or default_cache_path()
+            if path != ":memory:":
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            ResponseCache._size = ResponseCache._stored_size(connection)
+            ResponseCache._connection = connection
+        return ResponseCache._connection
+
+    @staticmethod
+    def get(key: str) -> CachedResponse | None:
+        """
+        Get an entry, fresh or expired, and mark it as recently used.
+        """
+        import sqlite3
+
+        try:
+            with ResponseCache._lock:
+                db = ResponseCache._db()
+                row = db.execute(
+                    "SELECT status, body, etag, last_modified, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            payload: Any = JsonCodec.get().decode(row[1])
+        except (sqlite3.Error, OSError, ValueError) as error:
+            logger.warning("Response cache lookup failed: %s", error)
+            return None
+        return CachedResponse(
+            status_code=row[0],
+            data=payload["data"],
+            meta=payload["meta"],
+            etag=row[2],
+            last_modified=row[3],
+            expires_at=row[4],
+        )
+
+    @staticmethod
+    def put(key: str, status: int, data: Any, meta: Any, headers: Mapping[str, str], ttl: float) -> None:
+        """
+        Store a successful response, remembering its validators for later revalidation.
+        """
+        import sqlite3
+
+        now = time.time()
+        try:
+            body = JsonCodec.get().encode({"data": data, "meta": meta})
+            with ResponseCache._lock:
+                db = ResponseCache._db()
+                replaced = db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+                db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, status, body, headers.get("ETag"), headers.get("Last-Modified"), now + ttl, now, len(body)),
+                )
+                ResponseCache._size += len(body) - (replaced[0] if replaced is not None else 0)
+                ResponseCache._evict(db)
+        except (sqlite3.Error, OSError, TypeError, ValueError) as error:
+            logger.warning("Response cache store failed: %s", error)
+
+    @staticmethod
+    def refresh(key: str, headers: Mapping[str, str], ttl: float) -> None:
+        """
+        Extend an entry after the server confirmed it is unchanged (`304 Not Modified`).
+        """
+        import sqlite3
+
+        now = time.time()
+        try:
+            with ResponseCache._lock:
+                ResponseCache._db().execute(
+                    "UPDATE responses SET expires_at = ?, accessed_at = ?, etag = COALESCE(?, etag),"
+                    " last_modified = COALESCE(?, last_modified) WHERE key = ?",
+                    (now + ttl, now, headers.get("ETag"), headers.get("Last-Modified"), key),
+                )
+        except (sqlite3.Error, OSError) as error:
+            logger.warning("Response cache refresh failed: %s", error)
+
+    @staticmethod
+    def _stored_size(db: 'sqlite3.Connection') -> int:
+        return db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def _evict(db: 'sqlite3.Connection') -> None:
+        if ResponseCache._size <= ResponseCache._max_bytes:
+            return
+        # Another process sharing the file may have changed it: recount before evicting.
+        total = ResponseCache._size = ResponseCache._stored_size(db)
+        if total <= ResponseCache._max_bytes:
+            return
+        freed = 0
+        victims: list[str] = []
+        for key, size in db.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            victims.append(key)
+            freed += size
+            if total - freed <= ResponseCache._max_bytes:
+                break
+        db.executemany("DELETE FROM responses WHERE key = ?", [(key,) for key in victims])
+        ResponseCache._size = total - freed
+        logger.debug("Evicted %d cached responses (%d bytes)", len(victims), freed)
+
+    @staticmethod
+    def clear() -> None:
+        import sqlite3
+
+        try:
+            with ResponseCache._lock:
+                ResponseCache._db().execute("DELETE FROM responses")
+                ResponseCache._size = 0
+        except (sqlite3.Error, OSError) as error:
+            logger.warning("Response cache clear failed: %s", error)
+
+    @staticmethod
+    def close() -> None:
+        with ResponseCache._lock:
+            if ResponseCache._connection is not None:
+                ResponseCache._connection.close()
+                ResponseCache._connection = None
@@ -0,0 +1,308 @@
+import asyncio
+import logging
+import os
+import time
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from http import HTTPMethod
+from typing import Any
+
+from rustipy.result import Err, Ok, Result
+
+from .codec import JsonCodec
+from .const import ProviderUrl
+from .pagination import PaginationError, paginate, request_pages
+from .request import ErrorResponse, Request
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION = 1
+DEFAULT_TTL = 24 * 60 * 60
+
+# Route name of each catalog section.
+_SECTIONS: dict[str, str] = {
+    "plans": "plans",
+    "metal_plans": "plans_metal",
+    "regions": "regions",
+    "operating_systems": "operating_systems",
+    "applications": "applications",
+}
+
+Item = dict[str, Any]
+
+def default_cache_path(provider: str) -> str:
+    """
+    `$XDG_CACHE_HOME/proschedio/catalog-<provider>.json`, falling back to `~/.cache`.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "proschedio", f"catalog-{provider}.json")
+
+def plan_vcpus(plan: Item) -> int:
+    """
+    vCPU count of a plan; bare-metal plans report `cpu_threads`/`cpu_count` instead of `vcpu_count`.
+    """
+    return int(plan.get("vcpu_count") or plan.get("cpu_threads") or plan.get("cpu_count") or 0)
+
+def _cost(plan: Item) -> float:
+    cost = plan.get("monthly_cost")
+    return float(cost) if cost is not None else float("inf")
+
+class Catalog:
+    """
+    Read-only snapshot of a provider's plans, bare-metal plans, regions, OS images and applications.
+
+    Build one with `Catalog.load()`, which serves a fresh on-disk copy when there is one and otherwise
+    fetches every section concurrently and writes it back. Plans are indexed by id, region, type,
+    monthly cost, vCPU count and RAM when the catalog is built, so queries never touch the network.
+    """
+    def __init__(
+        self,
+        plans: list[Item],
+        metal_plans: list[Item],
+        regions: list[Item],
+        operating_systems: list[Item],
+        applications: list[Item],
+        fetched_at: float | None = None,
+    ):
+        self.plans = plans
+        self.metal_plans = metal_plans
+        self.regions = regions
+        self.operating_systems = operating_systems
+        self.applications = applications
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+
+        self._metal_ids = {plan["id"] for plan in metal_plans}
+        # Every plan, cheapest first; ties keep API order.
+        self._by_cost = sorted([*plans, *metal_plans], key=_cost)
+        self._costs = [_cost(plan) for plan in self._by_cost]
+        self._plans_by_id = {plan["id"]: plan for plan in self._by_cost}
+
+        self._by_region: dict[str, list[Item]] = {}
+        self._by_type: dict[str, list[Item]] = {}
+        for plan in self._by_cost:
+            for region in plan.get("locations") or ():
+                self._by_region.setdefault(region, []).append(plan)
+            self._by_type.setdefault(plan.get("type") or "", []).append(plan)
+
+        self._by_vcpu = sorted(self._by_cost, key=plan_vcpus)
+        self._vcpus = [plan_vcpus(plan) for plan in self._by_vcpu]
+        self._by_ram = sorted(self._by_cost, key=lambda plan: plan.get("ram") or 0)
+        self._rams = [plan.get("ram") or 0 for plan in self._by_ram]
+
+        self._regions_by_id = {region["id"]: region for region in regions}
+        self._os_by_id = {image["id"]: image for image in operating_systems}
+        self._apps_by_id = {app["id"]: app for app in applications}
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    def is_stale(self, ttl: float = DEFAULT_TTL) -> bool:
+        return self.age > ttl
+
+    def plan(self, plan_id: str) -> Item | None:
+        return self._plans_by_id.get(plan_id)
+
+    def region(self, region_id: str) -> Item | None:
+        return self._regions_by_id.get(region_id)
+
+    def operating_system(self, os_id: int) -> Item | None:
+        return self._os_by_id.get(os_id)
+
+    def application(self, app_id: int) -> Item | None:
+        return self._apps_by_id.get(app_id)
+
+    def is_metal(self, plan: Item) -> bool:
+        return plan["id"] in self._metal_ids
+
+    def plans_in(self, region: str) -> list[Item]:
+        """
+        Plans available in `region`, cheapest first.
+        """
+        return list(self._by_region.get(region, ()))
+
+    def _candidates(
+        self,
+        region: str | None,
+        type: str | None,
+        min_vcpu: int,
+        min_ram: int,
+        max_monthly_cost: float | None,
+    ) -> tuple[Iterable[Item], bool]:
+        """
+        The smallest index slice that satisfies at least one filter, and whether it is in cost order.
+        """
+        pools: list[tuple[int, Iterable[Item], bool]] = [(len(self._by_cost), self._by_cost, True)]
+        if region is not None:
+            pool = self._by_region.get(region, [])
+            pools.append((len(pool), pool, True))
+        if type is not None:
+            pool = self._by_type.get(type, [])
+            pools.append((len(pool), pool, True))
+        if max_monthly_cost is not None:
+            end = bisect_right(self._costs, max_monthly_cost)
+            pools.append((end, self._by_cost[:end], True))
+        if min_vcpu:
+            start = bisect_left(self._vcpus, min_vcpu)
+            pools.append((len(self._by_vcpu) - start, self._by_vcpu[start:], False))
+        if min_ram:
+            start = bisect_left(self._rams, min_ram)
+            pools.append((len(self._by_ram) - start, self._by_ram[start:], False))
+        _, pool, ordered = min(pools, key=lambda entry: entry[0])
+        return pool, ordered
+
+    def find_plans(
+        self,
+        region: str | None = None,
+        type: str | None = None,
+        min_vcpu: int = 0,
+        min_ram: int = 0,
+        max_monthly_cost: float | None = None,
+        metal: bool | None = None,
+    ) -> list[Item]:
+        """
+        Plans matching every given filter, cheapest first. `min_ram` is in MB, as reported by the
+        API; `metal` restricts the result to bare-metal (`True`) or virtual (`False`) plans.
+        """
+        pool, ordered = self._candidates(region, type, min_vcpu, min_ram, max_monthly_cost)
+        matches = [
+            plan for plan in pool
+            if (region is None or region in (plan.get("locations") or ()))
+            and (type is None or plan.get("type") == type)
+            and plan_vcpus(plan) >= min_vcpu
+            and (plan.get("ram") or 0) >= min_ram
+            and (max_monthly_cost is None or _cost(plan) <= max_monthly_cost)
+            and (metal is None or (plan["id"] in self._metal_ids) == metal)
+        ]
+        if not ordered:
+            matches.sort(key=_cost)
+        return matches
+
+    def cheapest(
+        self,
+        region: str | None = None,
+        type: str | None = None,
+        min_vcpu: int = 0,
+        min_ram: int = 0,
+        metal: bool | None = None,
+    ) -> Item | None:
+        """
+        The cheapest plan matching every given filter, e.g. `catalog.cheapest(region="ewr", min_vcpu=4)`.
+        """
+        pool, ordered = self._candidates(region, type, min_vcpu, min_ram, None)
+        best: Item | None = None
+        for plan in pool:
+            if best is not None and ordered:
+                break
+            if region is not None and region not in (plan.get("locations") or ()):
+                continue
+            if type is not None and plan.get("type") != type:
+                continue
+            if plan_vcpus(plan) < min_vcpu or (plan.get("ram") or 0) < min_ram:
+                continue
+            if metal is not None and (plan["id"] in self._metal_ids) != metal:
+                continue
+            if best is None or _cost(plan) < _cost(best):
+                best = plan
+        return best
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": CATALOG_VERSION,
+            "fetched_at": self.fetched_at,
+            **{section: getattr(self, section) for section in _SECTIONS},
+        }
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> 'Catalog':
+        if data.get("version") != CATALOG_VERSION:
+            raise ValueError(f"Unsupported catalog version: {data.get('version')}")
+        return Catalog(**{section: data[section] for section in _SECTIONS}, fetched_at=data["fetched_at"])
+
+    def save(self, path: str) -> None:
+        """
+        Write the catalog to `path` atomically, so concurrent readers never see a partial file.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(JsonCodec.get().encode(self.to_dict()))
+        os.replace(temporary, path)
+
+    @staticmethod
+    def read(path: str) -> 'Catalog | None':
+        """
+        Read a catalog written by `save()`, or `None` if the file is missing or unreadable.
+        """
+        try:
+            with open(path, "rb") as file:
+                data = JsonCodec.get().decode(file.read())
+            return Catalog.from_dict(data)  # type: ignore[arg-type]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            logger.warning("Ignoring unreadable catalog cache %s: %s", path, error)
+            return None
+
+    @staticmethod
+    async def fetch(provider: str = "vultr", api_key: str | None = None) -> Result['Catalog', ErrorResponse]:
+        """
+        Fetch every section from the API, concurrently and following pagination.
+        """
+        provider_url = ProviderUrl(provider)
+
+        async def section(route: str) -> list[Item]:
+            url = provider_url.route(route)
+
+            def make() -> Request:
+                return Request(url).set_method(HTTPMethod.GET).authorize(provider, api_key)
+
+            return [item async for item in paginate(request_pages(make))]  # type: ignore[misc]
+
+        async def sections() -> list[list[Item]]:
+            # When one section fails, the task group cancels the others before the error surfaces.
+            try:
+                async with asyncio.TaskGroup() as group:
+                    tasks = [group.create_task(section(route)) for route in _SECTIONS.values()]
+            except* PaginationError as failed:
+                raise failed.exceptions[0]
+            return [task.result() for task in tasks]
+
+        try:
+            fetched = await sections()
+        except PaginationError as error:
+            logger.error("Failed to fetch catalog from %s: %s", provider, error)
+            return Err(error.response)
+        return Ok(Catalog(**dict(zip(_SECTIONS, fetched))))
+
+    @staticmethod
+    async def load(
+        provider: str = "vultr",
+        api_key: str | None = None,
+        cache_path: str | None = None,
+        ttl: float = DEFAULT_TTL,
+        refresh: bool = False,
+    ) -> Result['Catalog', ErrorResponse]:
+        """
+        Get the catalog from the disk cache if it is younger than `ttl` seconds, otherwise fetch it
+        and update the cache. If the fetch fails, a stale cached copy is returned instead of the error.
+        """
+        path = cache_path or default_cache_path(provider)
+        cached = Catalog.read(path)
+        if cached is not None and not refresh and not cached.is_stale(ttl):
+            logger.debug("Using cached catalog %s (age %.0fs)", path, cached.age)
+            return Ok(cached)
+
+        result = await Catalog.fetch(provider, api_key)
+        if result.is_err():
+            if cached is not None:
+                logger.warning("Catalog refresh failed; using stale cache %s (age %.0fs)", path, cached.age)
+                return Ok(cached)
+            return result
+
+        catalog = result.unwrap()
+        try:
+            catalog.save(path)
+        except OSError as error:
+            logger.warning("Could not write catalog cache %s: %s", path, error)
+        return Ok(catalog)
@@ -0,0 +1,114 @@
+import json
+import logging
+from collections.abc import Callable
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+class Codec(Protocol):
+    """
+    A JSON backend. `encode` returns UTF-8 bytes ready to send; `decode` accepts the raw response
+    bytes and raises `ValueError` (or a subclass) on malformed input.
+    """
+    name: str
+
+    def encode(self, value: object) -> bytes: ...
+
+    def decode(self, data: bytes) -> object: ...
+
+class StdlibCodec:
+    name = "json"
+
+    def encode(self, value: object) -> bytes:
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def decode(self, data: bytes) -> object:
+        return json.loads(data)
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def encode(self, value: object) -> bytes:
+        return self._dumps(value)
+
+    def decode(self, data: bytes) -> object:
+        return self._loads(data)
+
+class MsgspecCodec:
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, value: object) -> bytes:
+        return self._encoder.encode(value)
+
+    def decode(self, data: bytes) -> object:
+        return self._decoder.decode(data)
+
+class JsonCodec:
+    """
+    Process-wide choice of JSON backend used by `Request` for request and response bodies.
+
+    By default the fastest installed backend is picked on first use (`orjson`, then `msgspec`, then
+    the standard library). Neither optional backend is imported until then.
+    """
+    _backends: dict[str, Callable[[], Codec]] = {
+        OrjsonCodec.name: OrjsonCodec,
+        MsgspecCodec.name: MsgspecCodec,
+        StdlibCodec.name: StdlibCodec,
+    }
+    _preference: tuple[str, ...] = (OrjsonCodec.name, MsgspecCodec.name, StdlibCodec.name)
+    _active: Codec | None = None
+
+    @staticmethod
+    def register(name: str, factory: Callable[[], Codec], override: bool = False) -> None:
+        """
+        Make a backend available to `use()`. `factory` may raise `ImportError` if its library is
+        not installed.
+        """
+        if name in JsonCodec._backends and not override:
+            raise ValueError(f"JSON codec '{name}' is already registered")
+        JsonCodec._backends[name] = factory
+
+    @staticmethod
+    def available() -> list[str]:
+        return list(JsonCodec._backends.keys())
+
+    @staticmethod
+    def use(name: str) -> Codec:
+        """
+        Switch to the named backend. Raises `ValueError` for an unknown name and `ImportError` if
+        the backend's library is not installed.
+        """
+        factory = JsonCodec._backends.get(name)
+        if factory is None:
+            raise ValueError(f"Unknown JSON codec: {name}")
+        JsonCodec._active = factory()
+        logger.debug("Using JSON codec %s", name)
+        return JsonCodec._active
+
+    @staticmethod
+    def get() -> Codec:
+        if JsonCodec._active is None:
+            for name in JsonCodec._preference:
+                try:
+                    return JsonCodec.use(name)
+                except ImportError:
+                    continue
+            JsonCodec._active = StdlibCodec()
+        return JsonCodec._active
+
+    @staticmethod
+    def reset() -> None:
+        """
+        Forget the current choice so the next `get()` picks the preferred backend again.
+        """
+        JsonCodec._active = None
@@ -0,0 +1,103 @@
+import itertools
+import logging
+import os
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=64)
+def bearer(api_key: str) -> str:
+    """
+    The `Authorization` header value for `api_key`, built once per key.
+    """
+    return f"Bearer {api_key}"
+
+class Credential(Protocol):
+    def authorization(self) -> str | None:
+        """
+        The `Authorization` header value for the next request, or `None` to send none.
+        """
+        ...
+
+class StaticKey:
+    def __init__(self, api_key: str):
+        self._header = bearer(api_key)
+
+    def authorization(self) -> str | None:
+        return self._header
+
+class EnvironmentKey:
+    """
+    Key read from an environment variable the first time it is needed; `refresh()` rereads it.
+    """
+    def __init__(self, variable: str):
+        self.variable = variable
+        self._header: str | None = None
+
+    def authorization(self) -> str | None:
+        if self._header is None:
+            api_key = os.environ.get(self.variable)
+            if api_key:
+                self._header = bearer(api_key)
+        return self._header
+
+    def refresh(self) -> None:
+        self._header = None
+
+class KeyPool:
+    """
+    Several keys used in turn, one per request.
+
+    Rate limits are per key (see `RateLimiter`), so a pool of `n` keys multiplies the request budget
+    of read-heavy sweeps such as inventory syncs and catalog fetches by `n`. Every key in a pool must
+    see the same resources, e.g. several API users of one account.
+    """
+    def __init__(self, api_keys: Iterable[str]):
+        self._headers = [bearer(api_key) for api_key in dict.fromkeys(api_keys)]
+        if not self._headers:
+            raise ValueError("A key pool needs at least one key.")
+        self._next = itertools.cycle(self._headers)
+
+    def __len__(self) -> int:
+        return len(self._headers)
+
+    def authorization(self) -> str | None:
+        return next(self._next)
+
+class Credentials:
+    """
+    Credential of each provider, used by every `Request.authorize()` call.
+
+    Defaults to the `<PROVIDER>_API_KEY` environment variable (`VULTR_API_KEY`), read once.
+    """
+    _credentials: dict[str, Credential] = {}
+
+    @staticmethod
+    def use(provider: str, credential: Credential | str) -> None:
+        """
+        Set the credential of `provider`; a `str` is taken as a single API key.
+        """
+        Credentials._credentials[provider] = StaticKey(credential) if isinstance(credential, str) else credential
+
+    @staticmethod
+    def get(provider: str) -> Credential:
+        credential = Credentials._credentials.get(provider)
+        if credential is None:
+            credential = EnvironmentKey(f"{provider.upper()}_API_KEY")
+            Credentials._credentials[provider] = credential
+        return credential
+
+    @staticmethod
+    def authorization(provider: str, api_key: str | None = None) -> str | None:
+        """
+        The `Authorization` header value for a request to `provider`; an explicit `api_key` wins.
+        """
+        if api_key is not None:
+            return bearer(api_key) if api_key else None
+        return Credentials.get(provider).authorization()
+
+    @staticmethod
+    def reset() -> None:
+        Credentials._credentials.clear()
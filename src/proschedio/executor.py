@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Iterable
+from urllib.parse import urlsplit
+
+from rustipy.result import Result
+
+from .request import ErrorResponse, Request, SuccessResponse
+
+logger = logging.getLogger(__name__)
+
+class RequestExecutor:
+    """
+    Runs prepared `Request` objects concurrently under a global in-flight cap and a per-provider cap.
+
+    Requests are pulled from the input lazily, so at most `max_in_flight` of them exist as running
+    tasks at any time no matter how large the iterable is. The per-provider cap is keyed by the
+    request's host, which is what each provider's API throttles on.
+    """
+    def __init__(self, max_in_flight: int = 32, max_per_provider: int = 16):
+        if max_in_flight < 1 or max_per_provider < 1:
+            raise ValueError("max_in_flight and max_per_provider must be at least 1.")
+
+        self._max_in_flight = max_in_flight
+        self._max_per_provider = max_per_provider
+        self._provider_slots: dict[str, asyncio.Semaphore] = {}
+
+    def _slot(self, request: Request) -> asyncio.Semaphore:
+        provider = urlsplit(request.url).netloc
+        slot = self._provider_slots.get(provider)
+        if slot is None:
+            slot = asyncio.Semaphore(self._max_per_provider)
+            self._provider_slots[provider] = slot
+        return slot
+
+    async def _run_one(
+        self, index: int, request: Request
+    ) -> tuple[int, Request, Result[SuccessResponse, ErrorResponse]]:
+        async with self._slot(request):
+            return index, request, await request.request()
+
+    async def _stream(
+        self, requests: Iterable[Request]
+    ) -> AsyncIterator[tuple[int, Request, Result[SuccessResponse, ErrorResponse]]]:
+        source = enumerate(requests)
+        pending: set[asyncio.Task[tuple[int, Request, Result[SuccessResponse, ErrorResponse]]]] = set()
+
+        def fill() -> None:
+            while len(pending) < self._max_in_flight:
+                item = next(source, None)
+                if item is None:
+                    return
+                pending.add(asyncio.ensure_future(self._run_one(*item)))
+
+        try:
+            fill()
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                pending.difference_update(done)
+                fill()
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                logger.debug("Cancelled %d in-flight requests", len(pending))
+
+    async def as_completed(
+        self, requests: Iterable[Request]
+    ) -> AsyncIterator[tuple[Request, Result[SuccessResponse, ErrorResponse]]]:
+        """
+        Yield `(request, result)` pairs in completion order.
+
+        Closing the iterator early (`aclose()`) cancels whatever is still in flight.
+        """
+        async for _, request, result in self._stream(requests):
+            yield request, result
+
+    async def gather(self, requests: Iterable[Request]) -> list[Result[SuccessResponse, ErrorResponse]]:
+        """
+        Run every request and return the results in input order.
+        """
+        results: dict[int, Result[SuccessResponse, ErrorResponse]] = {}
+        async for index, _, result in self._stream(requests):
+            results[index] = result
+        return [results[index] for index in range(len(results))]
@@ -0,0 +1,332 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable
+from http import HTTPMethod
+from typing import TYPE_CHECKING, Any, TypedDict, cast
+
+from rustipy.result import Err, Ok, Result
+
+from .codec import JsonCodec
+from .const import ProviderUrl
+from .pagination import MAX_PER_PAGE, PaginationError, paginate, request_pages
+from .request import ErrorResponse, Request, Url
+
+if TYPE_CHECKING:
+    import sqlite3
+
+logger = logging.getLogger(__name__)
+
+Item = dict[str, Any]
+
+# Kinds mirrored by default: route names of the account's list endpoints.
+DEFAULT_KINDS: tuple[str, ...] = (
+    "instances",
+    "bare_metals",
+    "block_storages",
+    "load_balancers",
+    "firewall_groups",
+    "reserved_ips",
+    "snapshots",
+    "backups",
+    "ssh_keys",
+    "vpcs",
+    "vpc2s",
+    "kubernetes_clusters",
+    "databases",
+    "object_storages",
+    "container_registries",
+    "cdn_pull_zones",
+    "cdn_push_zones",
+    "domains",
+    "domain_records",
+)
+# Kinds listed once per parent item rather than once per account, as kind -> (parent kind, placeholder).
+_NESTED: dict[str, tuple[str, str]] = {
+    "domain_records": ("domains", "dns-domain"),
+}
+# Kinds whose items are identified by a field other than `id`.
+_ID_FIELDS: dict[str, str] = {
+    "domains": "domain",
+}
+INDEXED_FIELDS: tuple[str, ...] = ("label", "tag", "region", "main_ip", "hostname", "parent")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS inventory (
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    parent TEXT,
+    body BLOB NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+"""
+
+class Delta(TypedDict):
+    added: list[str]
+    updated: list[str]
+    removed: list[str]
+
+def _index_values(field: str, item: Item, parent: str | None) -> Iterable[object]:
+    if field == "tag":
+        return item.get("tags") or ()
+    if field == "parent":
+        return (parent,) if parent is not None else ()
+    value = item.get(field)
+    return (value,) if value not in (None, "") else ()
+
+class Inventory:
+    """
+    Local mirror of the account's resources with secondary indexes, kept fresh by delta syncs.
+
+    `sync()` lists every mirrored kind through its list endpoint (concurrently, page by page) and
+    applies only what changed: indexes are touched for added, updated and removed items alone, and
+    with a `path` the same delta is written to an SQLite file that warms the next process instantly.
+    SQLite work runs in a worker thread, off the event loop; `load()` restores the mirror from the
+    file, and the first `sync()` does so if it was not called.
+    Queries such as `find(tag="web", region="ewr")` intersect index entries and never hit the API.
+
+    Items of nested kinds (DNS records) are indexed under `parent`, the id of the item they belong to.
+    They are listed per parent, at most `max_concurrency` parents at a time.
+    """
+    def __init__(
+        self,
+        provider: str = "vultr",
+        api_key: str | None = None,
+        kinds: Iterable[str] = DEFAULT_KINDS,
+        path: str | None = None,
+        max_concurrency: int = 16,
+    ):
+        self._provider_url = ProviderUrl(provider)
+        self._api_key = api_key
+        self._max_concurrency = max_concurrency
+        self._kinds = tuple(kinds)
+        for kind in self._kinds:
+            parent = _NESTED.get(kind)
+            if parent is not None and parent[0] not in self._kinds:
+                raise ValueError(f"Kind '{kind}' requires '{parent[0]}' to be mirrored too.")
+        self._path = path
+        self._connection: 'sqlite3.Connection | None' = None
+        self._db_lock = threading.Lock()
+        self._loaded = path is None
+
+        self._items: dict[str, dict[str, Item]] = {kind: {} for kind in self._kinds}
+        self._parents: dict[tuple[str, str], str] = {}
+        self._index: dict[str, dict[object, set[tuple[str, str]]]] = {field: {} for field in INDEXED_FIELDS}
+        self.synced_at: dict[str, float] = {}
+        self._sync_lock = asyncio.Lock()
+
+    # --- Queries ---
+    def get(self, kind: str, item_id: str) -> Item | None:
+        return self._items.get(kind, {}).get(item_id)
+
+    def all(self, kind: str) -> list[Item]:
+        return list(self._items.get(kind, {}).values())
+
+    def count(self, kind: str | None = None) -> int:
+        if kind is not None:
+            return len(self._items.get(kind, {}))
+        return sum(len(items) for items in self._items.values())
+
+    def find(self, kind: str | None = None, **filters: object) -> list[Item]:
+        """
+        Items matching every filter, e.g. `find("instances", tag="web", region="ewr")`.
+
+        Filters are the `INDEXED_FIELDS`; `tag` matches any of an item's tags. With no filters,
+        every item of `kind` is returned.
+        """
+        unknown = set(filters) - set(INDEXED_FIELDS)
+        if unknown:
+            raise ValueError(f"Cannot filter on {sorted(unknown)}; indexed fields are {list(INDEXED_FIELDS)}")
+        if not filters:
+            return self.all(kind) if kind is not None else [item for items in self._items.values() for item in items.values()]
+
+        matches: set[tuple[str, str]] | None = None
+        for field, value in sorted(filters.items(), key=lambda entry: len(self._index[entry[0]].get(entry[1], ()))):
+            keys = self._index[field].get(value, set())
+            matches = set(keys) if matches is None else matches & keys
+            if not matches:
+                return []
+        assert matches is not None
+        return [self._items[k][i] for k, i in matches if kind is None or k == kind]
+
+    # --- Indexing ---
+    def _add_to_index(self, kind: str, item_id: str, item: Item) -> None:
+        parent = self._parents.get((kind, item_id))
+        for field in INDEXED_FIELDS:
+            for value in _index_values(field, item, parent):
+                self._index[field].setdefault(value, set()).add((kind, item_id))
+
+    def _remove_from_index(self, kind: str, item_id: str, item: Item) -> None:
+        parent = self._parents.get((kind, item_id))
+        for field in INDEXED_FIELDS:
+            for value in _index_values(field, item, parent):
+                keys = self._index[field].get(value)
+                if keys is not None:
+                    keys.discard((kind, item_id))
+                    if not keys:
+                        del self._index[field][value]
+
+    def _apply(self, kind: str, listed: dict[str, tuple[Item, str | None]], scope: set[str] | None = None) -> Delta:
+        """
+        Replace the items of `kind` with `listed` (id -> (item, parent)), touching only what changed.
+        `scope` limits removals to items of those parents, for partially listed nested kinds.
+        """
+        current = self._items[kind]
+        delta = Delta(added=[], updated=[], removed=[])
+        for item_id, (item, parent) in listed.items():
+            old = current.get(item_id)
+            if old == item and self._parents.get((kind, item_id)) == parent:
+                continue
+            if old is not None:
+                self._remove_from_index(kind, item_id, old)
+            if parent is None:
+                self._parents.pop((kind, item_id), None)
+            else:
+                self._parents[(kind, item_id)] = parent
+            current[item_id] = item
+            self._add_to_index(kind, item_id, item)
+            (delta["updated"] if old is not None else delta["added"]).append(item_id)
+
+        for item_id in [item_id for item_id in current if item_id not in listed]:
+            if scope is not None and self._parents.get((kind, item_id)) not in scope:
+                continue
+            self._remove_from_index(kind, item_id, current.pop(item_id))
+            self._parents.pop((kind, item_id), None)
+            delta["removed"].append(item_id)
+        return delta
+
+    # --- Sync ---
+    def _request(self, url: Url) -> Request:
+        return Request(url).set_method(HTTPMethod.GET).authorize(self._provider_url.provider, self._api_key)
+
+    async def _list(self, url: Url) -> list[Item]:
+        return [cast(Item, item) async for item in paginate(request_pages(lambda: self._request(url)), per_page=MAX_PER_PAGE)]
+
+    def _listed(self, kind: str, items: list[Item], parent: str | None) -> dict[str, tuple[Item, str | None]]:
+        id_field = _ID_FIELDS.get(kind, "id")
+        return {str(item[id_field]): (item, parent) for item in items}
+
+    async def _sync_kind(self, kind: str) -> Result[Delta, ErrorResponse]:
+        nested = _NESTED.get(kind)
+        try:
+            if nested is None:
+                listed = self._listed(kind, await self._list(self._provider_url.route(kind)), None)
+                delta = self._apply(kind, listed)
+            else:
+                parent_kind, placeholder = nested
+                parents = list(self._items[parent_kind])
+                url = self._provider_url.route(kind)
+                slots = asyncio.Semaphore(self._max_concurrency)
+
+                async def children(parent: str) -> list[Item]:
+                    async with slots:
+                        return await self._list(url.assign(placeholder, parent))
+
+                pages = await asyncio.gather(*(children(parent) for parent in parents), return_exceptions=True)
+                listed: dict[str, tuple[Item, str | None]] = {}
+                scope: set[str] = set()
+                for parent, page in zip(parents, pages):
+                    if isinstance(page, PaginationError):
+                        logger.warning("Inventory sync of %s under %s failed: %s", kind, parent, page)
+                        continue
+                    if isinstance(page, BaseException):
+                        raise page
+                    scope.add(parent)
+                    listed.update(self._listed(kind, page, parent))
+                # Children of parents that no longer exist go too.
+                scope.update(parent for key, parent in self._parents.items() if key[0] == kind and parent not in self._items[parent_kind])
+                delta = self._apply(kind, listed, scope)
+        except PaginationError as error:
+            logger.warning("Inventory sync of %s failed: %s", kind, error)
+            return Err(error.response)
+
+        self.synced_at[kind] = time.time()
+        if delta["added"] or delta["updated"] or delta["removed"]:
+            logger.info("Inventory %s: +%d ~%d -%d", kind, len(delta["added"]), len(delta["updated"]), len(delta["removed"]))
+            await self._persist(kind, delta)
+        return Ok(delta)
+
+    async def sync(self, kinds: Iterable[str] | None = None) -> dict[str, Result[Delta, ErrorResponse]]:
+        """
+        Refresh the given kinds (default: all mirrored kinds) and return each kind's delta. A kind
+        whose listing fails keeps its previous contents.
+        """
+        selected = [kind for kind in self._kinds if kinds is None or kind in set(kinds)]
+        await self.load()
+        async with self._sync_lock:
+            top = [kind for kind in selected if kind not in _NESTED]
+            nested = [kind for kind in selected if kind in _NESTED]
+            results = dict(zip(top, await asyncio.gather(*(self._sync_kind(kind) for kind in top))))
+            # Nested kinds are listed per parent, so they run once their parents are fresh.
+            results.update(zip(nested, await asyncio.gather(*(self._sync_kind(kind) for kind in nested))))
+        return results
+
+    async def run(self, interval: float = 60.0, kinds: Iterable[str] | None = None) -> None:
+        """
+        Sync every `interval` seconds until cancelled, e.g. `asyncio.create_task(inventory.run())`.
+        """
+        selected = list(kinds) if kinds is not None else None
+        while True:
+            started = time.monotonic()
+            await self.sync(selected)
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    # --- Persistence ---
+    def _db(self) -> 'sqlite3.Connection':
+        import sqlite3
+
+        if self._connection is None:
+            assert self._path is not None
+            if self._path != ":memory:":
+                os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+            self._connection = sqlite3.connect(self._path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+        return self._connection
+
+    async def load(self) -> int:
+        """
+        Restore the mirror from the SQLite file at `path`, once, and return the number of items
+        restored.
+        """
+        async with self._sync_lock:
+            if self._loaded:
+                return 0
+            rows = await asyncio.to_thread(self._read)
+            for kind, item_id, parent, item in rows:
+                if parent is not None:
+                    self._parents[(kind, item_id)] = parent
+                self._items[kind][item_id] = item
+                self._add_to_index(kind, item_id, item)
+            self._loaded = True
+        logger.debug("Loaded %d inventory items from %s", len(rows), self._path)
+        return len(rows)
+
+    def _read(self) -> list[tuple[str, str, str | None, Item]]:
+        codec = JsonCodec.get()
+        with self._db_lock:
+            rows = self._db().execute("SELECT kind, id, parent, body FROM inventory").fetchall()
+        return [(kind, item_id, parent, cast(Item, codec.decode(body))) for kind, item_id, parent, body in rows if kind in self._items]
+
+    async def _persist(self, kind: str, delta: Delta) -> None:
+        if self._path is None:
+            return
+        # Items are replaced rather than mutated by later syncs, so the thread can encode them.
+        changed = [(kind, item_id, self._parents.get((kind, item_id)), self._items[kind][item_id]) for item_id in [*delta["added"], *delta["updated"]]]
+        removed = [(kind, item_id) for item_id in delta["removed"]]
+        await asyncio.to_thread(self._write, changed, removed)
+
+    def _write(self, changed: list[tuple[str, str, str | None, Item]], removed: list[tuple[str, str]]) -> None:
+        codec = JsonCodec.get()
+        rows = [(kind, item_id, parent, codec.encode(item)) for kind, item_id, parent, item in changed]
+        with self._db_lock, self._db() as db:
+            db.executemany("INSERT OR REPLACE INTO inventory VALUES (?, ?, ?, ?)", rows)
+            db.executemany("DELETE FROM inventory WHERE kind = ? AND id = ?", removed)
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
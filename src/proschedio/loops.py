@@ -0,0 +1,36 @@
+import asyncio
+import logging
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class LoopLocal(dict[asyncio.AbstractEventLoop, T]):
+    """
+    Per-event-loop state (sessions, rate-limit buckets, shared watchers), keyed by loop.
+
+    A `WeakKeyDictionary` cannot be used here: the values reference their loop (a session's
+    connector, a task), so the key would never be collected and every dead loop would keep its
+    state alive. Entries of closed loops are evicted instead whenever a new entry is added. State
+    that holds resources (sessions) should still be released explicitly before the loop closes.
+    """
+    def __setitem__(self, loop: asyncio.AbstractEventLoop, value: T) -> None:
+        self.evict_closed()
+        super().__setitem__(loop, value)
+
+    def setdefault(self, loop: asyncio.AbstractEventLoop, default: T) -> T:  # type: ignore[override]
+        if loop not in self:
+            self[loop] = default
+        return self[loop]
+
+    def evict_closed(self) -> int:
+        """
+        Drop the entries of closed loops and return how many there were.
+        """
+        closed = [loop for loop in self if loop.is_closed()]
+        for loop in closed:
+            del self[loop]
+        if closed:
+            logger.debug("Dropped state of %d closed event loops", len(closed))
+        return len(closed)
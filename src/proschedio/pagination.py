@@ -0,0 +1,126 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Protocol
+
+from rustipy.result import Result
+
+from .request import ErrorResponse, MetaInfo, Request, SuccessResponse
+
+logger = logging.getLogger(__name__)
+
+MAX_PER_PAGE = 500
+
+class PageFetcher(Protocol):
+    """
+    Anything that fetches one page given `per_page` and `cursor` keyword arguments, e.g.
+    `vultr.apis.billings.get_billing_history` or `functools.partial(list_domain_records, "example.com")`.
+    """
+    def __call__(self, *, per_page: int, cursor: str | None) -> Awaitable[Result[SuccessResponse, ErrorResponse]]: ...
+
+class PaginationError(Exception):
+    """
+    Raised when a page request fails while iterating.
+    """
+    def __init__(self, response: ErrorResponse):
+        super().__init__(f"Failed to fetch page (status {response['status_code']}): {response['error']}")
+        self.response = response
+
+def next_cursor(meta: MetaInfo | None) -> str | None:
+    """
+    Get the cursor of the next page from a response's `meta`, or `None` on the last page.
+    """
+    if not meta:
+        return None
+    links = meta.get("links") or {}
+    return links.get("next") or None
+
+def page_items(data: dict[str, object] | list[object] | None) -> list[object]:
+    """
+    Get the list of items from a page's `data`.
+
+    `Request.request()` already unwraps single-key bodies such as `{"plans": [...]}`; for bodies with
+    extra keys the single list-valued entry is used.
+    """
+    if data is None:
+        return []
+    if isinstance(data, list):
+        return data
+
+    lists = [value for value in data.values() if isinstance(value, list)]
+    if len(lists) != 1:
+        raise TypeError(f"Cannot find the item list in page data with keys {list(data)}")
+    return lists[0]
+
+async def paginate(
+    fetch_page: PageFetcher,
+    per_page: int = MAX_PER_PAGE,
+    prefetch: bool = True,
+) -> AsyncIterator[object]:
+    """
+    Iterate over every item of a cursor-paginated list endpoint, following `meta.links.next`.
+
+    With `prefetch`, the next page is requested as soon as the current one arrives, so the network
+    round trip overlaps with the caller consuming items. At most two pages are held in memory.
+
+    Raises `PaginationError` if a page request fails.
+    """
+    async def fetch(cursor: str | None) -> Result[SuccessResponse, ErrorResponse]:
+        return await fetch_page(per_page=per_page, cursor=cursor)
+
+    pending: asyncio.Future[Result[SuccessResponse, ErrorResponse]] | None = asyncio.ensure_future(fetch(None))
+    seen: set[str] = set()
+    try:
+        while pending is not None:
+            result = await pending
+            pending = None
+            if result.is_err():
+                raise PaginationError(result.unwrap_err())
+
+            page = result.unwrap()
+            cursor = next_cursor(page["meta"])
+            if cursor is not None and cursor in seen:
+                logger.warning("Pagination cursor %s repeated; stopping", cursor)
+                cursor = None
+
+            if cursor is not None:
+                seen.add(cursor)
+                if prefetch:
+                    pending = asyncio.ensure_future(fetch(cursor))
+
+            for item in page_items(page["data"]):
+                yield item
+
+            if cursor is not None and pending is None:
+                pending = asyncio.ensure_future(fetch(cursor))
+    finally:
+        if pending is not None:
+            # Wait for the abandoned prefetch so it neither outlives the iteration nor leaves an
+            # exception unretrieved.
+            pending.cancel()
+            try:
+                await pending
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if task is not None and task.cancelling():
+                    raise
+            except Exception as error:
+                logger.debug("Discarded prefetched page: %s", error)
+
+def request_pages(factory: Callable[[], Request]) -> PageFetcher:
+    """
+    Adapt a `Request` factory to a `PageFetcher` by adding `per_page`/`cursor` params to each request.
+
+    ```python
+    url = provider_url.get_url_instances()
+    async for instance in paginate(request_pages(lambda: Request(url).set_method(HTTPMethod.GET))):
+        ...
+    ```
+    """
+    async def fetch(*, per_page: int, cursor: str | None) -> Result[SuccessResponse, ErrorResponse]:
+        request = factory().add_param("per_page", per_page)
+        if cursor is not None:
+            request.add_param("cursor", cursor)
+        return await request.request()
+
+    return fetch
@@ -0,0 +1,506 @@
+import asyncio
+import logging
+import time
+from collections.abc import Iterable, Mapping
+from http import HTTPMethod
+from typing import Any, Literal, cast
+
+from rustipy.result import Err, Ok, Result
+
+from .const import ProviderUrl
+from .pagination import MAX_PER_PAGE, PaginationError, paginate, request_pages
+from .readiness import ReadinessWatcher
+from .request import ErrorResponse, Request, Url
+
+logger = logging.getLogger(__name__)
+
+Item = dict[str, Any]
+Action = Literal["create", "update", "delete", "noop"]
+
+# Marks a planned value that depends on a resource not created yet.
+_UNKNOWN = object()
+
+class Ref:
+    """
+    Reference to an attribute of another resource in the same stack (by default its id, e.g. the
+    `domain` of a DNS domain), resolved once that resource exists. Using a `Ref` also makes the
+    referring resource depend on it.
+    """
+    __slots__ = ("name", "attribute")
+
+    def __init__(self, name: str, attribute: str | None = None):
+        self.name = name
+        self.attribute = attribute
+
+    def __repr__(self) -> str:
+        return f"Ref({self.name!r}, {self.attribute!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Ref) and (other.name, other.attribute) == (self.name, self.attribute)
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.attribute))
+
+class Kind:
+    """
+    How one resource type maps onto the API.
+
+    - `collection`/`item`: Route names of the list/create and get/update/delete endpoints.
+    - `placeholder`: The item route's placeholder for the resource id.
+    - `identity`: Fields that match a desired resource to a live one.
+    - `parent`: For nested kinds, the collection route's placeholder for the parent id.
+    - `immutable`: Fields that cannot be changed after creation; differences are reported, not applied.
+    - `updatable`: Whether the API can update the resource at all.
+    """
+    def __init__(
+        self,
+        collection: str,
+        item: str,
+        placeholder: str,
+        identity: tuple[str, ...],
+        parent: str | None = None,
+        id_field: str = "id",
+        update_method: HTTPMethod = HTTPMethod.PATCH,
+        immutable: frozenset[str] = frozenset(),
+        updatable: bool = True,
+        wait_ready: bool = False,
+    ):
+        self.collection = collection
+        self.item = item
+        self.placeholder = placeholder
+        self.identity = identity
+        self.parent = parent
+        self.id_field = id_field
+        self.update_method = update_method
+        self.immutable = immutable
+        self.updatable = updatable
+        self.wait_ready = wait_ready
+
+KINDS: dict[str, Kind] = {
+    "vpc": Kind("vpcs", "vpc_by_id", "vpc-id", ("description",), update_method=HTTPMethod.PUT,
+                immutable=frozenset({"region", "v4_subnet", "v4_subnet_mask"})),
+    "vpc2": Kind("vpc2s", "vpc2_by_id", "vpc-id", ("description",), update_method=HTTPMethod.PUT,
+                 immutable=frozenset({"region", "ip_type", "ip_block", "prefix_length"})),
+    "firewall_group": Kind("firewall_groups", "firewall_group_by_id", "firewall-group-id", ("description",),
+                           update_method=HTTPMethod.PUT),
+    "firewall_rule": Kind("firewall_group_rules", "firewall_group_rule_by_id", "firewall-rule-id",
+                          ("ip_type", "protocol", "subnet", "subnet_size", "port"), parent="firewall-group-id", updatable=False),
+    "instance": Kind("instances", "instance_by_id", "instance-id", ("label",),
+                     immutable=frozenset({"region", "hostname", "os_id", "app_id", "image_id", "snapshot_id", "iso_id"}), wait_ready=True),
+    "bare_metal": Kind("bare_metals", "bare_metal_by_id", "baremetal-id", ("label",),
+                       immutable=frozenset({"region", "plan", "hostname"}), wait_ready=True),
+    "block_storage": Kind("block_storages", "block_storage_by_id", "block-id", ("label",), immutable=frozenset({"region", "block_type"})),
+    "reserved_ip": Kind("reserved_ips", "reserved_ip_by_id", "reserved-ip", ("label",), immutable=frozenset({"region", "ip_type"})),
+    "ssh_key": Kind("ssh_keys", "ssh_key_by_id", "ssh-key-id", ("name",)),
+    "load_balancer": Kind("load_balancers", "load_balancer_by_id", "load-balancer-id", ("label",), immutable=frozenset({"region"})),
+    "domain": Kind("domains", "domain_by_name", "dns-domain", ("domain",), id_field="domain", update_method=HTTPMethod.PUT,
+                   immutable=frozenset({"ip"})),
+    "dns_record": Kind("domain_records", "domain_record_by_id", "record-id", ("type", "name"), parent="dns-domain",
+                       immutable=frozenset({"type"})),
+}
+
+class Desired:
+    """
+    One resource as it should exist: `Desired("instance", "web-1", {"label": "web-1", ...})`.
+
+    `name` is the resource's key within the stack, used by `Ref` and `depends_on`. Nested kinds
+    (firewall rules, DNS records) need the `parent` id, literally or as a `Ref`. With `absent`, the
+    resource is deleted if it exists.
+    """
+    def __init__(
+        self,
+        kind: str,
+        name: str,
+        properties: Mapping[str, Any] | None = None,
+        parent: str | Ref | None = None,
+        depends_on: Iterable[str] = (),
+        absent: bool = False,
+    ):
+        if kind not in KINDS:
+            raise ValueError(f"Unknown resource kind: {kind}")
+        if (KINDS[kind].parent is not None) != (parent is not None):
+            raise ValueError(f"Resource '{name}' of kind '{kind}' {'needs' if KINDS[kind].parent else 'takes no'} parent")
+        self.kind = kind
+        self.name = name
+        self.properties = dict(properties or {})
+        self.parent = parent
+        self.depends_on = frozenset(depends_on)
+        self.absent = absent
+
+        missing = [field for field in KINDS[kind].identity if field not in self.properties]
+        if missing:
+            raise ValueError(f"Resource '{name}' is missing identity fields {missing}")
+
+    def references(self) -> set[str]:
+        found: set[str] = set()
+
+        def walk(value: Any) -> None:
+            if isinstance(value, Ref):
+                found.add(value.name)
+            elif isinstance(value, Mapping):
+                for inner in cast(Mapping[str, Any], value).values():
+                    walk(inner)
+            elif isinstance(value, (list, tuple)):
+                for inner in cast(Iterable[Any], value):
+                    walk(inner)
+
+        walk(self.properties)
+        walk(self.parent)
+        return found | self.depends_on
+
+class Step:
+    """
+    What applying a plan does to one resource. `changes` maps each field to `(live, desired)`;
+    `ignored` lists immutable fields that differ and are left alone.
+    """
+    __slots__ = ("desired", "action", "live", "changes", "ignored")
+
+    def __init__(self, desired: Desired, action: Action, live: Item | None, changes: dict[str, tuple[Any, Any]], ignored: list[str]):
+        self.desired = desired
+        self.action = action
+        self.live = live
+        self.changes = changes
+        self.ignored = ignored
+
+    def __repr__(self) -> str:
+        return f"Step({self.desired.name!r}, {self.action!r})"
+
+def _contains(value: Any, wanted: Any) -> bool:
+    if isinstance(value, Mapping):
+        return any(_contains(inner, wanted) for inner in cast(Mapping[str, Any], value).values())
+    if isinstance(value, (list, tuple)):
+        return any(_contains(inner, wanted) for inner in cast(Iterable[Any], value))
+    return value == wanted
+
+def _execution_order(steps: Mapping[str, Step], dependencies: Mapping[str, frozenset[str]]) -> dict[str, frozenset[str]]:
+    """
+    What each step waits for. Creates and updates wait for what they reference. A delete waits for
+    every step that references the deleted resource, and for every update that detaches it (whose
+    changed fields hold its id), so a resource is never deleted while something still uses it.
+    Deletes of a dependency chain thus run in reverse. A delete does not wait for what it references.
+    """
+    waits: dict[str, set[str]] = {name: set() for name in dependencies}
+    for name, references in dependencies.items():
+        deleting = steps[name].action == "delete"
+        for reference in references:
+            if steps[reference].action == "delete":
+                waits[reference].add(name)
+            elif not deleting:
+                waits[name].add(reference)
+
+    for name, step in steps.items():
+        if step.action != "delete" or step.live is None:
+            continue
+        live_id = step.live.get(KINDS[step.desired.kind].id_field)
+        for other, update in steps.items():
+            if update.action == "update" and any(_contains(live, live_id) for live, _ in update.changes.values()):
+                waits[name].add(other)
+    return {name: frozenset(names) for name, names in waits.items()}
+
+class Plan:
+    """
+    The steps that bring live state to the desired state, and the dependency graph between them.
+    `dependencies` holds what each resource references; `execution` what each step waits for when
+    applied (see `_execution_order()`).
+    """
+    def __init__(self, steps: dict[str, Step], dependencies: dict[str, frozenset[str]]):
+        self.steps = steps
+        self.dependencies = dependencies
+        self.execution = _execution_order(steps, dependencies)
+
+    @property
+    def has_changes(self) -> bool:
+        return any(step.action != "noop" for step in self.steps.values())
+
+    def levels(self) -> list[list[str]]:
+        """
+        Steps grouped by depth in the graph; each level can run once the previous ones finished,
+        and the number of levels is the length of the critical path.
+        """
+        depth: dict[str, int] = {}
+        for name in _topological_order(self.execution):
+            depth[name] = 1 + max((depth[dependency] for dependency in self.execution[name]), default=-1)
+        levels: list[list[str]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+        for name, level in depth.items():
+            levels[level].append(name)
+        return levels
+
+    def describe(self) -> str:
+        symbols = {"create": "+", "update": "~", "delete": "-", "noop": " "}
+        lines: list[str] = []
+        for name in _topological_order(self.execution):
+            step = self.steps[name]
+            line = f"{symbols[step.action]} {step.desired.kind} {name}"
+            if step.changes:
+                line += f" ({', '.join(sorted(step.changes))})"
+            if step.ignored:
+                line += f" [immutable, not applied: {', '.join(sorted(step.ignored))}]"
+            lines.append(line)
+        return "\n".join(lines)
+
+class ApplyReport:
+    def __init__(self, results: dict[str, Result[Item | None, ErrorResponse]], elapsed: float):
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return all(result.is_ok() for result in self.results.values())
+
+    def failed(self) -> dict[str, ErrorResponse]:
+        return {name: result.unwrap_err() for name, result in self.results.items() if result.is_err()}
+
+def _topological_order(dependencies: Mapping[str, frozenset[str]]) -> list[str]:
+    """
+    Kahn's algorithm; raises `ValueError` on a cycle.
+    """
+    remaining = {name: set(deps) for name, deps in dependencies.items()}
+    dependents: dict[str, list[str]] = {name: [] for name in dependencies}
+    for name, deps in dependencies.items():
+        for dependency in deps:
+            dependents[dependency].append(name)
+
+    ready = [name for name, deps in remaining.items() if not deps]
+    order: list[str] = []
+    while ready:
+        name = ready.pop()
+        order.append(name)
+        for dependent in dependents[name]:
+            remaining[dependent].discard(name)
+            if not remaining[dependent]:
+                ready.append(dependent)
+    if len(order) != len(dependencies):
+        raise ValueError(f"Dependency cycle between {sorted(name for name, deps in remaining.items() if deps)}")
+    return order
+
+class Planner:
+    """
+    Diffs `Desired` resources against live state and applies the difference as a parallel DAG.
+
+    ```python
+    planner = Planner("vultr")
+    plan = (await planner.plan([
+        Desired("vpc", "net", {"description": "app", "region": "ewr"}),
+        Desired("instance", "web", {"label": "web", "region": "ewr", "plan": "vc2-1c-1gb", "attach_vpc": [Ref("net")]}),
+    ])).unwrap()
+    print(plan.describe())
+    report = await planner.apply(plan)
+    ```
+
+    Independent steps run concurrently (up to `max_concurrency`, and under the shared rate limiter),
+    so a stack takes about as long as its longest dependency chain.
+    """
+    def __init__(self, provider: str = "vultr", api_key: str | None = None):
+        self._provider = provider
+        self._provider_url = ProviderUrl(provider)
+        self._api_key = api_key
+
+    def _request(self, url: Url, method: HTTPMethod) -> Request:
+        return Request(url).set_method(method).authorize(self._provider, self._api_key)
+
+    def _collection_url(self, kind: Kind, parent: str | None) -> Url:
+        url = self._provider_url.route(kind.collection)
+        if kind.parent is not None and parent is not None:
+            url = url.assign(kind.parent, parent)
+        return url
+
+    def _item_url(self, kind: Kind, item_id: str, parent: str | None) -> Url:
+        url = self._provider_url.route(kind.item).assign(kind.placeholder, item_id)
+        if kind.parent is not None and parent is not None:
+            url = url.assign(kind.parent, parent)
+        return url
+
+    async def _list(self, kind: Kind, parent: str | None) -> list[Item]:
+        url = self._collection_url(kind, parent)
+        return [cast(Item, item) async for item in paginate(request_pages(lambda: self._request(url, HTTPMethod.GET)), per_page=MAX_PER_PAGE)]
+
+    async def plan(self, resources: Iterable[Desired]) -> Result[Plan, ErrorResponse]:
+        """
+        Build the plan. Raises `ValueError` for duplicate names, unknown references and cycles.
+        """
+        desired: dict[str, Desired] = {}
+        for resource in resources:
+            if resource.name in desired:
+                raise ValueError(f"Duplicate resource name: {resource.name}")
+            desired[resource.name] = resource
+
+        dependencies: dict[str, frozenset[str]] = {}
+        for name, resource in desired.items():
+            references = resource.references()
+            unknown = references - desired.keys()
+            if unknown:
+                raise ValueError(f"Resource '{name}' references unknown resources {sorted(unknown)}")
+            dependencies[name] = frozenset(references)
+        order = _topological_order(dependencies)
+
+        # Top-level collections are listed once each, concurrently.
+        top_kinds = sorted({resource.kind for resource in desired.values() if KINDS[resource.kind].parent is None})
+        try:
+            listings = await asyncio.gather(*(self._list(KINDS[kind], None) for kind in top_kinds))
+        except PaginationError as error:
+            return Err(error.response)
+        live_by_kind: dict[tuple[str, str | None], list[Item]] = {(kind, None): items for kind, items in zip(top_kinds, listings)}
+
+        steps: dict[str, Step] = {}
+        matched: dict[str, Item] = {}
+        for name in order:
+            resource = desired[name]
+            kind = KINDS[resource.kind]
+
+            live_items: list[Item] = []
+            parent: str | None = None
+            if kind.parent is not None:
+                parent = self._resolve_at_plan(resource.parent, matched, steps)
+                if parent is not None:
+                    key = (resource.kind, parent)
+                    if key not in live_by_kind:
+                        try:
+                            live_by_kind[key] = await self._list(kind, parent)
+                        except PaginationError as error:
+                            return Err(error.response)
+                    live_items = live_by_kind[key]
+            else:
+                live_items = live_by_kind[(resource.kind, None)]
+
+            live = next(
+                (item for item in live_items if all(item.get(field) == resource.properties[field] for field in kind.identity)),
+                None,
+            )
+            steps[name] = self._diff(resource, kind, live, matched, steps)
+            if live is not None:
+                matched[name] = live
+
+        return Ok(Plan(steps, dependencies))
+
+    def _resolve_at_plan(self, value: Any, matched: Mapping[str, Item], steps: Mapping[str, Step]) -> Any:
+        """
+        Resolve `Ref`s whose target already exists and is not recreated; `None` if not yet known.
+        """
+        if isinstance(value, Ref):
+            step = steps.get(value.name)
+            target = matched.get(value.name)
+            if target is None or step is None or step.action in ("create", "delete"):
+                return None
+            return target.get(value.attribute or KINDS[step.desired.kind].id_field)
+        return value
+
+    def _diff(self, resource: Desired, kind: Kind, live: Item | None, matched: Mapping[str, Item], steps: Mapping[str, Step]) -> Step:
+        if resource.absent:
+            return Step(resource, "delete" if live is not None else "noop", live, {}, [])
+        if live is None:
+            return Step(resource, "create", None, {}, [])
+
+        changes: dict[str, tuple[Any, Any]] = {}
+        ignored: list[str] = []
+        for field, wanted in resource.properties.items():
+            # Write-only fields (passwords, user data, ...) are not echoed back and cannot be compared.
+            if field not in live:
+                continue
+            value = self._resolve_deep(wanted, matched, steps)
+            if value is _UNKNOWN or live[field] != value:
+                if field in kind.immutable or not kind.updatable:
+                    ignored.append(field)
+                else:
+                    changes[field] = (live[field], wanted)
+        return Step(resource, "update" if changes else "noop", live, changes, ignored)
+
+    def _resolve_deep(self, value: Any, matched: Mapping[str, Item], steps: Mapping[str, Step]) -> Any:
+        if isinstance(value, Ref):
+            resolved = self._resolve_at_plan(value, matched, steps)
+            return _UNKNOWN if resolved is None else resolved
+        if isinstance(value, list):
+            items = [self._resolve_deep(inner, matched, steps) for inner in cast(list[Any], value)]
+            return _UNKNOWN if any(item is _UNKNOWN for item in items) else items
+        return value
+
+    async def apply(self, plan: Plan, max_concurrency: int = 16, wait_ready: bool = True) -> ApplyReport:
+        """
+        Execute the plan. Each step starts as soon as everything it waits for (`Plan.execution`) has
+        finished; if a step fails, the steps waiting for it are skipped and reported as failed.
+        """
+        started = time.monotonic()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        resolved: dict[str, Item] = {name: step.live for name, step in plan.steps.items() if step.live is not None}
+        results: dict[str, Result[Item | None, ErrorResponse]] = {}
+        tasks: dict[str, asyncio.Task[bool]] = {}
+
+        async def run(name: str) -> bool:
+            dependencies = plan.execution[name]
+            outcomes = await asyncio.gather(*(tasks[dependency] for dependency in dependencies))
+            if not all(outcomes):
+                failed = sorted(dependency for dependency, outcome in zip(dependencies, outcomes) if not outcome)
+                results[name] = Err(ErrorResponse(status_code=0, error=f"Skipped: dependency {', '.join(failed)} failed"))
+                return False
+            async with semaphore:
+                result = await self._execute(plan, plan.steps[name], resolved, wait_ready)
+            results[name] = result
+            if result.is_ok() and result.unwrap() is not None:
+                resolved[name] = cast(Item, result.unwrap())
+            return result.is_ok()
+
+        for name in _topological_order(plan.execution):
+            tasks[name] = asyncio.ensure_future(run(name))
+        await asyncio.gather(*tasks.values())
+
+        report = ApplyReport(results, time.monotonic() - started)
+        logger.info("Applied %d steps in %.2fs (%d failed)", len(results), report.elapsed, len(report.failed()))
+        return report
+
+    async def _execute(self, plan: Plan, step: Step, resolved: Mapping[str, Item], wait_ready: bool) -> Result[Item | None, ErrorResponse]:
+        resource = step.desired
+        kind = KINDS[resource.kind]
+
+        def resolve(value: Any) -> Any:
+            if isinstance(value, Ref):
+                target = resolved.get(value.name)
+                attribute = value.attribute or KINDS[plan.steps[value.name].desired.kind].id_field
+                if target is None or attribute not in target:
+                    raise LookupError(f"Cannot resolve {value!r} for '{resource.name}'")
+                return target[attribute]
+            if isinstance(value, Mapping):
+                return {key: resolve(inner) for key, inner in cast(Mapping[str, Any], value).items()}
+            if isinstance(value, list):
+                return [resolve(inner) for inner in cast(list[Any], value)]
+            return value
+
+        if step.action == "noop":
+            return Ok(step.live)
+        try:
+            parent = resolve(resource.parent)
+        except LookupError as error:
+            return Err(ErrorResponse(status_code=0, error=str(error)))
+
+        if step.action == "delete":
+            assert step.live is not None
+            result = await self._request(self._item_url(kind, str(step.live[kind.id_field]), parent), HTTPMethod.DELETE).request()
+            return Ok(None) if result.is_ok() else Err(result.unwrap_err())
+
+        try:
+            if step.action == "create":
+                body = resolve(resource.properties)
+            else:
+                body = {field: resolve(resource.properties[field]) for field in step.changes}
+        except LookupError as error:
+            return Err(ErrorResponse(status_code=0, error=str(error)))
+
+        if step.action == "create":
+            result = await self._request(self._collection_url(kind, parent), HTTPMethod.POST).set_body(body).request()
+            if result.is_err():
+                return Err(result.unwrap_err())
+            item = cast(Item, result.unwrap()["data"] or {})
+            if wait_ready and kind.wait_ready and kind.id_field in item:
+                try:
+                    item = await ReadinessWatcher.shared(self._provider, self._api_key).wait(str(item[kind.id_field]), kind.collection)
+                except TimeoutError as error:
+                    return Err(ErrorResponse(status_code=0, error=str(error)))
+            logger.info("Created %s %s", resource.kind, resource.name)
+            return Ok(item)
+
+        assert step.live is not None
+        url = self._item_url(kind, str(step.live[kind.id_field]), parent)
+        result = await self._request(url, kind.update_method).set_body(body).request()
+        if result.is_err():
+            return Err(result.unwrap_err())
+        logger.info("Updated %s %s (%s)", resource.kind, resource.name, ", ".join(sorted(body)))
+        return Ok({**step.live, **body})
+
@@ -0,0 +1,165 @@
+import asyncio
+import logging
+import time
+from http import HTTPMethod
+
+from rustipy.result import Result
+
+from .const import ProviderUrl
+from .loops import LoopLocal
+from .request import ErrorResponse, Request, SuccessResponse
+
+logger = logging.getLogger(__name__)
+
+class _ZoneQueue:
+    __slots__ = ("pending", "first_at", "last_at", "dispatched_at", "wake", "task")
+
+    def __init__(self) -> None:
+        # Shared by every purge request waiting for the next dispatch of this zone.
+        self.pending: asyncio.Future[Result[SuccessResponse, ErrorResponse]] | None = None
+        self.first_at = 0.0
+        self.last_at = 0.0
+        self.dispatched_at = float("-inf")
+        self.wake = asyncio.Event()
+        self.task: asyncio.Task[None] | None = None
+
+class PurgeCoordinator:
+    """
+    Debounces and coalesces pull zone cache purges, so a burst of requests costs one API call.
+
+    A purge request joins the zone's pending purge, which is sent once no new request arrived for
+    `window` seconds (but at most `max_delay` seconds after the first), and never sooner than
+    `min_interval` seconds after the zone's previous purge. Every request in the batch receives the
+    same `Result`. A request arriving while a purge is in flight starts the next batch, since the
+    content it wants cleared may have changed after that purge began. Purges of different zones run
+    concurrently, at most `max_concurrency` at a time, through the shared rate limiter.
+
+    Vultr accepts one purge per zone every six hours; set `min_interval` accordingly to queue
+    purges instead of having them rejected.
+    """
+    _shared: 'LoopLocal[dict[str, PurgeCoordinator]]' = LoopLocal()
+
+    def __init__(
+        self,
+        provider: str = "vultr",
+        api_key: str | None = None,
+        window: float = 2.0,
+        max_delay: float = 10.0,
+        min_interval: float = 0.0,
+        max_concurrency: int = 4,
+    ):
+        if window < 0 or max_delay < window:
+            raise ValueError("Delays must satisfy 0 <= window <= max_delay.")
+        self._provider = provider
+        self._provider_url = ProviderUrl(provider)
+        self._api_key = api_key
+        self._window = window
+        self._max_delay = max_delay
+        self._min_interval = min_interval
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._zones: dict[str, _ZoneQueue] = {}
+        self.requested = 0
+        self.dispatched = 0
+
+    @staticmethod
+    def shared(provider: str = "vultr") -> 'PurgeCoordinator':
+        """
+        Get the coordinator shared by every caller on the running event loop for `provider`.
+        """
+        coordinators = PurgeCoordinator._shared.setdefault(asyncio.get_running_loop(), {})
+        coordinator = coordinators.get(provider)
+        if coordinator is None:
+            coordinator = PurgeCoordinator(provider)
+            coordinators[provider] = coordinator
+        return coordinator
+
+    def pending(self) -> int:
+        return sum(1 for queue in self._zones.values() if queue.pending is not None)
+
+    async def purge(self, pullzone_id: str) -> Result[SuccessResponse, ErrorResponse]:
+        """
+        Request a purge of `pullzone_id` and wait for the purge that covers it.
+        """
+        now = time.monotonic()
+        queue = self._zones.get(pullzone_id)
+        if queue is None:
+            queue = self._zones[pullzone_id] = _ZoneQueue()
+        if queue.pending is None:
+            queue.pending = asyncio.get_running_loop().create_future()
+            queue.first_at = now
+        queue.last_at = now
+        queue.wake.set()
+        self.requested += 1
+        future = queue.pending
+        if queue.task is None or queue.task.done():
+            queue.task = asyncio.ensure_future(self._run(pullzone_id, queue))
+        # One waiter giving up must not cancel the purge for the others.
+        return await asyncio.shield(future)
+
+    def _due(self, queue: _ZoneQueue) -> float:
+        debounced = min(queue.last_at + self._window, queue.first_at + self._max_delay)
+        return max(debounced, queue.dispatched_at + self._min_interval)
+
+    async def _run(self, pullzone_id: str, queue: _ZoneQueue) -> None:
+        while True:
+            while queue.pending is not None:
+                while (delay := self._due(queue) - time.monotonic()) > 0:
+                    await self._sleep(queue, delay)
+
+                future, queue.pending = queue.pending, None
+                try:
+                    async with self._slots:
+                        queue.dispatched_at = time.monotonic()
+                        self.dispatched += 1
+                        try:
+                            # A purge is a GET with a side effect: it must neither join an identical
+                            # request in flight nor be answered from the response cache.
+                            result = await Request(self._provider_url.route("cdn_pull_zone_purge").assign("pullzone-id", pullzone_id)) \
+                                .set_method(HTTPMethod.GET) \
+                                .authorize(self._provider, self._api_key) \
+                                .coalesce(False) \
+                                .set_cache_ttl(0) \
+                                .request()
+                        except Exception as error:
+                            future.set_exception(error)
+                            continue
+                    if result.is_err():
+                        logger.warning("Purge of pull zone %s failed: %s", pullzone_id, result.unwrap_err()["error"])
+                    future.set_result(result)
+                finally:
+                    # The batch is no longer `pending`, so close() cannot reach it: a dispatch
+                    # cancelled mid-flight must release its requests itself.
+                    if not future.done():
+                        future.cancel()
+
+            # Nothing is pending. The queue is kept only while `min_interval` still needs the time
+            # of its last purge; a request arriving meanwhile wakes this task up.
+            delay = queue.dispatched_at + self._min_interval - time.monotonic()
+            if delay <= 0:
+                break
+            await self._sleep(queue, delay)
+        if self._zones.get(pullzone_id) is queue:
+            del self._zones[pullzone_id]
+
+    @staticmethod
+    async def _sleep(queue: _ZoneQueue, delay: float) -> None:
+        queue.wake.clear()
+        try:
+            await asyncio.wait_for(queue.wake.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def close(self) -> None:
+        """
+        Stop dispatching. Requests still waiting for a purge are cancelled.
+        """
+        for queue in list(self._zones.values()):
+            if queue.task is not None:
+                queue.task.cancel()
+                try:
+                    await queue.task
+                except asyncio.CancelledError:
+                    pass
+            if queue.pending is not None:
+                queue.pending.cancel()
+        self._zones.clear()
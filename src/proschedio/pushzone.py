@@ -0,0 +1,296 @@
+import asyncio
+import hashlib
+import logging
+import mimetypes
+import os
+import time
+from collections.abc import Callable
+from http import HTTPMethod
+from typing import Any, TypedDict, cast
+from urllib.parse import quote
+
+from rustipy.result import Err, Ok, Result
+
+from .codec import JsonCodec
+from .const import ProviderUrl
+from .pagination import MAX_PER_PAGE, PaginationError, paginate, request_pages
+from .request import ErrorResponse, Request, RetryPolicy, SessionPool, Url
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+MANIFEST_VERSION = 1
+# Uploads between manifest checkpoints, so an interrupted deploy resumes close to where it stopped.
+CHECKPOINT_EVERY = 500
+
+class ManifestEntry(TypedDict):
+    size: int
+    mtime_ns: int
+    sha256: str
+
+def default_manifest_path(zone_id: str) -> str:
+    """
+    `$XDG_CACHE_HOME/proschedio/pushzone-<zone_id>.json`, falling back to `~/.cache`.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "proschedio", f"pushzone-{zone_id}.json")
+
+def file_sha256(path: str) -> str:
+    """
+    Hash a file in `HASH_CHUNK_SIZE` pieces, never holding more than one in memory.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class Manifest:
+    """
+    What was last uploaded to a push zone: file name -> size, modification time and content hash.
+
+    A local file whose size and modification time match its entry is skipped without being read;
+    one that was only touched is rehashed and skipped if its content is unchanged.
+    """
+    def __init__(self, path: str | None, entries: dict[str, ManifestEntry] | None = None):
+        self.path = path
+        self.entries: dict[str, ManifestEntry] = entries or {}
+
+    @staticmethod
+    def load(path: str | None) -> 'Manifest':
+        if path is None:
+            return Manifest(None)
+        try:
+            with open(path, "rb") as file:
+                data = cast(dict[str, Any], JsonCodec.get().decode(file.read()))
+            if data.get("version") != MANIFEST_VERSION:
+                raise ValueError(f"unsupported manifest version {data.get('version')}")
+            return Manifest(path, data["files"])
+        except FileNotFoundError:
+            return Manifest(path)
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            logger.warning("Ignoring unreadable push zone manifest %s: %s", path, error)
+            return Manifest(path)
+
+    def save(self) -> None:
+        """
+        Write the manifest atomically; a no-op for an in-memory manifest.
+        """
+        if self.path is None:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(JsonCodec.get().encode({"version": MANIFEST_VERSION, "files": self.entries}))
+        os.replace(temporary, self.path)
+
+class PushReport:
+    def __init__(self, uploaded: list[str], deleted: list[str], skipped: int, failed: dict[str, ErrorResponse], uploaded_bytes: int, elapsed: float):
+        self.uploaded = uploaded
+        self.deleted = deleted
+        self.skipped = skipped
+        self.failed = failed
+        self.uploaded_bytes = uploaded_bytes
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+class PushZoneSync:
+    """
+    Mirrors a local directory into a CDN push zone.
+
+    ```python
+    report = await PushZoneSync(zone_id, "public/").sync()
+    ```
+
+    Local files are compared with the `Manifest` (hashing only those whose size or modification
+    time changed) and with the zone's file listing, so files deleted remotely are uploaded again.
+    Each changed file gets a presigned endpoint and is streamed from disk to it, at most
+    `max_concurrency` files at a time. Uploads have no total deadline, only `upload_read_timeout`
+    seconds of silence from the server, so large files on slow links finish; an upload failing with
+    a connection error or a `retry_policy` status is retried after the policy's backoff. With
+    `delete`, remote files missing locally are deleted, except those matching `exclude`. File names
+    are paths relative to `root`, with `/` separators.
+    """
+    def __init__(
+        self,
+        zone_id: str,
+        root: str,
+        provider: str = "vultr",
+        api_key: str | None = None,
+        manifest_path: str | None = None,
+        max_concurrency: int = 32,
+        delete: bool = True,
+        exclude: Callable[[str], bool] | None = None,
+        upload_read_timeout: float = 120.0,
+        retry_policy: RetryPolicy | None = None,
+    ):
+        self._zone_id = zone_id
+        self._root = root
+        self._provider = provider
+        self._provider_url = ProviderUrl(provider)
+        self._api_key = api_key
+        self._manifest = Manifest.load(manifest_path if manifest_path is not None else default_manifest_path(zone_id))
+        self._max_concurrency = max_concurrency
+        self._delete = delete
+        self._exclude = exclude
+        self._upload_read_timeout = upload_read_timeout
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy.default
+
+    @property
+    def manifest(self) -> Manifest:
+        return self._manifest
+
+    def _request(self, url: Url, method: HTTPMethod) -> Request:
+        return Request(url).set_method(method).authorize(self._provider, self._api_key)
+
+    def _files_url(self) -> Url:
+        return self._provider_url.route("cdn_push_zone_files").assign("pushzone-id", self._zone_id)
+
+    def _file_url(self, name: str) -> Url:
+        return self._provider_url.route("cdn_push_zone_file_by_name").assign("pushzone-id", self._zone_id).assign("file-name", quote(name, safe=""))
+
+    def scan(self) -> dict[str, os.stat_result]:
+        """
+        Every regular file under `root`, by name.
+        """
+        files: dict[str, os.stat_result] = {}
+        for directory, _, names in os.walk(self._root):
+            for file_name in names:
+                path = os.path.join(directory, file_name)
+                name = os.path.relpath(path, self._root).replace(os.sep, "/")
+                if self._exclude is not None and self._exclude(name):
+                    continue
+                status = os.stat(path)
+                files[name] = status
+        return files
+
+    async def remote(self) -> Result[set[str], ErrorResponse]:
+        names: set[str] = set()
+        try:
+            async for item in paginate(request_pages(lambda: self._request(self._files_url(), HTTPMethod.GET)), per_page=MAX_PER_PAGE):
+                names.add(cast(dict[str, Any], item)["name"])
+        except PaginationError as error:
+            logger.error("Listing push zone %s failed: %s", self._zone_id, error)
+            return Err(error.response)
+        return Ok(names)
+
+    async def _changed(self, name: str, status: os.stat_result, remote: set[str]) -> ManifestEntry | None:
+        """
+        The entry to upload `name` under, or `None` if the zone already has this content.
+        """
+        entry = self._manifest.entries.get(name)
+        if entry is not None and name in remote and (entry["size"], entry["mtime_ns"]) == (status.st_size, status.st_mtime_ns):
+            return None
+        digest = await asyncio.to_thread(file_sha256, os.path.join(self._root, name))
+        current = ManifestEntry(size=status.st_size, mtime_ns=status.st_mtime_ns, sha256=digest)
+        if entry is not None and name in remote and entry["sha256"] == digest:
+            self._manifest.entries[name] = current
+            return None
+        return current
+
+    async def _upload(self, name: str) -> Result[None, ErrorResponse]:
+        size = os.path.getsize(os.path.join(self._root, name))
+        presigned = await self._request(self._files_url(), HTTPMethod.POST).set_body({"name": name, "size": size}).request()
+        if presigned.is_err():
+            return Err(presigned.unwrap_err())
+        # `{"upload_endpoint": {...}}` arrives unwrapped, as the single key of the body.
+        endpoint = cast(dict[str, Any], presigned.unwrap()["data"] or {})
+        if "URL" not in endpoint:
+            return Err(ErrorResponse(status_code=0, error=f"No upload endpoint returned for {name}"))
+
+        attempt = 0
+        while True:
+            attempt += 1
+            result, retryable = await self._post_file(name, endpoint)
+            if result.is_ok() or not retryable or attempt >= self._retry_policy.max_attempts:
+                return result
+            delay = self._retry_policy.backoff(attempt, None)
+            logger.info("Upload of %s failed (%s); retrying in %.2fs", name, result.unwrap_err()["error"], delay)
+            await asyncio.sleep(delay)
+
+    async def _post_file(self, name: str, endpoint: dict[str, Any]) -> tuple[Result[None, ErrorResponse], bool]:
+        """
+        One upload attempt, and whether a failure is worth retrying.
+        """
+        import aiohttp
+
+        form = aiohttp.FormData()
+        for field, value in (endpoint.get("inputs") or {}).items():
+            form.add_field(field, str(value))
+        content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=self._upload_read_timeout)
+        try:
+            with open(os.path.join(self._root, name), "rb") as file:
+                # aiohttp streams file objects in small chunks; the file is never read whole.
+                form.add_field("file", file, filename=os.path.basename(name), content_type=content_type)
+                async with SessionPool.get_session().post(endpoint["URL"], data=form, timeout=timeout) as response:
+                    if response.status >= 300:
+                        error = ErrorResponse(status_code=response.status, error=(await response.text())[:500])
+                        return Err(error), response.status in self._retry_policy.retry_statuses
+        except OSError as error:
+            return Err(ErrorResponse(status_code=0, error=f"Cannot read {name}: {error}")), False
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            return Err(ErrorResponse(status_code=0, error=f"Upload of {name} failed: {error!r}")), True
+        return Ok(None), False
+
+    async def sync(self) -> Result[PushReport, ErrorResponse]:
+        started = time.monotonic()
+        remote = await self.remote()
+        if remote.is_err():
+            return Err(remote.unwrap_err())
+        remote_names = remote.unwrap()
+        local = await asyncio.to_thread(self.scan)
+        slots = asyncio.Semaphore(self._max_concurrency)
+        uploaded: list[str] = []
+        deleted: list[str] = []
+        failed: dict[str, ErrorResponse] = {}
+        uploaded_bytes = 0
+        skipped = 0
+
+        async def push(name: str, status: os.stat_result) -> None:
+            nonlocal uploaded_bytes, skipped
+            async with slots:
+                try:
+                    entry = await self._changed(name, status, remote_names)
+                except OSError as error:
+                    failed[name] = ErrorResponse(status_code=0, error=f"Cannot read {name}: {error}")
+                    return
+                if entry is None:
+                    skipped += 1
+                    return
+                result = await self._upload(name)
+            if result.is_err():
+                failed[name] = result.unwrap_err()
+                logger.warning("Upload of %s to push zone %s failed: %s", name, self._zone_id, failed[name]["error"])
+                return
+            self._manifest.entries[name] = entry
+            uploaded.append(name)
+            uploaded_bytes += entry["size"]
+            if len(uploaded) % CHECKPOINT_EVERY == 0:
+                self._manifest.save()
+
+        async def remove(name: str) -> None:
+            async with slots:
+                result = await self._request(self._file_url(name), HTTPMethod.DELETE).request()
+            if result.is_err():
+                failed[name] = result.unwrap_err()
+                return
+            self._manifest.entries.pop(name, None)
+            deleted.append(name)
+
+        await asyncio.gather(*(push(name, status) for name, status in local.items()))
+        if self._delete:
+            # Excluded files are not part of the mirror, so their remote copies are left alone too.
+            stale = [name for name in remote_names - local.keys() if self._exclude is None or not self._exclude(name)]
+            await asyncio.gather(*(remove(name) for name in stale))
+        for name in [name for name in self._manifest.entries if name not in local]:
+            del self._manifest.entries[name]
+        self._manifest.save()
+
+        report = PushReport(uploaded, deleted, skipped, failed, uploaded_bytes, time.monotonic() - started)
+        logger.info("Push zone %s: %d uploaded (%d bytes), %d deleted, %d unchanged, %d failed",
+                    self._zone_id, len(uploaded), uploaded_bytes, len(deleted), skipped, len(failed))
+        return Ok(report)
@@ -0,0 +1,199 @@
+import asyncio
+import hashlib
+import logging
+import time
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+from .loops import LoopLocal
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    """
+    Async token bucket whose refill rate adapts to what the server tells us.
+
+    A 429 halves the rate (down to `min_rate`) and, when the server sends `Retry-After`, pauses the
+    bucket until then. Further 429s within `cooldown` seconds of a decrease, or before its
+    `Retry-After` deadline, answer requests sent before the slowdown took effect and leave the rate
+    alone, so a burst of concurrent requests throttled together halves it once. Every successful
+    (2xx/3xx) response nudges the rate back up by `recovery_step` until it reaches its configured
+    rate again, so a burst of throttling recovers gradually instead of oscillating.
+    """
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        min_rate: float = 1.0,
+        recovery_step: float = 0.5,
+        cooldown: float = 1.0,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+
+        self._max_rate = rate
+        self._rate = rate
+        self._min_rate = min(min_rate, rate)
+        self._recovery_step = recovery_step
+        self._cooldown = cooldown
+        self._capacity = burst if burst is not None else rate
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._decreased_until = float("-inf")
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """
+        Wait until a token is available and take it. Waiters are served in FIFO order.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def observe(self, status: int, headers: Mapping[str, str]) -> None:
+        """
+        Adapt the bucket to a response's status code and rate-limit headers.
+        """
+        now = time.monotonic()
+        self._refill(now)
+
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        reset = _header_float(headers, "X-RateLimit-Reset")
+
+        if status == 429:
+            self._tokens = 0
+            retry_after = parse_retry_after(headers)
+            if retry_after is not None:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            if now >= self._decreased_until:
+                self._rate = max(self._min_rate, self._rate / 2)
+                self._decreased_until = max(now + self._cooldown, self._blocked_until)
+                logger.warning("Rate limited (429); slowing down to %.2f req/s", self._rate)
+        elif 200 <= status < 400:
+            self._rate = min(self._max_rate, self._rate + self._recovery_step)
+
+        if remaining is not None and reset is not None and 0 < reset < 3600:
+            if remaining <= 0:
+                self._tokens = 0
+                self._blocked_until = max(self._blocked_until, now + reset)
+            else:
+                # Spread what is left of the window evenly over the time until it resets.
+                self._rate = max(self._min_rate, min(self._rate, remaining / reset))
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+def parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    """
+    Get the delay in seconds requested by a `Retry-After` header, if any.
+    """
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class RateLimiter:
+    """
+    Registry of token buckets keyed by provider host and API key.
+
+    Every `Request` goes through the bucket for its host and `Authorization` header, so all call
+    sites sharing a key share one budget. Buckets are kept per event loop, like `SessionPool`.
+    """
+    _enabled: bool = True
+    _rate: float = 30.0
+    _burst: float | None = None
+    _rates: dict[str, float] = {}
+    _buckets: LoopLocal[dict[tuple[str, str], TokenBucket]] = LoopLocal()
+
+    @staticmethod
+    def configure(
+        rate: float | None = None,
+        burst: float | None = None,
+        enabled: bool | None = None,
+    ) -> None:
+        """
+        Configure the default requests-per-second budget for buckets created afterwards.
+        """
+        if rate is not None:
+            RateLimiter._rate = rate
+        if burst is not None:
+            RateLimiter._burst = burst
+        if enabled is not None:
+            RateLimiter._enabled = enabled
+
+    @staticmethod
+    def set_provider_rate(host: str, rate: float) -> None:
+        """
+        Override the requests-per-second budget for one provider host.
+        """
+        RateLimiter._rates[host] = rate
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return RateLimiter._enabled
+
+    @staticmethod
+    def get_bucket(host: str, authorization: str | None) -> TokenBucket:
+        """
+        Get the bucket for a provider host and `Authorization` header value.
+        """
+        buckets = RateLimiter._buckets.setdefault(asyncio.get_running_loop(), {})
+        key = (host, fingerprint(authorization))
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(RateLimiter._rates.get(host, RateLimiter._rate), RateLimiter._burst)
+            buckets[key] = bucket
+        return bucket
+
+    @staticmethod
+    def for_url(url: str, authorization: str | None) -> TokenBucket:
+        return RateLimiter.get_bucket(urlsplit(url).netloc, authorization)
+
+    @staticmethod
+    def reset() -> None:
+        """
+        Drop every bucket, e.g. between test cases.
+        """
+        RateLimiter._buckets.clear()
+
+def fingerprint(secret: str | None) -> str:
+    """
+    Short, non-reversible identifier for a credential so it can be used as a key without being stored.
+    """
+    if not secret:
+        return ""
+    return hashlib.sha256(secret.encode()).hexdigest()[:16]
@@ -0,0 +1,206 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from http import HTTPMethod
+from typing import Any, cast
+
+from .const import ProviderUrl
+from .loops import LoopLocal
+from .pagination import MAX_PER_PAGE, PaginationError, paginate, request_pages
+from .request import Request
+
+logger = logging.getLogger(__name__)
+
+Item = dict[str, Any]
+Predicate = Callable[[Item], bool]
+
+def is_ready(item: Item) -> bool:
+    """
+    Vultr's notion of a usable server: `active`, and for instances also `server_status == "ok"`.
+    Bare-metal servers have no `server_status`.
+    """
+    return item.get("status") == "active" and item.get("server_status", "ok") == "ok"
+
+class _Waiter:
+    __slots__ = ("future", "predicate")
+
+    def __init__(self, future: asyncio.Future[Item], predicate: Predicate):
+        self.future = future
+        self.predicate = predicate
+
+class ReadinessWatcher:
+    """
+    One polling loop for every resource being waited on, instead of one loop per resource.
+
+    Each tick lists the collections that have waiters (`instances`, `bare_metals`) page by page and
+    resolves every waiter whose resource now satisfies its predicate, so API calls grow with the
+    number of pages rather than the number of resources. The interval starts at `min_interval`,
+    backs off by `backoff` towards `max_interval` while nothing changes, and snaps back as soon as
+    a watched resource changes status or a new waiter arrives.
+    """
+    _shared: 'LoopLocal[dict[tuple[str, str | None], ReadinessWatcher]]' = LoopLocal()
+
+    def __init__(
+        self,
+        provider: str = "vultr",
+        api_key: str | None = None,
+        min_interval: float = 2.0,
+        max_interval: float = 15.0,
+        backoff: float = 1.5,
+        per_page: int = MAX_PER_PAGE,
+    ):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval.")
+
+        self._provider_url = ProviderUrl(provider)
+        self._api_key = api_key
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._per_page = per_page
+        self._interval = min_interval
+        # route name -> resource id -> waiters
+        self._waiters: dict[str, dict[str, list[_Waiter]]] = {}
+        self._statuses: dict[tuple[str, str], tuple[object, ...]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._wake = asyncio.Event()
+        self.polls = 0
+
+    @staticmethod
+    def shared(provider: str = "vultr", api_key: str | None = None) -> 'ReadinessWatcher':
+        """
+        Get the watcher shared by every caller on the running event loop for `provider`, polling
+        with `api_key` (default: the provider's `Credentials`).
+        """
+        watchers = ReadinessWatcher._shared.setdefault(asyncio.get_running_loop(), {})
+        watcher = watchers.get((provider, api_key))
+        if watcher is None:
+            watcher = ReadinessWatcher(provider, api_key)
+            watchers[(provider, api_key)] = watcher
+        return watcher
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    def pending(self) -> int:
+        return sum(len(waiters) for by_id in self._waiters.values() for waiters in by_id.values())
+
+    async def wait(
+        self,
+        resource_id: str,
+        route: str = "instances",
+        timeout: float | None = 300,
+        predicate: Predicate = is_ready,
+    ) -> Item:
+        """
+        Wait until the resource `resource_id` in the collection `route` satisfies `predicate` and
+        return its latest representation. Raises `TimeoutError` after `timeout` seconds.
+        """
+        future: asyncio.Future[Item] = asyncio.get_running_loop().create_future()
+        waiter = _Waiter(future, predicate)
+        self._waiters.setdefault(route, {}).setdefault(resource_id, []).append(waiter)
+        self._interval = self._min_interval
+        self._wake.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"{route} {resource_id} did not become ready within {timeout} seconds.") from None
+        finally:
+            self._discard(route, resource_id, waiter)
+
+    def _discard(self, route: str, resource_id: str, waiter: _Waiter) -> None:
+        by_id = self._waiters.get(route, {})
+        waiters = by_id.get(resource_id, [])
+        if waiter in waiters:
+            waiters.remove(waiter)
+        if not waiters:
+            by_id.pop(resource_id, None)
+            self._statuses.pop((route, resource_id), None)
+        if not by_id:
+            self._waiters.pop(route, None)
+
+    def _request(self, route: str) -> Request:
+        return Request(self._provider_url.route(route)).set_method(HTTPMethod.GET).authorize(self._provider_url.provider, self._api_key)
+
+    async def _poll(self, route: str) -> bool:
+        """
+        List `route` once and resolve its waiters. Returns whether any watched resource changed.
+        """
+        changed = False
+        async for raw in paginate(request_pages(lambda: self._request(route)), per_page=self._per_page):
+            item = cast(Item, raw)
+            waiters = self._waiters.get(route, {}).get(item["id"])
+            if not waiters:
+                continue
+            state = (item.get("status"), item.get("server_status"), item.get("power_status"))
+            if self._statuses.get((route, item["id"])) != state:
+                self._statuses[(route, item["id"])] = state
+                changed = True
+            for waiter in list(waiters):
+                if not waiter.future.done() and waiter.predicate(item):
+                    waiter.future.set_result(item)
+        return changed
+
+    async def _run(self) -> None:
+        try:
+            while self._waiters:
+                started = time.monotonic()
+                changed = False
+                for route in list(self._waiters):
+                    try:
+                        changed = await self._poll(route) or changed
+                    except PaginationError as error:
+                        logger.warning("Readiness poll of %s failed: %s", route, error)
+                self.polls += 1
+
+                if changed:
+                    self._interval = self._min_interval
+                else:
+                    self._interval = min(self._max_interval, self._interval * self._backoff)
+                if self._waiters:
+                    await self._sleep(started)
+        except Exception as error:
+            logger.error("Readiness watcher stopped: %s", error, exc_info=True)
+            for by_id in self._waiters.values():
+                for waiters in by_id.values():
+                    for waiter in waiters:
+                        if not waiter.future.done():
+                            waiter.future.set_exception(error)
+
+    async def _sleep(self, started: float) -> None:
+        """
+        Sleep out the current interval, cut short (but never below `min_interval`) by a new waiter.
+        """
+        self._wake.clear()
+        try:
+            await asyncio.wait_for(self._wake.wait(), max(0.0, self._interval - (time.monotonic() - started)))
+        except asyncio.TimeoutError:
+            return
+        await asyncio.sleep(max(0.0, self._min_interval - (time.monotonic() - started)))
+
+    async def close(self) -> None:
+        """
+        Stop polling. Pending `wait()` calls are cancelled.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for by_id in self._waiters.values():
+            for waiters in by_id.values():
+                for waiter in waiters:
+                    waiter.future.cancel()
+
+    async def __aenter__(self) -> 'ReadinessWatcher':
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
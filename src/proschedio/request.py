@@ -1,11 +1,25 @@
-import json
-import aiohttp
+import asyncio
+import random
+import reprlib
+import time
 import logging
+from collections.abc import Awaitable, Callable, Hashable, Mapping
 from http import HTTPMethod
-from typing import TypedDict, cast
+from typing import TYPE_CHECKING, TypedDict, cast
 
 from rustipy.result import Err, Ok, Result
 
+from .cache import CachedResponse, ResponseCache
+from .codec import JsonCodec
+from .credentials import Credentials
+from .loops import LoopLocal
+from .ratelimit import RateLimiter, fingerprint, parse_retry_after
+from .routes import RouteTemplate
+
+if TYPE_CHECKING:
+    # aiohttp is imported on first use; it dominates the cold-start time of the package.
+    import aiohttp
+
 logger = logging.getLogger(__name__)
 
 class MetaInfo(TypedDict, total=False):
@@ -21,29 +35,270 @@ class ErrorResponse(TypedDict):
     status_code: int
     error: str
 
+# Headers whose values never reach the logs.
+_REDACTED_HEADERS = frozenset({"authorization", "proxy-authorization", "cookie", "set-cookie", "x-api-key"})
+LOG_BODY_LIMIT = 2048
+
+_log_repr = reprlib.Repr()
+_log_repr.maxlevel = 4
+_log_repr.maxdict = 20
+_log_repr.maxlist = 20
+_log_repr.maxstring = 200
+_log_repr.maxother = 200
+
+class _LogRedacted:
+    """
+    Log argument that renders headers with credentials masked.
+    """
+    __slots__ = ("_headers",)
+
+    def __init__(self, headers: Mapping[str, str]):
+        self._headers = headers
+
+    def __str__(self) -> str:
+        return str({key: "<redacted>" if key.lower() in _REDACTED_HEADERS else value for key, value in self._headers.items()})
+
+class _LogTruncated:
+    """
+    Log argument that renders a (possibly huge) body as a bounded preview.
+
+    Like every `%s` argument it is only formatted if the record is actually emitted, so disabled
+    levels cost nothing beyond constructing this wrapper.
+    """
+    __slots__ = ("_value",)
+
+    def __init__(self, value: object):
+        self._value = value
+
+    def __str__(self) -> str:
+        if isinstance(self._value, str):
+            text = self._value
+        elif isinstance(self._value, bytes):
+            text = self._value[:LOG_BODY_LIMIT * 4].decode(errors="replace")
+        else:
+            text = _log_repr.repr(self._value)
+        if len(text) > LOG_BODY_LIMIT:
+            return f"{text[:LOG_BODY_LIMIT]}... ({len(text)} chars)"
+        return text
+
 class Url:
-    def __init__(self, provider: str):
+    """
+    Immutable URL built from a provider base URL and a compiled `RouteTemplate`.
+
+    `uri()` and `assign()` return new objects, so module-level templates can be shared safely.
+    """
+    __slots__ = ("_provider", "_route", "_values")
+
+    def __init__(self, provider: str, route: RouteTemplate | None = None, values: Mapping[str, str] | None = None):
         self._provider = provider
-        self._uri = ""
-    
+        self._route = route if route is not None else RouteTemplate.compile("")
+        self._values: Mapping[str, str] = values if values is not None else {}
+
+    @property
+    def route(self) -> RouteTemplate:
+        return self._route
+
     def uri(self, token: str) -> 'Url':
-        self._uri = token
-        return self
-    
+        return Url(self._provider, RouteTemplate.compile(token), self._values)
+
     def assign(self, placeholder: str, value: str) -> 'Url':
-        self._uri = self._uri.replace(f"{{{placeholder}}}", value)
-        return self
-    
+        return Url(self._provider, self._route, {**self._values, placeholder: value})
+
     def to_str(self) -> str:
-        return str(self._provider) + self._uri
+        return str(self._provider) + self._route.render(self._values)
+
+class SessionPool:
+    """
+    Long-lived `aiohttp.ClientSession` shared by every `Request`, one per event loop.
+
+    Reusing the session keeps the connector's pool of keep-alive connections (and their
+    TLS sessions and DNS cache) alive across calls instead of paying a handshake per request.
+
+    `close()` must be awaited before the event loop shuts down: a session cannot be closed once
+    its loop is gone. The session of a loop closed without it is only dropped (see `LoopLocal`),
+    and aiohttp reports it as unclosed.
+    """
+    _limit: int = 100
+    _limit_per_host: int = 0
+    _keepalive_timeout: float = 30.0
+    _dns_cache_ttl: int = 300
+    _timeout: 'aiohttp.ClientTimeout | None' = None
+    _sessions: 'LoopLocal[aiohttp.ClientSession]' = LoopLocal()
+
+    @staticmethod
+    def configure(
+        limit: int | None = None,
+        limit_per_host: int | None = None,
+        keepalive_timeout: float | None = None,
+        dns_cache_ttl: int | None = None,
+        timeout: 'aiohttp.ClientTimeout | None' = None,
+    ) -> None:
+        """
+        Configure the connection pool. Only sessions created afterwards pick up the new settings,
+        so call this before the first request (or after `close()`).
+
+        - `limit`: Total number of simultaneous connections (0 for unlimited).
+        - `limit_per_host`: Simultaneous connections to the same endpoint (0 for unlimited).
+        - `keepalive_timeout`: Seconds an idle connection is kept open for reuse.
+        - `dns_cache_ttl`: Seconds resolved addresses are cached.
+        - `timeout`: Default timeout applied to every request (60 seconds total if unset).
+        """
+        if limit is not None:
+            SessionPool._limit = limit
+        if limit_per_host is not None:
+            SessionPool._limit_per_host = limit_per_host
+        if keepalive_timeout is not None:
+            SessionPool._keepalive_timeout = keepalive_timeout
+        if dns_cache_ttl is not None:
+            SessionPool._dns_cache_ttl = dns_cache_ttl
+        if timeout is not None:
+            SessionPool._timeout = timeout
+
+    @staticmethod
+    def get_session() -> 'aiohttp.ClientSession':
+        """
+        Get the session bound to the running event loop, creating it on first use.
+        """
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        session = SessionPool._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=SessionPool._limit,
+                limit_per_host=SessionPool._limit_per_host,
+                keepalive_timeout=SessionPool._keepalive_timeout,
+                ttl_dns_cache=SessionPool._dns_cache_ttl,
+            )
+            timeout = SessionPool._timeout or aiohttp.ClientTimeout(total=60)
+            session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+            SessionPool._sessions[loop] = session
+            logger.debug("Created shared HTTP session for loop %s", id(loop))
+        return session
+
+    @staticmethod
+    async def close() -> None:
+        """
+        Close the session bound to the running event loop. Call this before the loop shuts down
+        (e.g. at the end of `main()`); the next request transparently opens a fresh session.
+        """
+        session = SessionPool._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent `GET` requests into one HTTP call, one table per event loop.
+
+    While a request is in flight, every identical one (same URL, params and headers) awaits the
+    same task and receives the same `Result`. Treat the shared response data as read-only.
+    Cancelling one waiter does not cancel the call for the others.
+    """
+    _enabled: bool = True
+    _flights: 'LoopLocal[dict[Hashable, asyncio.Task[Result[SuccessResponse, ErrorResponse]]]]' = LoopLocal()
+
+    @staticmethod
+    def configure(enabled: bool | None = None) -> None:
+        if enabled is not None:
+            SingleFlight._enabled = enabled
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return SingleFlight._enabled
+
+    @staticmethod
+    def in_flight() -> int:
+        return len(SingleFlight._flights.get(asyncio.get_running_loop(), ()))
+
+    @staticmethod
+    async def run(
+        key: Hashable, call: Callable[[], Awaitable[Result[SuccessResponse, ErrorResponse]]]
+    ) -> Result[SuccessResponse, ErrorResponse]:
+        """
+        Await the in-flight call for `key`, starting `call()` if there is none.
+        """
+        flights = SingleFlight._flights.setdefault(asyncio.get_running_loop(), {})
+        task = flights.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            flights[key] = task
+
+            def land(done: asyncio.Task[Result[SuccessResponse, ErrorResponse]]) -> None:
+                if flights.get(key) is done:
+                    del flights[key]
+
+            task.add_done_callback(land)
+        return await asyncio.shield(task)
+
+class RetryPolicy:
+    """
+    When and how long to wait before re-sending a failed request.
+
+    Idempotent methods are retried on network errors and on `retry_statuses`; other methods only
+    when the request was marked with `Request.retry_safe()`. Delays use "full jitter" exponential
+    backoff, and a server-sent `Retry-After` is treated as a lower bound.
+    """
+    IDEMPOTENT_METHODS: frozenset[HTTPMethod] = frozenset({
+        HTTPMethod.GET, HTTPMethod.HEAD, HTTPMethod.OPTIONS, HTTPMethod.PUT, HTTPMethod.DELETE,
+    })
+    default: 'RetryPolicy'
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504}),
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = retry_statuses
+
+    def allows(self, method: HTTPMethod, retry_safe: bool) -> bool:
+        return self.max_attempts > 1 and (retry_safe or method in RetryPolicy.IDEMPOTENT_METHODS)
+
+    def backoff(self, attempt: int, retry_after: float | None) -> float:
+        """
+        Delay before the attempt following `attempt` (1-based).
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    @staticmethod
+    def disabled() -> 'RetryPolicy':
+        return RetryPolicy(max_attempts=1)
+
+RetryPolicy.default = RetryPolicy()
+
+def _from_cache(cached: CachedResponse) -> SuccessResponse:
+    return SuccessResponse(status_code=cached["status_code"], data=cached["data"], meta=cached["meta"])
 
 class Request:
     def __init__(self, url: Url):
         self._url = url.to_str()
+        self._route = url.route.template
         self._method: HTTPMethod | None = None
         self._headers: dict[str, str] = {}
         self._params: dict[str, str | int] = {}
-        self._body: str | None = None
+        self._body: bytes | None = None
+        self._retry: RetryPolicy | None = None
+        self._retry_safe = False
+        self._cache_ttl: float | None = None
+        self._coalesce = True
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @property
+    def method(self) -> HTTPMethod | None:
+        return self._method
 
     def set_method(self, method: HTTPMethod) -> 'Request':
         self._method = method
@@ -53,113 +308,251 @@ class Request:
         self._headers[key] = value
         return self
     
+    def authorize(self, provider: str = "vultr", api_key: str | None = None) -> 'Request':
+        """
+        Add the `Authorization` header for `api_key`, or else from the provider's `Credentials`.
+        """
+        header = Credentials.authorization(provider, api_key)
+        if header is not None:
+            self._headers["Authorization"] = header
+        return self
+
     def add_param(self, key: str, value: str | int) -> 'Request':
         self._params[key] = value
         return self
     
-    def set_body(self, body: str) -> 'Request':
-        self._body = body
+    def set_body(self, body: str | bytes | Mapping[str, object] | list[object]) -> 'Request':
+        """
+        Set the JSON body. A `str` or `bytes` body is taken as already-encoded JSON and sent as is;
+        anything else is encoded once with the active `JsonCodec`. Sets `Content-Type` unless the
+        caller already did.
+        """
+        if isinstance(body, bytes):
+            self._body = body
+        elif isinstance(body, str):
+            self._body = body.encode()
+        else:
+            self._body = JsonCodec.get().encode(body)
+        if not any(key.lower() == "content-type" for key in self._headers):
+            self._headers["Content-Type"] = "application/json"
         return self
     
+    def set_retry(self, policy: RetryPolicy) -> 'Request':
+        self._retry = policy
+        return self
+
+    def retry_safe(self, safe: bool = True) -> 'Request':
+        """
+        Mark a non-idempotent request (`POST`, `PATCH`) as safe to send more than once, so the retry
+        policy applies to it too.
+        """
+        self._retry_safe = safe
+        return self
+
+    def set_cache_ttl(self, ttl: float) -> 'Request':
+        """
+        Override the route's `ResponseCache` TTL for this `GET`; `0` bypasses the cache.
+        """
+        self._cache_ttl = ttl
+        return self
+
+    def coalesce(self, enabled: bool = True) -> 'Request':
+        """
+        Let this `GET` share an identical in-flight request through `SingleFlight`. Disable it for
+        a `GET` with side effects, which must reach the API every time it is sent.
+        """
+        self._coalesce = enabled
+        return self
+
     async def request(self) -> Result[SuccessResponse, ErrorResponse]:
         if self._method is None:
-            logger.error(f"Request method not set for URL: {self._url}")
+            logger.error("Request method not set for URL: %s", self._url)
             return Err(ErrorResponse(status_code=0, error="Request method not set"))
 
-        async with aiohttp.ClientSession() as session:
+        if self._method is HTTPMethod.GET:
+            if self._coalesce and SingleFlight.is_enabled():
+                return await SingleFlight.run(self._flight_key(), self._request_get)
+            return await self._request_get()
+
+        result, _ = await self._request_with_retry(self._method, self._headers)
+        return result
+
+    def _flight_key(self) -> Hashable:
+        headers = tuple(sorted(
+            (name.lower(), fingerprint(value) if name.lower() == "authorization" else value)
+            for name, value in self._headers.items()
+        ))
+        params = tuple(sorted((name, str(value)) for name, value in self._params.items()))
+        return (self._url, params, headers)
+
+    async def _request_get(self) -> Result[SuccessResponse, ErrorResponse]:
+        if ResponseCache.is_enabled():
+            ttl = self._cache_ttl if self._cache_ttl is not None else ResponseCache.ttl_for(self._route)
+            if ttl:
+                return await self._request_cached(ttl)
+
+        result, _ = await self._request_with_retry(HTTPMethod.GET, self._headers)
+        return result
+
+    async def _request_cached(self, ttl: float) -> Result[SuccessResponse, ErrorResponse]:
+        """
+        Serve a fresh `ResponseCache` entry, or revalidate/refetch and store the result.
+        """
+        key = ResponseCache.key(HTTPMethod.GET.name, self._url, self._params, self._headers.get("Authorization"))
+        cached = await asyncio.to_thread(ResponseCache.get, key)
+        if cached is not None and cached["expires_at"] > time.time():
+            logger.debug("Serving %s from the response cache", self._url)
+            return Ok(_from_cache(cached))
+
+        headers = self._headers
+        if cached is not None and (cached["etag"] or cached["last_modified"]):
+            headers = dict(self._headers)
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        result, response_headers = await self._request_with_retry(HTTPMethod.GET, headers)
+        if result.is_err():
+            if cached is not None and result.unwrap_err()["status_code"] == 304:
+                logger.debug("Revalidated cached response for %s", self._url)
+                await asyncio.to_thread(ResponseCache.refresh, key, response_headers, ttl)
+                return Ok(_from_cache(cached))
+            return result
+
+        response = result.unwrap()
+        await asyncio.to_thread(ResponseCache.put, key, response["status_code"], response["data"], response["meta"], response_headers, ttl)
+        return result
+
+    async def _request_with_retry(
+        self, method: HTTPMethod, headers: Mapping[str, str]
+    ) -> tuple[Result[SuccessResponse, ErrorResponse], Mapping[str, str]]:
+        import aiohttp
+
+        policy = self._retry if self._retry is not None else RetryPolicy.default
+        retryable = policy.allows(method, self._retry_safe)
+        attempt = 0
+        while True:
+            attempt += 1
             try:
-                logger.debug(f"Sending {self._method.name} request to {self._url} with params={self._params}, headers={self._headers}, body={self._body}")
-                async with session.request(
-                    method=self._method.name,
-                    url=self._url,
-                    headers=self._headers,
-                    params=self._params,
-                    json=self._body
-                ) as response:
-                    status = response.status
-                    logger.debug(f"Request to {self._url} returned status {status}")
-
-                    if status == 204:
-                        logger.info(f"Request successful (204 No Content): {self._url}")
-                        return Ok(SuccessResponse(status_code=status, data=None, meta=None))
-
-                    raw_body: dict[str, object] | list[object] | None = None
-                    parsing_error_message: str | None = None
-                    try:
-                        raw_body = await response.json(content_type=None)
-                        logger.debug(f"Raw API response body: {raw_body}")
-                    except aiohttp.ContentTypeError:
-                        try:
-                            text_response = await response.text()
-                            error_detail = f"Non-JSON response: {text_response[:100]}..."
-                            logger.warning(f"API request to {self._url} returned status {status} with non-JSON body: {text_response}")
-                        except Exception as text_err:
-                            logger.warning(f"API request to {self._url} returned status {status} with non-JSON body, failed to read text: {text_err}")
-                            error_detail = "Non-JSON response, unable to read text."
-                        parsing_error_message = f"Status {status}: {error_detail}"
-                    except json.JSONDecodeError as json_err:
-                        logger.warning(f"API request to {self._url} returned status {status} but failed to decode JSON response: {json_err}")
-                        parsing_error_message = f"Status {status}: Failed to decode JSON response"
-                    except Exception as e:
-                        logger.error(f"Unexpected error processing response body from {self._url} (status {status}): {e}", exc_info=True)
-                        parsing_error_message = f"Status {status}: Unexpected error processing response body: {e}"
-
-                    if 200 <= status < 300:
-                        if parsing_error_message is not None:
-                            logger.warning(f"Request to {self._url} had status {status} but failed body processing: {parsing_error_message}")
-                            return Err(ErrorResponse(status_code=status, error=parsing_error_message))
-
-                        data_payload: dict[str, object] | list[object] | None = None
-                        meta_payload: MetaInfo | None = None
-
-                        if isinstance(raw_body, dict):
-                            possible_data_keys = [k for k in raw_body if k != 'meta']
-                            if len(possible_data_keys) == 1:
-                                potential_payload = raw_body.get(possible_data_keys[0])
-                                # Check if the payload is a dict or list before assigning
-                                if isinstance(potential_payload, (dict, list)):
-                                    # Cast is safe here because we checked the type
-                                    data_payload = cast(dict[str, object] | list[object], potential_payload)
-                                elif potential_payload is None:
-                                     data_payload = None # Explicitly handle None case
-                                else:
-                                    logger.warning(f"Expected dict or list for single data key '{possible_data_keys[0]}' in response from {self._url}, but got {type(potential_payload)}. Setting data_payload to None.")
-                                    data_payload = None
-                            else:
-                                # If multiple keys (or zero keys besides meta), treat the dict itself as payload (excluding meta)
-                                data_payload = {k: v for k, v in raw_body.items() if k != 'meta'}
-                            # Safely get meta information
-                            meta_payload = cast(MetaInfo | None, raw_body.get("meta"))
-                        # Explicitly check if raw_body is a list
-                        elif isinstance(raw_body, list):
-                            data_payload = raw_body
-                        elif raw_body is None:
+                result, response_headers = await self._send(method, headers)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as client_err:
+                if retryable and attempt < policy.max_attempts:
+                    delay = policy.backoff(attempt, None)
+                    logger.warning("Network error during request to %s (attempt %d/%d): %r. Retrying in %.2fs", self._url, attempt, policy.max_attempts, client_err, delay)
+                    await asyncio.sleep(delay)
+                    continue
+                logger.error("Network or client error during request to %s: %s", self._url, client_err, exc_info=True)
+                return Err(ErrorResponse(status_code=0, error=f"Network error: {client_err}")), {}
+            except Exception as general_err:
+                logger.error("Unexpected error during request execution for %s: %s", self._url, general_err, exc_info=True)
+                return Err(ErrorResponse(status_code=0, error=f"Unexpected error: {general_err}")), {}
+
+            if result.is_err() and retryable and attempt < policy.max_attempts:
+                status = result.unwrap_err()["status_code"]
+                if status in policy.retry_statuses:
+                    delay = policy.backoff(attempt, parse_retry_after(response_headers))
+                    logger.warning("Request to %s failed with status %d (attempt %d/%d). Retrying in %.2fs", self._url, status, attempt, policy.max_attempts, delay)
+                    await asyncio.sleep(delay)
+                    continue
+
+            return result, response_headers
+
+    async def _send(
+        self, method: HTTPMethod, headers: Mapping[str, str]
+    ) -> tuple[Result[SuccessResponse, ErrorResponse], Mapping[str, str]]:
+        """
+        Perform a single HTTP attempt. Network errors propagate to the retry loop in `request()`.
+        """
+        bucket = RateLimiter.for_url(self._url, self._headers.get("Authorization")) if RateLimiter.is_enabled() else None
+        if bucket is not None:
+            await bucket.acquire()
+
+        session = SessionPool.get_session()
+        logger.debug("Sending %s request to %s with params=%s, headers=%s, body=%s", method.name, self._url, self._params, _LogRedacted(headers), _LogTruncated(self._body))
+        async with session.request(
+            method=method.name,
+            url=self._url,
+            headers=headers,
+            params=self._params,
+            data=self._body
+        ) as response:
+            status = response.status
+            logger.debug("Request to %s returned status %d", self._url, status)
+            if bucket is not None:
+                bucket.observe(status, response.headers)
+
+            if status == 204:
+                logger.info("Request successful (204 No Content): %s", self._url)
+                return Ok(SuccessResponse(status_code=status, data=None, meta=None)), response.headers
+
+            if status == 304:
+                logger.debug("Not modified: %s", self._url)
+                return Err(ErrorResponse(status_code=status, error="Not Modified")), response.headers
+
+            raw_body: dict[str, object] | list[object] | None = None
+            parsing_error_message: str | None = None
+            content = await response.read()
+            try:
+                # Decode straight from bytes: skips aiohttp's charset sniffing and the str copy.
+                if content.strip():
+                    raw_body = cast(dict[str, object] | list[object], JsonCodec.get().decode(content))
+                logger.debug("Raw API response body: %s", _LogTruncated(raw_body))
+            except ValueError as json_err:
+                logger.warning("API request to %s returned status %d but failed to decode JSON response: %s. Body: %s", self._url, status, json_err, _LogTruncated(content))
+                parsing_error_message = f"Status {status}: Failed to decode JSON response"
+            except Exception as e:
+                logger.error("Unexpected error processing response body from %s (status %d): %s", self._url, status, e, exc_info=True)
+                parsing_error_message = f"Status {status}: Unexpected error processing response body: {e}"
+
+            if 200 <= status < 300:
+                if parsing_error_message is not None:
+                    logger.warning("Request to %s had status %d but failed body processing: %s", self._url, status, parsing_error_message)
+                    return Err(ErrorResponse(status_code=status, error=parsing_error_message)), response.headers
+
+                data_payload: dict[str, object] | list[object] | None = None
+                meta_payload: MetaInfo | None = None
+
+                if isinstance(raw_body, dict):
+                    possible_data_keys = [k for k in raw_body if k != 'meta']
+                    if len(possible_data_keys) == 1:
+                        potential_payload = raw_body.get(possible_data_keys[0])
+                        # Check if the payload is a dict or list before assigning
+                        if isinstance(potential_payload, (dict, list)):
+                            # Cast is safe here because we checked the type
+                            data_payload = cast(dict[str, object] | list[object], potential_payload)
+                        elif potential_payload is None:
                              data_payload = None # Explicitly handle None case
                         else:
-                            # Handle cases where raw_body is neither dict, list, nor None (e.g., str, int)
-                            logger.warning(f"Expected dict or list as response body from {self._url}, but got {type(raw_body)}. Setting data_payload to None.")
+                            logger.warning("Expected dict or list for single data key '%s' in response from %s, but got %s. Setting data_payload to None.", possible_data_keys[0], self._url, type(potential_payload))
                             data_payload = None
-
-                        logger.info(f"Request successful (Status {status}): {self._url}")
-                        return Ok(SuccessResponse(status_code=status, data=data_payload, meta=meta_payload))
-
                     else:
-                        error_message_to_return: str
-                        if parsing_error_message is not None:
-                            error_message_to_return = parsing_error_message
-                        elif isinstance(raw_body, dict) and "error" in raw_body:
-                            api_error = str(raw_body.get("error", f"Unknown API error (status {status})"))
-                            error_message_to_return = api_error
-                        else:
-                            error_message_to_return = f"API request failed with status {status}"
+                        # If multiple keys (or zero keys besides meta), treat the dict itself as payload (excluding meta)
+                        data_payload = {k: v for k, v in raw_body.items() if k != 'meta'}
+                    # Safely get meta information
+                    meta_payload = cast(MetaInfo | None, raw_body.get("meta"))
+                # Explicitly check if raw_body is a list
+                elif isinstance(raw_body, list):
+                    data_payload = raw_body
+                elif raw_body is None:
+                     data_payload = None # Explicitly handle None case
+                else:
+                    # Handle cases where raw_body is neither dict, list, nor None (e.g., str, int)
+                    logger.warning("Expected dict or list as response body from %s, but got %s. Setting data_payload to None.", self._url, type(raw_body))
+                    data_payload = None
 
-                        logger.warning(f"Request failed (Status {status}): {self._url}. Error: {error_message_to_return}. Raw Body: {raw_body}")
-                        return Err(ErrorResponse(status_code=status, error=error_message_to_return))
+                logger.info("Request successful (Status %d): %s", status, self._url)
+                return Ok(SuccessResponse(status_code=status, data=data_payload, meta=meta_payload)), response.headers
 
-            except aiohttp.ClientError as client_err:
-                logger.error(f"Network or client error during request to {self._url}: {client_err}", exc_info=True)
-                return Err(ErrorResponse(status_code=0, error=f"Network error: {client_err}"))
-            except Exception as general_err:
-                logger.error(f"Unexpected error during request execution for {self._url}: {general_err}", exc_info=True)
-                return Err(ErrorResponse(status_code=0, error=f"Unexpected error: {general_err}"))
+            else:
+                error_message_to_return: str
+                if parsing_error_message is not None:
+                    error_message_to_return = parsing_error_message
+                elif isinstance(raw_body, dict) and "error" in raw_body:
+                    api_error = str(raw_body.get("error", f"Unknown API error (status {status})"))
+                    error_message_to_return = api_error
+                else:
+                    error_message_to_return = f"API request failed with status {status}"
 
+                logger.warning("Request failed (Status %d): %s. Error: %s. Raw Body: %s", status, self._url, error_message_to_return, _LogTruncated(raw_body))
+                return Err(ErrorResponse(status_code=status, error=error_message_to_return)), response.headers
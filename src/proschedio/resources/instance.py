@@ -1,4 +1,3 @@
-import os
 import logging
 from http import HTTPMethod
 from typing import Any
@@ -29,7 +28,7 @@ class ResourceInstance(BaseInstance):
         """
         request = Request(ProviderUrl.get_url_instances(self.provider_url)) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get("VULTR_API_KEY")}")
+            .authorize(self.provider)
 
         if filters is not None:
             # Apply filters using the filter object's method
@@ -43,7 +42,7 @@ class ResourceInstance(BaseInstance):
         """
         return await Request(ProviderUrl.get_url_instances_base(self.provider_url)) \
             .set_method(HTTPMethod.POST) \
-            .add_header("Authorization", f"Bearer {os.environ.get("VULTR_API_KEY")}") \
+            .authorize(self.provider) \
             .add_header("Content-Type", "application/json") \
             .set_body(self.config) \
             .request()
@@ -54,7 +53,7 @@ class ResourceInstance(BaseInstance):
         """
         return await Request(ProviderUrl.get_url_instance_by_id(self.provider_url).assign("instance-id", instance_id)) \
             .set_method(HTTPMethod.GET) \
-            .add_header("Authorization", f"Bearer {os.environ.get("VULTR_API_KEY")}") \
+            .authorize(self.provider) \
             .request()
 
     async def update(self, instance_id: str, data: instance_structs.UpdateInstanceData) -> Result[SuccessResponse, ErrorResponse]:
@@ -63,7 +62,7 @@ class ResourceInstance(BaseInstance):
         """
         return await Request(ProviderUrl.get_url_instance_by_id(self.provider_url).assign("instance-id", instance_id)) \
             .set_method(HTTPMethod.PATCH) \
-            .add_header("Authorization", f"Bearer {os.environ.get("VULTR_API_KEY")}") \
+            .authorize(self.provider) \
             .add_header("Content-Type", "application/json") \
             .set_body(self.config) \
             .request()
@@ -74,7 +73,7 @@ class ResourceInstance(BaseInstance):
         """
         return await Request(ProviderUrl.get_url_instance_by_id(self.provider_url).assign("instance-id", instance_id)) \
             .set_method(HTTPMethod.DELETE) \
-            .add_header("Authorization", f"Bearer {os.environ.get("VULTR_API_KEY")}") \
+            .authorize(self.provider) \
             .request()
     
     async def reboot(self) -> str | None:
@@ -0,0 +1,3041 @@
+"""
+Request/response reference for every route in `proschedio.const.ROUTES`.
+
+Kept out of `const` so that importing the route table stays cheap; `ProviderUrl.describe()` loads
+this module on demand.
+"""
+
+ROUTE_DOCS: dict[str, str] = {
+    "account": """
+### Request Methods
+- `GET`: Get your Vultr account, permission, and billing information.
+
+### Response Schema
+- `GET`:
+
+```js
+{
+    "account": {
+        b
+    }
+}
+```
+""",
+
+    "account_bandwidth": """
+### Request Methods
+- `GET`: Get your Vultr account bandwidth information.
+""",
+
+    "applications": """
+### Request Methods
+- `GET`: Get a list of all available Applications.
+
+### Query parameters
+- `GET`:
+    - `type` - Filter the results by type.
+
+| Type | Description |
+| --- | --- |
+| all | All available aplication types |
+| marketplace | Marketplace applications |
+| one-click | Vultr one-click applications |
+
+    - `per_page` - Number of applications per page. Default is 100 and max is 500.
+    - `cursor` - Cursor for paging. See Meta and pagination.
+""",
+
+    "backups": """
+### Request Methods
+- `GET`: Get information about Backups in your account.
+
+### Query parameters
+- `GET`:
+    - `instance_id` - Filter the backups list by Instance id.
+    - `per_page` - Number of items requested per page. Default is 100 and max is 500.
+    - `cursor` - Cursor for paging. See Meta and pagination.
+""",
+
+    "backup_by_id": """
+### Request Methods
+- `GET`: Get the information for the Backup.
+
+### Path parameters
+- `backup_id` - The Backup id.
+""",
+
+    "bare_metals": """
+### Request Methods
+- `GET`: List all Bare Metal instances in your account.
+- `POST`: Create a new Bare Metal instance in a `region` with the desired `plan`. Choose one of the following to deploy the instance:
+    - `os_id`
+    - `snapshot_id`
+    - `app_id`
+    - `image_id`
+
+Supply other attributes as desired.
+
+### Query parameters
+- `GET`:
+    - `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+    - `cursor` - Cursor for paging. See Meta and pagination.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "region": String, // The [Region id](#operation/list-regions) to create the instance.
+    "plan": String, // The [Bare Metal plan id](#operation/list-metal-plans) to use for this instance.
+    "script_id": Optional<String>, // The [Startup Script id](#operation/list-startup-scripts) to use for this instance.
+    "enable_ipv6": Optional<Boolean>, // Enable IPv6. * true
+    "sshkey_id": Optional<Array<Strings>>, // The [SSH Key id](#operation/list-ssh-keys) to install on this instance.
+    "user_data": Optional<String>, // The user-supplied, base64 encoded [user data](https://www.vultr.com/docs/manage-instance-user-data-with-the-vultr-metadata-api/) for this Instance.
+    "label": Optional<String>, // The user-supplied label.
+    "activation_email": Optional<Boolean>, // Notify by email after deployment. * true * false (default)
+    "hostname": Optional<String>, // The user-supplied hostname to use when deploying this instance.
+    "reserved_ipv4": Optional<String>, // The [Reserved IP id](#operation/list-reserved-ips) for this instance.
+    "os_id": Optional<Integer>, // If supplied, deploy the instance using this [Operating System id](#operation/list-os).
+    "snapshot_id": Optional<String>, // If supplied, deploy the instance using this [Snapshot ID](#operation/list-snapshots).
+    "app_id": Optional<Integer>, // If supplied, deploy the instance using this [Application id](#operation/list-applications).
+    "image_id": Optional<String>, // If supplied, deploy the instance using this [Application image_id](#operation/list-applications).
+    "persistent_pxe": Optional<Boolean>, // Enable persistent PXE. * true * false (default)
+    "attach_vpc2": Optional<Array<Strings>>, // An array of [VPC IDs](#operation/list-vpc2) to attach to this Bare Metal Instance. This parameter takes precedence over `enable_vpc2`.  Please choose one parameter.
+    "detach_vpc2": Optional<Array<Strings>>, // An array of [VPC IDs](#operation/list-vpc2) to detach from this Bare Metal Instance. This parameter takes precedence over `enable_vpc2`.
+    "enable_vpc2": Optional<Boolean>, // If `true`, VPC 2.0 support will be added to the new server.
+    "tags": Optional<Array<Strings>>, // Tags to apply to the instance.
+    "user_scheme": Optional<String>, // Linux-only: The user scheme used for logging into this instance. * root * limited
+    "mdisk_mode": Optional<String>, // The RAID configuration used for the disks on this instance. * raid1 * jbod * none (default)
+    "app_variables": Optional<Object> // The [app variable inputs](#operation/list-marketplace-app-variables) for configuring the marketplace app (name/value pairs).
+}
+```
+""",
+
+    "bare_metal_bandwidth": """
+### Request Methods
+- `GET`: Get bandwidth information for the Bare Metal instance.
+
+### Path Parameters
+- `baremetal-id` - The [Bare Metal id](#operation/list-baremetals).
+
+### Response Schema
+- `GET`:
+
+```js
+{
+    "bandwidth": {
+        "2024-01-01": { // One entry per day.
+            "incoming_bytes": Integer, // Total bytes received by this instance on the date.
+            "outgoing_bytes": Integer // Total bytes sent by this instance on the date.
+        }
+    }
+}
+```
+""",
+
+    "bare_metals_halt": """
+### Request Methods
+- `POST`: Halt Bare Metals.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "baremetal_ids": Array<String>, // The [Bare Metal ids](#operation/list-baremetals) to halt.
+}
+```
+""",
+
+    "bare_metals_reboot": """
+### Request Methods
+- `POST`: Reboot Bare Metals.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "baremetal_ids": Array<String>, // The [Bare Metal ids](#operation/list-baremetals) to reboot.
+}
+```
+""",
+
+    "bare_metals_start": """
+### Request Methods
+- `POST`: Start Bare Metals.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "baremetal_ids": Array<String>, // The [Bare Metal ids](#operation/list-baremetals) to start.
+}
+```
+""",
+
+    "bare_metal_by_id": """
+### Request Methods
+- `GET`: Get information for a Bare Metal instance.
+- `PATCH`: Update a Bare Metal instance. All attributes are optional. If not set, the attributes will retain their original values.
+- `DELETE`: Delete a Bare Metal instance.
+
+### Path Parameters
+- `baremetal-id` - The [Bare Metal id](#operation/list-baremetals).
+
+### Request Body Schema
+- `PATCH`:
+
+```js
+{
+    "user_data": Optional<String>, // The user-supplied, base64 encoded [user data](https://www.vultr.com/docs/manage-instance-user-data-with-the-vultr-metadata-api/) to attach to this instance.
+    "label": Optional<String>, // The user-supplied label.
+    "os_id": Optional<Integer>, // If supplied, reinstall the instance using this [Operating System id](#operation/list-os).
+    "app_id": Optional<Integer>, // If supplied, reinstall the instance using this [Application id](#operation/list-applications).
+    "image_id": Optional<String>, // If supplied, reinstall the instance using this [Application image_id](#operation/list-applications).
+    "enable_ipv6": Optional<Boolean>, // Enable IPv6.
+    "tags": Optional<Array<String>>, // Tags to apply to the instance.
+}
+```
+""",
+
+    "billing_history": """
+### Request Methods
+- `GET`: Retrieve list of billing history.
+
+### Query Parameters
+- `per_page`: Number of items requested per page. Default is 100, maximum is 500.
+- `cursor`: Cursor for pagination.
+
+### Response Schema
+- `GET`:
+
+```js
+{
+    "billing_history": [
+        {
+            "id": Integer, // The Billing History id.
+            "date": String, // Date of the billing history item.
+            "type": String, // Type of billing history item, `invoice` or `payment`.
+            "description": String, // Description of the billing history item.
+            "amount": Number, // Amount of the billing history item.
+            "balance": Number // Account balance after the billing history item.
+        }
+    ],
+    "meta": Object // See Meta and pagination.
+}
+```
+""",
+
+    "billing_invoices": """
+### Request Methods
+- `GET`: Retrieve a list of invoices.
+
+### Query Parameters
+- `per_page`: Number of items requested per page. Default is 100, maximum is 500.
+- `cursor`: Cursor for pagination.
+
+### Response Schema
+- `GET`:
+
+```js
+{
+    "billing_invoices": [
+        {
+            "id": Integer, // The Invoice id.
+            "date": String, // Date of the invoice.
+            "description": String, // Description of the invoice.
+            "amount": Number, // Amount of the invoice.
+            "balance": Number // Account balance after the invoice.
+        }
+    ],
+    "meta": Object // See Meta and pagination.
+}
+```
+""",
+
+    "billing_invoice_by_id": """
+### Request Methods
+- `GET`: Retrieve a specific invoice by ID.
+
+### Path Parameters
+- `invoice-id`: The ID of the invoice to retrieve.
+""",
+
+    "billing_invoice_items": """
+### Request Methods
+- `GET`: Retrieve line items for a specific invoice.
+
+### Path Parameters
+- `invoice-id`: The ID of the invoice.
+
+### Query Parameters
+- `per_page`: Number of items requested per page. Default is 100, maximum is 500.
+- `cursor`: Cursor for pagination.
+""",
+
+    "billing_pending_charges": """
+### Request Methods
+- `GET`: Retrieve all pending charges for the account.
+""",
+
+    "block_storages": """
+### Request Methods
+- `GET`: List all Block Storage in your account.
+- `POST`: Create new Block Storage in a `region` with a size of `size_gb`.
+
+### Query parameters
+- `GET`:
+    - `per_page` - Number of items requested per page. Default is 100 and max is 500.
+    - `cursor` - Cursor for paging. See Meta and pagination.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "region": String, // The [Region id](#operation/list-regions) where the Block Storage will be created.
+    "size_gb": Integer, // Size in GB may range between 10 and 40000, depending on the block_type.
+    "label": Optional<String>, // The user-supplied label.
+    "block_type": Optional<String> // An optional parameter, that determines the type of block storage volume.
+    // high_perf from 10GB to 10,000GB
+    // storage_opt from 40GB to 40,000GB
+}
+```
+""",
+
+    "block_storage_by_id": """
+### Request Methods
+- `GET`: Get information for Block Storage.
+- `PATCH`: Update information for Block Storage.
+- `DELETE`: Delete Block Storage.
+
+### Path parameters
+- `block-id` - The Block Storage id.
+
+### Request Body Schema
+- `PATCH`:
+
+```js
+{
+    "label": Optional<String>, // The user-supplied label.
+    "size_gb": Optional<Integer> // The new size of the block storage volume in GB. Must be >= current size.
+}
+```
+""",
+
+    "block_storage_attach": """
+### Request Methods
+- `POST`: Attach Block Storage to Instance.
+
+### Path parameters
+- `block-id` - The Block Storage id.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "instance_id": String, // The [Instance id](#operation/list-instances) to attach.
+    "live": Optional<Boolean> // Attach without restarting the Instance.
+    // true: Attach live
+    // false: Restart and attach (default)
+}
+```
+""",
+
+    "block_storage_detach": """
+### Request Methods
+- `POST`: Detach Block Storage.
+
+### Path parameters
+- `block-id` - The Block Storage id.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "live": Optional<Boolean> // Detach without restarting the Instance.
+}
+```
+
+|Value|Description|
+|----|----|
+|true|Detach live, do not restart the instance.|
+|false|Restart the instance and detach the Block Storage.|
+
+### Notes
+- Block Storage must be in `active` state.
+- Re-attaching a Block Storage volume is allowed after 3 minutes.
+""",
+
+    "cdn_pull_zones": """
+### Request Methods
+- `GET`: List CDN Pull Zones.
+- `POST`: Create a new CDN Pull Zone.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "label": String, // The user-supplied label.
+    "origin_scheme": String, // The URI scheme of the origin domain. Enum: ["http", "https"]
+    "origin_domain": String, // The domain name from which the content stored in the CDN will be pulled.
+    "vanity_domain": Optional<String>, // An optional domain name that can be used to access the cached files.
+    "ssl_cert": Optional<String>, // Base 64 encoded SSL certificate (required if vanity_domain and origin_scheme=https)
+    "ssl_cert_key": Optional<String>, // Base 64 encoded SSL private key (required if vanity_domain and origin_scheme=https)
+    "cors": Optional<Boolean>, // Enable Cross-origin resource sharing
+    "gzip": Optional<Boolean>, // Enable Gzip compression
+    "block_ai": Optional<Boolean>, // Block AI bots
+    "block_bad_bots": Optional<Boolean> // Block potentially malicious bots
+}
+// Required: label, origin_scheme, origin_domain
+```
+""",
+
+    "cdn_pull_zone_by_id": """
+### Request Methods
+- `GET`: Get information about a CDN Pull Zones.
+- `PUT`: Update information for a CDN Pullzone. All attributes are optional. If not set, the attributes will retain their original values.
+- `DELETE`: Delete a CDN Pull Zone.
+
+### Request Body Schema
+- `PUT`:
+
+```js
+{
+    "label": Optional<String>, // The user-supplied label.
+    "vanity_domain": Optional<String>, // An optional domain name that can be used to access the cached files.
+    "ssl_cert": Optional<String>, // Base 64 encoded SSL certificate (required if vanity_domain and origin_scheme=https)
+    "ssl_cert_key": Optional<String>, // Base 64 encoded SSL private key (required if vanity_domain and origin_scheme=https)
+    "cors": Optional<Boolean>, // Cross-origin resource sharing
+    "gzip": Optional<Boolean>, // Optional feature to compress files
+    "block_ai": Optional<Boolean>, // Optional feature to block AI bots
+    "block_bad_bots": Optional<Boolean>, // Optional feature to block malicious bots
+    "regions": Optional<Array> // List of [Region ids](#operation/list-regions) for content delivery
+}
+```
+""",
+
+    "cdn_pull_zone_purge": """
+### Request Methods
+- `GET`: Clears cached content on server proxies so that visitors can get the latest page versions.
+
+**Note:** This action may only be performed once every six hours.
+**Note:** This action may take a few extra seconds to complete.
+""",
+
+    "cdn_push_zones": """
+### Request Methods
+- `GET`: List CDN Push Zones.
+- `POST`: Create a new CDN Push Zone.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "label": String, // The user-supplied label.
+    "vanity_domain": Optional<String>, // An optional domain name that can be used to access the cached files.
+    "ssl_cert": Optional<String>, // Base 64 encoded SSL certificate (required if vanity_domain)
+    "ssl_cert_key": Optional<String>, // Base 64 encoded SSL private key (required if vanity_domain)
+    "cors": Optional<Boolean>, // Enable Cross-origin resource sharing
+    "gzip": Optional<Boolean>, // Enable Gzip compression
+    "block_ai": Optional<Boolean>, // Block AI bots
+    "block_bad_bots": Optional<Boolean> // Block potentially malicious bots
+}
+```
+""",
+
+    "cdn_push_zone_by_id": """
+### Request Methods
+- `GET`: Get information about a CDN Push Zone.
+- `PUT`: Update information for a CDN Pushzone. All attributes are optional. If not set, the attributes will retain their original values.
+- `DELETE`: Delete a CDN Push Zone.
+
+### Request Body Schema
+- `PUT`:
+
+```js
+{
+    "label": Optional<String>, // The user-supplied label.
+    "vanity_domain": Optional<String>, // An optional domain name that can be used to access the cached files.
+    "ssl_cert": Optional<String>, // Base 64 encoded SSL certificate (required if vanity_domain)
+    "ssl_cert_key": Optional<String>, // Base 64 encoded SSL private key (required if vanity_domain)
+    "cors": Optional<Boolean>, // Cross-origin resource sharing
+    "gzip": Optional<Boolean>, // Optional feature to compress files
+    "block_ai": Optional<Boolean>, // Optional feature to block AI bots
+    "block_bad_bots": Optional<Boolean>, // Optional feature to block malicious bots
+    "regions": Optional<Array> // List of [Region ids](#operation/list-regions) for content delivery
+}
+```
+""",
+
+    "cdn_push_zone_files": """
+### Request Methods
+- `GET`: Get a list of files that have been uploaded to a specific CDN Push Zones.
+- `POST`: Create a presigned post endpoint that can be used to upload a file to your Push Zone.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "name": String, // The name of the file including extension.
+    "size": Integer // The size of the file in bytes.
+}
+```
+""",
+
+    "cdn_push_zone_file_by_name": """
+### Request Methods
+- `GET`: Get information about a CDN Push Zone file.
+- `DELETE`: Delete a CDN Push Zone file.
+
+### Path Parameters
+- `pushzone-id`: The [Push Zone ID](#operation/list-pushzones)
+- `file-name`: The [File Name](#operation/list-pushzone-files)
+""",
+
+    "container_registries": """
+### Request Methods
+- `GET`: List All Container Registry Subscriptions for this account
+
+### Query parameters
+- `GET`:
+    - `per_page` - Number of items requested per page. Default is 100 and max is 500.
+    - `cursor` - Cursor for paging. See Meta and pagination.
+""",
+
+    "container_registry_base": """
+### Request Methods
+- `POST`: Create a new Container Registry Subscription
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "name": String, // "The globally unique name to reference this registry",
+    "public": Boolean, // "If true, this is a publically accessible registry allowing anyone to pull from it. If false, this registry is completely private",
+    "region": String, // "The name of the region you'd like to deploy this Registry in. Can get list of regions from /registry/region/list endpoint i.e. sjc",
+    "plan": String, // "The key of the plan you'd like to select which dictates how much storage you're allocated and the monthly cost. Can get list of plans from /plan/list endpoint i.e. start_up"
+}
+```
+""",
+
+    "container_registry_by_id": """
+### Request Methods
+- `GET`: Get a single Container Registry Subscription
+- `PUT`: Update a Container Registry Subscription
+- `DELETE`: Delete a Container Registry Subscription
+
+### Path parameters
+- `registry-id`: The Container Registry Subscription ID
+
+### Request Body Schema
+- `PUT`:
+
+```js
+{
+    "public": Boolean, // "If true, this is a publically accessible registry allowing anyone to pull from it. If false, this registry is completely private",
+    "plan": String, // "The key of the plan you'd like to upgrade to which dictates how much storage you're allocated and the monthly cost. Can get list of plans from /plan/list endpoint i.e. business"
+}
+```
+""",
+
+    "container_registry_repositories": """
+### Request Methods
+- `GET`: List All Repositories in a Container Registry Subscription
+
+### Path parameters
+- `registry-id`: The Container Registry Subscription ID
+""",
+
+    "container_registry_repository_by_image": """
+### Request Methods
+- `GET`: Get a single Repository in a Container Registry Subscription
+- `PUT`: Update a Repository in a Container Registry Subscription
+- `DELETE`: Delete a Repository from a Container Registry Subscription
+
+### Path parameters
+- `registry-id`: The Container Registry Subscription ID
+- `repository-image`: Target repository name
+
+### Request Body Schema
+- `PUT`:
+
+```js
+{
+    "description": String, // "This is my super cool hello-world project"
+}
+```
+""",
+
+    "container_registry_docker_credentials": """
+### Request Methods
+- `OPTIONS`: Create a fresh set of Docker Credentials for this Container Registry Subscription
+
+### Path parameters
+- `registry-id`: The Container Registry Subscription ID
+
+### Query parameters
+- `expiry_seconds`: "The duration in seconds for which the credentials are valid (default: 0)"
+- `read_write`: "If false, credentials will be read-only (default: false)"
+""",
+
+    "container_registry_kubernetes_docker_credentials": """
+### Request Methods
+- `OPTIONS`: Create a fresh set of Docker Credentials for this Container Registry Subscription and return them in a Kubernetes friendly YAML format
+
+### Path parameters
+- `registry-id`: The Container Registry Subscription ID
+
+### Query parameters
+- `expiry_seconds`: "The duration in seconds for which the credentials are valid (default: 0)"
+- `read_write`: "If false, credentials will be read-only (default: false)"
+- `base64_encode`: "If true, encodes the output in base64 (default: false)"
+""",
+
+    "container_registry_robots": """
+### Request Methods
+- `GET`: List All Robots in a Conainer Registry Subscription
+
+### Path parameters
+- `registry-id`: The Container Registry Subscription ID
+""",
+
+    "container_registry_robot_by_name": """
+### Request Methods
+- `GET`: Get a single Robot in a Container Registry Subscription
+- `PUT`: Update the description, disable, duration, and add or remove access, in a Container Registry Subscription Robot
+- `DELETE`: Deletes a Robot from a Container Registry Subscription
+
+### Path parameters
+- `registry-id`: The Container Registry Subscription ID
+- `robot-name`: The Robot name
+
+### Request Body Schema
+- `PUT`:
+
+```js
+{
+    "description": String, // "Robot user auto generated by Vultr - enter only what you want to update in the request body",
+    "disable": Boolean, // true,
+    "duration": Integer, // -1,
+    "access": [
+        {
+            "action": String, // "pull",
+            "resource":, String, // "repository",
+            "effect": String, // "allow"
+        },
+        {
+            "action": String, // "delete",
+            "resource": String, // "artifact",
+            "effect": String, // "deny"
+        }
+    ]
+}
+```
+""",
+
+    "container_registry_repository_artifacts": """
+### Request Methods
+- `GET`: List All Artifacts in a Container Registry Repository
+
+### Path parameters
+- `registry-id`: The Container Registry Subscription ID
+- `repository-image`: The Repository Name
+""",
+
+    "container_registry_repository_artifact_by_digest": """
+### Request Methods
+- `GET`: Get a single Artifact in a Container Registry Repository
+- `DELETE`: Deletes an Artifact from a Container Registry Repository
+
+### Path Parameters
+- `registry-id`: The Container Registry Subscription ID
+- `repository-image`: The Repository Name
+- `artifact-digest`: The Artifact Digest
+""",
+
+    "container_registry_regions": """
+### Request Methods
+- `GET`: List All Regions where a Container Registry can be deployed
+""",
+
+    "database_plans": """
+        ### Request Methods
+        - `GET`: List Managed Database Plans.
+
+        ### Query parameters
+        - `GET`:
+            - `engine` - Filter by engine type
+
+* `mysql`
+* `pg`
+* `valkey`
+* `kafka`
+            - `nodes` - Filter by number of nodes.
+            - `region` - Filter by [Region id](#operation/list-regions).
+        
+""",
+
+    "databases": """
+### Request Methods
+- `GET`: List all Managed Databases in your account.
+- `POST`: Create a new Managed Database in a `region` with the desired `plan`. Supply optional attributes as desired.
+
+### Query parameters
+- `GET`:
+    - `label` - Filter by label.
+    - `tag` - Filter by specific tag.
+    - `region` - Filter by [Region id](#operation/list-regions).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "database_engine": String, // The database engine type for the Managed Database. * `mysql` * `pg` * `valkey` * `kafka`
+    "database_engine_version": String, // The version of the chosen database engine type for the Managed Database. * MySQL: `8` * PostgreSQL: `13` - `16` * Valkey: `7` * Kafka: `3.7`
+    "region": String, // The [Region id](#operation/list-regions) where the Managed Database is located.
+    "plan": String, // The [Plan id](#operation/list-database-plans) to use when deploying this Managed Database.
+    "label": String, // A user-supplied label for this Managed Database.
+    "tag": Optional<String>, // The user-supplied tag for this Managed Database.
+    "vpc_id": Optional<String>, // The [VPC id](#operation/list-vpcs) to use when deploying this Managed Database.
+    "maintenance_dow": Optional<String>, // The day of week for routine maintenance updates. * `monday` * `tuesday` * `wednesday` * `thursday` * `friday` * `saturday` * `sunday`
+    "maintenance_time": Optional<String>, // The preferred time (UTC) for routine maintenance updates in 24-hour HH:00 format
+    "trusted_ips": Optional<Array<String>>, // A list of IP addresses allowed to access the Managed Database in CIDR notation
+    "mysql_sql_modes": Optional<Array<String>>, // A list of SQL modes to enable (MySQL engine types only)
+    "mysql_require_primary_key": Optional<Boolean>, // Require a primary key for all tables (MySQL engine types only)
+    "mysql_slow_query_log": Optional<Boolean>, // Enable slow query logging (MySQL engine types only)
+    "mysql_long_query_time": Optional<Integer>, // Number of seconds to denote a slow query (MySQL engine types only)
+    "eviction_policy": Optional<String> // Set the data eviction policy (Valkey engine types only)
+}
+```
+""",
+
+    "database_by_id": """
+### Request Methods
+- `GET`: Get information about a Managed Database.
+- `PUT`: Update information for a Managed Database. All attributes are optional. If not set, the attributes will retain their original values.
+- `DELETE`: Delete a Managed Database.
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+
+### Request Body Schema
+- `PUT`:
+
+```js
+{
+    "region": Optional<String>, // The [Region id](#operation/list-regions) where the Managed Database is located.
+    "plan": Optional<String>, // The [Plan id](#operation/list-database-plans) for this Managed Database.
+    "label": Optional<String>, // A user-supplied label for this Managed Database.
+    "tag": Optional<String>, // The user-supplied tag for this Managed Database.
+    "vpc_id": Optional<String>, // The [VPC id](#operation/list-vpcs) for this Managed Database.
+    "maintenance_dow": Optional<String>, // The day of week for routine maintenance updates
+    "maintenance_time": Optional<String>, // The preferred time (UTC) for routine maintenance updates
+    "cluster_time_zone": Optional<String>, // The configured time zone in TZ database format
+    "trusted_ips": Optional<Array<String>>, // A list of IP addresses allowed to access the Managed Database
+    "mysql_sql_modes": Optional<Array<String>>, // A list of SQL modes to enable (MySQL engine types only)
+    "mysql_require_primary_key": Optional<Boolean>, // Require a primary key for all tables (MySQL engine types only)
+    "mysql_slow_query_log": Optional<Boolean>, // Enable slow query logging (MySQL engine types only)
+    "mysql_long_query_time": Optional<Integer>, // Number of seconds to denote a slow query (MySQL engine types only)
+    "eviction_policy": Optional<String> // Set the data eviction policy (Valkey engine types only)
+}
+```
+""",
+
+    "database_usage": """
+### Request Methods
+- `GET`: Get disk, memory, and vCPU usage information for a Managed Database.
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+""",
+
+    "database_users": """
+### Request Methods
+- `GET`: List all database users within the Managed Database.
+- `POST`: Create a new database user within the Managed Database. Supply optional attributes as desired.
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "username": String, // The username of the database user
+    "password": Optional<String>, // The password for the database user (omit to auto-generate)
+    "encryption": Optional<String>, // The password encryption type (MySQL engine types only) * `caching_sha2_password` * `mysql_native_password`
+    "permission": Optional<String> // The permission level (Kafka engine types only) * `admin` * `read` * `write` * `readwrite`
+}
+```
+""",
+
+    "database_user_by_username": """
+### Request Methods
+- `GET`: Get information about a Managed Database user.
+- `PUT`: Update database user information within a Managed Database.
+- `DELETE`: Delete a database user within a Managed Database.
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+- `username` - The [database user](#operation/list-database-users).
+
+### Request Body Schema
+- `PUT`:
+
+```js
+{
+    "password": String // The password for the database user (can be empty to auto-generate)
+}
+```
+""",
+
+    "database_user_access_control": """
+### Request Methods
+- `PUT`: Configure access control settings for a Managed Database user (Valkey and Kafka engine types only).
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+- `username` - The [database user](#operation/list-database-users).
+
+### Request Body Schema
+- `PUT`:
+
+when access control:
+
+```js
+{
+    "acl_categories": Optional<Array<String>>, // ACL categories array (Valkey)
+    "acl_channels": Optional<Array<String>>, // ACL channels array (Valkey)
+    "acl_commands": Optional<Array<String>>, // ACL commands array (Valkey)
+    "acl_keys": Optional<Array<String>> // ACL keys array (Valkey)
+}
+```
+
+Or when kafka-permission:
+
+```js
+{
+    "permission": Optional<String> // Kafka permissions * `admin` * `read` * `write` * `readwrite`
+}
+```
+""",
+
+    "database_logical_databases": """
+### Request Methods
+- `GET`: List all logical databases within the Managed Database (MySQL and PostgreSQL only).
+- `POST`: Create a new logical database within the Managed Database (MySQL and PostgreSQL only).
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "name": String // The name of the logical database
+}
+```
+""",
+
+    "database_logical_database_by_name": """
+### Request Methods
+- `GET`: Get information about a logical database within a Managed Database (MySQL and PostgreSQL only).
+- `DELETE`: Delete a logical database within a Managed Database (MySQL and PostgreSQL only).
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+- `db-name` - The [logical database name](#operation/list-database-dbs).
+""",
+
+    "database_topics": """
+### Request Methods
+- `GET`: List all topics within the Managed Database (Kafka engine types only).
+- `POST`: Create a new topic within the Managed Database (Kafka engine types only).
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "name": String, // The name for the database topic
+    "partitions": Integer, // The number of partitions
+    "replication": Integer, // The replication factor
+    "retention_hours": Integer, // The retention hours
+    "retention_bytes": Integer // The retention bytes
+}
+```
+""",
+
+    "database_topic_by_name": """
+### Request Methods
+- `GET`: Get information about a Managed Database topic (Kafka engine types only).
+- `PUT`: Update topic information within a Managed Database (Kafka engine types only).
+- `DELETE`: Delete a topic within a Managed Database (Kafka engine types only).
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+- `topic-name` - The [database topic](#operation/list-database-topics).
+
+### Request Body Schema
+- `PUT`:
+
+```js
+{
+    "partitions": Integer, // "The number of partitions for the database topic.",
+    "replication": Integer, // "The replication factor for the database topic.",
+    "retention_hours": Integer, // "The retention hours for the database topic.",
+    "retention_bytes": Integer, // "The retention bytes for the database topic."
+}
+```
+""",
+
+    "database_quotas": """
+### Request Methods
+- `GET`: List all quotas within the Managed Database (Kafka engine types only).
+- `POST`: Create a new quota within the Managed Database (Kafka engine types only).
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "client_id": Integer, // "The client ID for the database quota. Note: Creating a new quota with the same client ID and user will overwrite the previous record.",
+    "consumer_byte_rate": Integer, // "The consumer byte rate for the database quota.",
+    "producer_byte_rate": Integer, // "The producer byte rate for the database quota.",
+    "request_percentage": Integer, // "The CPU request percentage for the database quota.",
+    "user": String, // "The [user](#operation/list-database-users) for the database quota."
+}
+```
+""",
+
+    "database_maintenance": """
+### Request Methods
+- `GET`: List all available version upgrades within the Managed Database.
+- `POST`: Start maintenance updates for the Managed Database.
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+""",
+
+    "database_migration": """
+### Request Methods
+- `GET`: View the status of a migration attached to the Managed Database.
+- `POST`: Start a migration to the Managed Database.
+- `DELETE`: Detach a migration from the Managed Database.
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "host": String, // "The host name of the source server.",
+    "port": Integer, // "The connection port of the source server.",
+    "username": String, // "The username of the source server. Uses `default` for Valkey if left empty or unset.",
+    "password": String, // "The password of the source server.",
+    "database": Optional<String>, // "The database of the source server. Required for MySQL/PostgreSQL engine types, but excluded for Valkey.",
+    "ignored_databases": Optional<String>, // "Comma-separated list of ignored databases on the source server. Excluded for Valkey engine types.",
+    "ssl": Boolean, // "The true/false value for whether SSL is needed to connect to the source server."
+}
+```
+""",
+
+    "database_read_replica": """
+### Request Methods
+- `POST`: Create a read-only replica node for the Managed Database.
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "region": String, // "The [Region id](#operation/list-regions) where the Managed Database is located.",
+    "label": String, // "A user-supplied label for this Managed Database."
+}
+```
+""",
+
+    "database_promote_read_replica": """
+### Request Methods
+- `POST`: Promote a read-only replica node to its own primary Managed Database.
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+""",
+
+    "database_backups": """
+### Request Methods
+- `GET`: Get backup information for the Managed Database.
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+""",
+
+    "database_restore": """
+### Request Methods
+- `POST`: Create a new Managed Database from a backup.
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "label": String, // A user-supplied label for this Managed Database.
+    "type": String, // The type of backup restoration to use for this Managed Database.
+    "date": String, // The [backup date](#operation/get-backup-information) to use when restoring the Managed Database in YYYY-MM-DD date format.
+    "time": String // The [backup time](#operation/get-backup-information) to use when restoring the Managed Database in HH-MM-SS time format (24-hour UTC).
+}
+```
+""",
+
+    "database_fork": """
+### Request Methods
+- `POST`: Fork a Managed Database to a new subscription from a backup.
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "label": String, // A user-supplied label for this Managed Database.
+    "region": String, // The [Region id](#operation/list-regions) where the Managed Database is located.
+    "plan": String, // The [Plan id](#operation/list-database-plans) to use when deploying this Managed Database.
+    "vpc_id": String, // The [VPC id](#operation/list-vpcs) to use when deploying this Managed Database.
+    "type": String, // The type of backup restoration to use for this Managed Database.
+    "date": String, // The [backup date](#operation/get-backup-information) to use when restoring the Managed Database in YYYY-MM-DD date format.
+    "time": String // The [backup time](#operation/get-backup-information) to use when restoring the Managed Database in HH-MM-SS time format (24-hour UTC).
+}
+```
+""",
+
+    "database_connection_pools": """
+### Request Methods
+- `GET`: List all connection pools within the Managed Database (PostgreSQL engine types only).
+- `POST`: Create a new connection pool within the Managed Database (PostgreSQL engine types only).
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "name": String, // The name of the connection pool.
+    "database": String, // The logical database associated with the connection pool.
+    "username": String, // The database user associated with the connection pool.
+    "mode": String, // The mode for the connection pool.
+    "size": Integer // The size of the connection pool.
+}
+```
+""",
+
+    "database_connection_pool_by_name": """
+### Request Methods
+- `GET`: Get information about a Managed Database connection pool (PostgreSQL engine types only).
+- `PUT`: Update connection-pool information within a Managed Database (PostgreSQL engine types only).
+- `DELETE`: Delete a connection pool within a Managed Database (PostgreSQL engine types only).
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+- `pool-name` - The [connection pool name](#operation/list-connection-pools).
+
+### Request Body Schema
+- `PUT`:
+
+```js
+{
+    "database": String, // The logical database associated with the connection pool.
+    "username": String, // The database user associated with the connection pool.
+    "mode": String, // The mode for the connection pool.
+    "size": Integer // The size of the connection pool.
+}
+```
+""",
+
+    "database_advanced_options": """
+### Request Methods
+- `GET`: List all configured and available advanced options for the Managed Database (MySQL, PostgreSQL, and Kafka engine types only).
+- `PUT`: Updates an advanced configuration option for the Managed Database (MySQL, PostgreSQL, and Kafka engine types only).
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+""",
+
+    "database_version_upgrade": """
+### Request Methods
+- `GET`: List all available version upgrades within the Managed Database (PostgreSQL engine types only).
+- `POST`: Start a version upgrade for the Managed Database (PostgreSQL engine types only).
+
+### Path parameters
+- `database-id` - The [Managed Database ID](#operation/list-databases).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "version": String // The version number to upgrade the Managed Database to.
+}
+```
+""",
+
+    "domains": """
+        ### Request Methods
+        - `GET`: List all DNS Domains in your account.
+        - `POST`: Create a DNS Domain for `domain`. If no `ip` address is supplied a domain with no records will be created.
+
+        ### Query parameters
+        - `GET`:
+            - `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+            - `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+
+        ### Request Body Schema
+
+        - `POST`:
+
+        ```js
+        {
+            "domain": String, // "Your registered DNS Domain name.",
+            "ip": Optional<String>, // "The default IP address for your DNS Domain. If omitted an empty domain zone will be created.",
+            "dns_sec": Optional<String>, // "Enable or disable DNSSEC.
+
+* enabled
+* disabled (default)"
+        }
+        ```
+        
+""",
+
+    "domain_by_name": """
+        ### Request Methods
+        - `GET`: Get information for the DNS Domain.
+        - `PUT`: Update the DNS Domain.
+        - `DELETE`: Delete the DNS Domain.
+
+        ### Path parameters
+        - `dns-domain` - The [DNS Domain](#operation/list-dns-domains).
+
+        ### Request Body Schema
+        - `PUT`:
+
+        ```js
+        {
+            "dns_sec": String, // "Enable or disable DNSSEC.
+
+* enabled
+* disabled"
+        }
+        ```
+        
+""",
+
+    "domain_soa": """
+### Request Methods
+- `GET`: Get SOA information for the DNS Domain.
+- `PATCH`: Update the SOA information for the DNS Domain. All attributes are optional. If not set, the attributes will retain their original values.
+
+### Path parameters
+- `dns-domain` - The [DNS Domain](#operation/list-dns-domains).
+
+### Request Body Schema
+- `PATCH`:
+
+```js
+{
+    "nsprimary": String, // "Set the primary nameserver.",
+    "email": String, // "Set the contact email address."
+}
+```
+""",
+
+    "domain_dnssec": """
+### Request Methods
+- `GET`: Get the DNSSEC information for the DNS Domain.
+
+### Path parameters
+- `dns-domain` - The [DNS Domain](#operation/list-dns-domains).
+""",
+
+    "domain_records": """
+        ### Request Methods
+        - `GET`: Get the DNS records for the Domain.
+        - `POST`: Create a DNS record.
+
+        ### Path parameters
+        - `dns-domain` - The [DNS Domain](#operation/list-dns-domains).
+
+        ### Query parameters
+        - `GET`:
+            - `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+            - `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+
+        ### Request Body Schema
+        - `POST`:
+
+        ```js
+        {
+            "name": String, // "The hostname for this DNS record.",
+            "type": String, // "The DNS record type.
+
+* A
+* AAAA
+* CNAME
+* NS
+* MX
+* SRV
+* TXT
+* CAA
+* SSHFP",
+            "data": String, // "The DNS data for this record type.",
+            "ttl": Integer // "Time to Live in seconds."
+            "priority": Integer // "DNS priority. Does not apply to all record types. (Only required for MX and SRV)"
+        }
+        ```
+        
+""",
+
+    "domain_record_by_id": """
+### Request Methods
+- `GET`: Get information for a DNS Record.
+- `PATCH`: Update the information for a DNS record. All attributes are optional. If not set, the attributes will retain their original values.
+- `DELETE`: Delete the DNS record.
+
+### Path parameters
+- `dns-domain` - The [DNS Domain](#operation/list-dns-domains).
+- `record-id` - The [DNS Record id](#operation/list-dns-domain-records).
+
+### Request Body Schema
+- `PATCH`:
+
+```js
+{
+    "name": String // "The hostname for this DNS record.",
+    "data": String // "The DNS data for this record type.",
+    "ttl": Integer // "Time to Live in seconds.",
+    "priority": Integer // "DNS priority. Does not apply to all record types."
+}
+```
+""",
+
+    "firewall_groups": """
+### Request Methods
+- `GET`: Get a list of all Firewall Groups.
+- `POST`: Create a new Firewall Group.
+
+### Query parameters
+- `GET`:
+    - `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+    - `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "description": String, // "User-supplied description of this Firewall Group."
+}
+```
+""",
+
+    "firewall_group_by_id": """
+### Request Methods
+- `GET`: Get information for a Firewall Group.
+- `PUT`: Update information for a Firewall Group.
+- `DELETE`: Delete a Firewall Group.
+
+### Path parameters
+- `firewall-group-id` - The [Firewall Group id](#operation/list-firewall-groups).
+
+### Request Body Schema
+- `PUT`:
+
+```js
+{
+    "description": String, // "User-supplied description of this Firewall Group."
+}
+```
+""",
+
+    "firewall_group_rules": """
+        ### Request Methods
+        - `GET`: Get the Firewall Rules for a Firewall Group.
+        - `POST`: Create a Firewall Rule for a Firewall Group. The attributes `ip_type`, `protocol`, `subnet`, and `subnet_size` are required.
+
+        ### Path parameters
+        - `firewall-group-id` - The [Firewall Group id](#operation/list-firewall-groups).
+
+        ### Query parameters
+        - `GET`:
+            - `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+            - `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+
+        ### Request Body Schema
+        - `POST`:
+
+        ```js
+        {
+            "ip_type": String, // "The type of IP rule.
+
+* v4
+* v6",
+            "protocol": String, // "The protocol for this rule.
+
+* ICMP
+* TCP
+* UDP
+* GRE
+* ESP
+* AH
+",
+            "subnet": String, // "IP address representing a subnet. The IP address format must match with the "ip_type" parameter value.",
+            "subnet_size": Integer, // "The number of bits for the netmask in CIDR notation. Example: 32",
+            "port": Optional<String>, // "TCP/UDP only. This field can be a specific port or a colon separated port range.",
+            "source": Optional<String>, // "If the source string is given a value of "cloudflare" subnet and subnet_size will both be ignored.
+Possible values:
+
+|   | Value | Description |
+| - | ------ | ------------- |
+|   | "" | Use the value from `subnet` and `subnet_size`. |
+|   | cloudflare | Allow all of Cloudflare's IP space through the firewall |
+|   | [Load Balancer id](#operation/list-load-balancers) | Provide a load balancer ID to use its IPs |
+",
+            "notes": Optional<String>, // "User-supplied notes for this rule."
+        }
+        ```
+        
+""",
+
+    "firewall_group_rule_by_id": """
+### Request Methods
+- `GET`: Get a Firewall Rule.
+- `DELETE`: Delete a Firewall Rule.
+
+### Path parameters
+- `firewall-group-id` - The [Firewall Group id](#operation/list-firewall-groups).
+- `firewall-rule-id` - The [Firewall Rule id](#operation/list-firewall-group-rules).
+""",
+
+    "inferences": """
+### Request Methods
+- `GET`: List all Serverless Inference subscriptions in your account.
+- `POST`: Create a new Serverless Inference subscription.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "label": String, "A user-supplied label for this Serverless Inference subscription."
+}
+```
+""",
+
+    "inference_by_id": """
+### Request Methods
+- `GET`: Get information about a Serverless Inference subscription.
+- `PATCH`: Update information for a Serverless Inference subscription.
+- `DELETE`: Delete a Serverless Inference subscription.
+
+### Path parameters
+- `inference-id` - The [Inference ID](#operation/list-inference).
+
+### Request Body Schema
+- `PATCH`:
+
+```js
+{
+    "label": String, // "A user-supplied label for this Serverless Inference subscription."
+}
+```
+""",
+
+    "inference_usage": """
+### Request Methods
+- `GET`: Get usage information for a Serverless Inference subscription.
+
+### Path parameters
+- `inference-id` - The [Inference ID](#operation/list-inference).
+""",
+
+    "instances": """
+### Request Methods
+- `GET`: List all VPS instances in your account.
+
+### Query Parameters
+- `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+- `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+- `tag` - Filter by specific tag. (Deprecated)
+- `label` - Filter by label.
+- `main_ip` - Filter by main ip address.
+- `region` - Filter by [Region id](#operation/list-regions).
+- `firewall_group_id` - Filter by [Firewall group id](#operation/list-firewall-groups).
+- `hostname` - Filter by hostname.
+- `show_pending_charges` - Set to `true` to show pending charges.
+""",
+
+    "instances_base": """
+### Request Methods
+- `POST`: Create a new VPS Instance in a `region` with the desired `plan`. Choose one of the following to deploy the instance:
+    - `os_id`
+    - `iso_id`
+    - `snapshot_id`
+    - `app_id`
+    - `image_id`
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "region": String, // [Required] [Region id](#operation/list-regions) where the Instance is located.
+    "plan": String, // [Required] [Plan id](#operation/list-plans) to use when deploying this instance.
+    "os_id": Optional<Integer>, // [Operating System id](#operation/list-os) to use when deploying this instance.
+    "ipxe_chain_url": Optional<String>, // URL location of the iPXE chainloader.
+    "iso_id": Optional<String>, // [ISO id](#operation/list-isos) to use when deploying this instance.
+    "script_id": Optional<String>, // [Startup Script id](#operation/list-startup-scripts) to use.
+    "snapshot_id": Optional<String>, // [Snapshot id](#operation/list-snapshots) to use for deployment.
+    "enable_ipv6": Optional<Boolean>, // Enable IPv6. Default: false
+    "disable_public_ipv4": Optional<Boolean>, // Disable public IPv4 when IPv6 is enabled. Default: false
+    "attach_private_network": Optional<Array<String>>, // [Deprecated] Use `attach_vpc`. [Private Network ids](#operation/list-networks).
+    "attach_vpc": Optional<Array<String>>, // [VPC IDs](#operation/list-vpcs) to attach.
+    "attach_vpc2": Optional<Array<String>>, // [VPC 2.0 IDs](#operation/list-vpc2) to attach.
+    "label": Optional<String>, // User-supplied label (max 255 characters).
+    "sshkey_id": Optional<Array<String>>, // [SSH Key ids](#operation/list-ssh-keys) to install.
+    "backups": Optional<String>, // Enable automatic backups. Values: "enabled"|"disabled".
+    "app_id": Optional<Integer>, // [Application id](#operation/list-applications) for deployment.
+    "image_id": Optional<String>, // [Application image_id](#operation/list-applications) for deployment.
+    "user_data": Optional<String>, // Base64-encoded user data (cloud-init).
+    "ddos_protection": Optional<Boolean>, // Enable DDoS protection. Default: false
+    "activation_email": Optional<Boolean>, // Send deployment email. Default: false
+    "hostname": Optional<String>, // Hostname (max 255 characters).
+    "tag": Optional<String>, // [Deprecated] Use `tags`. User-supplied tag.
+    "firewall_group_id": Optional<String>, // [Firewall Group id](#operation/list-firewall-groups) to attach.
+    "reserved_ipv4": Optional<String>, // [Reserved IP id](#operation/list-reserved-ips) to use as main IP.
+    "enable_private_network": Optional<Boolean>, // [Deprecated] Use `enable_vpc`. Enable private networking.
+    "enable_vpc": Optional<Boolean>, // Enable VPC support. Default: false
+    "enable_vpc2": Optional<Boolean>, // Enable VPC 2.0 support. Default: false
+    "tags": Optional<Array<String>>, // Tags to apply (max 5 tags, 255 chars each).
+    "user_scheme": Optional<String>, // Linux user scheme. Values: "root"|"limited".
+    "app_variables": Optional<Object> // [App variables](#operation/list-marketplace-app-variables) (key/value pairs).
+}
+```
+""",
+
+    "instance_by_id": """
+### Request Methods
+- `GET`: Get information about an Instance.
+- `PATCH`: Update information for an Instance. All attributes are optional. If not set, the attributes will retain their original values.
+- `DELETE`: Delete an Instance.
+
+### Path Parameters
+- `instance-id` - The [Instance ID](#operation/list-instances).
+
+### Request Body Schema
+- `PATCH`:
+
+```js
+{
+    "app_id": Optional<Integer>, // [Application id](#operation/list-applications) to reinstall the instance.
+    "image_id": Optional<String>, // [Application image_id](#operation/list-applications) to reinstall the instance.
+    "backups": Optional<String>, // Enable automatic backups. Values: "enabled"|"disabled".
+    "firewall_group_id": Optional<String>, // [Firewall Group id](#operation/list-firewall-groups) to attach.
+    "enable_ipv6": Optional<Boolean>, // Enable IPv6. Default: false
+    "os_id": Optional<Integer>, // [ISO id](#operation/list-isos) to reinstall (field name may be misleading).
+    "user_data": Optional<String>, // Base64-encoded user data (cloud-init).
+    "tag": Optional<String>, // [Deprecated] Use `tags`. User-supplied tag.
+    "plan": Optional<String>, // [Plan id](#operation/list-plans) for upgrade.
+    "ddos_protection": Optional<Boolean>, // Enable DDoS protection. Values: true|false.
+    "attach_private_network": Optional<Array<String>>, // [Deprecated] Use `attach_vpc`. [Private Network ids](#operation/list-networks).
+    "attach_vpc": Optional<Array<String>>, // [VPC IDs](#operation/list-vpcs) to attach.
+    "attach_vpc2": Optional<Array<String>>, // [VPC 2.0 IDs](#operation/list-vpc2) to attach.
+    "detach_private_network": Optional<Array<String>>, // [Deprecated] Use `detach_vpc`. [Private Network ids](#operation/list-networks).
+    "detach_vpc": Optional<Array<String>>, // [VPC IDs](#operation/list-vpcs) to detach.
+    "detach_vpc2": Optional<Array<String>>, // [VPC 2.0 IDs](#operation/list-vpc2) to detach.
+    "enable_private_network": Optional<Boolean>, // [Deprecated] Use `enable_vpc`. Enable private networking.
+    "enable_vpc": Optional<Boolean>, // Enable VPC support. Default: false
+    "enable_vpc2": Optional<Boolean>, // Enable VPC 2.0 support. Default: false
+    "label": Optional<String>, // User-supplied label (max 255 characters).
+    "tags": Optional<Array<String>>, // Tags to apply (max 5 tags, 255 chars each).
+    "user_scheme": Optional<String> // Linux user scheme. Values: "root"|"limited".
+}
+```
+""",
+
+    "instance_reinstall": """
+### Request Methods
+- `POST`: Reinstall an Instance using an optional `hostname`.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "hostname": Optional<String> // The hostname to use when reinstalling this instance.
+}
+```
+""",
+
+    "instance_bandwidth": """
+### Request Methods
+- `GET`: Get bandwidth information about an Instance.
+
+### Query Parameters
+- `date_range` - The range of days to include (1-180). Default 30.
+""",
+
+    "instance_neighbors": """
+### Request Methods
+- `GET`: Get a list of other instances in the same location as this Instance.
+""",
+
+    "instance_private_networks": """
+### Request Methods
+- `GET`: **Deprecated**: use [List Instance VPCs](#operation/list-instance-vpcs) instead. List the private networks for an Instance.
+
+### Query Parameters
+- `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+- `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+""",
+
+    "instance_vpcs": """
+### Request Methods
+- `GET`: List the VPCs for an Instance.
+
+### Query Parameters
+- `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+- `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+""",
+
+    "instance_vpc2s": """
+### Request Methods
+- `GET`: List the VPC 2.0 networks for an Instance.
+
+### Query Parameters
+- `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+- `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+""",
+
+    "instance_iso": """
+### Request Methods
+- `GET`: Get the ISO status for an Instance.
+
+### Path Parameters
+- `instance-id` - The [Instance ID](#operation/list-instances).
+""",
+
+    "instance_iso_attach": """
+### Request Methods
+- `POST`: Attach an ISO to an Instance.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "iso_id": String // The [ISO id](#operation/list-isos) to attach to this Instance.
+}
+```
+""",
+
+    "instance_iso_detach": """
+### Request Methods
+- `POST`: Detach the ISO from an Instance.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "network_id": String // The [Private Network id](#operation/list-networks) to detach from this Instance.
+}
+```
+""",
+
+    "instance_private_networks_attach": """
+### Request Methods
+- `POST`: Attach Private Network to an Instance. (Deprecated)
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "network_id": String // The [Private Network id](#operation/list-networks) to attach to this Instance.
+}
+```
+""",
+
+    "instance_private_networks_detach": """
+### Request Methods
+- `POST`: Detach Private Network from an Instance. (Deprecated)
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "network_id": String // The [Private Network id](#operation/list-networks) to detach from this Instance.
+}
+```
+""",
+
+    "instance_vpcs_attach": """
+### Request Methods
+- `POST`: Attach a VPC to an Instance.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "vpc_id": String // The [VPC ID](#operation/list-vpcs) to attach to this Instance.
+}
+```
+""",
+
+    "instance_vpcs_detach": """
+### Request Methods
+- `POST`: Detach a VPC from an Instance.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "vpc_id": String // The [VPC ID](#operation/list-vpcs) to detach from this Instance.
+}
+```
+""",
+
+    "instance_vpc2_attach": """
+### Request Methods
+- `POST`: Attach a VPC 2.0 Network to an Instance.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "vpc_id": String, // The [VPC ID](#operation/list-vpc2) to attach to this Instance.
+    "ip_address": Optional<String> // The IP address to use for this instance on the attached VPC 2.0 network.
+}
+```
+""",
+
+    "instance_vpc2_detach": """
+### Request Methods
+- `POST`: Detach a VPC 2.0 Network from an Instance.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "vpc_id": String // The [VPC ID](#operation/list-vpc2) to detach from this Instance.
+}
+```
+""",
+
+    "instance_backup_schedule": """
+### Request Methods
+- `GET`: Get the backup schedule for an Instance.
+- `POST`: Set the backup schedule for an Instance in UTC.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "type": String, // Type of backup schedule: `daily`, `weekly`, `monthly`, `daily_alt_even`, `daily_alt_odd`.
+    "hour": Optional<Integer>, // Hour of day to run in UTC.
+    "dow": Optional<Integer>, // Day of week to run (1-7).
+    "dom": Optional<Integer> // Day of month to run (1-28).
+}
+```
+
+|Type | Description |
+|---|---|
+|daily | Backups run every day. |
+|weekly | Backups run every week. |
+|monthly | Backups run every month. |
+|daily_alt_even | Backups run every other day starting on an even day of the month. |
+|daily_alt_odd | Backups run every other day starting on an odd day of the month |
+""",
+
+    "instance_restore": """
+### Request Methods
+- `POST`: Restore an Instance from either `backup_id` or `snapshot_id`.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "backup_id": Optional<String>, // The [Backup id](#operation/list-backups) used to restore this instance.
+    "snapshot_id": Optional<String> // The [Snapshot id](#operation/list-snapshots) used to restore this instance.
+}
+```
+""",
+
+    "instance_ipv4": """
+### Request Methods
+- `GET`: List the IPv4 information for an Instance.
+- `POST`: Create an IPv4 address for an Instance.
+
+### Path parameters
+- `instance-id` - The [Instance ID](#operation/list-instances).
+
+### Query Parameters
+- `GET`:
+    - `public_network` - If `true`, includes information about the public network adapter (such as MAC address) with the `main_ip` entry.
+    - `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+    - `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "reboot": Optional<Boolean> // Set if the server is rebooted immediately after the IPv4 address is created.
+}
+```
+""",
+
+    "instance_ipv6": """
+### Request Methods
+- `GET`: Get the IPv6 information for an VPS Instance.
+
+### Path parameters
+- `instance-id` - The [Instance ID](#operation/list-instances).
+""",
+
+    "instance_ipv4_reverse": """
+### Request Methods
+- `POST`: Create a reverse IPv4 entry for an Instance. The `ip` and `reverse` attributes are required.
+
+### Path parameters
+- `instance-id` - The [Instance ID](#operation/list-instances).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "ip": String, // The IPv4 address.
+    "reverse": String // The IPv4 reverse entry.
+}
+```
+""",
+
+    "instance_ipv6_reverse": """
+### Request Methods
+- `GET`: List the reverse IPv6 information for an Instance.
+- `POST`: Create a reverse IPv6 entry for an Instance. The `ip` and `reverse` attributes are required. IP address must be in full, expanded format.
+
+### Path parameters
+- `instance-id` - The [Instance ID](#operation/list-instances).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "ip": String, // The IPv6 address in full, expanded format.
+    "reverse": String // The IPv6 reverse entry.
+}
+```
+""",
+
+    "instance_ipv4_reverse_default": """
+### Request Methods
+- `POST`: Set a reverse DNS entry for an IPv4 address
+
+### Path parameters
+- `instance-id` - The [Instance ID](#operation/list-instances).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "ip": String // The IPv4 address.
+}
+```
+""",
+
+    "instance_ipv6_reverse_by_ipv6": """
+### Request Methods
+- `DELETE`: Delete the reverse IPv6 for an Instance.
+
+### Path parameters
+- `instance-id` - The [Instance ID](#operation/list-instances).
+- `ipv6` - The IPv6 address.
+""",
+
+    "instances_halt": """
+### Request Methods
+- `POST`: Halt Instances.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "instance_ids": Array<String>, // The [Instance IDs](#operation/list-instances) to halt.
+}
+```
+""",
+
+    "instances_reboot": """
+### Request Methods
+- `POST`: Reboot Instances.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "instance_ids": Array<String>, // The [Instance IDs](#operation/list-instances) to reboot.
+}
+```
+""",
+
+    "instances_start": """
+### Request Methods
+- `POST`: Start Instances.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "instance_ids": Array<String>, // The [Instance IDs](#operation/list-instances) to start.
+}
+```
+""",
+
+    "instance_halt": """
+### Request Methods
+- `POST`: Halt an Instance.
+
+### Path parameters
+- `instance-id` - The [Instance ID](#operation/list-instances).
+""",
+
+    "instance_user_data": """
+### Request Methods
+- `GET`: Get the user-supplied, base64 encoded [user data](https://www.vultr.com/docs/manage-instance-user-data-with-the-vultr-metadata-api/) for an Instance.
+
+### Path parameters
+- `instance-id` - The [Instance ID](#operation/list-instances).
+""",
+
+    "instance_upgrades": """
+        ### Request Methods
+        - `GET`: Get available upgrades for an Instance.
+
+        ### Path parameters
+        - `instance-id` - The [Instance ID](#operation/list-instances).
+
+        ### Query parameters
+        - `type` - Filter upgrade by type:
+
+- all (applications, os, plans)
+- applications
+- os
+- plans
+        
+""",
+
+    "kubernetes_clusters": """
+### Request Methods
+- `GET`: List all Kubernetes clusters currently deployed.
+- `POST`: Create Kubernetes Cluster.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "label": String, // The label for your Kubernetes cluster.
+    "region": String, // Region you want to deploy VKE in. See [Regions](#tag/region) for more information.
+    "version": String, // Version of Kubernetes you want to deploy.
+    "ha_controlplanes": Optional<Boolean>, // Whether a highly available control planes configuration should be deployed.
+    "enable_firewall": Optional<Boolean>, // Whether a [Firewall Group](#tag/firewall) should be deployed and managed by this cluster.
+    "node_pools": Array<{ // Array of node pool objects containing:
+        "node_quantity": Integer, // Number of instances to deploy in this nodepool.
+        "label": String, // Label for this nodepool.
+        "plan": String, // Plan you want this nodepool to use.
+        "tag": String, // Tag for node pool.
+        "auto_scaler": Boolean, // Option to use the auto scaler.
+        "min_nodes": Integer, // Auto scaler minimum nodes.
+        "max_nodes": Integer // Auto scaler maximum nodes.
+    }>
+}
+```
+""",
+
+    "kubernetes_cluster_by_id": """
+### Request Methods
+- `GET`: Get Kubernetes Cluster.
+- `PUT`: Update Kubernetes Cluster.
+- `DELETE`: Delete Kubernetes Cluster.
+
+### Path parameters
+- `vke-id` - The [VKE ID](#operation/list-kubernetes-clusters).
+
+### Request Body Schema
+- `PUT`:
+
+```js
+{
+    "label": Optional<String> // Label for the Kubernetes cluster.
+}
+```
+""",
+
+    "kubernetes_cluster_delete_with_resources": """
+### Request Methods
+- `DELETE`: Delete Kubernetes Cluster and all related resources.
+
+### Path parameters
+- `vke-id` - The [VKE ID](#operation/list-kubernetes-clusters).
+""",
+
+    "kubernetes_cluster_resources": """
+### Request Methods
+- `GET`: Get the block storage volumes and load balancers deployed by the specified Kubernetes cluster.
+
+### Path parameters
+- `vke-id` - The [VKE ID](#operation/list-kubernetes-clusters).
+""",
+
+    "kubernetes_cluster_available_upgrades": """
+### Request Methods
+- `GET`: Get the available upgrades for the specified Kubernetes cluster.
+
+### Path parameters
+- `vke-id` - The [VKE ID](#operation/list-kubernetes-clusters).
+""",
+
+    "kubernetes_cluster_upgrades": """
+### Request Methods
+- `POST`: Start a Kubernetes cluster upgrade.
+
+### Path parameters
+- `vke-id` - The [VKE ID](#operation/list-kubernetes-clusters).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "upgrade_version": String // The version you're upgrading to.
+}
+```
+""",
+
+    "kubernetes_cluster_nodepools": """
+### Request Methods
+- `GET`: List all available NodePools on a Kubernetes Cluster.
+- `POST`: Create NodePool for a Existing Kubernetes Cluster.
+
+### Path parameters
+- `vke-id` - The [VKE ID](#operation/list-kubernetes-clusters).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "node_quantity": Integer, // Number of instances in this nodepool.
+    "label": String, // Label for the nodepool.
+    "plan": String, // Plan that this nodepool will use.
+    "tag": Optional<String>, // Tag for node pool.
+    "auto_scaler": Optional<Boolean>, // Option to use the auto scaler.
+    "min_nodes": Optional<Integer>, // Auto scaler minimum nodes.
+    "max_nodes": Optional<Integer>, // Auto scaler maximum nodes.
+    "labels": Optional<Object> // Map of key/value pairs defining labels.
+}
+```
+""",
+
+    "kubernetes_cluster_nodepool_by_id": """
+### Request Methods
+- `GET`: Get Nodepool from a Kubernetes Cluster.
+- `PATCH`: Update a Nodepool on a Kubernetes Cluster.
+- `DELETE`: Delete a NodePool from a Kubernetes Cluster.
+
+### Path parameters
+- `vke-id` - The [VKE ID](#operation/list-kubernetes-clusters).
+- `nodepool-id` - The [NodePool ID](#operation/get-nodepools).
+
+### Request Body Schema
+- `PATCH`:
+
+```js
+{
+    "node_quantity": Integer, // Number of instances in the NodePool.
+    "tag": Optional<String>, // Tag for node pool.
+    "auto_scaler": Optional<Boolean>, // Option to use the auto scaler.
+    "min_nodes": Optional<Integer>, // Auto scaler minimum nodes.
+    "max_nodes": Optional<Integer>, // Auto scaler maximum nodes.
+    "labels": Optional<Object> // Map of key/value pairs defining labels.
+}
+```
+""",
+
+    "kubernetes_cluster_nodepool_node_by_id": """
+### Request Methods
+- `DELETE`: Delete a single nodepool instance from a given Nodepool.
+
+### Path parameters
+- `vke-id` - The [VKE ID](#operation/list-kubernetes-clusters).
+- `nodepool-id` - The [NodePool ID](#operation/get-nodepools).
+- `node-id` - The [Instance ID](#operation/list-instances).
+""",
+
+    "kubernetes_cluster_nodepool_node_recycle": """
+### Request Methods
+- `POST`: Recycle a specific NodePool Instance.
+
+### Path parameters
+- `vke-id` - The [VKE ID](#operation/list-kubernetes-clusters).
+- `nodepool-id` - The [NodePool ID](#operation/get-nodepools).
+- `node-id` - Node ID
+""",
+
+    "kubernetes_cluster_config": """
+### Request Methods
+- `GET`: Get Kubernetes Cluster Kubeconfig.
+
+### Path parameters
+- `vke-id` - The [VKE ID](#operation/list-kubernetes-clusters).
+""",
+
+    "kubernetes_versions": """
+### Request Methods
+- `GET`: Get a list of supported Kubernetes versions.
+""",
+
+    "load_balancers": """
+### Request Methods
+- `GET`: List the Load Balancers in your account.
+
+### Query parameters
+- `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+- `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+""",
+
+    "load_balancers_base": """
+        ### Request Methods
+        - `POST`: Create a new Load Balancer in a particular `region`.
+
+        ### Request Body Schema
+        - `POST`:
+
+        ```js
+        {
+            "region": String, // [Required] [Region id](#operation/list-regions) to create this Load Balancer.
+            "balancing_algorithm": Optional<String>, // The balancing algorithm.
+
+* roundrobin (default)
+* leastconn
+            "ssl_redirect": Optional<Boolean>, // If `true`, this will redirect all HTTP traffic to HTTPS. You must have an HTTPS rule and SSL certificate installed on the load balancer to enable this option.
+
+* true
+* false
+            "http2": Optional<Boolean>, // If `true`, this will enable HTTP2 traffic. You must have an HTTPS forwarding rule combo (HTTPS -> HTTPS) to enable this option.
+
+* true
+* false
+            "http3": Optional<Boolean>, // If `true`, this will enable HTTP3/QUIC traffic. You must have HTTP2 enabled.
+
+* true
+* false
+            "nodes": Optional<Integer>, // The number of nodes to add to the load balancer (1-99), must be an odd number. This defaults to 1.
+            "proxy_protocol": Optional<Boolean>, // If `true`, you must configure backend nodes to accept Proxy protocol.
+
+* true
+* false (Default)
+            "timeout": Optional<Integer>, // The maximum time allowed for the connection to remain inactive before timing out in seconds. This defaults to 600.
+            "health_check": Optional<{
+                "protocol": String, // The protocol to use for health checks.
+
+* HTTPS
+* HTTP
+* TCP
+                "port": Integer, // The port to use for health checks.
+                "path": Optional<String>, // HTTP Path to check. Only applies if protocol is HTTP, or HTTPS.
+                "check_interval": Optional<Integer>, // Interval between health checks.
+                "response_timeout": Optional<Integer>, // Timeout before health check fails.
+                "unhealthy_threshold": Optional<Integer>, // Number times a check must fail before becoming unhealthy.
+                "healthy_threshold": Optional<Integer> // Number of times a check must succeed before returning to healthy status.
+            }>,
+            "forwarding_rules": Array<{ // [Required] Array of forwarding rules
+                "frontend_protocol": String, // The protocol on the Load Balancer to forward to the backend.
+
+* HTTP
+* HTTPS
+* TCP
+                "frontend_port": Integer, // The port number on the Load Balancer to forward to the backend.
+                "backend_protocol": String, // The protocol destination on the backend server.
+
+* HTTP
+* HTTPS
+* TCP
+                "backend_port": Integer // The port number destination on the backend server.
+            }>,
+            "sticky_session": Optional<{
+                "cookie_name": String // The cookie name to make sticky. See [Load Balancer documentation](https://www.vultr.com/docs/vultr-load-balancers/#Load_Balancer_Configuration).
+            }>,
+            "ssl": Optional<{
+                "private_key": String, // The private key.
+                "certificate": String, // The SSL certificate.
+                "chain": Optional<String>, // The certificate chain.
+                "private_key_b64": Optional<String>, // The private key base64 encoded. (Base64 encoded values should not be used alongside with non-Base64 encoded values)
+                "certificate_b64": Optional<String>, // The SSL certificate base64 encoded. (Base64 encoded values should not be used alongside with non-Base64 encoded values)
+                "chain_b64": Optional<String> // The certificate chain base64 encoded. (Base64 encoded values should not be used alongside with non-Base64 encoded values)
+            }>,
+            "label": Optional<String>, // Label for your Load Balancer.
+            "instances": Optional<Array<String>>, // An array of instances IDs that you want attached to the load balancer.
+            "firewall_rules": Optional<Array<{
+                "port": Integer, // Port for this rule.
+                "source": String, // If the source string is given a value of "cloudflare" then cloudflare IPs will be supplied. Otherwise enter a IP address with subnet size that you wish to permit through the firewall.
+                "ip_type": String // The type of IP rule.
+
+* v4
+* v6
+            }>>,
+            "vpc": Optional<String>, // ID of the VPC you wish to use. If a VPC ID is omitted it will default to the public network.
+            "auto_ssl": Optional<{
+                "domain_zone": String, // The domain zone. (example.com)
+                "domain_sub": Optional<String> // (optional) Subdomain to append to the domain zone.
+            }>,
+            "global_regions": Optional<Array<String>> // Array of [Region ids](#operation/list-regions) to deploy child Load Balancers to.
+        }
+        ```
+        
+""",
+
+    "load_balancer_by_id": """
+        ### Request Methods
+        - `GET`: Get information for a Load Balancer.
+        - `PATCH`: Update information for a Load Balancer. All attributes are optional. If not set, the attributes will retain their original values.
+        - `DELETE`: Delete a Load Balancer.
+
+        ### Path parameters
+        - `load-balancer-id` - The [Load Balancer id](#operation/list-load-balancers).
+
+        ### Request Body Schema
+        - `PATCH`:
+
+        ```js
+        {
+            "ssl": {
+                "private_key": String, // "The private key.",
+                "certificate": String, // "The SSL certificate.",
+                "chain": String, // "The certificate chain.",
+                "private_key_b64": String, // "The private key base64 encoded.",
+                "certificate_b64": String, // "The SSL certificate base64 encoded.",
+                "chain_b64": String, // "The certificate chain base64 encoded."
+            },
+            "sticky_session": {
+                "cookie_name": String, // "The cookie name to make sticky."
+            },
+            "forwarding_rules": [{
+                "frontend_protocol": String, // "The protocol on the Load Balancer to forward to the backend.
+
+* HTTP
+* HTTPS
+* TCP",
+                "frontend_port": Integer, // "The port number on the Load Balancer to forward to the backend.",
+                "backend_protocol": String, // "The protocol destination on the backend server.
+
+* HTTP
+* HTTPS
+* TCP",
+                "backend_port": Integer, // "The port number destination on the backend server."
+            }],
+            "health_check": {
+                "protocol": String, // "The protocol to use for health checks.
+
+* HTTPS
+* HTTP
+* TCP",
+                "port": Integer, // "The port to use for health checks.",
+                "path": String, // "HTTP Path to check. Only applies if protocol is HTTP, or HTTPS.",
+                "check_interval": String, // "Interval between health checks.",
+                "response_timeout": String, // "Timeout before health check fails.",
+                "unhealthy_threshold": String, // "Number times a check must fail before becoming unhealthy.",
+                "healthy_threshold": String, // "Number of times a check must succeed before returning to healthy status."
+            },
+            "proxy_protocol": Boolean, // "If `true`, you must configure backend nodes to accept Proxy protocol.
+
+* true
+* false (Default)",
+            "timeout": Integer, // "The maximum time allowed for the connection to remain inactive before timing out in seconds. This defaults to 600.",
+            "ssl_redirect": Boolean, // "If `true`, this will redirect all HTTP traffic to HTTPS.",
+            "http2": Boolean, // "If `true`, this will enable HTTP2 traffic.",
+            "http3": Boolean, // "If `true`, this will enable HTTP3/QUIC traffic.",
+            "nodes": Integer, // "The number of nodes to add to the load balancer (1-99), must be an odd number.",
+            "balancing_algorithm": String, // "The balancing algorithm.
+
+* roundrobin (default)
+* leastconn",
+            "instances": Array<String>, // "Send the complete array of Instances IDs that should be attached to this Load Balancer.",
+            "label": String, // "The label for your Load Balancer",
+            "vpc": String, // "ID of the VPC you wish to use. If a VPC ID is omitted it will default to the public network.",
+            "firewall_rules": [{
+                "port": Integer, // "Port for this rule.",
+                "source": String, // "If the source string is given a value of "cloudflare" then cloudflare IPs will be supplied.",
+                "ip_type": String, // "The type of IP rule.
+
+* v4
+* v6"
+            }],
+            "auto_ssl": {
+                "domain_zone": String, // "The domain zone. (example.com)",
+                "domain_sub": String, // "(optional) Subdomain to append to the domain zone."
+            },
+            "global_regions": Array<String>, // "Array of [Region ids](#operation/list-regions) to deploy child Load Balancers to."
+        }
+        ```
+        
+""",
+
+    "load_balancer_ssl": """
+### Request Methods
+- `DELETE`: Delete a Load Balancer SSL.
+
+### Path parameters
+- `load-balancer-id` - The [Load Balancer id](#operation/list-load-balancers).
+""",
+
+    "load_balancer_auto_ssl": """
+### Request Methods
+- `DELETE`: Remove a Load Balancer Auto SSL. This will not remove an ssl certificate from the load balancer.
+
+### Path parameters
+- `load-balancer-id` - The [Load Balancer id](#operation/list-load-balancers).
+""",
+
+    "load_balancer_forwarding_rules": """
+        ### Request Methods
+        - `GET`: List the fowarding rules for a Load Balancer.
+        - `POST`: Create a new forwarding rule for a Load Balancer.
+
+        ### Path parameters
+        - `load-balancer-id` - The [Load Balancer id](#operation/list-load-balancers).
+
+        ### Query parameters
+        - `GET`:
+            - `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+            - `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+
+        ### Request Body Schema
+        - `POST`:
+
+        ```js
+        {
+            "frontend_protocol": String, // "The protocol on the Load Balancer to forward to the backend.
+
+* HTTP
+* HTTPS
+* TCP",
+            "frontend_port": Integer, // "The port number on the Load Balancer to forward to the backend.",
+            "backend_protocol": String, // "The protocol destination on the backend server.
+
+* HTTP
+* HTTPS
+* TCP",
+            "backend_port": Integer, // "The port number destination on the backend server."
+        }
+        ```
+        
+""",
+
+    "load_balancer_forwarding_rule_by_id": """
+### Request Methods
+- `GET`: Get information for a Forwarding Rule on a Load Balancer.
+- `DELETE`: Delete a Forwarding Rule on a Load Balancer.
+
+### Path parameters
+- `load-balancer-id` - The [Load Balancer id](#operation/list-load-balancers).
+- `forwarding-rule-id` - The [Forwarding Rule id](#operation/list-load-balancer-forwarding-rules).
+""",
+
+    "load_balancer_firewall_rules": """
+### Request Methods
+- `GET`: List the firewall rules for a Load Balancer.
+
+### Path parameters
+- `load-balancer-id` - The [Load Balancer id](#operation/list-load-balancers).
+
+### Query parameters
+- `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+- `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+""",
+
+    "load_balancer_firewall_rule_by_id": """
+### Request Methods
+- `GET`: Get a firewall rule for a Load Balancer.
+
+### Path parameters
+- `load-balancer-id` - The [Load Balancer id](#operation/list-load-balancers).
+- `firewall-rule-id` - The [Firewall Rule id](#operation/list-loadbalancer-firewall-rules).
+""",
+
+    "marketplace_app_variables": """
+### Request Methods
+- `GET`: List all user-supplied variables for a Marketplace App.
+
+### Path parameters
+- `image-id` - The application's [Image ID](#operation/list-applications).
+""",
+
+    "operating_systems": """
+### Request Methods
+- `GET`: List the OS images available for installation at Vultr.
+
+### Query parameters
+- `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+- `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+""",
+
+    "plans": """
+### Request Methods
+- `GET`: Get a list of all VPS plans at Vultr.
+
+The response is an array of JSON `plan` objects, with unique `id` with sub-fields in the general format of:
+
+  <type>-<number of cores>-<memory size>-<optional modifier>
+
+For example: `vc2-24c-96gb-sc1`
+
+More about the sub-fields:
+
+* `<type>`: The Vultr type code. For example, `vc2`, `vhf`, `vdc`, etc.
+* `<number of cores>`: The number of cores, such as `4c` for "4 cores", `8c` for "8 cores", etc.
+* `<memory size>`: Size in GB, such as `32gb`.
+* `<optional modifier>`: Some plans include a modifier for internal identification purposes, such as CPU type or location surcharges.
+
+> Note: This information about plan id format is for general education. Vultr may change the sub-field format or values at any time. You should not attempt to parse the plan ID sub-fields in your code for any specific purpose.
+
+### Query parameters
+- `type` - Filter the results by type.
+
+| **Type** | **Description** |
+|----------|-----------------|
+| all | All available types |
+| vc2 | Cloud Compute |
+| vdc | Dedicated Cloud |
+| vhf | High Frequency Compute |
+| vhp | High Performance |
+| voc | All Optimized Cloud types |
+| voc-g | General Purpose Optimized Cloud |
+| voc-c | CPU Optimized Cloud |
+| voc-m | Memory Optimized Cloud |
+| voc-s | Storage Optimized Cloud |
+| vcg | Cloud GPU |
+- `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+- `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+- `os` - Filter the results by operating system.
+
+|   | Type | Description |
+| - | ------ | ------------- |
+|   | windows | All available plans that support windows |
+""",
+
+    "plans_metal": """
+### Request Methods
+- `GET`: Get a list of all Bare Metal plans at Vultr.
+
+The response is an array of JSON `plan` objects, with unique `id` with sub-fields in the general format of:
+
+  <type>-<number of cores>-<memory size>-<optional modifier>
+
+For example: `vc2-24c-96gb-sc1`
+
+More about the sub-fields:
+
+* `<type>`: The Vultr type code. For example, `vc2`, `vhf`, `vdc`, etc.
+* `<number of cores>`: The number of cores, such as `4c` for "4 cores", `8c` for "8 cores", etc.
+* `<memory size>`: Size in GB, such as `32gb`.
+* `<optional modifier>`: Some plans include a modifier for internal identification purposes, such as CPU type or location surcharges.
+
+> Note: This information about plan id format is for general education. Vultr may change the sub-field format or values at any time. You should not attempt to parse the plan ID sub-fields in your code for any specific purpose.
+
+### Query parameters
+- `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+- `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+""",
+
+    "regions": """
+### Request Methods
+- `GET`: List all Regions at Vultr.
+
+### Query parameters
+- `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+- `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+""",
+
+    "region_availability": """
+### Request Methods
+- `GET`: Get a list of the available plans in Region `region-id`. Not all plans are available in all regions.
+
+### Path parameters
+- `region-id` - The [Region id](#operation/list-regions).
+
+### Query parameters
+- `type` - Filter the results by type.
+
+| **Type** | **Description** |
+|----------|-----------------|
+| all | All available types |
+| vc2 | Cloud Compute |
+| vdc | Dedicated Cloud |
+| vhf | High Frequency Compute |
+| vhp | High Performance |
+| voc | All Optimized Cloud types |
+| voc-g | General Purpose Optimized Cloud |
+| voc-c | CPU Optimized Cloud |
+| voc-m | Memory Optimized Cloud |
+| voc-s | Storage Optimized Cloud |
+| vbm | Bare Metal |
+| vcg | Cloud GPU |
+""",
+
+    "reserved_ips": """
+        ### Request Methods
+        - `GET`: List all Reserved IPs in your account.
+        - `POST`: Create a new Reserved IP. The `region` and `ip_type` attributes are required.
+
+        ### Request Body Schema
+        - `POST`:
+
+        ```js
+        {
+            "region": String, // The [Region id](#operation/list-regions) where the Reserved IP will be created.
+            "ip_type": String, // The type of IP address.
+
+* v4
+* v6
+            "label": String // The user-supplied label.
+        }
+        ```
+        
+""",
+
+    "reserved_ip_by_id": """
+### Request Methods
+- `GET`: Get information about a Reserved IP.
+- `PATCH`: Update information on a Reserved IP.
+- `DELETE`: Delete a Reserved IP.
+
+### Path parameters
+- `reserved-ip` - The [Reserved IP id](#operation/list-reserved-ips).
+
+### Request Body Schema
+- `PATCH`:
+
+```js
+{
+    "label": String // The user-supplied label.
+}
+```
+""",
+
+    "reserved_ip_attach": """
+### Request Methods
+- `POST`: Attach a Reserved IP to an compute instance or a baremetal instance - `instance_id`.
+
+### Path parameters
+- `reserved-ip` - The [Reserved IP id](#operation/list-reserved-ips).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "instance_id": String // Attach the Reserved IP to a [Compute Instance id](#operation/list-instances) or a [Bare Metal Instance id](#operation/list-baremetals).
+}
+```
+""",
+
+    "reserved_ip_detach": """
+### Request Methods
+- `POST`: Detach a Reserved IP.
+
+### Path parameters
+- `reserved-ip` - The [Reserved IP id](#operation/list-reserved-ips).
+""",
+
+    "reserved_ip_convert": """
+### Request Methods
+- `POST`: Convert the `ip_address` of an existing [instance](#operation/list-instances) into a Reserved IP.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "ip_address": String, // The IP address to convert.
+    "label": String // A user-supplied label for this IP address.
+}
+```
+""",
+
+    "snapshots": """
+### Request Methods
+- `GET`: Get information about all Snapshots in your account.
+- `POST`: Create a new Snapshot for `instance_id`.
+
+### Query parameters
+- `GET`:
+    - `description` - Filter the list of Snapshots by `description`.
+    - `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+    - `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "instance_id": String, // Create a Snapshot for this [Instance id](#operation/list-instances).
+    "description": String // The user-supplied description of the Snapshot.
+}
+```
+""",
+
+    "snapshot_by_id": """
+### Request Methods
+- `GET`: Get information about a Snapshot.
+- `PUT`: Update the description for a Snapshot.
+- `DELETE`: Delete a Snapshot.
+
+### Path parameters
+- `snapshot-id` - The [Snapshot id](#operation/list-snapshots).
+
+### Request Body Schema
+- `PUT`:
+
+```js
+{
+    "description": String // The user-supplied description for the Snapshot.
+}
+```
+""",
+
+    "snapshot_create_from_url": """
+### Request Methods
+- `POST`: Create a new Snapshot from a RAW image located at `url`.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "url": String, // The public URL containing a RAW image.
+    "description": Optional<String>, // The user-supplied description of the Snapshot.
+    "uefi": Optional<String> // Whether or not the snapshot uses UEFI.
+}
+```
+""",
+
+    "startup_script_by_id": """
+        ### Request Methods
+        - `GET`: Get information for a Startup Script.
+        - `PATCH`: Update a Startup Script.
+        - `DELETE`: Delete a Startup Script.
+
+        ### Path parameters
+        - `startup-id` - The [Startup Script id](#operation/list-startup-scripts).
+
+        ### Request Body Schema
+        - `PATCH`:
+
+        ```js
+        {
+            "name": String, // The name of the Startup Script.
+            "script": String, // The base-64 encoded Startup Script.
+            "type": String // The Startup Script type.
+
+boot (default)
+pxe
+        }
+        ```
+        
+""",
+
+    "ssh_keys": """
+### Request Methods
+- `GET`: List all SSH Keys in your account.
+- `POST`: Create a new SSH Key for use with future instances.
+
+### Query parameters
+- `GET`:
+    - `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+    - `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "name": String, // The user-supplied name for this SSH Key.
+    "ssh_key": String // The SSH Key.
+}
+```
+""",
+
+    "ssh_key_by_id": """
+### Request Methods
+- `GET`: Get information about an SSH Key.
+- `PATCH`: Update an SSH Key.
+- `DELETE`: Delete an SSH Key.
+
+### Path parameters
+- `ssh-key-id` - The [SSH Key id](#operation/list-ssh-keys).
+
+### Request Body Schema
+- `PATCH`:
+
+```js
+{
+    "name": String, // The user-supplied name for this SSH Key.
+    "ssh_key": String // The SSH Key.
+}
+```
+""",
+
+    "users": """
+        ### Request Methods
+        - `GET`: Get a list of all Users in your account.
+        - `POST`: Create a new User. The `email`, `name`, and `password` attributes are required.
+
+        ### Query parameters
+        - `GET`:
+            - `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+            - `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+
+        ### Request Body Schema
+        - `POST`:
+
+        ```js
+        {
+            "email": String, // The User's email address.
+            "name": String, // The User's name.
+            "password": String, // The User's password.
+            "api_enabled": Boolean, // API access is permitted for this User.
+
+* true (default)
+* false
+            "acls": Array<String> // An array of permissions granted.
+
+* abuse
+* alerts
+* billing
+* dns
+* firewall
+* loadbalancer
+* manage_users
+* objstore
+* provisioning
+* subscriptions
+* subscriptions_view
+* support
+* upgrade
+        }
+        ```
+        
+""",
+
+    "user_by_id": """
+        ### Request Methods
+        - `GET`: Get information about a User.
+        - `PATCH`: Update information for a User.
+        - `DELETE`: Delete a User.
+
+        ### Path parameters
+        - `user-id` - The [User id](#operation/list-users).
+
+        ### Request Body Schema
+        - `PATCH`:
+
+        ```js
+        {
+            "email": String, // The User's email address.
+            "name": String, // The User's name.
+            "password": String, // The User's password.
+            "api_enabled": Boolean, // API access is permitted for this User.
+
+* true (default)
+* false
+            "acls": Array<String> // An array of permission granted. Valid values:
+
+* abuse
+* alerts
+* billing
+* dns
+* firewall
+* loadbalancer
+* manage_users
+* objstore
+* provisioning
+* subscriptions
+* subscriptions_view
+* support
+* upgrade
+        }
+        ```
+        
+""",
+
+    "subaccounts": """
+### Request Methods
+- `GET`: Get information about all sub-accounts for your account.
+- `POST`: Create a new subaccount.
+
+### Query parameters
+- `GET`:
+    - `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+    - `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "email": String, // Create a new sub-account with this email address.
+    "subaccount_name": String, // Your name for this sub-account.
+    "subaccount_id": String // Your ID for this sub-account.
+}
+```
+""",
+
+    "vpcs": """
+### Request Methods
+- `GET`: Get a list of all VPCs in your account.
+- `POST`: Create a new VPC in a `region`. VPCs should use [RFC1918 private address space](https://tools.ietf.org/html/rfc1918).
+
+### Query parameters
+- `GET`:
+    - `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+    - `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "region": String, // Create the VPC in this [Region id](#operation/list-regions).
+    "description": Optional<String>, // A description of the VPC.
+    "v4_subnet": Optional<String>, // The IPv4 VPC address. For example: 10.99.0.0 *If v4_subnet_mask is specified then v4_subnet is a required field.
+    "v4_subnet_mask": Optional<Integer> // The number of bits for the netmask in CIDR notation. Example: 24 *If v4_subnet is specified then v4_subnet_mask is a required field.
+}
+```
+""",
+
+    "vpc_by_id": """
+### Request Methods
+- `GET`: Get information about a VPC.
+- `PUT`: Update information for a VPC.
+- `DELETE`: Delete a VPC.
+
+### Path parameters
+- `vpc-id` - The [VPC ID](#operation/list-vpcs).
+
+### Request Body Schema
+- `PUT`:
+
+```js
+{
+    "description": String // The VPC description.
+}
+```
+""",
+
+    "vpc2s": """
+### Request Methods
+- `GET`: Get a list of all VPC 2.0 networks in your account.
+- `POST`: Create a new VPC 2.0 network in a `region`. VPCs should use [RFC1918 private address space](https://tools.ietf.org/html/rfc1918):
+
+    - 10.0.0.0    - 10.255.255.255  (10/8 prefix)
+    - 172.16.0.0  - 172.31.255.255  (172.16/12 prefix)
+    - 192.168.0.0 - 192.168.255.255 (192.168/16 prefix)
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "region": String, // "The [Region id](#operation/list-regions) to create the instance.",
+    "description": Optional<String>"A description of the VPC. </br> Must be no longer than 255 characters and may include only letters, numbers, spaces, underscores and hyphens.",
+    "ip_block": Optional<String>"The VPC subnet IP address. For example: 10.99.0.0<br><span style="color: red">If a prefix_length is specified then ip_block is a required field.</span>",
+    "prefix_length": Optional<Integer>"The number of bits for the netmask in CIDR notation. Example: 24<br><span style="color: red">If an ip_block is specified then prefix_length is a required field.</span>"
+}
+```
+""",
+
+    "vpc2_by_id": """
+### Request Methods
+- `GET`: Get information about a VPC 2.0 network.
+- `PUT`: Update information for a VPC 2.0 network.
+- `DELETE`: Delete a VPC 2.0 network.
+
+### Path parameters
+- `vpc-id`: The [VPC ID](#operation/list-vpcs).
+
+### Request Body Schema
+- `PUT`:
+
+```js
+{
+    "description": String, // "The VPC description. </br> Must be no longer than 255 characters and may include only letters, numbers, spaces, underscores and hyphens."
+}
+```
+""",
+
+    "vpc2_nodes": """
+### Request Methods
+- `GET`: Get a list of nodes attached to a VPC 2.0 network.
+
+### Path parameters
+- `vpc-id`: The [VPC ID](#operation/list-vpcs).
+
+### Query Parameters
+- `per_page`: Number of items requested per page. Default is 100 and Max is 500.
+- `cursor`: Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+""",
+
+    "vpc2_attach_nodes": """
+### Request Methods
+- `POST`: Attach nodes to a VPC 2.0 network.
+
+### Path parameters
+- `vpc-id`: The [VPC ID](#operation/list-vpcs).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "nodes": Array<Array<String>>, // "An array of ID strings for [instances](#operation/list-instances) and [Bare Metal servers](#operation/list-baremetals) to attach as nodes to the VPC 2.0 network. A limit of 1000 nodes can be processed in a request"
+}
+```
+""",
+
+    "vpc2_detach_nodes": """
+### Request Methods
+- `POST`: Remove nodes from a VPC 2.0 network.
+
+### Path parameters
+- `vpc-id`: The [VPC ID](#operation/list-vpcs).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "nodes": Array<Array<String>>, // "An array of ID strings for [nodes](#operation/list-vpc2-nodes) to detach from the VPC 2.0 network. A limit of 1000 nodes can be processed in a request"
+}
+```
+""",
+
+    "vfs_regions": """
+### Request Methods
+- `GET`: Retrieve a list of all regions where VFS can be deployed.
+""",
+
+    "vfs_subscriptions": """
+### Request Methods
+- `GET`: Retrieve a list of all VFS subscriptions for the account.
+- `POST`: Create a new VFS subscription with the specified configuration.
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "region": String, // "Region identifier where to create the VFS",
+    "label": String, // "User-defined label for the VFS subscription",
+    "storage_size": {
+        "gb": Integer, // "Size in gigabytes for the VFS"
+    },
+    "disk_type": Optional<String>, // "Type of storage disk (defaults to nvme if not specified)",
+    "tags": Optional<Array<String>>, // "Optional tags to apply to the VFS subscription"
+}
+```
+
+### Required Fields
+- `region`
+- `label`
+- `storage_size`
+""",
+
+    "vfs_subscription_by_id": """
+### Request Methods
+- `GET`: Retrieve a specific VFS subscription by ID.
+- `PUT`: Update a VFS subscription's label or storage size.
+- `DELETE`: Delete a specific VFS subscription by ID.
+
+### Path parameters
+- `vfs_id`: ID of the VFS subscription to retrieve
+
+### Request Body Schema
+- `PUT`:
+
+```js
+{
+    "label": String, // "New label for the VFS subscription",
+    "storage_size": {
+        "gb": Integer, // "Size in gigabytes for the VFS"
+    }
+}
+```
+""",
+
+    "vfs_subscription_attachments": """
+### Request Methods
+- `GET`: Retrieve a list of all attachments for a specific VFS subscription.
+
+### Path parameters
+- `vfs_id`: ID of the VFS subscription
+""",
+
+    "vfs_subscription_attachment_by_vps_id": """
+### Request Methods
+- `PUT`: Attach a VPS instance to a VFS subscription.
+- `GET`: Retrieve details about a specific VFS-VPS attachment.
+- `DELETE`: Detach a VPS instance from a VFS subscription.
+
+### Path parameters
+- `vfs_id`: ID of the VFS subscription
+- `vps_id`: ID of the VPS subscription to attach
+""",
+
+    "object_storages": """
+### Request Methods
+- `GET`: Get a list of all Object Storage in your account.
+- `POST`: Create new Object Storage. The `cluster_id` attribute is required.
+
+### Query Parameters
+- `GET`:
+    - `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+    - `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "cluster_id": Integer, // "The [Cluster id](#operation/list-object-storage-clusters) where the Object Storage will be created.",
+    "label": Optional<String>, "The user-supplied label for this Object Storage."
+}
+```
+
+### Required Fields
+- `cluster_id`
+""",
+
+    "object_storage_by_id": """
+### Request Methods
+- `GET`: Get information about an Object Storage.
+- `PUT`: Update the label for an Object Storage.
+- `DELETE`: Delete an Object Storage.
+
+### Path parameters
+- `object-storage-id` - The [Object Storage id](#operation/list-object-storages).
+
+### Request Body Schema
+- `PUT`:
+
+```js
+{
+    "label": Optional<String>, // "The user-supplied label for the Object Storage."
+}
+```
+""",
+
+    "object_storage_regenerate_keys": """
+### Request Methods
+- `POST`: Regenerate the keys for an Object Storage.
+
+### Path parameters
+- `object-storage-id` - The [Object Storage id](#operation/list-object-storages).
+""",
+
+    "object_storage_clusters": """
+### Request Methods
+- `GET`: Get a list of all Object Storage Clusters.
+
+### Query Parameters
+- `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+- `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+""",
+
+    "isos": """
+### Request Methods
+- `GET`: Get the ISOs in your account.
+- `POST`: Create a new ISO in your account from `url`.
+
+### Query Parameters
+- `GET`:
+    - `per_page` - Number of items requested per page. Default is 100 and Max is 500.
+    - `cursor` - Cursor for paging. See [Meta and Pagination](#section/Introduction/Meta-and-Pagination).
+
+### Request Body Schema
+- `POST`:
+
+```js
+{
+    "url": String, // "Public URL location of the ISO image to download. Example: https://example.com/my-iso.iso"
+}
+```
+""",
+
+    "iso_by_id": """
+### Request Methods
+- `GET`: Get information for an ISO.
+- `DELETE`: Delete an ISO.
+
+### Path parameters
+- `iso-id` - The [ISO id](#operation/list-isos).
+""",
+
+    "isos_public": """
+### Request Methods
+- `GET`: List all Vultr Public ISOs.
+""",
+}
@@ -0,0 +1,68 @@
+from collections.abc import Mapping
+from string import Formatter
+
+class RouteTemplate:
+    """
+    An API path template such as `instances/{instance-id}/ipv4`, compiled once.
+
+    Instances are immutable and shared between every `Url` built from the same template, so they
+    are safe to use from any number of concurrent tasks. Use `RouteTemplate.compile()` rather than
+    the constructor to get the cached instance.
+    """
+    __slots__ = ("_template", "_placeholders")
+
+    _compiled: dict[str, 'RouteTemplate'] = {}
+
+    def __init__(self, template: str):
+        placeholders: list[str] = []
+        for _, field_name, format_spec, conversion in Formatter().parse(template):
+            if field_name is None:
+                continue
+            if not field_name or format_spec or conversion:
+                raise ValueError(f"Invalid placeholder in route template '{template}'")
+            if field_name not in placeholders:
+                placeholders.append(field_name)
+
+        object.__setattr__(self, "_template", template)
+        object.__setattr__(self, "_placeholders", tuple(placeholders))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("RouteTemplate is immutable")
+
+    def __repr__(self) -> str:
+        return f"RouteTemplate({self._template!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RouteTemplate) and other._template == self._template
+
+    def __hash__(self) -> int:
+        return hash(self._template)
+
+    @staticmethod
+    def compile(template: str) -> 'RouteTemplate':
+        """
+        Get the compiled template for `template`, compiling it on first use.
+        """
+        route = RouteTemplate._compiled.get(template)
+        if route is None:
+            route = RouteTemplate._compiled.setdefault(template, RouteTemplate(template))
+        return route
+
+    @property
+    def template(self) -> str:
+        return self._template
+
+    @property
+    def placeholders(self) -> tuple[str, ...]:
+        return self._placeholders
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """
+        Fill every placeholder from `values` in a single format call.
+        """
+        if not self._placeholders:
+            return self._template
+        try:
+            return self._template.format_map(values)
+        except KeyError as missing:
+            raise ValueError(f"Missing value for placeholder {missing} in route '{self._template}'") from None
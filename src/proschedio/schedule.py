@@ -0,0 +1,526 @@
+import asyncio
+import heapq
+import inspect
+import logging
+import math
+import os
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from datetime import datetime, timedelta, tzinfo
+from typing import TYPE_CHECKING, Any, Protocol
+
+from .codec import JsonCodec
+
+if TYPE_CHECKING:
+    import sqlite3
+
+logger = logging.getLogger(__name__)
+
+Task = Callable[..., Awaitable[object] | object]
+
+# --- Triggers ---
+class Trigger(Protocol):
+    def next_fire(self, after: float) -> float | None:
+        """
+        The first fire time strictly after `after` (epoch seconds), or `None` if there is none.
+        """
+        ...
+
+    def to_dict(self) -> dict[str, Any]: ...
+
+class IntervalTrigger:
+    """
+    Fires every `seconds`, aligned to `start` (epoch seconds; default: when the trigger is created).
+    """
+    def __init__(self, seconds: float, start: float | None = None):
+        if seconds <= 0:
+            raise ValueError("Interval must be positive.")
+        self.seconds = seconds
+        self.start = time.time() if start is None else start
+
+    def next_fire(self, after: float) -> float | None:
+        if after < self.start:
+            return self.start
+        return self.start + (math.floor((after - self.start) / self.seconds) + 1) * self.seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"type": "interval", "seconds": self.seconds, "start": self.start}
+
+_CRON_FIELDS: tuple[tuple[str, int, int], ...] = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    # 7 is accepted as Sunday too.
+    ("weekday", 0, 7),
+)
+
+def _parse_cron_field(spec: str, name: str, low: int, high: int) -> frozenset[int]:
+    values: set[int] = set()
+    for part in spec.split(","):
+        body, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if body == "*":
+            first, last = low, high
+        elif "-" in body:
+            first_text, _, last_text = body.partition("-")
+            first, last = int(first_text), int(last_text)
+        else:
+            first = int(body)
+            last = high if step_text else first
+        if step < 1 or first < low or last > high or first > last:
+            raise ValueError(f"Invalid cron {name} field: {spec}")
+        values.update(value % 7 if name == "weekday" else value for value in range(first, last + 1, step))
+    return frozenset(values)
+
+class CronTrigger:
+    """
+    Classic five-field cron expression (`minute hour day month weekday`), e.g. `"0 22 * * 1-5"`.
+
+    Fields accept `*`, lists, ranges and steps; weekday 0 or 7 is Sunday. As in cron, when both
+    day and weekday are restricted a time matches if either does. Times are wall-clock times in
+    `tz` (default: the local time zone, with its DST rules), so `"0 9 * * *"` stays at 09:00 across
+    DST changes. A time that occurs twice when clocks go back fires once, at its first occurrence;
+    a time skipped when clocks go forward fires once, at the jump (02:30 fires at 03:00).
+    """
+    def __init__(self, expression: str, tz: tzinfo | None = None):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: {expression}")
+        self.expression = expression
+        self.tz = tz
+        self._minutes, self._hours, self._days, self._months, self._weekdays = (
+            _parse_cron_field(spec, name, low, high) for spec, (name, low, high) in zip(fields, _CRON_FIELDS)
+        )
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day = moment.day in self._days
+        # datetime.weekday() is Monday=0; cron is Sunday=0.
+        weekday = (moment.weekday() + 1) % 7 in self._weekdays
+        if self._any_day or self._any_weekday:
+            return day and weekday
+        return day or weekday
+
+    def _wall(self, timestamp: float) -> datetime:
+        return datetime.fromtimestamp(timestamp, self.tz).replace(tzinfo=None)
+
+    def _timestamp(self, moment: datetime) -> float:
+        """
+        Epoch seconds of the wall-clock time `moment` in `tz`. A time that occurs twice (clocks going
+        back) is its first occurrence; a time that does not occur (clocks going forward) is the
+        instant the clocks jump past it.
+        """
+        aware = moment if self.tz is None else moment.replace(tzinfo=self.tz)
+        earliest, latest = sorted((aware.replace(fold=0).timestamp(), aware.replace(fold=1).timestamp()))
+        if self._wall(earliest) == moment or earliest == latest:
+            return earliest
+        # `earliest` is the skipped time read with the offset from before the jump, so it lies
+        # before the jump; the first minute reading at least `moment` is the jump itself.
+        fire = earliest
+        while self._wall(fire) < moment:
+            fire += 60
+        return fire
+
+    def next_fire(self, after: float) -> float | None:
+        # Matching runs on naive wall-clock time, so a DST change moves no fire time; only the final
+        # conversion applies the zone's offset for that day.
+        moment = self._wall(after).replace(second=0, microsecond=0, fold=0) + timedelta(minutes=1)
+        limit = moment + timedelta(days=366 * 5)
+        while moment < limit:
+            if moment.month not in self._months:
+                moment = (moment.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+                continue
+            if not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if moment.hour not in self._hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+                continue
+            if moment.minute not in self._minutes:
+                moment += timedelta(minutes=1)
+                continue
+            fire = self._timestamp(moment)
+            # A repeated wall-clock time already passed in its first occurrence does not fire again.
+            if fire > after:
+                return fire
+            moment += timedelta(minutes=1)
+        return None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"type": "cron", "expression": self.expression, "tz": getattr(self.tz, "key", None)}
+
+def trigger_from_dict(data: Mapping[str, Any]) -> Trigger:
+    if data["type"] == "interval":
+        return IntervalTrigger(data["seconds"], data["start"])
+    if data["type"] == "cron":
+        tz: tzinfo | None = None
+        if data.get("tz"):
+            from zoneinfo import ZoneInfo
+            tz = ZoneInfo(data["tz"])
+        return CronTrigger(data["expression"], tz)
+    raise ValueError(f"Unknown trigger type: {data['type']}")
+
+def _schedule_of(trigger: Trigger) -> dict[str, Any]:
+    """
+    A trigger's definition without its anchor, which differs every time an interval is redeclared.
+    """
+    return {key: value for key, value in trigger.to_dict().items() if key != "start"}
+
+# --- Jobs ---
+class Job:
+    """
+    A task scheduled by a trigger.
+
+    - `task`: Name of a task registered with `Scheduler.register_task()`; `args`/`kwargs` must be
+      JSON-serializable so the job survives restarts.
+    - `job_type`: Concurrency group (see `Scheduler.set_concurrency()`).
+    - `jitter`: Up to this many seconds are added at random to each run, to spread fleets out.
+    - `misfire_grace`: A run that is more than this many seconds late (e.g. after downtime) is skipped.
+    - `coalesce`: If several runs were missed, run once instead of once per missed run.
+    - `max_instances`: Runs of this job allowed at the same time; extra runs are skipped.
+    """
+    def __init__(
+        self,
+        id: str,
+        task: str,
+        trigger: Trigger,
+        args: Iterable[Any] = (),
+        kwargs: Mapping[str, Any] | None = None,
+        job_type: str = "default",
+        jitter: float = 0.0,
+        misfire_grace: float = 60.0,
+        coalesce: bool = True,
+        max_instances: int = 1,
+        next_run: float | None = None,
+    ):
+        self.id = id
+        self.task = task
+        self.trigger = trigger
+        self.args = list(args)
+        self.kwargs = dict(kwargs or {})
+        self.job_type = job_type
+        self.jitter = jitter
+        self.misfire_grace = misfire_grace
+        self.coalesce = coalesce
+        self.max_instances = max_instances
+        self.next_run = next_run if next_run is not None else trigger.next_fire(time.time())
+        # Bumped whenever the job is rescheduled, so stale heap entries can be recognized.
+        self.version = 0
+        self.runs = 0
+        self.failures = 0
+        self.misfires = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "task": self.task,
+            "trigger": self.trigger.to_dict(),
+            "args": self.args,
+            "kwargs": self.kwargs,
+            "job_type": self.job_type,
+            "jitter": self.jitter,
+            "misfire_grace": self.misfire_grace,
+            "coalesce": self.coalesce,
+            "max_instances": self.max_instances,
+            "next_run": self.next_run,
+        }
+
+    @staticmethod
+    def from_dict(data: Mapping[str, Any]) -> 'Job':
+        return Job(**{**data, "trigger": trigger_from_dict(data["trigger"])})
+
+    def __repr__(self) -> str:
+        return f"Job({self.id!r}, task={self.task!r}, next_run={self.next_run})"
+
+# --- Stores ---
+class JobStore(Protocol):
+    def load(self) -> list[Job]: ...
+
+    def save(self, jobs: Iterable[Job]) -> None: ...
+
+    def delete(self, job_id: str) -> None: ...
+
+class MemoryJobStore:
+    """
+    Keeps nothing across restarts.
+    """
+    def load(self) -> list[Job]:
+        return []
+
+    def save(self, jobs: Iterable[Job]) -> None:
+        pass
+
+    def delete(self, job_id: str) -> None:
+        pass
+
+class SQLiteJobStore:
+    """
+    Persists job definitions and their next run time, so a restarted scheduler resumes where it
+    stopped and applies misfire handling to runs it missed while down.
+
+    The scheduler saves run state from a worker thread, so every method holds a lock around the
+    connection.
+    """
+    def __init__(self, path: str):
+        self._path = path
+        self._connection: 'sqlite3.Connection | None' = None
+        self._lock = threading.Lock()
+
+    def _db(self) -> 'sqlite3.Connection':
+        import sqlite3
+
+        if self._connection is None:
+            if self._path != ":memory:":
+                os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+            self._connection = sqlite3.connect(self._path, check_same_thread=False)
+            self._connection.execute("CREATE TABLE IF NOT EXISTS jobs (id TEXT PRIMARY KEY, body BLOB NOT NULL)")
+        return self._connection
+
+    def load(self) -> list[Job]:
+        codec = JsonCodec.get()
+        jobs: list[Job] = []
+        with self._lock:
+            rows = self._db().execute("SELECT id, body FROM jobs").fetchall()
+        for job_id, body in rows:
+            try:
+                jobs.append(Job.from_dict(codec.decode(body)))  # type: ignore[arg-type]
+            except (KeyError, TypeError, ValueError) as error:
+                logger.error("Skipping unreadable stored job %s: %s", job_id, error)
+        return jobs
+
+    def save(self, jobs: Iterable[Job]) -> None:
+        codec = JsonCodec.get()
+        rows = [(job.id, codec.encode(job.to_dict())) for job in jobs]
+        with self._lock, self._db() as db:
+            db.executemany("INSERT OR REPLACE INTO jobs VALUES (?, ?)", rows)
+
+    def delete(self, job_id: str) -> None:
+        with self._lock, self._db() as db:
+            db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+# --- Scheduler ---
+class Scheduler:
+    """
+    Asyncio job scheduler: a min-heap of run times, so each due job costs O(log n) however many
+    jobs are scheduled.
+
+    ```python
+    scheduler = Scheduler(SQLiteJobStore("jobs.sqlite3"))
+    actions = Action.instance(ProviderUrl("vultr"))
+    scheduler.register_task("halt", actions.halt_instance)
+    scheduler.set_concurrency("power", 10)
+    for instance_id in instance_ids:
+        scheduler.add_job(Job(f"halt-{instance_id}", "halt", CronTrigger("0 22 * * *"), args=[instance_id], job_type="power", jitter=120))
+    await scheduler.start()
+    ```
+
+    Tasks may be plain or async functions; a returned `Result` that is an error counts as a failure.
+    """
+    def __init__(self, store: JobStore | None = None, default_concurrency: int = 32):
+        self._store: JobStore = store if store is not None else MemoryJobStore()
+        self._default_concurrency = default_concurrency
+        self._tasks: dict[str, Task] = {}
+        self._jobs: dict[str, Job] = {}
+        # (run at, sequence, job id, job version)
+        self._heap: list[tuple[float, int, str, int]] = []
+        self._sequence = 0
+        self._limits: dict[str, int] = {}
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        self._running: dict[str, int] = {}
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._wake = asyncio.Event()
+        self._loop_task: asyncio.Task[None] | None = None
+        self._dirty: dict[str, Job] = {}
+        self._restored = False
+        self._random = random.Random()
+
+    # --- Configuration ---
+    def register_task(self, name: str, func: Task) -> None:
+        self._tasks[name] = func
+
+    def task(self, name: str) -> Callable[[Task], Task]:
+        """
+        Decorator form of `register_task()`.
+        """
+        def register(func: Task) -> Task:
+            self.register_task(name, func)
+            return func
+        return register
+
+    def set_concurrency(self, job_type: str, limit: int) -> None:
+        """
+        Run at most `limit` jobs of `job_type` at once. Applies to runs started afterwards.
+        """
+        if limit < 1:
+            raise ValueError("Concurrency limit must be at least 1.")
+        self._limits[job_type] = limit
+        self._slots.pop(job_type, None)
+
+    def _slot(self, job_type: str) -> asyncio.Semaphore:
+        slot = self._slots.get(job_type)
+        if slot is None:
+            slot = asyncio.Semaphore(self._limits.get(job_type, self._default_concurrency))
+            self._slots[job_type] = slot
+        return slot
+
+    # --- Jobs ---
+    def get_job(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def jobs(self) -> list[Job]:
+        return list(self._jobs.values())
+
+    def add_job(self, job: Job, replace_existing: bool = True) -> Job:
+        """
+        Schedule `job`. If a job with the same id was restored from the store with the same trigger,
+        its pending run time is kept, so redeclaring jobs at startup does not lose missed runs.
+        """
+        self._restore()
+        existing = self._jobs.get(job.id)
+        if existing is not None:
+            if not replace_existing:
+                raise ValueError(f"Job '{job.id}' already exists")
+            if _schedule_of(existing.trigger) == _schedule_of(job.trigger):
+                job.trigger = existing.trigger
+                job.next_run = existing.next_run
+            job.version = existing.version + 1
+        self._jobs[job.id] = job
+        self._push(job)
+        self._store.save([job])
+        return job
+
+    def remove_job(self, job_id: str) -> None:
+        self._restore()
+        if self._jobs.pop(job_id, None) is not None:
+            self._dirty.pop(job_id, None)
+            self._store.delete(job_id)
+
+    def _push(self, job: Job) -> None:
+        if job.next_run is None:
+            return
+        run_at = job.next_run + (self._random.uniform(0, job.jitter) if job.jitter else 0.0)
+        self._sequence += 1
+        heapq.heappush(self._heap, (run_at, self._sequence, job.id, job.version))
+        if self._heap[0][1] == self._sequence:
+            self._wake.set()
+
+    def _restore(self) -> None:
+        if self._restored:
+            return
+        self._restored = True
+        for job in self._store.load():
+            self._jobs[job.id] = job
+            self._push(job)
+
+    # --- Loop ---
+    async def start(self) -> None:
+        """
+        Restore stored jobs and start the scheduling loop in the background.
+        """
+        self._restore()
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = asyncio.ensure_future(self._run())
+        logger.info("Scheduler started with %d jobs", len(self._jobs))
+
+    async def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop scheduling. With `wait`, let running jobs finish; otherwise cancel them.
+        """
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
+        if not wait:
+            for task in self._in_flight:
+                task.cancel()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+        await self._flush()
+
+    async def _flush(self) -> None:
+        # Runs on every tick, so the store is written from a worker thread, off the event loop.
+        if self._dirty:
+            jobs = list(self._dirty.values())
+            self._dirty.clear()
+            await asyncio.to_thread(self._store.save, jobs)
+
+    async def _run(self) -> None:
+        while True:
+            self._wake.clear()
+            now = time.time()
+            while self._heap and self._heap[0][0] <= now:
+                _, _, job_id, version = heapq.heappop(self._heap)
+                job = self._jobs.get(job_id)
+                if job is None or job.version != version:
+                    continue
+                self._fire(job, now)
+            await self._flush()
+
+            delay = self._heap[0][0] - time.time() if self._heap else None
+            try:
+                await asyncio.wait_for(self._wake.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def _fire(self, job: Job, now: float) -> None:
+        scheduled = job.next_run
+        assert scheduled is not None
+        late = now - scheduled - job.jitter
+
+        if late > job.misfire_grace:
+            job.misfires += 1
+            logger.warning("Job %s misfired: run due at %s was %.0fs late", job.id, datetime.fromtimestamp(scheduled).isoformat(), late)
+        elif self._running.get(job.id, 0) >= job.max_instances:
+            logger.warning("Job %s skipped: %d run(s) still in progress", job.id, self._running[job.id])
+        else:
+            self._dispatch(job)
+
+        # Coalescing skips every run already missed; otherwise missed runs are replayed one per tick.
+        job.next_run = job.trigger.next_fire(now if job.coalesce else scheduled)
+        job.version += 1
+        self._dirty[job.id] = job
+        self._push(job)
+
+    def _dispatch(self, job: Job) -> None:
+        func = self._tasks.get(job.task)
+        if func is None:
+            job.failures += 1
+            logger.error("Job %s refers to unregistered task '%s'", job.id, job.task)
+            return
+
+        self._running[job.id] = self._running.get(job.id, 0) + 1
+        task = asyncio.ensure_future(self._execute(job, func))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _execute(self, job: Job, func: Task) -> None:
+        try:
+            async with self._slot(job.job_type):
+                outcome = func(*job.args, **job.kwargs)
+                if inspect.isawaitable(outcome):
+                    outcome = await outcome
+            job.runs += 1
+            is_err = getattr(outcome, "is_err", None)
+            if callable(is_err) and is_err():
+                job.failures += 1
+                logger.warning("Job %s returned an error: %s", job.id, outcome.unwrap_err())  # type: ignore[attr-defined]
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            job.failures += 1
+            logger.error("Job %s failed: %s", job.id, error, exc_info=True)
+        finally:
+            self._running[job.id] -= 1
@@ -0,0 +1,461 @@
+"""
+In-process stand-in for the Vultr v2 API, for offline tests and benchmarks.
+
+`FakeVultrServer` serves every route in `proschedio.const.ROUTES` from an in-memory store:
+
+- collection routes (`instances`, `domains/{dns-domain}/records`, ...) list with Vultr-style cursor
+  pagination and create on `POST`;
+- item routes (`instances/{instance-id}`, ...) get, update and delete;
+- everything else answers `GET` with `{}` (or a fixture set via `set_fixture`) and other methods
+  with `204`, recording the call.
+
+Latency, 429 injection and large synthetic inventories are configurable:
+
+```python
+async with FakeVultrServer(latency=0.005, throttle_rate=0.01) as server:
+    server.install()  # point the "vultr" provider at the fake server
+    server.seed("instances", 20_000)
+    ...
+```
+"""
+import asyncio
+import base64
+import logging
+import random
+import re
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import unquote
+
+from aiohttp import web
+
+from .const import ROUTES, ProviderRegistry
+from .routes import RouteTemplate
+
+logger = logging.getLogger(__name__)
+
+Item = dict[str, Any]
+
+DEFAULT_PER_PAGE = 100
+MAX_PER_PAGE = 500
+
+# Response keys that do not follow the "last path segment" convention.
+_LIST_KEYS: dict[str, str] = {
+    "billing/history": "billing_history",
+    "billing/invoices": "billing_invoices",
+    "billing/invoices/{invoice-id}/items": "invoice_items",
+    "blocks": "blocks",
+    "firewalls": "firewall_groups",
+    "iso": "isos",
+    "iso-public": "public_isos",
+    "kubernetes/clusters": "vke_clusters",
+    "object-storage": "object_storages",
+    "os": "os",
+    "plans-metal": "plans_metal",
+    "registries": "registries",
+    "vpc2": "vpcs",
+}
+_ITEM_KEYS: dict[str, str] = {
+    "blocks": "block",
+    "firewalls": "firewall_group",
+    "iso": "iso",
+    "kubernetes/clusters": "vke_cluster",
+    "object-storage": "object_storage",
+    "vpc2": "vpc",
+}
+# Collections whose items are addressed by a body field rather than a generated id.
+_ID_FIELDS: dict[str, str] = {
+    "domains": "domain",
+    "databases/{database-id}/users": "username",
+    "databases/{database-id}/dbs": "name",
+    "databases/{database-id}/topics": "name",
+    "databases/{database-id}/connection-pools": "name",
+    "cdns/push-zones/{pushzone-id}/files": "name",
+}
+# Collections without item routes, either because items live under a different path
+# (`registry/{registry-id}`) or because they are read-only listings; only list and create are served.
+_LIST_ONLY = {"registries", "billing/history", "billing/invoices/{invoice-id}/items", "billing/pending-charges"}
+# Collections whose `POST` hands out a presigned upload endpoint; the item appears once uploaded.
+_PRESIGNED = {"cdns/push-zones/{pushzone-id}/files"}
+# Collections whose items go through a provisioning phase before becoming active.
+_PROVISIONED = {"instances", "bare-metals", "databases", "kubernetes/clusters", "load-balancers"}
+
+def _last_literal(template: str) -> str:
+    return template.rstrip("/").rsplit("/", 1)[-1]
+
+def _list_key(template: str) -> str:
+    return _LIST_KEYS.get(template, _last_literal(template).replace("-", "_"))
+
+def _item_key(template: str) -> str:
+    if template in _ITEM_KEYS:
+        return _ITEM_KEYS[template]
+    key = _list_key(template)
+    return key[:-1] if key.endswith("s") else key
+
+def _matches(value: Any, wanted: str) -> bool:
+    return wanted in value if isinstance(value, list) else value == wanted
+
+class _Route:
+    """
+    One `ROUTES` entry matched against request paths.
+    """
+    def __init__(self, name: str, template: str, item_of: str | None, collection_of: str | None):
+        self.name = name
+        self.template = template
+        # For item routes: the template of the collection they belong to.
+        self.item_of = item_of
+        # For collection routes: the placeholder that addresses one item.
+        self.collection_of = collection_of
+
+        route = RouteTemplate.compile(template)
+        pattern = re.escape(template)
+        for index, placeholder in enumerate(route.placeholders):
+            pattern = pattern.replace(re.escape(f"{{{placeholder}}}"), f"(?P<p{index}>[^/]+)")
+        self.placeholders = route.placeholders
+        self.regex = re.compile(pattern + "/?")
+
+    def match(self, path: str) -> dict[str, str] | None:
+        found = self.regex.fullmatch(path)
+        if found is None:
+            return None
+        return {placeholder: found.group(f"p{index}") for index, placeholder in enumerate(self.placeholders)}
+
+def _build_routes() -> list[_Route]:
+    templates = set(ROUTES.values())
+    item_placeholder: dict[str, str] = {}
+    for template in templates:
+        head, _, tail = template.rpartition("/")
+        if head in templates and tail.startswith("{") and tail.endswith("}"):
+            item_placeholder[head] = tail[1:-1]
+
+    routes: list[_Route] = []
+    for name, template in ROUTES.items():
+        head, _, tail = template.rpartition("/")
+        item_of = head if head in item_placeholder and item_placeholder[head] == tail[1:-1] else None
+        collection_of = item_placeholder.get(template, "" if template in _LIST_ONLY else None)
+        routes.append(_Route(name, template, item_of, collection_of))
+
+    # Literal segments win over placeholders ("registry/region/list" before "registry/{registry-id}").
+    routes.sort(key=lambda route: (len(route.placeholders), -len(route.template)))
+    return routes
+
+class FakeVultrServer:
+    """
+    Local aiohttp server that imitates the Vultr v2 API.
+
+    - `latency`: Seconds added to every response (plus up to `jitter` seconds at random).
+    - `throttle_rate`: Probability of answering with `429` and `Retry-After: retry_after`.
+    - `provisioning_delay`: Seconds a newly created instance/bare metal/... stays `pending`.
+    - `api_key`: If set, requests must carry `Authorization: Bearer <api_key>`.
+    """
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 0.0,
+        provisioning_delay: float = 0.0,
+        api_key: str | None = None,
+        seed: int | None = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.provisioning_delay = provisioning_delay
+        self.api_key = api_key
+        # Per-(method, route name) call counter, e.g. `server.calls[("GET", "instances")]`.
+        self.calls: Counter[tuple[str, str]] = Counter()
+        # Every call to a non-CRUD route, as `(method, path, body)`.
+        self.actions: list[tuple[str, str, Any]] = []
+        # Contents received by the presigned upload endpoint, by collection path and file name.
+        self.uploads: dict[tuple[str, str], bytes] = {}
+        # Number of upcoming presigned uploads to answer with `503` after reading them.
+        self.upload_failures = 0
+
+        self._random = random.Random(seed)
+        self._routes = _build_routes()
+        self._collections: dict[str, dict[str, Item]] = {}
+        self._fixtures: dict[str, Any] = {}
+        self._runner: web.AppRunner | None = None
+        self._base_url: str | None = None
+        self._previous_base_url: str | None = None
+        self._installed_provider: str | None = None
+
+    @property
+    def base_url(self) -> str:
+        if self._base_url is None:
+            raise RuntimeError("FakeVultrServer is not started.")
+        return self._base_url
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Start listening and return the base URL (ending in `/v2/`).
+        """
+        app = web.Application(client_max_size=64 * 1024 ** 2)
+        app.router.add_route("*", "/v2/{path:.*}", self._handle)
+        app.router.add_post("/upload", self._upload)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+
+        bound_port = self._runner.addresses[0][1]
+        self._base_url = f"http://{host}:{bound_port}/v2/"
+        logger.debug("Fake Vultr API listening on %s", self._base_url)
+        return self._base_url
+
+    async def close(self) -> None:
+        self.uninstall()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> 'FakeVultrServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def install(self, provider: str = "vultr") -> None:
+        """
+        Point `provider` at this server via `ProviderRegistry`; `close()` restores the original URL.
+        """
+        if self._installed_provider is None:
+            self._previous_base_url = ProviderRegistry.get_base_url(provider)
+            self._installed_provider = provider
+        ProviderRegistry.register(provider, self.base_url, override=True)
+
+    def uninstall(self) -> None:
+        if self._installed_provider is not None and self._previous_base_url is not None:
+            ProviderRegistry.register(self._installed_provider, self._previous_base_url, override=True)
+        self._installed_provider = None
+        self._previous_base_url = None
+
+    # --- Data ---
+    def items(self, path: str) -> dict[str, Item]:
+        """
+        Get the mutable store behind a collection path such as `"instances"` or
+        `"domains/example.com/records"`.
+        """
+        return self._collections.setdefault(path.strip("/"), {})
+
+    def add(self, path: str, item: Item) -> Item:
+        """
+        Insert `item` into the collection at `path`, generating an `id` if it has none.
+        """
+        item = dict(item)
+        item.setdefault("id", str(uuid.uuid4()))
+        self.items(path)[str(item["id"])] = item
+        return item
+
+    def provision(self, path: str, item: Item | None = None) -> Item:
+        """
+        Insert a server-like item that is `pending`, as right after creation, and turns `active`
+        `provisioning_delay` seconds later.
+        """
+        item = dict(item or {})
+        item.update(status="pending", power_status="stopped", server_status="none")
+        item["_ready_at"] = time.monotonic() + self.provisioning_delay
+        return self.add(path, item)
+
+    def seed(self, path: str, count: int, factory: Callable[[int], Item] | None = None) -> list[Item]:
+        """
+        Fill a collection with `count` synthetic items (by default, active instance-like records).
+        """
+        make = factory or self._synthetic_item
+        return [self.add(path, make(index)) for index in range(count)]
+
+    def set_fixture(self, path: str, body: Any) -> None:
+        """
+        Serve `body` as the JSON response to `GET path` for a non-collection route.
+        """
+        self._fixtures[path.strip("/")] = body
+
+    def _synthetic_item(self, index: int) -> Item:
+        region = ("ewr", "ord", "lax", "ams", "nrt")[index % 5]
+        return {
+            "id": str(uuid.UUID(int=self._random.getrandbits(128))),
+            "label": f"node-{index:05d}",
+            "hostname": f"node-{index:05d}.example.com",
+            "region": region,
+            "plan": "vc2-1c-1gb",
+            "main_ip": f"10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}",
+            "tags": [f"group-{index % 10}"],
+            "status": "active",
+            "power_status": "running",
+            "server_status": "ok",
+            "date_created": "2024-01-01T00:00:00+00:00",
+        }
+
+    # --- Request handling ---
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        if self.latency or self.jitter:
+            await asyncio.sleep(self.latency + self._random.uniform(0, self.jitter))
+
+        if self.api_key is not None and request.headers.get("Authorization") != f"Bearer {self.api_key}":
+            return web.json_response({"error": "Invalid API token.", "status": 401}, status=401)
+
+        if self.throttle_rate and self._random.random() < self.throttle_rate:
+            return web.json_response(
+                {"error": "Rate limit reached - please try your request again later.", "status": 429},
+                status=429,
+                headers={"Retry-After": f"{self.retry_after:g}"},
+            )
+
+        # Routes are matched on the raw path so an escaped `/` inside an id (`files/css%2Fsite.css`)
+        # stays part of that id.
+        raw_path = request.rel_url.raw_path.removeprefix("/v2/").strip("/")
+        path = unquote(raw_path)
+        for route in self._routes:
+            values = route.match(raw_path)
+            if values is not None:
+                break
+        else:
+            return web.json_response({"error": f"Invalid route: {path}", "status": 404}, status=404)
+
+        self.calls[(request.method, route.name)] += 1
+        body: Any = None
+        if request.can_read_body:
+            try:
+                body = await request.json()
+            except ValueError:
+                body = await request.text()
+
+        if route.collection_of is not None:
+            if request.method == "GET":
+                return self._list(route, path, request)
+            if request.method == "POST":
+                return self._create(route, path, body)
+        if route.item_of is not None:
+            collection_path, _, item_id = raw_path.rpartition("/")
+            return self._item(route, unquote(collection_path), unquote(item_id), request.method, body)
+
+        if request.method == "GET":
+            return web.json_response(self._fixtures.get(path, {}))
+
+        self.actions.append((request.method, path, body))
+        error = self._apply_action(path, body)
+        if error is not None:
+            return web.json_response({"error": error, "status": 400}, status=400)
+        return web.Response(status=204)
+
+    async def _upload(self, request: web.Request) -> web.Response:
+        """
+        Presigned `POST` form upload: form fields (including `key`) followed by the `file` part.
+        """
+        fields: dict[str, str] = {}
+        content = b""
+        reader = await request.multipart()
+        async for part in reader:
+            if part.name == "file":
+                content = await part.read()  # type: ignore[union-attr]
+            else:
+                fields[str(part.name)] = await part.text()  # type: ignore[union-attr]
+        if self.upload_failures > 0:
+            self.upload_failures -= 1
+            return web.Response(status=503, text="Slow down")
+        path, _, name = fields.get("key", "").partition("/files/")
+        if not name:
+            return web.Response(status=400, text="Missing key")
+        path = f"{path}/files"
+        self.uploads[(path, name)] = content
+        self.items(path)[name] = {
+            "id": name,
+            "name": name,
+            "size": len(content),
+            "mime": "application/octet-stream",
+            "last_modified": time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime()),
+        }
+        return web.Response(status=204)
+
+    def _list(self, route: _Route, path: str, request: web.Request) -> web.Response:
+        items = list(self.items(path).values())
+        for key in ("label", "region", "main_ip", "hostname", "tag"):
+            wanted = request.query.get(key)
+            if wanted is not None:
+                field = "tags" if key == "tag" else key
+                items = [item for item in items if _matches(item.get(field), wanted)]
+
+        try:
+            per_page = min(MAX_PER_PAGE, max(1, int(request.query.get("per_page", DEFAULT_PER_PAGE))))
+            offset = int(base64.urlsafe_b64decode(request.query["cursor"]).decode()) if request.query.get("cursor") else 0
+        except ValueError:
+            return web.json_response({"error": "Invalid pagination parameters.", "status": 400}, status=400)
+
+        page = [self._view(route.template, item) for item in items[offset:offset + per_page]]
+        next_offset = offset + per_page
+        links = {
+            "next": base64.urlsafe_b64encode(str(next_offset).encode()).decode() if next_offset < len(items) else "",
+            "prev": base64.urlsafe_b64encode(str(max(0, offset - per_page)).encode()).decode() if offset > 0 else "",
+        }
+        return web.json_response({_list_key(route.template): page, "meta": {"total": len(items), "links": links}})
+
+    def _create(self, route: _Route, path: str, body: Any) -> web.Response:
+        item: Item = dict(body) if isinstance(body, dict) else {}
+        if route.template in _PRESIGNED:
+            inputs = {"key": f"{path}/{item.get('name', '')}", "acl": "public-read", "policy": "fake"}
+            return web.json_response({"upload_endpoint": {"URL": f"{self.base_url[:-len('v2/')]}upload", "inputs": inputs}}, status=201)
+        id_field = _ID_FIELDS.get(route.template)
+        if id_field is not None and id_field in item:
+            item["id"] = str(item[id_field])
+        item.setdefault("date_created", time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime()))
+        item = self.provision(path, item) if route.template in _PROVISIONED else self.add(path, item)
+
+        status = 202 if route.template in _PROVISIONED else 201
+        return web.json_response({_item_key(route.template): self._view(route.template, item)}, status=status)
+
+    def _item(self, route: _Route, collection_path: str, item_id: str, method: str, body: Any) -> web.Response:
+        collection = self.items(collection_path)
+        item = collection.get(item_id)
+        if item is None:
+            return web.json_response({"error": "Not found.", "status": 404}, status=404)
+
+        collection_template = route.item_of or ""
+        if method == "GET":
+            return web.json_response({_item_key(collection_template): self._view(collection_template, item)})
+        if method == "DELETE":
+            del collection[item_id]
+            return web.Response(status=204)
+        if method in ("PUT", "PATCH"):
+            if isinstance(body, dict):
+                item.update(body)
+            if method == "PATCH":
+                return web.json_response({_item_key(collection_template): self._view(collection_template, item)}, status=202)
+            return web.Response(status=204)
+        return web.json_response({"error": "Method not allowed.", "status": 405}, status=405)
+
+    def _view(self, template: str, item: Item) -> Item:
+        ready_at = item.get("_ready_at")
+        if ready_at is not None and time.monotonic() >= ready_at:
+            item.update(status="active", power_status="running", server_status="ok")
+            del item["_ready_at"]
+        return {key: value for key, value in item.items() if not key.startswith("_")}
+
+    def _apply_action(self, path: str, body: Any) -> str | None:
+        """
+        Apply a power action, returning an error message if the request is rejected.
+        """
+        collection_path, _, action = path.rpartition("/")
+        power = {"halt": "stopped", "start": "running", "reboot": "running"}.get(action)
+        if power is None:
+            return None
+        if collection_path in self._collections:
+            # Bulk actions (`instances/halt`) name their targets in the body, e.g. `instance_ids`, and
+            # are rejected as a whole if any of them is unknown.
+            collection = self._collections[collection_path]
+            ids = next((value for key, value in body.items() if key.endswith("_ids")), []) if isinstance(body, dict) else []
+            unknown = [item_id for item_id in ids if item_id not in collection]
+            if unknown:
+                return f"Invalid id: {unknown[0]}"
+            targets = [collection[item_id] for item_id in ids]
+        else:
+            parent_path, _, item_id = collection_path.rpartition("/")
+            targets = [item for item in (self._collections.get(parent_path, {}).get(item_id),) if item is not None]
+        for item in targets:
+            item["power_status"] = power
+        return None
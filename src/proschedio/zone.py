@@ -0,0 +1,337 @@
+import asyncio
+import logging
+import re
+import time
+from collections.abc import Iterable, Mapping
+from http import HTTPMethod
+from typing import Any, Literal, cast
+
+from rustipy.result import Err, Ok, Result
+
+from .const import ProviderUrl
+from .pagination import MAX_PER_PAGE, PaginationError, paginate, request_pages
+from .request import ErrorResponse, Request, Url
+
+logger = logging.getLogger(__name__)
+
+Item = dict[str, Any]
+ChangeAction = Literal["create", "update", "delete"]
+
+DEFAULT_TTL = 300
+# Record types whose data (or the last field of it) is a host name.
+_HOST_TYPES = {"CNAME", "NS", "MX", "SRV", "PTR"}
+# Record types that carry a separate `priority` field at Vultr.
+_PRIORITY_TYPES = {"MX", "SRV"}
+_TTL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+_CLASSES = {"IN", "CH", "HS"}
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[()]|[^\s"()]+')
+
+class Record:
+    """
+    One DNS record as Vultr stores it: `name` is relative to the zone (`""` for the apex) and host
+    names in `data` carry no trailing dot.
+    """
+    __slots__ = ("type", "name", "data", "ttl", "priority")
+
+    def __init__(self, type: str, name: str, data: str, ttl: int = DEFAULT_TTL, priority: int = 0):
+        self.type = type.upper()
+        self.name = name.lower()
+        self.data = data
+        self.ttl = ttl
+        self.priority = priority
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        return (self.type, self.name, self.data)
+
+    @staticmethod
+    def from_dict(data: Mapping[str, Any]) -> 'Record':
+        return Record(data["type"], data.get("name", ""), str(data["data"]), int(data.get("ttl") or DEFAULT_TTL), int(data.get("priority") or 0))
+
+    def to_dict(self) -> dict[str, Any]:
+        body: dict[str, Any] = {"type": self.type, "name": self.name, "data": self.data, "ttl": self.ttl}
+        if self.type in _PRIORITY_TYPES:
+            body["priority"] = self.priority
+        return body
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Record) and (self.key, self.ttl, self.priority) == (other.key, other.ttl, other.priority)
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return f"Record({self.type!r}, {self.name!r}, {self.data!r}, ttl={self.ttl}, priority={self.priority})"
+
+# --- BIND zone files ---
+def _strip_comment(line: str) -> str:
+    quoted = False
+    for index, char in enumerate(line):
+        if char == '"' and (index == 0 or line[index - 1] != "\\"):
+            quoted = not quoted
+        elif char == ";" and not quoted:
+            return line[:index]
+    return line
+
+def _logical_lines(text: str) -> Iterable[tuple[bool, list[str]]]:
+    """
+    Yield `(starts with an owner, tokens)` per record, joining lines split with parentheses.
+    Quoted strings stay one token; comments are dropped.
+    """
+    pending: list[str] = []
+    owner = False
+    depth = 0
+    for line in text.splitlines():
+        tokens = _TOKEN.findall(_strip_comment(line))
+        if not tokens:
+            continue
+        if depth == 0:
+            owner = not line[:1].isspace()
+        for token in tokens:
+            if token == "(":
+                depth += 1
+            elif token == ")":
+                depth -= 1
+            else:
+                pending.append(token)
+        if depth <= 0:
+            depth = 0
+            yield owner, pending
+            pending = []
+    if pending:
+        yield owner, pending
+
+def _ttl(token: str) -> int | None:
+    if token.isdigit():
+        return int(token)
+    parts = re.fullmatch(r"(?:\d+[smhdw])+", token.lower())
+    if parts is None:
+        return None
+    return sum(int(number) * _TTL_UNITS[unit] for number, unit in re.findall(r"(\d+)([smhdw])", token.lower()))
+
+def _relative(name: str, origin: str) -> str:
+    name = name.lower()
+    if name == "@":
+        return ""
+    if not name.endswith("."):
+        return name
+    name = name[:-1]
+    if name == origin:
+        return ""
+    if name.endswith("." + origin):
+        return name[:-len(origin) - 1]
+    raise ValueError(f"Name '{name}' is outside the zone '{origin}'")
+
+def _host(target: str, origin: str) -> str:
+    if target == "@":
+        return origin
+    if target.endswith("."):
+        return target[:-1]
+    return f"{target}.{origin}"
+
+def parse_zone(text: str, origin: str) -> list[Record]:
+    """
+    Read the records of a BIND zone file for the domain `origin`.
+
+    Supports `$ORIGIN` and `$TTL`, `@`, omitted owners, TTLs with units (`1h30m`), parentheses and
+    comments. `SOA` records are skipped: Vultr manages them separately (see `domain_soa`).
+    """
+    zone = origin.lower().rstrip(".")
+    current_origin = zone
+    default_ttl = DEFAULT_TTL
+    records: list[Record] = []
+    owner = ""
+    for has_owner, tokens in _logical_lines(text):
+        if tokens[0].upper() == "$ORIGIN":
+            current_origin = tokens[1].lower().rstrip(".")
+            continue
+        if tokens[0].upper() == "$TTL":
+            default_ttl = _ttl(tokens[1]) or DEFAULT_TTL
+            continue
+        if tokens[0].startswith("$"):
+            raise ValueError(f"Unsupported zone file directive: {tokens[0]}")
+
+        if has_owner:
+            name = tokens.pop(0)
+            owner = _relative(name if name.endswith(".") or name == "@" else f"{name}.{current_origin}.", zone)
+        ttl = default_ttl
+        while tokens and (tokens[0].upper() in _CLASSES or _ttl(tokens[0]) is not None):
+            token = tokens.pop(0)
+            if token.upper() not in _CLASSES:
+                ttl = cast(int, _ttl(token))
+        if not tokens:
+            raise ValueError(f"Record for '{owner or '@'}' has no type")
+        type = tokens.pop(0).upper()
+        if type == "SOA":
+            continue
+
+        priority = 0
+        if type in _PRIORITY_TYPES:
+            priority = int(tokens.pop(0))
+        if type in _HOST_TYPES and tokens:
+            tokens[-1] = _host(tokens[-1], current_origin)
+        records.append(Record(type, owner, " ".join(tokens), ttl, priority))
+    return records
+
+# --- Diff ---
+class Change:
+    __slots__ = ("action", "record", "record_id")
+
+    def __init__(self, action: ChangeAction, record: Record, record_id: str | None = None):
+        self.action: ChangeAction = action
+        self.record = record
+        self.record_id = record_id
+
+    def __repr__(self) -> str:
+        return f"Change({self.action!r}, {self.record!r}, {self.record_id!r})"
+
+class ZoneDiff:
+    def __init__(self, domain: str, changes: list[Change], unchanged: int):
+        self.domain = domain
+        self.changes = changes
+        self.unchanged = unchanged
+
+    def count(self, action: ChangeAction) -> int:
+        return sum(1 for change in self.changes if change.action == action)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.changes)
+
+    def describe(self) -> str:
+        symbols = {"create": "+", "update": "~", "delete": "-"}
+        lines = [f"{symbols[change.action]} {change.record.type} {change.record.name or '@'} {change.record.data}" for change in self.changes]
+        lines.append(f"{self.domain}: {self.count('create')} to create, {self.count('update')} to update, "
+                     f"{self.count('delete')} to delete, {self.unchanged} unchanged")
+        return "\n".join(lines)
+
+def diff_records(domain: str, desired: Iterable[Record], live: Iterable[tuple[str, Record]]) -> ZoneDiff:
+    """
+    Minimal changes turning the `live` records (id, record) into `desired`.
+
+    Records are matched on `(type, name, data)`; a match whose TTL or priority differs is updated.
+    Leftover creates and deletes with the same type and name are paired into updates of `data`, so
+    changing an address costs one call instead of two.
+    """
+    wanted: dict[tuple[str, str, str], Record] = {}
+    for record in desired:
+        wanted[record.key] = record
+
+    changes: list[Change] = []
+    unchanged = 0
+    matched: set[tuple[str, str, str]] = set()
+    stale: dict[tuple[str, str], list[tuple[str, Record]]] = {}
+    for record_id, record in live:
+        target = wanted.get(record.key)
+        if target is None or record.key in matched:
+            stale.setdefault((record.type, record.name), []).append((record_id, record))
+            continue
+        matched.add(record.key)
+        if target == record:
+            unchanged += 1
+        else:
+            changes.append(Change("update", target, record_id))
+
+    for key, record in wanted.items():
+        if key in matched:
+            continue
+        leftovers = stale.get((record.type, record.name))
+        if leftovers:
+            record_id, _ = leftovers.pop()
+            changes.append(Change("update", record, record_id))
+        else:
+            changes.append(Change("create", record))
+    changes.extend(Change("delete", record, record_id) for leftovers in stale.values() for record_id, record in leftovers)
+    return ZoneDiff(domain, changes, unchanged)
+
+class ZoneReport:
+    def __init__(self, results: list[tuple[Change, Result[None, ErrorResponse]]], elapsed: float):
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return all(result.is_ok() for _, result in self.results)
+
+    def failed(self) -> list[tuple[Change, ErrorResponse]]:
+        return [(change, result.unwrap_err()) for change, result in self.results if result.is_err()]
+
+class ZoneSync:
+    """
+    Reconciles a DNS zone with a desired record set.
+
+    ```python
+    sync = ZoneSync("vultr")
+    diff = (await sync.diff("example.com", parse_zone(text, "example.com"))).unwrap()
+    print(diff.describe())
+    report = await sync.apply(diff)
+    ```
+
+    Live records are streamed page by page, diffed with `diff_records()` and the changes applied at
+    most `max_concurrency` at a time. With `types`, only records of those types are managed and
+    everything else in the zone is left alone (e.g. to keep Vultr's default `NS` records).
+    """
+    def __init__(self, provider: str = "vultr", api_key: str | None = None, max_concurrency: int = 16):
+        self._provider = provider
+        self._provider_url = ProviderUrl(provider)
+        self._api_key = api_key
+        self._max_concurrency = max_concurrency
+
+    def _request(self, url: Url, method: HTTPMethod) -> Request:
+        return Request(url).set_method(method).authorize(self._provider, self._api_key)
+
+    async def live(self, domain: str) -> Result[list[tuple[str, Record]], ErrorResponse]:
+        url = self._provider_url.route("domain_records").assign("dns-domain", domain)
+        records: list[tuple[str, Record]] = []
+        try:
+            async for item in paginate(request_pages(lambda: self._request(url, HTTPMethod.GET)), per_page=MAX_PER_PAGE):
+                item = cast(Item, item)
+                records.append((str(item["id"]), Record.from_dict(item)))
+        except PaginationError as error:
+            logger.error("Listing records of %s failed: %s", domain, error)
+            return Err(error.response)
+        return Ok(records)
+
+    async def diff(self, domain: str, desired: Iterable[Record | Mapping[str, Any]], types: Iterable[str] | None = None) -> Result[ZoneDiff, ErrorResponse]:
+        live = await self.live(domain)
+        if live.is_err():
+            return Err(live.unwrap_err())
+        records = [record if isinstance(record, Record) else Record.from_dict(record) for record in desired]
+        managed = {type.upper() for type in types} if types is not None else None
+        if managed is not None:
+            records = [record for record in records if record.type in managed]
+        current = [(record_id, record) for record_id, record in live.unwrap() if managed is None or record.type in managed]
+        return Ok(diff_records(domain, records, current))
+
+    async def apply(self, diff: ZoneDiff) -> ZoneReport:
+        started = time.monotonic()
+        slots = asyncio.Semaphore(self._max_concurrency)
+        records_url = self._provider_url.route("domain_records").assign("dns-domain", diff.domain)
+        record_url = self._provider_url.route("domain_record_by_id").assign("dns-domain", diff.domain)
+
+        async def run(change: Change) -> Result[None, ErrorResponse]:
+            async with slots:
+                if change.action == "create":
+                    result = await self._request(records_url, HTTPMethod.POST).set_body(change.record.to_dict()).request()
+                elif change.action == "update":
+                    assert change.record_id is not None
+                    body = {key: value for key, value in change.record.to_dict().items() if key != "type"}
+                    result = await self._request(record_url.assign("record-id", change.record_id), HTTPMethod.PATCH).set_body(body).request()
+                else:
+                    assert change.record_id is not None
+                    result = await self._request(record_url.assign("record-id", change.record_id), HTTPMethod.DELETE).request()
+            return Ok(None) if result.is_ok() else Err(result.unwrap_err())
+
+        results = await asyncio.gather(*(run(change) for change in diff.changes))
+        report = ZoneReport(list(zip(diff.changes, results)), time.monotonic() - started)
+        logger.info("Applied %d changes to %s in %.2fs (%d failed)", len(diff.changes), diff.domain, report.elapsed, len(report.failed()))
+        return report
+
+    async def sync(self, domain: str, desired: Iterable[Record | Mapping[str, Any]], types: Iterable[str] | None = None) -> Result[ZoneReport, ErrorResponse]:
+        """
+        Diff and apply in one go.
+        """
+        diff = await self.diff(domain, desired, types)
+        if diff.is_err():
+            return Err(diff.unwrap_err())
+        return Ok(await self.apply(diff.unwrap()))
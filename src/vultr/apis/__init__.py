@@ -0,0 +1,47 @@
+import importlib
+from types import ModuleType
+
+# Submodules are imported on first attribute access (`vultr.apis.dns`), so importing the package
+# does not pull in every API module.
+__all__ = [
+    "account",
+    "applications",
+    "backups",
+    "bare_metal",
+    "billings",
+    "block_storage",
+    "cdns",
+    "container_registry",
+    "database",
+    "dns",
+    "firewall",
+    "inference",
+    "iso",
+    "kubernetes",
+    "load_balancers",
+    "marketplace",
+    "object_storage",
+    "operating_systems",
+    "plans",
+    "plans_metal",
+    "regions",
+    "reserved_ips",
+    "snapshots",
+    "ssh_keys",
+    "startup_script",
+    "subaccounts",
+    "users",
+    "vfs",
+    "vpc2",
+    "vpcs",
+]
+
+def __getattr__(name: str) -> ModuleType:
+    if name in __all__:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
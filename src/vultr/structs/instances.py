@@ -1,9 +1,8 @@
 from typing import Optional, List, Literal, Dict, Any
-import time
-import asyncio
 
 # Import the base class
 from proschedio.resources.instance import BaseInstance
+from proschedio.readiness import ReadinessWatcher
 # Import Vultr API functions needed for implementation
 from vultr.apis import instances as vultr_instance_api
 # Import the CreateInstanceData struct from its new location
@@ -46,11 +45,7 @@ class Instance(BaseInstance):
         self._properties = instance_info
 
         if config.get('wait_for_ready', False):
-            await self._wait_until_ready(
-                timeout=config.get('wait_timeout', 300),
-                interval=config.get('wait_interval', 10)
-            )
-            await self.get()
+            await self._wait_until_ready(timeout=config.get('wait_timeout', 300))
 
         return self
 
@@ -124,21 +119,19 @@ class Instance(BaseInstance):
     def provider_specific_data(self) -> Dict[str, Any]:
         return self._raw_data
 
-    async def _wait_until_ready(self, timeout: int, interval: int):
-        """Internal helper to wait for instance to become active."""
+    async def _wait_until_ready(self, timeout: int):
+        """
+        Internal helper to wait for instance to become active.
+
+        Waits on the shared `ReadinessWatcher`, which polls the instance list once per tick for every
+        instance being waited on, instead of polling this instance on its own.
+        """
         if not self.id:
             return
 
-        start_time = time.monotonic()
-        while time.monotonic() - start_time < timeout:
-            await asyncio.sleep(interval)
-            instance_state = await self.get()
-            if instance_state and instance_state.status == "active" and instance_state._properties.get("server_status") == "ok":
-                print(f"Instance {self.id} is ready.")
-                return
-            print(f"Waiting for instance {self.id}... Current status: {instance_state.status if instance_state else 'N/A'}")
-
-        raise TimeoutError(f"Instance {self.id} did not become ready within {timeout} seconds.")
+        instance_info = await ReadinessWatcher.shared("vultr").wait(self.id, "instances", timeout=timeout)
+        self._raw_data = instance_info
+        self._properties = instance_info
 
     @property
     def server_status(self) -> Optional[str]:
@@ -1,17 +1,14 @@
-
 import asyncio
 import os
-import json
 import sys
 from dotenv import load_dotenv
 
-# Assuming API functions and set_key are importable
+# Assuming the src directory is importable
 # Adjust imports based on actual project structure if needed
 try:
-    from vultr.apis.plans_metal import list_metal_plans
-    from vultr import set_key
+    from proschedio.catalog import Catalog
 except ImportError:
-    print("Error: Could not import Vultr API functions. Make sure src directory is in PYTHONPATH or script is run from project root.")
+    print("Error: Could not import proschedio. Make sure src directory is in PYTHONPATH or script is run from project root.")
     sys.exit(1)
 
 async def find_cheapest():
@@ -23,38 +20,15 @@ async def find_cheapest():
         print("Error: VULTR_API_KEY not found in environment variables.")
         return
 
-    # Set the API key for the API functions
-    set_key(api_key)
-
-    print("Fetching bare metal plans...")
-    try:
-        response_dict = await list_metal_plans(per_page=None, cursor=None)
-    except Exception as e:
-        print(f"Error calling list_metal_plans: {e}")
-        return
-
-    status = response_dict.get("status")
-    data = response_dict.get("data")
-
-    if status != 200:
-        print(f"Error: API returned status {status}")
-        print(f"Response data: {data}")
+    print("Loading plan catalog...")
+    result = await Catalog.load(api_key=api_key)
+    if result.is_err():
+        error = result.unwrap_err()
+        print(f"Error: API returned status {error['status_code']}")
+        print(f"Response data: {error['error']}")
         return
 
-    plans = data.get("plans_metal", [])
-
-    if not plans:
-        print("No bare metal plans found.")
-        return
-
-    cheapest_plan = None
-    min_cost = float('inf')
-
-    for plan in plans:
-        cost = plan.get("monthly_cost")
-        if cost is not None and cost < min_cost:
-            min_cost = cost
-            cheapest_plan = plan
+    cheapest_plan = result.unwrap().cheapest(metal=True)
 
     if cheapest_plan:
         print("\n--- Cheapest Bare Metal Plan ---")
@@ -65,7 +39,7 @@ async def find_cheapest():
         print(f"Disk: {cheapest_plan.get('disk')} GB (Count: {cheapest_plan.get('disk_count')})")
         print(f"Locations: {cheapest_plan.get('locations')}")
     else:
-        print("Could not determine the cheapest plan.")
+        print("No bare metal plans found.")
 
 if __name__ == "__main__":
     asyncio.run(find_cheapest())
@@ -4,17 +4,12 @@ import asyncio
 import pytest_asyncio
 import logging
 import colorlog
+from typing import Any
 
-from vultr.vultr import Vultr
-from vultr import set_key
-# Import necessary API functions and data classes
-from vultr.apis.plans_metal import list_metal_plans
-from vultr.apis.operating_systems import list_os_images
-from vultr.apis.bare_metal import create_bare_metal, delete_bare_metal, get_bare_metal
-from vultr.structs.bare_metal import CreateBareMetalData
-from vultr.apis.plans import list_plans
-from vultr.apis.instances import create_instance, delete_instance, get_instance
-from vultr.structs.instances import CreateInstanceData
+from proschedio.credentials import Credentials
+from proschedio.ratelimit import RateLimiter
+from proschedio.request import SessionPool
+from proschedio.testing import FakeVultrServer
 
 handler = colorlog.StreamHandler()
 handler.setFormatter(colorlog.ColoredFormatter(
@@ -32,18 +27,51 @@ logger = colorlog.getLogger(__name__)
 logger.addHandler(handler)
 logger.setLevel(logging.INFO)
 
+@pytest.fixture
+def fake_vultr_options() -> dict[str, Any]:
+    """
+    Options of the `fake_vultr` fixture; override in a test module, or parametrize `fake_vultr`
+    indirectly, to change them. `rate_limit` keeps the client-side rate limiter on; every other
+    key is passed to `FakeVultrServer`.
+    """
+    return {}
+
+@pytest_asyncio.fixture
+async def fake_vultr(request: pytest.FixtureRequest, fake_vultr_options: dict[str, Any]):
+    """Fixture to provide a fake Vultr API installed as the "vultr" provider, restoring global client state afterwards."""
+    options: dict[str, Any] = {"seed": 1, **fake_vultr_options, **getattr(request, "param", {})}
+    rate_limit = options.pop("rate_limit", False)
+    was_enabled = RateLimiter.is_enabled()
+    RateLimiter.configure(enabled=rate_limit)
+    try:
+        async with FakeVultrServer(**options) as server:
+            server.install()
+            try:
+                yield server
+            finally:
+                await SessionPool.close()
+    finally:
+        RateLimiter.configure(enabled=was_enabled)
+        RateLimiter.reset()
+        Credentials.reset()
+
 @pytest.fixture(scope="session")
 def api_key():
     """Fixture to get the API key from environment variable."""
     key = os.environ.get("VULTR_API_KEY")
     if not key:
         pytest.skip("VULTR_API_KEY environment variable not set")
+    # The legacy client is only needed by the live tests, so a broken import must not stop the
+    # offline suite from being collected.
+    from vultr import set_key
     set_key(key)
     return key
 
 @pytest_asyncio.fixture # Function scope (default)
 async def vultr_client(api_key):
     """Fixture to provide an initialized Vultr API client for each test function."""
+    from vultr.vultr import Vultr
+
     client = Vultr()
     yield client
     # No cleanup needed here as Vultr class doesn't manage sessions directly
@@ -55,6 +83,11 @@ async def managed_baremetal_instance(api_key):
     for the test function, and deletes it afterwards. Yields the instance ID.
     WARNING: This will be slow as it runs for every test function using it.
     """
+    from vultr.apis.bare_metal import create_bare_metal, delete_bare_metal, get_bare_metal
+    from vultr.apis.operating_systems import list_os_images
+    from vultr.apis.plans_metal import list_metal_plans
+    from vultr.structs.bare_metal import CreateBareMetalData
+
     cheapest_plan_id = None
     region = None
     os_id_to_use = None
@@ -194,6 +227,11 @@ async def managed_instance(api_key):
     Yields the instance ID.
     WARNING: This will be slow as it runs for every test function using it.
     """
+    from vultr.apis.instances import create_instance, delete_instance, get_instance
+    from vultr.apis.operating_systems import list_os_images
+    from vultr.apis.plans import list_plans
+    from vultr.structs.instances import CreateInstanceData
+
     cheapest_plan_id = None
     region = None
     os_id_to_use = None
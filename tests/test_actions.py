@@ -0,0 +1,33 @@
+import pytest
+import logging
+
+from proschedio.actions.instance import Action
+from proschedio.const import ProviderUrl
+from proschedio.testing import FakeVultrServer
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def fake_vultr(fake_vultr: FakeVultrServer) -> FakeVultrServer:
+    """Fixture to provide a fake Vultr API with a few running instances."""
+    fake_vultr.seed("instances", 5)
+    return fake_vultr
+
+@pytest.mark.asyncio
+async def test_bulk_power_actions(fake_vultr: FakeVultrServer):
+    """
+    Test that the bulk power actions reach their routes and change the named instances only.
+    """
+    actions = Action.instance(ProviderUrl("vultr"))
+    ids = list(fake_vultr.items("instances"))
+
+    assert (await actions.halt_instances(ids[:3])).is_ok()
+    assert [item["power_status"] for item in fake_vultr.items("instances").values()] == ["stopped"] * 3 + ["running"] * 2
+
+    assert (await actions.start_instances(ids[:2])).is_ok()
+    assert (await actions.reboot_instances(ids[:1])).is_ok()
+    assert [item["power_status"] for item in fake_vultr.items("instances").values()] == ["running", "running", "stopped", "running", "running"]
+    assert fake_vultr.actions[-1] == ("POST", "instances/reboot", {"instance_ids": ids[:1]})
+
+    rejected = await actions.halt_instances(["missing"])
+    assert rejected.unwrap_err()["status_code"] == 400
@@ -0,0 +1,91 @@
+import pytest
+import logging
+from datetime import date, timedelta
+
+from proschedio.bandwidth import BandwidthCollector, BandwidthSeries
+from proschedio.testing import FakeVultrServer
+
+logger = logging.getLogger(__name__)
+
+TODAY = date(2025, 3, 20)
+GIB = 1024 ** 3
+
+def usage(first: date, days: int, outgoing: int) -> dict:
+    return {"bandwidth": {
+        (first + timedelta(days=offset)).isoformat(): {"incoming_bytes": 1, "outgoing_bytes": outgoing}
+        for offset in range(days)
+    }}
+
+@pytest.fixture
+def fake_vultr(fake_vultr: FakeVultrServer) -> FakeVultrServer:
+    """Fixture to provide a fake Vultr API with 200 instances and 4 bare-metal servers reporting 30 days of traffic."""
+    first = TODAY - timedelta(days=29)
+    for index, instance in enumerate(fake_vultr.seed("instances", 200)):
+        fake_vultr.set_fixture(f"instances/{instance['id']}/bandwidth", usage(first, 30, index * GIB))
+    for index, machine in enumerate(fake_vultr.seed("bare-metals", 4)):
+        fake_vultr.set_fixture(f"bare-metals/{machine['id']}/bandwidth", usage(first, 30, (1000 + index) * GIB))
+    return fake_vultr
+
+def test_series_grows_with_zero_filled_gaps():
+    """Test that a series stays contiguous when days are recorded out of order."""
+    series = BandwidthSeries()
+    series.record(date(2025, 1, 5), 1, 10)
+    series.record(date(2025, 1, 8), 2, 20)
+    series.record(date(2025, 1, 3), 3, 30)
+
+    assert series.start == date(2025, 1, 3)
+    assert series.end == date(2025, 1, 8)
+    assert list(series.outgoing) == [30, 0, 10, 0, 0, 20]
+    assert series.total(since=date(2025, 1, 4)) == 30
+    assert series.total(direction="total") == 66
+    assert BandwidthSeries.from_dict(series.to_dict()).outgoing == series.outgoing
+
+@pytest.mark.asyncio
+async def test_collect_fleet_and_aggregates(fake_vultr: FakeVultrServer):
+    """Test that the whole fleet is swept and ranked, with bare metal at the top."""
+    collector = BandwidthCollector(api_key="test")
+    result = await collector.collect_fleet(today=TODAY)
+
+    assert result.is_ok()
+    collected = result.unwrap()
+    assert len(collected) == 204
+    assert all(days.unwrap() == 30 for days in collected.values())
+    assert fake_vultr.calls[("GET", "bare_metal_bandwidth")] == 4
+
+    top = collector.top(5, days=30, today=TODAY)
+    assert [total // (30 * GIB) for _, total in top] == [1003, 1002, 1001, 1000, 199]
+    assert collector.kinds[top[0][0]] == "bare_metals"
+
+@pytest.mark.asyncio
+async def test_incremental_collection_keeps_older_days(fake_vultr: FakeVultrServer, tmp_path):
+    """Test that a second run records only the last stored day and the new ones, and survives a reload."""
+    instance_id = next(iter(fake_vultr.items("instances")))
+    path = str(tmp_path / "bandwidth.json")
+    collector = BandwidthCollector(api_key="test", path=path)
+    await collector.collect([instance_id], today=TODAY)
+
+    # The provider reports a rolling window with different numbers; days before the last stored one are kept.
+    fake_vultr.set_fixture(f"instances/{instance_id}/bandwidth", usage(TODAY - timedelta(days=5), 8, 7))
+    reloaded = BandwidthCollector(api_key="test", path=path)
+    result = await reloaded.collect([instance_id], today=TODAY + timedelta(days=2))
+
+    assert result[instance_id].unwrap() == 3
+    series = reloaded.series[instance_id]
+    assert len(series) == 32
+    assert series.end == TODAY + timedelta(days=2)
+    assert list(series.outgoing[-4:]) == [0, 7, 7, 7]
+
+def test_projection_of_pooled_allowance():
+    """Test that month-end usage is projected from the recent daily average."""
+    collector = BandwidthCollector(api_key="test")
+    for server_id in ("a", "b"):
+        series = collector.series[server_id] = BandwidthSeries()
+        for day in range(1, 21):
+            series.record(date(2025, 4, day), 0, 10 * GIB)
+
+    projection = collector.projection(allowance=500 * GIB, today=date(2025, 4, 20))
+
+    assert projection["used"] == 400 * GIB
+    assert projection["projected"] == 600 * GIB
+    assert projection["overage"] == 100 * GIB
+    assert collector.projection(allowance=500 * GIB, server_ids=["a"], today=date(2025, 4, 20))["overage"] == 0
@@ -0,0 +1,91 @@
+import pytest
+import asyncio
+import logging
+
+from proschedio.billing import BillingAnalytics, classify
+from proschedio.pagination import PaginationError
+from proschedio.testing import FakeVultrServer
+
+logger = logging.getLogger(__name__)
+
+PRODUCTS = ("Cloud Compute", "Block Storage", "Bandwidth")
+REGIONS = ("ewr", "ams", "nrt")
+
+def add_invoice(server: FakeVultrServer, invoice_id: int, month: str) -> None:
+    server.add("billing/invoices", {"id": invoice_id, "date": f"{month}-01T00:00:00+00:00", "description": "Invoice", "amount": 60.0, "balance": 0})
+    server.seed(f"billing/invoices/{invoice_id}/items", 600, lambda index: {
+        "description": f"host-{index % 20} (vc2-1c-1gb) [{REGIONS[index % 3]}]",
+        "product": PRODUCTS[index % 3],
+        "start_date": f"{month}-01T00:00:00+00:00",
+        "end_date": f"{month}-28T00:00:00+00:00",
+        "units": 720,
+        "unit_type": "hours",
+        "unit_price": 0.0001,
+        "total": 0.1,
+    })
+
+@pytest.fixture
+def fake_vultr(fake_vultr: FakeVultrServer) -> FakeVultrServer:
+    """Fixture to provide a fake Vultr API with two months of invoices and some pending charges."""
+    add_invoice(fake_vultr, 1, "2025-01")
+    add_invoice(fake_vultr, 2, "2025-02")
+    fake_vultr.add("billing/pending-charges", {"description": "host-1 [ewr]", "product": "Cloud Compute", "start_date": "2025-03-01", "total": 5.0})
+    fake_vultr.add("billing/history", {"id": 10, "date": "2025-02-01", "type": "payment", "description": "Payment", "amount": -60.0, "balance": 0})
+    return fake_vultr
+
+def test_classify_description():
+    """
+    Test deriving label and region from an invoice item description.
+    """
+    assert classify({"description": "web-1 (vc2-1c-1gb) [ewr]"}) == ("web-1", "ewr")
+    assert classify({"description": "Bandwidth overage"}) == ("Bandwidth overage", "")
+
+@pytest.mark.asyncio
+async def test_refresh_is_incremental_and_groups(fake_vultr: FakeVultrServer, tmp_path):
+    """
+    Test that invoices are fetched once, later refreshes fetch only new ones, and group-bys add up.
+    """
+    billing = BillingAnalytics(path=str(tmp_path / "billing.sqlite3"))
+    stats = (await billing.refresh()).unwrap()
+    assert (stats["invoices"], stats["charges"], stats["pending"], stats["history"]) == (2, 1200, 1, 1)
+
+    by_month = billing.group_by("month")
+    assert by_month == [("2025-01", 60.0), ("2025-02", 60.0)] or by_month == [("2025-02", 60.0), ("2025-01", 60.0)]
+    assert billing.group_by("product", where={"month": "2025-01", "region": "ewr"}) == [("Cloud Compute", 20.0)]
+    assert billing.total(include_pending=True) == 125.0
+    billing.close()
+
+    add_invoice(fake_vultr, 3, "2025-03")
+    reopened = BillingAnalytics(path=str(tmp_path / "billing.sqlite3"))
+    stats = (await reopened.refresh()).unwrap()
+
+    assert stats["invoices"] == 1
+    assert fake_vultr.calls[("GET", "billing_invoice_items")] == 3 * 2
+    assert len(reopened.group_by("month")) == 3
+    assert [entry["type"] for entry in reopened.history()] == ["payment"]
+    with pytest.raises(ValueError):
+        reopened.group_by("description")
+    reopened.close()
+
+@pytest.mark.asyncio
+async def test_failed_refresh_stops_sibling_fetches(fake_vultr: FakeVultrServer, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that when one invoice fails to list, the other fetches are cancelled rather than left
+    writing to the store after refresh() has returned its error.
+    """
+    listing = BillingAnalytics._list
+
+    async def failing(self: BillingAnalytics, url):
+        if url.to_str().endswith("/invoices/1/items"):
+            raise PaginationError({"status_code": 500, "error": "Internal error"})
+        if "/items" in url.to_str():
+            await asyncio.sleep(0.05)
+        return await listing(self, url)
+
+    monkeypatch.setattr(BillingAnalytics, "_list", failing)
+    billing = BillingAnalytics()
+    result = await billing.refresh()
+    assert result.unwrap_err()["status_code"] == 500
+    await asyncio.sleep(0.1)
+    assert billing.known_invoices() == set()
+    billing.close()
@@ -0,0 +1,81 @@
+import pytest
+import logging
+
+from proschedio.bulk import BulkPower, chunk
+from proschedio.readiness import ReadinessWatcher
+from proschedio.request import RetryPolicy
+from proschedio.testing import FakeVultrServer
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def fake_vultr(fake_vultr: FakeVultrServer) -> FakeVultrServer:
+    """Fixture to provide a fake Vultr API with a fleet of running instances."""
+    fake_vultr.seed("instances", 1050)
+    return fake_vultr
+
+def test_chunk_balances_sizes():
+    """
+    Test that ids are split into the fewest chunks, evenly sized.
+    """
+    ids = [str(index) for index in range(250)]
+    chunks = chunk(ids, 100)
+    assert [len(part) for part in chunks] == [84, 83, 83]
+    assert [resource_id for part in chunks for resource_id in part] == ids
+    assert chunk([], 100) == []
+
+@pytest.mark.asyncio
+async def test_bulk_halt_reports_each_id(fake_vultr: FakeVultrServer):
+    """
+    Test that a fleet-wide halt is chunked, isolates unknown ids and verifies the rest by listing.
+    """
+    ids = list(fake_vultr.items("instances"))
+    async with ReadinessWatcher(min_interval=0.05, max_interval=0.1) as watcher:
+        report = await BulkPower(watcher=watcher).halt([*ids, "missing-1"], timeout=5)
+
+    assert set(report.failed()) == {"missing-1"}
+    assert report.failed()["missing-1"]["status_code"] == 400
+    assert len(report.succeeded()) == 1050
+    assert all(item["power_status"] == "stopped" for item in fake_vultr.items("instances").values())
+    # 11 chunks, plus the halvings that isolate the one bad id.
+    assert fake_vultr.calls[("POST", "instances_halt")] == report.requests <= 11 + 2 * 7
+    assert fake_vultr.calls[("GET", "instance_by_id")] == 0
+
+@pytest.mark.asyncio
+async def test_unauthorized_chunks_fail_without_splitting(fake_vultr: FakeVultrServer):
+    """
+    Test that a rejection unrelated to the ids fails each chunk once instead of bisecting it.
+    """
+    fake_vultr.api_key = "right-key"
+    ids = list(fake_vultr.items("instances"))
+    report = await BulkPower(api_key="wrong-key").halt(ids, timeout=1)
+
+    assert report.requests == 11
+    assert {error["status_code"] for error in report.failed().values()} == {401}
+    assert len(report.failed()) == 1050
+
+@pytest.mark.asyncio
+async def test_throttled_chunks_are_retried(fake_vultr: FakeVultrServer):
+    """
+    Test that 429s go through the retry policy rather than splitting chunks, and reboots are not verified.
+    """
+    fake_vultr.throttle_rate = 0.3
+    ids = list(fake_vultr.items("instances"))
+    policy = RetryPolicy(max_attempts=30, base_delay=0.001, max_delay=0.01)
+    report = await BulkPower(retry_policy=policy).reboot(ids)
+
+    assert report.ok
+    assert fake_vultr.calls[("POST", "instances_reboot")] >= report.requests == 11
+    assert fake_vultr.calls[("GET", "instances")] == 0
+
+@pytest.mark.asyncio
+async def test_verification_polls_with_the_given_key(fake_vultr: FakeVultrServer):
+    """
+    Test that the shared watcher used for verification authorizes with the caller's API key.
+    """
+    fake_vultr.api_key = "right-key"
+    ids = list(fake_vultr.items("instances"))[:10]
+    report = await BulkPower(api_key="right-key").halt(ids, timeout=5)
+
+    assert report.ok, report.failed()
+    assert fake_vultr.calls[("GET", "instances")] >= 1
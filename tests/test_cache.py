@@ -0,0 +1,134 @@
+import pytest
+import asyncio
+import pytest_asyncio
+import logging
+import threading
+from http import HTTPMethod
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from proschedio.cache import ResponseCache
+from proschedio.request import Request, SessionPool, Url
+
+logger = logging.getLogger(__name__)
+
+@pytest_asyncio.fixture
+async def catalog_server():
+    """Fixture to provide a local server with an ETag-aware catalog route and an in-memory cache."""
+    hits = {"os": 0, "regions": 0, "not_modified": 0}
+
+    async def operating_systems(request: web.Request) -> web.Response:
+        hits["os"] += 1
+        if request.headers.get("If-None-Match") == '"v1"':
+            hits["not_modified"] += 1
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.json_response({"os": [{"id": 2284, "name": "Ubuntu"}], "meta": {"total": 1}}, headers={"ETag": '"v1"'})
+
+    async def regions(request: web.Request) -> web.Response:
+        hits["regions"] += 1
+        return web.json_response({"regions": [{"id": "ewr"}]})
+
+    app = web.Application()
+    app.router.add_get("/v2/os", operating_systems)
+    app.router.add_get("/v2/regions", regions)
+    app.router.add_get("/v2/account", regions)
+
+    server = TestServer(app)
+    await server.start_server()
+    server.hits = hits  # type: ignore[attr-defined]
+    ResponseCache.configure(enabled=True, path=":memory:")
+    yield server
+    ResponseCache.configure(enabled=False)
+    ResponseCache.close()
+    await SessionPool.close()
+    await server.close()
+
+def _get(server: TestServer, uri: str, key: str = "key-a") -> Request:
+    return Request(Url(str(server.make_url("/v2/"))).uri(uri)) \
+        .set_method(HTTPMethod.GET) \
+        .add_header("Authorization", f"Bearer {key}")
+
+@pytest.mark.asyncio
+async def test_fresh_entries_skip_the_network(catalog_server: TestServer):
+    """
+    Test that a cached route is fetched once per API key and uncached routes always go out.
+    """
+    for _ in range(3):
+        result = await _get(catalog_server, "regions").request()
+        assert result.unwrap()["data"] == [{"id": "ewr"}]
+    assert catalog_server.hits["regions"] == 1  # type: ignore[attr-defined]
+
+    await _get(catalog_server, "regions", key="key-b").request()
+    assert catalog_server.hits["regions"] == 2  # type: ignore[attr-defined]
+
+    await _get(catalog_server, "account").request()
+    await _get(catalog_server, "account").request()
+    assert catalog_server.hits["regions"] == 4  # type: ignore[attr-defined]
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_revalidated(catalog_server: TestServer):
+    """
+    Test that an expired entry with an ETag is revalidated and served after a 304.
+    """
+    first = (await _get(catalog_server, "os").set_cache_ttl(0.001).request()).unwrap()
+    await asyncio.sleep(0.01)
+    second = (await _get(catalog_server, "os").set_cache_ttl(0.001).request()).unwrap()
+
+    assert second == first
+    assert second["meta"] == {"total": 1}
+    assert catalog_server.hits["os"] == 2  # type: ignore[attr-defined]
+    assert catalog_server.hits["not_modified"] == 1  # type: ignore[attr-defined]
+
+@pytest.mark.asyncio
+async def test_cache_io_stays_off_the_event_loop(catalog_server: TestServer, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that SQLite lookups and stores run in worker threads, not on the event loop's thread.
+    """
+    threads: list[int] = []
+    for name in ("get", "put"):
+        original = getattr(ResponseCache, name)
+
+        def recording(*args: object, _original=original) -> object:
+            threads.append(threading.get_ident())
+            return _original(*args)
+
+        monkeypatch.setattr(ResponseCache, name, staticmethod(recording))
+
+    await _get(catalog_server, "regions").request()
+    await _get(catalog_server, "regions").request()
+
+    assert len(threads) == 3
+    assert threading.get_ident() not in threads
+
+def test_least_recently_used_entries_are_evicted():
+    """
+    Test that the size cap evicts the least recently used entries first.
+    """
+    ResponseCache.configure(path=":memory:", max_bytes=200)
+    try:
+        for name in ("a", "b", "c"):
+            ResponseCache.put(name, 200, ["x" * 60], None, {}, ttl=60)
+            ResponseCache.get("a")
+        assert ResponseCache.get("a") is not None
+        assert ResponseCache.get("b") is None
+        assert ResponseCache.get("c") is not None
+    finally:
+        ResponseCache.configure(max_bytes=64 * 1024 * 1024)
+        ResponseCache.close()
+
+def test_stores_track_the_size_without_scanning():
+    """
+    Test that stores below the cap never sum the table, and that replacing an entry counts it once.
+    """
+    ResponseCache.configure(path=":memory:", max_bytes=10_000)
+    try:
+        statements: list[str] = []
+        ResponseCache._db().set_trace_callback(statements.append)
+        for index in range(20):
+            ResponseCache.put(f"key-{index % 10}", 200, ["x" * 60], None, {}, ttl=60)
+        assert not any("SUM(size)" in statement for statement in statements)
+        assert ResponseCache._size == ResponseCache._stored_size(ResponseCache._db())
+    finally:
+        ResponseCache.configure(max_bytes=64 * 1024 * 1024)
+        ResponseCache.close()
@@ -0,0 +1,95 @@
+import pytest
+import asyncio
+import logging
+import os
+
+from rustipy.result import Err
+
+from proschedio import catalog as catalog_module
+from proschedio.catalog import Catalog
+from proschedio.testing import FakeVultrServer
+
+logger = logging.getLogger(__name__)
+
+PLANS = [
+    {"id": "vc2-1c-1gb", "vcpu_count": 1, "ram": 1024, "monthly_cost": 5, "type": "vc2", "locations": ["ewr", "ams"]},
+    {"id": "vc2-2c-4gb", "vcpu_count": 2, "ram": 4096, "monthly_cost": 20, "type": "vc2", "locations": ["ewr"]},
+    {"id": "vhf-4c-16gb", "vcpu_count": 4, "ram": 16384, "monthly_cost": 96, "type": "vhf", "locations": ["ams"]},
+    {"id": "vc2-4c-8gb", "vcpu_count": 4, "ram": 8192, "monthly_cost": 40, "type": "vc2", "locations": ["ewr", "ams"]},
+    {"id": "vc2-6c-16gb", "vcpu_count": 6, "ram": 16384, "monthly_cost": 80, "type": "vc2", "locations": ["ewr"]},
+]
+METAL_PLANS = [
+    {"id": "vbm-4c-32gb", "cpu_count": 4, "cpu_threads": 8, "ram": 32768, "monthly_cost": 120, "type": "SSD", "locations": ["ewr"]},
+]
+
+@pytest.fixture
+def fake_vultr(fake_vultr: FakeVultrServer) -> FakeVultrServer:
+    """Fixture to provide a fake Vultr API serving a small catalog."""
+    fake_vultr.set_fixture("plans", {"plans": PLANS, "meta": {"total": len(PLANS), "links": {"next": "", "prev": ""}}})
+    fake_vultr.set_fixture("plans-metal", {"plans_metal": METAL_PLANS, "meta": {"total": 1, "links": {"next": "", "prev": ""}}})
+    fake_vultr.set_fixture("regions", {"regions": [{"id": "ewr", "city": "New Jersey"}, {"id": "ams", "city": "Amsterdam"}]})
+    fake_vultr.set_fixture("os", {"os": [{"id": 2284, "name": "Ubuntu 24.04 LTS x64"}]})
+    fake_vultr.set_fixture("applications", {"applications": [{"id": 1, "name": "Docker"}]})
+    return fake_vultr
+
+def test_queries_use_indexes():
+    """
+    Test plan lookups by region, type, vCPU, RAM and cost.
+    """
+    catalog = Catalog(PLANS, METAL_PLANS, [], [], [])
+
+    assert catalog.cheapest(region="ewr", min_vcpu=4)["id"] == "vc2-4c-8gb"  # type: ignore[index]
+    assert catalog.cheapest(region="ams", min_ram=16384)["id"] == "vhf-4c-16gb"  # type: ignore[index]
+    assert catalog.cheapest(min_vcpu=8)["id"] == "vbm-4c-32gb"  # type: ignore[index]
+    assert catalog.cheapest(region="ewr", min_vcpu=4, metal=True)["id"] == "vbm-4c-32gb"  # type: ignore[index]
+    assert catalog.cheapest(region="nrt") is None
+
+    assert [plan["id"] for plan in catalog.find_plans(region="ewr", type="vc2", max_monthly_cost=40)] == ["vc2-1c-1gb", "vc2-2c-4gb", "vc2-4c-8gb"]
+    assert [plan["id"] for plan in catalog.find_plans(min_vcpu=4, metal=False)] == ["vc2-4c-8gb", "vc2-6c-16gb", "vhf-4c-16gb"]
+    assert [plan["id"] for plan in catalog.plans_in("ams")] == ["vc2-1c-1gb", "vc2-4c-8gb", "vhf-4c-16gb"]
+
+@pytest.mark.asyncio
+async def test_load_fetches_once_and_caches(fake_vultr: FakeVultrServer, tmp_path):
+    """
+    Test that load() fetches every section once and then serves the disk cache until it expires.
+    """
+    path = os.path.join(tmp_path, "catalog.json")
+    catalog = (await Catalog.load(cache_path=path)).unwrap()
+    assert catalog.plan("vbm-4c-32gb") is not None
+    assert catalog.region("ams")["city"] == "Amsterdam"  # type: ignore[index]
+    assert catalog.operating_system(2284) is not None
+    assert fake_vultr.calls[("GET", "plans")] == 1
+
+    cached = (await Catalog.load(cache_path=path)).unwrap()
+    assert cached.cheapest(region="ewr", min_vcpu=4)["id"] == "vc2-4c-8gb"  # type: ignore[index]
+    assert fake_vultr.calls[("GET", "plans")] == 1
+
+    await Catalog.load(cache_path=path, ttl=0)
+    assert fake_vultr.calls[("GET", "plans")] == 2
+
+@pytest.mark.asyncio
+async def test_failed_section_cancels_the_others(fake_vultr: FakeVultrServer, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that when one section fails to list, the other section fetches stop with it.
+    """
+    request_pages = catalog_module.request_pages
+    finished: list[str] = []
+
+    def failing(factory):
+        fetch = request_pages(factory)
+        url = factory().url
+
+        async def pages(*, per_page, cursor):
+            if url.endswith("/regions"):
+                return Err({"status_code": 500, "error": "Internal error"})
+            await asyncio.sleep(0.05)
+            finished.append(url)
+            return await fetch(per_page=per_page, cursor=cursor)
+
+        return pages
+
+    monkeypatch.setattr(catalog_module, "request_pages", failing)
+    result = await Catalog.fetch()
+    assert result.unwrap_err()["status_code"] == 500
+    await asyncio.sleep(0.1)
+    assert finished == []
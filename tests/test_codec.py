@@ -0,0 +1,53 @@
+import pytest
+import logging
+
+from proschedio.codec import JsonCodec
+from proschedio.request import Request, Url
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture(autouse=True)
+def restore_codec():
+    """Fixture to restore the automatic codec choice after each test."""
+    yield
+    JsonCodec.reset()
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_backends_round_trip(name: str):
+    """
+    Test that every installed backend encodes compactly and decodes from bytes.
+    """
+    try:
+        codec = JsonCodec.use(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+
+    value = {"label": "héllo", "tags": ["a", "b"], "count": 3, "ratio": 0.5, "enabled": True, "parent": None}
+    encoded = codec.encode(value)
+    assert isinstance(encoded, bytes)
+    assert b": " not in encoded
+    assert codec.decode(encoded) == value
+    with pytest.raises(ValueError):
+        codec.decode(b"<html>")
+
+def test_unknown_codec_is_rejected():
+    """
+    Test that selecting an unregistered backend fails.
+    """
+    with pytest.raises(ValueError):
+        JsonCodec.use("yaml")
+
+def test_body_is_encoded_once():
+    """
+    Test that set_body() encodes objects once and passes pre-encoded bodies through unchanged.
+    """
+    JsonCodec.use("json")
+    request = Request(Url("https://example.com/v2/").uri("instances")).set_body({"label": "web"})
+    assert request._body == b'{"label":"web"}'  # type: ignore[attr-defined]
+    assert request._headers["Content-Type"] == "application/json"  # type: ignore[attr-defined]
+
+    request = Request(Url("https://example.com/v2/").uri("instances")) \
+        .add_header("content-type", "application/merge-patch+json") \
+        .set_body('{"label": "web"}')
+    assert request._body == b'{"label": "web"}'  # type: ignore[attr-defined]
+    assert "Content-Type" not in request._headers  # type: ignore[attr-defined]
@@ -0,0 +1,52 @@
+import pytest
+import asyncio
+import logging
+from http import HTTPMethod
+from typing import Any
+
+from proschedio.const import ProviderUrl
+from proschedio.credentials import Credentials, EnvironmentKey, KeyPool
+from proschedio.ratelimit import RateLimiter
+from proschedio.request import Request
+from proschedio.testing import FakeVultrServer
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def fake_vultr_options() -> dict[str, Any]:
+    """Fixture to keep rate limiting on, since key pools are observed through their buckets."""
+    return {"rate_limit": True}
+
+@pytest.fixture
+def fake_vultr(fake_vultr: FakeVultrServer) -> FakeVultrServer:
+    """Fixture to provide a fake Vultr API with a few instances."""
+    fake_vultr.seed("instances", 10)
+    return fake_vultr
+
+def test_environment_key_is_read_once(monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that the environment key is resolved once and its header reused until refreshed.
+    """
+    monkeypatch.setenv("EXAMPLE_API_KEY", "first")
+    credential = EnvironmentKey("EXAMPLE_API_KEY")
+    assert credential.authorization() == "Bearer first"
+
+    monkeypatch.setenv("EXAMPLE_API_KEY", "second")
+    assert credential.authorization() == "Bearer first"
+    credential.refresh()
+    assert credential.authorization() == "Bearer second"
+
+@pytest.mark.asyncio
+async def test_key_pool_spreads_requests_across_rate_limits(fake_vultr: FakeVultrServer):
+    """
+    Test that a key pool rotates keys per request, giving each key its own rate-limit bucket.
+    """
+    Credentials.use("vultr", KeyPool(["key-a", "key-b", "key-c", "key-a"]))
+    url = ProviderUrl("vultr").get_url_instances()
+
+    results = await asyncio.gather(*(Request(url).set_method(HTTPMethod.GET).add_param("page", index).authorize().request() for index in range(9)))
+
+    assert all(result.is_ok() for result in results)
+    buckets = RateLimiter._buckets[asyncio.get_running_loop()]
+    assert len([key for key in buckets if key[0] == fake_vultr.base_url.split("/")[2]]) == 3
+    assert Credentials.authorization("vultr", "explicit") == "Bearer explicit"
@@ -0,0 +1,66 @@
+import asyncio
+import pytest
+import pytest_asyncio
+import logging
+from http import HTTPMethod
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from proschedio.executor import RequestExecutor
+from proschedio.request import Request, SessionPool, Url
+
+logger = logging.getLogger(__name__)
+
+@pytest_asyncio.fixture
+async def slow_server():
+    """Fixture to provide a local HTTP server that records its peak concurrency."""
+    state = {"active": 0, "peak": 0}
+
+    async def instance(request: web.Request) -> web.Response:
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return web.json_response({"instance": {"id": request.match_info["instance_id"]}})
+
+    app = web.Application()
+    app.router.add_get("/v2/instances/{instance_id}", instance)
+
+    server = TestServer(app)
+    await server.start_server()
+    server.state = state  # type: ignore[attr-defined]
+    yield server
+    await SessionPool.close()
+    await server.close()
+
+def _requests(server: TestServer, count: int) -> list[Request]:
+    return [
+        Request(Url(str(server.make_url("/v2/"))).uri(f"instances/{i}")).set_method(HTTPMethod.GET)
+        for i in range(count)
+    ]
+
+@pytest.mark.asyncio
+async def test_per_provider_cap(slow_server: TestServer):
+    """
+    Test that the per-provider cap bounds the number of concurrent requests to one host.
+    """
+    executor = RequestExecutor(max_in_flight=20, max_per_provider=3)
+    seen = 0
+    async for request, result in executor.as_completed(_requests(slow_server, 30)):
+        assert result.unwrap()["data"] == {"id": request.url.rsplit("/", 1)[-1]}
+        seen += 1
+
+    assert seen == 30
+    assert slow_server.state["peak"] <= 3  # type: ignore[attr-defined]
+
+@pytest.mark.asyncio
+async def test_gather_keeps_input_order(slow_server: TestServer):
+    """
+    Test that gather() returns results in input order under the global cap.
+    """
+    executor = RequestExecutor(max_in_flight=4)
+    results = await executor.gather(_requests(slow_server, 12))
+
+    assert [result.unwrap()["data"] for result in results] == [{"id": str(i)} for i in range(12)]
+    assert slow_server.state["peak"] <= 4  # type: ignore[attr-defined]
@@ -0,0 +1,74 @@
+import pytest
+import logging
+from http import HTTPMethod
+
+from proschedio.const import ProviderUrl
+from proschedio.pagination import paginate, request_pages
+from proschedio.request import Request, RetryPolicy
+from proschedio.testing import FakeVultrServer
+
+logger = logging.getLogger(__name__)
+
+@pytest.mark.asyncio
+async def test_install_overrides_base_url(fake_vultr: FakeVultrServer):
+    """
+    Test that install() points ProviderUrl at the fake server and close() restores it.
+    """
+    assert ProviderUrl("vultr").get_url_account().to_str() == fake_vultr.base_url + "account"
+
+    async with FakeVultrServer() as other:
+        other.install()
+        assert ProviderUrl("vultr").get_url_account().to_str() == other.base_url + "account"
+    assert ProviderUrl("vultr").get_url_account().to_str() == fake_vultr.base_url + "account"
+
+@pytest.mark.asyncio
+async def test_large_inventory_paginates(fake_vultr: FakeVultrServer):
+    """
+    Test that a seeded collection is served page by page with Vultr-style cursors.
+    """
+    fake_vultr.seed("instances", 1200)
+    url = ProviderUrl("vultr").get_url_instances()
+    ids = [item["id"] async for item in paginate(request_pages(lambda: Request(url).set_method(HTTPMethod.GET)))]  # type: ignore[index]
+
+    assert len(ids) == len(set(ids)) == 1200
+    assert fake_vultr.calls[("GET", "instances")] == 3
+
+@pytest.mark.asyncio
+async def test_item_routes(fake_vultr: FakeVultrServer):
+    """
+    Test get and delete on an item of a nested collection.
+    """
+    record = fake_vultr.add("domains/example.com/records", {"type": "A", "name": "www", "data": "10.0.0.1"})
+    by_id = ProviderUrl("vultr").get_url_domain_record_by_id() \
+        .assign("dns-domain", "example.com") \
+        .assign("record-id", record["id"])
+
+    fetched = (await Request(by_id).set_method(HTTPMethod.GET).request()).unwrap()["data"]
+    assert fetched == record
+
+    assert (await Request(by_id).set_method(HTTPMethod.DELETE).request()).unwrap()["status_code"] == 204
+    assert (await Request(by_id).set_method(HTTPMethod.GET).request()).unwrap_err()["status_code"] == 404
+
+@pytest.mark.asyncio
+async def test_throttling_is_retried(fake_vultr: FakeVultrServer):
+    """
+    Test that injected 429s are absorbed by the retry policy.
+    """
+    fake_vultr.throttle_rate = 0.5
+    policy = RetryPolicy(max_attempts=20, base_delay=0.001, max_delay=0.01)
+    for _ in range(10):
+        result = await Request(ProviderUrl("vultr").get_url_account()).set_method(HTTPMethod.GET).set_retry(policy).request()
+        assert result.is_ok()
+
+@pytest.mark.asyncio
+async def test_body_is_sent_as_json_object(fake_vultr: FakeVultrServer):
+    """
+    Test that dict and pre-encoded bodies both reach the server as a JSON object, not a quoted string.
+    """
+    instances = ProviderUrl("vultr").get_url_instances()
+    created = (await Request(instances).set_method(HTTPMethod.POST).set_body({"region": "ewr", "label": "web"}).request()).unwrap()["data"]
+    assert created["label"] == "web"  # type: ignore[index]
+
+    by_id = ProviderUrl("vultr").get_url_instance_by_id().assign("instance-id", created["id"])  # type: ignore[index]
+    assert (await Request(by_id).set_method(HTTPMethod.PATCH).set_body('{"label": "api"}').request()).is_ok()
+    assert fake_vultr.items("instances")[created["id"]]["label"] == "api"  # type: ignore[index]
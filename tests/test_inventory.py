@@ -0,0 +1,123 @@
+import pytest
+import asyncio
+import logging
+import os
+import threading
+
+from proschedio.inventory import Inventory
+from proschedio.testing import FakeVultrServer
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def fake_vultr(fake_vultr: FakeVultrServer) -> FakeVultrServer:
+    """Fixture to provide a fake Vultr API with a small account."""
+    fake_vultr.seed("instances", 1200)
+    fake_vultr.add("domains", {"domain": "example.com"})
+    fake_vultr.add("domains/example.com/records", {"type": "A", "name": "www", "data": "10.0.0.1"})
+    return fake_vultr
+
+@pytest.mark.asyncio
+async def test_sync_builds_indexes(fake_vultr: FakeVultrServer):
+    """
+    Test that a full sync mirrors every kind and answers indexed queries locally.
+    """
+    inventory = Inventory()
+    results = await inventory.sync()
+    assert all(result.is_ok() for result in results.values())
+    assert len(results["instances"].unwrap()["added"]) == 1200
+    calls = sum(fake_vultr.calls.values())
+
+    web = inventory.find("instances", tag="group-3", region="ams")
+    assert len(web) == 120
+    assert inventory.find("instances", tag="group-3", region="nrt") == []
+    assert all("group-3" in item["tags"] and item["region"] == "ams" for item in web)
+    assert inventory.find(main_ip="10.0.0.7")[0]["label"] == "node-00007"
+    assert inventory.find(hostname="missing.example.com") == []
+    assert [record["name"] for record in inventory.find("domain_records", parent="example.com")] == ["www"]
+    assert sum(fake_vultr.calls.values()) == calls
+
+@pytest.mark.asyncio
+async def test_delta_sync_and_warm_start(fake_vultr: FakeVultrServer, tmp_path):
+    """
+    Test that a resync reports only changes and that a new mirror starts warm from SQLite.
+    """
+    path = os.path.join(tmp_path, "inventory.sqlite3")
+    inventory = Inventory(kinds=["instances"], path=path)
+    await inventory.sync()
+
+    instances = fake_vultr.items("instances")
+    first, second = list(instances)[:2]
+    instances[first]["tags"] = ["retired"]
+    del instances[second]
+    added = fake_vultr.add("instances", {"label": "fresh", "region": "ewr", "tags": ["group-3"]})
+
+    delta = (await inventory.sync())["instances"].unwrap()
+    assert delta == {"added": [added["id"]], "updated": [first], "removed": [second]}
+    assert [item["id"] for item in inventory.find(tag="retired")] == [first]
+    inventory.close()
+
+    warm = Inventory(kinds=["instances"], path=path)
+    assert warm.count("instances") == 0
+    assert await warm.load() == 1200
+    assert warm.count("instances") == 1200
+    assert warm.find(label="fresh")[0]["id"] == added["id"]
+    assert warm.get("instances", second) is None
+    warm.close()
+
+@pytest.mark.asyncio
+async def test_record_listings_are_bounded(fake_vultr: FakeVultrServer, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that DNS records are listed for at most `max_concurrency` domains at a time.
+    """
+    for index in range(20):
+        domain = f"zone-{index:02d}.example.com"
+        fake_vultr.add("domains", {"domain": domain})
+        fake_vultr.add(f"domains/{domain}/records", {"type": "A", "name": "www", "data": "10.0.1.1"})
+    listing = Inventory._list
+    running, peak = 0, 0
+
+    async def tracking(self: Inventory, url):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            await asyncio.sleep(0.01)
+            return await listing(self, url)
+        finally:
+            running -= 1
+
+    monkeypatch.setattr(Inventory, "_list", tracking)
+    inventory = Inventory(kinds=["domains", "domain_records"], max_concurrency=3)
+    results = await inventory.sync()
+    assert all(result.is_ok() for result in results.values())
+    assert inventory.count("domain_records") == 21
+    assert peak == 3
+
+@pytest.mark.asyncio
+async def test_store_io_runs_off_the_event_loop(fake_vultr: FakeVultrServer, monkeypatch: pytest.MonkeyPatch, tmp_path):
+    """
+    Test that loading and persisting the mirror run in worker threads, not on the event loop's thread.
+    """
+    threads: list[int] = []
+    for name in ("_read", "_write"):
+        original = getattr(Inventory, name)
+
+        def recording(self: Inventory, *args: object, _original=original) -> object:
+            threads.append(threading.get_ident())
+            return _original(self, *args)
+
+        monkeypatch.setattr(Inventory, name, recording)
+    inventory = Inventory(kinds=["instances"], path=os.path.join(tmp_path, "inventory.sqlite3"))
+    await inventory.sync()
+    inventory.close()
+
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
+
+def test_unknown_filter_is_rejected():
+    """
+    Test that filtering on a field without an index fails loudly.
+    """
+    with pytest.raises(ValueError):
+        Inventory(kinds=["instances"]).find(plan="vc2-1c-1gb")
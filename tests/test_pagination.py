@@ -0,0 +1,110 @@
+import asyncio
+import gc
+import pytest
+import logging
+
+from rustipy.result import Err, Ok, Result
+
+from proschedio.pagination import PaginationError, page_items, paginate
+from proschedio.request import ErrorResponse, SuccessResponse
+
+logger = logging.getLogger(__name__)
+
+def _pages(total: int, fail_at: int | None = None):
+    """Build a fetcher over `total` records that records every call it gets."""
+    calls: list[tuple[int, str | None]] = []
+
+    async def fetch(*, per_page: int, cursor: str | None) -> Result[SuccessResponse, ErrorResponse]:
+        calls.append((per_page, cursor))
+        start = int(cursor) if cursor else 0
+        if fail_at is not None and start >= fail_at:
+            return Err(ErrorResponse(status_code=500, error="boom"))
+        end = min(total, start + per_page)
+        next_cursor = str(end) if end < total else ""
+        return Ok(SuccessResponse(
+            status_code=200,
+            data=[{"id": i} for i in range(start, end)],
+            meta={"total": total, "links": {"next": next_cursor, "prev": ""}},
+        ))
+
+    return fetch, calls
+
+@pytest.mark.asyncio
+async def test_paginate_walks_every_page():
+    """
+    Test that paginate() follows meta.links.next at the requested page size.
+    """
+    fetch, calls = _pages(1234)
+    ids = [item["id"] async for item in paginate(fetch)]  # type: ignore[index]
+
+    assert ids == list(range(1234))
+    assert calls == [(500, None), (500, "500"), (500, "1000")]
+
+@pytest.mark.asyncio
+async def test_paginate_prefetches_next_page():
+    """
+    Test that the next page is requested before the current page is consumed.
+    """
+    fetch, calls = _pages(30)
+    iterator = paginate(fetch, per_page=10)
+    await iterator.__anext__()
+    await asyncio.sleep(0)
+
+    assert len(calls) == 2
+    await iterator.aclose()
+
+@pytest.mark.asyncio
+async def test_paginate_raises_on_error():
+    """
+    Test that a failed page surfaces as PaginationError after the good pages.
+    """
+    fetch, _ = _pages(30, fail_at=10)
+    seen = 0
+    with pytest.raises(PaginationError) as error:
+        async for _ in paginate(fetch, per_page=10):
+            seen += 1
+
+    assert seen == 10
+    assert error.value.response["status_code"] == 500
+
+def test_page_items():
+    """
+    Test item extraction from unwrapped and multi-key page bodies.
+    """
+    assert page_items(None) == []
+    assert page_items([1, 2]) == [1, 2]
+    assert page_items({"plans": [1], "total": 1}) == [1]
+    with pytest.raises(TypeError):
+        page_items({"a": [1], "b": [2]})
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("outcome", ["hangs", "raises"])
+async def test_stopping_early_settles_the_prefetch(outcome: str):
+    """
+    Test that leaving the loop early cancels and awaits the prefetched page, so it neither lingers
+    nor reports an unretrieved exception.
+    """
+    started = asyncio.Event()
+    unhandled: list[dict] = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+
+    async def fetch(*, per_page: int, cursor: str | None) -> Result[SuccessResponse, ErrorResponse]:
+        if cursor is None:
+            return Ok(SuccessResponse(status_code=200, data=[{"id": 0}], meta={"links": {"next": "1", "prev": ""}}))
+        started.set()
+        if outcome == "hangs":
+            await asyncio.Event().wait()
+        raise RuntimeError("connection reset")
+
+    iterator = paginate(fetch, per_page=1)
+    await iterator.__anext__()
+    await started.wait()
+    await asyncio.sleep(0)
+    await iterator.aclose()
+    del iterator
+    gc.collect()
+    loop.set_exception_handler(None)
+
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+    assert unhandled == []
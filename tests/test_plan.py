@@ -0,0 +1,135 @@
+import pytest
+import logging
+from typing import Any
+
+from proschedio.plan import Desired, Planner, Ref
+from proschedio.testing import FakeVultrServer
+
+logger = logging.getLogger(__name__)
+
+LATENCY = 0.05
+
+@pytest.fixture
+def fake_vultr_options() -> dict[str, Any]:
+    """Fixture to give the fake Vultr API noticeable latency."""
+    return {"latency": LATENCY}
+
+def _stack(web_count: int = 20, ttl: int = 300) -> list[Desired]:
+    resources = [
+        Desired("vpc", "net", {"description": "app", "region": "ewr", "v4_subnet": "10.10.0.0", "v4_subnet_mask": 24}),
+        Desired("domain", "zone", {"domain": "example.com"}),
+    ]
+    for index in range(web_count):
+        resources.append(Desired("instance", f"web-{index}", {
+            "label": f"web-{index}", "region": "ewr", "plan": "vc2-1c-1gb", "os_id": 2284, "attach_vpc": [Ref("net")],
+        }))
+        resources.append(Desired("dns_record", f"www-{index}", {"type": "A", "name": f"www{index}", "data": f"10.10.0.{index}", "ttl": ttl}, parent=Ref("zone")))
+    resources.append(Desired("load_balancer", "lb", {
+        "label": "lb", "region": "ewr", "instances": [Ref(f"web-{index}") for index in range(web_count)],
+    }))
+    return resources
+
+@pytest.mark.asyncio
+async def test_apply_runs_along_the_critical_path(fake_vultr: FakeVultrServer):
+    """
+    Test that a 43-resource stack is applied in dependency order in about critical-path time.
+    """
+    planner = Planner()
+    plan = (await planner.plan(_stack())).unwrap()
+    assert sum(step.action == "create" for step in plan.steps.values()) == 43
+    assert len(plan.levels()) == 3
+
+    report = await planner.apply(plan, max_concurrency=64, wait_ready=False)
+    assert report.ok, report.failed()
+    assert report.elapsed < 43 * LATENCY / 3
+
+    vpc_id = report.results["net"].unwrap()["id"]  # type: ignore[index]
+    instances = fake_vultr.items("instances")
+    assert all(instance["attach_vpc"] == [vpc_id] for instance in instances.values())
+    (balancer,) = fake_vultr.items("load-balancers").values()
+    assert sorted(balancer["instances"]) == sorted(instances)
+    assert len(fake_vultr.items("domains/example.com/records")) == 20
+
+@pytest.mark.asyncio
+async def test_replan_is_a_minimal_diff(fake_vultr: FakeVultrServer):
+    """
+    Test that re-planning an applied stack changes only what differs.
+    """
+    planner = Planner()
+    assert (await planner.apply((await planner.plan(_stack(web_count=3))).unwrap(), wait_ready=False)).ok
+
+    unchanged = (await planner.plan(_stack(web_count=3))).unwrap()
+    assert not unchanged.has_changes
+
+    resources = _stack(web_count=3, ttl=60)
+    resources[2] = Desired("instance", "web-0", {"label": "web-0", "region": "ams"})
+    resources.append(Desired("instance", "old", {"label": "web-2"}, absent=True))
+    resources = [resource for resource in resources if resource.name != "web-2"]
+    resources[-2] = Desired("load_balancer", "lb", {"label": "lb", "region": "ewr", "instances": [Ref("web-0"), Ref("web-1")]})
+    plan = (await planner.plan(resources)).unwrap()
+
+    actions = {name: step.action for name, step in plan.steps.items() if step.action != "noop"}
+    assert actions == {"www-0": "update", "www-1": "update", "www-2": "update", "lb": "update", "old": "delete"}
+    assert plan.steps["web-0"].ignored == ["region"]
+    assert plan.steps["www-0"].changes == {"ttl": (300, 60)}
+
+    # "old" is deleted only once the load balancer no longer lists it.
+    assert plan.execution["old"] == {"lb"}
+    assert plan.levels()[-1] == ["old"]
+
+    assert (await planner.apply(plan, wait_ready=False)).ok
+    assert len(fake_vultr.items("instances")) == 2
+
+@pytest.mark.asyncio
+async def test_deletes_run_in_reverse_dependency_order(fake_vultr: FakeVultrServer, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that tearing down a chain deletes each resource only after what references it is gone.
+    """
+    planner = Planner()
+    stack = [
+        Desired("vpc", "net", {"description": "app", "region": "ewr"}),
+        Desired("instance", "web", {"label": "web", "region": "ewr", "attach_vpc": [Ref("net")]}),
+        Desired("load_balancer", "lb", {"label": "lb", "region": "ewr", "instances": [Ref("web")]}),
+    ]
+    assert (await planner.apply((await planner.plan(stack)).unwrap(), wait_ready=False)).ok
+
+    teardown = [Desired(resource.kind, resource.name, resource.properties, absent=True) for resource in stack]
+    plan = (await planner.plan(teardown)).unwrap()
+    assert plan.levels() == [["lb"], ["web"], ["net"]]
+
+    deleted: list[str] = []
+    original = planner._execute
+
+    async def recording(plan, step, resolved, wait_ready):
+        result = await original(plan, step, resolved, wait_ready)
+        deleted.append(step.desired.name)
+        return result
+
+    monkeypatch.setattr(planner, "_execute", recording)
+    assert (await planner.apply(plan, wait_ready=False)).ok
+    assert deleted == ["lb", "web", "net"]
+    assert not fake_vultr.items("vpcs") and not fake_vultr.items("instances") and not fake_vultr.items("load-balancers")
+
+@pytest.mark.asyncio
+async def test_cycles_are_rejected(fake_vultr: FakeVultrServer):
+    """
+    Test that a dependency cycle is reported before anything is fetched.
+    """
+    with pytest.raises(ValueError):
+        await Planner().plan([
+            Desired("vpc", "a", {"description": "a"}, depends_on=["b"]),
+            Desired("vpc", "b", {"description": "b"}, depends_on=["a"]),
+        ])
+
+@pytest.mark.asyncio
+async def test_readiness_waits_use_the_planner_key(fake_vultr: FakeVultrServer):
+    """
+    Test that waiting for created instances polls with the planner's API key.
+    """
+    fake_vultr.api_key = "right-key"
+    planner = Planner(api_key="right-key")
+    stack = [Desired("instance", "web", {"label": "web", "region": "ewr", "plan": "vc2-1c-1gb", "os_id": 2284})]
+    report = await planner.apply((await planner.plan(stack)).unwrap())
+
+    assert report.ok, report.failed()
+    assert fake_vultr.calls[("GET", "instances")] >= 1
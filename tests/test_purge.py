@@ -0,0 +1,96 @@
+import pytest
+import asyncio
+import logging
+import time
+from typing import Any
+
+from proschedio.purge import PurgeCoordinator
+from proschedio.testing import FakeVultrServer
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def fake_vultr_options() -> dict[str, Any]:
+    """Fixture to give the fake Vultr API a little latency."""
+    return {"latency": 0.02}
+
+@pytest.mark.asyncio
+async def test_burst_of_purges_coalesces_per_zone(fake_vultr: FakeVultrServer):
+    """
+    Test that hundreds of purge requests over three zones become one purge per zone.
+    """
+    coordinator = PurgeCoordinator(window=0.05, max_delay=0.5)
+
+    async def worker(index: int):
+        await asyncio.sleep(index * 0.0005)
+        return await coordinator.purge(f"zone-{index % 3}")
+
+    results = await asyncio.gather(*(worker(index) for index in range(300)))
+
+    assert all(result.is_ok() for result in results)
+    assert fake_vultr.calls[("GET", "cdn_pull_zone_purge")] == 3
+    assert (coordinator.requested, coordinator.dispatched, coordinator.pending()) == (300, 3, 0)
+    await coordinator.close()
+
+@pytest.mark.asyncio
+async def test_request_during_purge_waits_for_min_interval(fake_vultr: FakeVultrServer):
+    """
+    Test that a request arriving mid-purge triggers one more purge, no sooner than `min_interval`.
+    """
+    coordinator = PurgeCoordinator(window=0.01, max_delay=0.1, min_interval=0.2)
+    started = time.monotonic()
+
+    first = asyncio.ensure_future(coordinator.purge("zone"))
+    await asyncio.sleep(0.02)  # the first purge is now in flight
+    late = await asyncio.gather(*(coordinator.purge("zone") for _ in range(10)))
+
+    assert (await first).is_ok() and all(result.is_ok() for result in late)
+    assert fake_vultr.calls[("GET", "cdn_pull_zone_purge")] == 2
+    assert time.monotonic() - started >= 0.2
+    await coordinator.close()
+
+@pytest.mark.asyncio
+async def test_idle_zones_are_released(fake_vultr: FakeVultrServer):
+    """
+    Test that a zone's queue is dropped once idle, but kept while `min_interval` still applies.
+    """
+    coordinator = PurgeCoordinator(window=0.01, max_delay=0.1)
+    results = await asyncio.gather(*(coordinator.purge(f"zone-{index}") for index in range(50)))
+    assert all(result.is_ok() for result in results)
+    await asyncio.sleep(0)
+    assert coordinator._zones == {}
+
+    throttled = PurgeCoordinator(window=0.01, max_delay=0.1, min_interval=0.1)
+    assert (await throttled.purge("zone")).is_ok()
+    await asyncio.sleep(0)
+    assert "zone" in throttled._zones
+    await asyncio.sleep(0.15)
+    assert throttled._zones == {}
+    await coordinator.close()
+    await throttled.close()
+
+@pytest.mark.asyncio
+async def test_purges_are_never_shared_between_coordinators(fake_vultr: FakeVultrServer):
+    """
+    Test that concurrent purges of one zone from separate coordinators each reach the API.
+    """
+    coordinators = [PurgeCoordinator(window=0, max_delay=0) for _ in range(2)]
+    results = await asyncio.gather(*(coordinator.purge("zone") for coordinator in coordinators))
+    assert all(result.is_ok() for result in results)
+    assert fake_vultr.calls[("GET", "cdn_pull_zone_purge")] == 2
+    for coordinator in coordinators:
+        await coordinator.close()
+
+@pytest.mark.asyncio
+async def test_close_cancels_a_purge_in_flight(fake_vultr: FakeVultrServer):
+    """
+    Test that closing the coordinator mid-purge releases the requests of that purge.
+    """
+    fake_vultr.latency = 1.0
+    coordinator = PurgeCoordinator(window=0, max_delay=0)
+    waiter = asyncio.ensure_future(coordinator.purge("zone"))
+    await asyncio.sleep(0.05)  # the purge is now in flight
+    await coordinator.close()
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(waiter, 0.1)
@@ -0,0 +1,75 @@
+import pytest
+import logging
+import os
+
+from proschedio.pushzone import Manifest, PushZoneSync
+from proschedio.request import RetryPolicy
+from proschedio.testing import FakeVultrServer
+
+logger = logging.getLogger(__name__)
+
+FILES = "cdns/push-zones/zone-1/files"
+
+@pytest.fixture
+def fake_vultr(fake_vultr: FakeVultrServer) -> FakeVultrServer:
+    """Fixture to provide a fake Vultr API with one CDN push zone."""
+    fake_vultr.add("cdns/push-zones", {"id": "zone-1", "label": "site"})
+    return fake_vultr
+
+def write(path: str, content: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(content)
+
+@pytest.mark.asyncio
+async def test_push_zone_sync_uploads_only_changes(fake_vultr: FakeVultrServer, tmp_path):
+    """
+    Test that a second sync uploads only modified files, skips touched ones and deletes stale ones.
+    """
+    root = str(tmp_path / "site")
+    manifest_path = str(tmp_path / "manifest.json")
+    for index in range(60):
+        write(os.path.join(root, "assets", f"file-{index}.css"), f"body {{ order: {index}; }}".encode() * 100)
+    write(os.path.join(root, "index.html"), b"<html></html>")
+
+    first = (await PushZoneSync("zone-1", root, manifest_path=manifest_path, max_concurrency=8).sync()).unwrap()
+    assert first.ok and len(first.uploaded) == 61
+    assert fake_vultr.uploads[(FILES, "assets/file-7.css")] == b"body { order: 7; }" * 100
+
+    write(os.path.join(root, "index.html"), b"<html>v2</html>")
+    os.utime(os.path.join(root, "assets", "file-1.css"), ns=(1, 1))
+    os.remove(os.path.join(root, "assets", "file-2.css"))
+    fake_vultr.add(FILES, {"id": "old.js", "name": "old.js", "size": 1})
+
+    second = (await PushZoneSync("zone-1", root, manifest_path=manifest_path).sync()).unwrap()
+
+    assert second.uploaded == ["index.html"]
+    assert sorted(second.deleted) == ["assets/file-2.css", "old.js"]
+    assert second.skipped == 59
+    assert fake_vultr.uploads[(FILES, "index.html")] == b"<html>v2</html>"
+    assert sorted(fake_vultr.items(FILES)) == sorted(Manifest.load(manifest_path).entries)
+
+@pytest.mark.asyncio
+async def test_failed_uploads_are_retried_and_excluded_files_kept(fake_vultr: FakeVultrServer, tmp_path):
+    """
+    Test that uploads answered with 503 are retried, and remote files matching `exclude` are not deleted.
+    """
+    root = str(tmp_path / "site")
+    for index in range(4):
+        write(os.path.join(root, f"page-{index}.html"), b"<html></html>")
+    write(os.path.join(root, "drafts", "local.html"), b"draft")
+    fake_vultr.add(FILES, {"id": "drafts/remote.html", "name": "drafts/remote.html", "size": 1})
+    fake_vultr.upload_failures = 3
+
+    sync = PushZoneSync(
+        "zone-1", root, manifest_path=str(tmp_path / "manifest.json"),
+        exclude=lambda name: name.startswith("drafts/"),
+        retry_policy=RetryPolicy(max_attempts=4, base_delay=0.001, max_delay=0.01),
+    )
+    report = (await sync.sync()).unwrap()
+
+    assert report.ok, report.failed
+    assert sorted(report.uploaded) == [f"page-{index}.html" for index in range(4)]
+    assert report.deleted == []
+    assert "drafts/remote.html" in fake_vultr.items(FILES)
+    assert fake_vultr.upload_failures == 0
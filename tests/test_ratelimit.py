@@ -0,0 +1,84 @@
+import asyncio
+import time
+import pytest
+import logging
+
+from proschedio.ratelimit import RateLimiter, TokenBucket, parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+@pytest.mark.asyncio
+async def test_bucket_paces_requests():
+    """
+    Test that a drained bucket hands out tokens at its configured rate.
+    """
+    bucket = TokenBucket(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+    elapsed = time.monotonic() - start
+
+    # One token from the burst, five more at 50/s.
+    assert elapsed >= 0.09
+
+@pytest.mark.asyncio
+async def test_bucket_adapts_to_429():
+    """
+    Test that a 429 halves the rate and honors Retry-After, and that successes recover it.
+    """
+    bucket = TokenBucket(rate=20, recovery_step=5)
+    bucket.observe(429, {"Retry-After": "0.1"})
+    assert bucket.rate == 10
+
+    start = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - start >= 0.09
+
+    bucket.observe(200, {})
+    bucket.observe(200, {})
+    bucket.observe(200, {})
+    assert bucket.rate == 20
+
+def test_concurrent_429s_halve_the_rate_once():
+    """
+    Test that a burst of 429s for the same window slows the bucket once, and client errors do not recover it.
+    """
+    bucket = TokenBucket(rate=40, min_rate=1, recovery_step=5, cooldown=60)
+    for _ in range(10):
+        bucket.observe(429, {})
+    assert bucket.rate == 20
+
+    for status in (400, 403, 404):
+        bucket.observe(status, {})
+    assert bucket.rate == 20
+    bucket.observe(304, {})
+    assert bucket.rate == 25
+
+@pytest.mark.asyncio
+async def test_bucket_follows_remaining_headers():
+    """
+    Test that remaining/reset headers slow the bucket down to the advertised budget.
+    """
+    bucket = TokenBucket(rate=30)
+    bucket.observe(200, {"X-RateLimit-Remaining": "4", "X-RateLimit-Reset": "2"})
+    assert bucket.rate == 2
+
+@pytest.mark.asyncio
+async def test_buckets_are_keyed_by_host_and_key():
+    """
+    Test that the registry shares buckets per (host, API key) pair.
+    """
+    RateLimiter.reset()
+    first = RateLimiter.for_url("https://api.vultr.com/v2/instances", "Bearer a")
+    assert RateLimiter.for_url("https://api.vultr.com/v2/plans", "Bearer a") is first
+    assert RateLimiter.for_url("https://api.vultr.com/v2/plans", "Bearer b") is not first
+    assert RateLimiter.for_url("https://example.com/v2/plans", "Bearer a") is not first
+
+def test_parse_retry_after():
+    """
+    Test Retry-After parsing for both delta-seconds and HTTP dates.
+    """
+    assert parse_retry_after({"Retry-After": "3"}) == 3.0
+    assert parse_retry_after({}) is None
+    assert parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+    assert parse_retry_after({"Retry-After": "soon"}) is None
@@ -0,0 +1,44 @@
+import pytest
+import asyncio
+import logging
+from typing import Any
+
+from proschedio.readiness import ReadinessWatcher
+from proschedio.testing import FakeVultrServer
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def fake_vultr_options() -> dict[str, Any]:
+    """Fixture to make new servers of the fake Vultr API take a moment to provision."""
+    return {"provisioning_delay": 0.2}
+
+@pytest.mark.asyncio
+async def test_many_waiters_share_list_polls(fake_vultr: FakeVultrServer):
+    """
+    Test that waiting on many provisioning servers costs list calls per tick, not per server.
+    """
+    instances = [fake_vultr.provision("instances") for _ in range(300)]
+    metal = fake_vultr.provision("bare-metals")
+
+    async with ReadinessWatcher(min_interval=0.05, max_interval=0.1) as watcher:
+        ready = await asyncio.gather(
+            *(watcher.wait(instance["id"], timeout=5) for instance in instances),
+            watcher.wait(metal["id"], "bare_metals", timeout=5),
+        )
+        assert watcher.pending() == 0
+
+    assert all(item["status"] == "active" for item in ready)
+    assert fake_vultr.calls[("GET", "instance_by_id")] == 0
+    # One 300-item listing takes one page per tick.
+    assert fake_vultr.calls[("GET", "instances")] == watcher.polls
+
+@pytest.mark.asyncio
+async def test_wait_times_out(fake_vultr: FakeVultrServer):
+    """
+    Test that waiting on a resource that never appears raises TimeoutError.
+    """
+    async with ReadinessWatcher(min_interval=0.01, max_interval=0.02) as watcher:
+        with pytest.raises(TimeoutError):
+            await watcher.wait("missing", timeout=0.1)
+        assert watcher.pending() == 0
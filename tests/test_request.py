@@ -0,0 +1,202 @@
+import pytest
+import asyncio
+import pytest_asyncio
+import logging
+from http import HTTPMethod
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from proschedio.ratelimit import RateLimiter
+from proschedio.request import LOG_BODY_LIMIT, Request, RetryPolicy, SessionPool, SingleFlight, Url
+
+logger = logging.getLogger(__name__)
+
+@pytest_asyncio.fixture
+async def local_server():
+    """Fixture to provide a local HTTP server that tracks its connections and can fail on demand."""
+    peers: set[object] = set()
+
+    async def account(request: web.Request) -> web.Response:
+        peers.add(request.transport)
+        return web.json_response({"account": {"name": "test"}})
+
+    async def no_content(request: web.Request) -> web.Response:
+        return web.Response(status=204)
+
+    failures = {"remaining": 0}
+
+    async def flaky(request: web.Request) -> web.Response:
+        if failures["remaining"] > 0:
+            failures["remaining"] -= 1
+            return web.json_response({"error": "try again"}, status=503, headers={"Retry-After": "0"})
+        return web.json_response({"instances": []})
+
+    async def plans(request: web.Request) -> web.Response:
+        return web.json_response({"plans": [{"id": f"vc2-{index}", "monthly_cost": index} for index in range(500)]})
+
+    app = web.Application()
+    app.router.add_get("/v2/account", account)
+    app.router.add_get("/v2/plans", plans)
+    app.router.add_delete("/v2/account", no_content)
+    app.router.add_get("/v2/instances", flaky)
+    app.router.add_post("/v2/instances", flaky)
+
+    server = TestServer(app)
+    await server.start_server()
+    server.peers = peers  # type: ignore[attr-defined]
+    server.failures = failures  # type: ignore[attr-defined]
+    yield server
+    await SessionPool.close()
+    await server.close()
+
+def _url(server: TestServer, uri: str) -> Url:
+    return Url(str(server.make_url("/v2/"))).uri(uri)
+
+@pytest.mark.asyncio
+async def test_session_is_reused(local_server: TestServer):
+    """
+    Test that consecutive requests share one session and one keep-alive connection.
+    """
+    first = SessionPool.get_session()
+    for _ in range(5):
+        result = await Request(_url(local_server, "account")).set_method(HTTPMethod.GET).request()
+        assert result.is_ok()
+        assert result.unwrap()["data"] == {"name": "test"}
+
+    assert SessionPool.get_session() is first
+    assert len(local_server.peers) == 1  # type: ignore[attr-defined]
+
+@pytest.mark.asyncio
+async def test_close_reopens_session(local_server: TestServer):
+    """
+    Test that a closed session is transparently replaced on the next request.
+    """
+    first = SessionPool.get_session()
+    await SessionPool.close()
+    assert first.closed
+
+    result = await Request(_url(local_server, "account")).set_method(HTTPMethod.DELETE).request()
+    assert result.is_ok()
+    assert result.unwrap()["status_code"] == 204
+    assert SessionPool.get_session() is not first
+
+@pytest.mark.asyncio
+async def test_idempotent_request_is_retried(local_server: TestServer):
+    """
+    Test that a GET is retried on 503 until it succeeds.
+    """
+    local_server.failures["remaining"] = 2  # type: ignore[attr-defined]
+    result = await Request(_url(local_server, "instances")) \
+        .set_method(HTTPMethod.GET) \
+        .set_retry(RetryPolicy(max_attempts=3, base_delay=0.01)) \
+        .request()
+
+    assert result.is_ok()
+    assert local_server.failures["remaining"] == 0  # type: ignore[attr-defined]
+
+@pytest.mark.asyncio
+async def test_post_is_retried_only_when_marked_safe(local_server: TestServer):
+    """
+    Test that a POST is not retried unless the caller opts in with retry_safe().
+    """
+    policy = RetryPolicy(max_attempts=3, base_delay=0.01)
+
+    local_server.failures["remaining"] = 1  # type: ignore[attr-defined]
+    result = await Request(_url(local_server, "instances")).set_method(HTTPMethod.POST).set_retry(policy).request()
+    assert result.is_err()
+    assert result.unwrap_err()["status_code"] == 503
+
+    local_server.failures["remaining"] = 1  # type: ignore[attr-defined]
+    result = await Request(_url(local_server, "instances")).set_method(HTTPMethod.POST).set_retry(policy).retry_safe().request()
+    assert result.is_ok()
+
+@pytest.mark.asyncio
+async def test_network_errors_are_retried():
+    """
+    Test that connection failures are retried and then reported as a status 0 error.
+    """
+    result = await Request(Url("http://127.0.0.1:9/").uri("account")) \
+        .set_method(HTTPMethod.GET) \
+        .set_retry(RetryPolicy(max_attempts=2, base_delay=0.01)) \
+        .request()
+
+    assert result.is_err()
+    assert result.unwrap_err()["status_code"] == 0
+    await SessionPool.close()
+
+def test_backoff_honors_retry_after():
+    """
+    Test that jittered backoff stays within bounds and never undercuts Retry-After.
+    """
+    policy = RetryPolicy(base_delay=1, max_delay=10)
+    for attempt in range(1, 8):
+        assert 0 <= policy.backoff(attempt, None) <= min(10, 2 ** (attempt - 1))
+    assert policy.backoff(1, 5) >= 5
+    assert policy.backoff(1, 60) == 10
+
+@pytest.mark.asyncio
+async def test_debug_logs_redact_credentials_and_truncate_bodies(local_server: TestServer, caplog: pytest.LogCaptureFixture):
+    """
+    Test that debug logging never shows the API key and keeps large bodies bounded.
+    """
+    with caplog.at_level(logging.DEBUG, logger="proschedio.request"):
+        result = await Request(_url(local_server, "plans")) \
+            .set_method(HTTPMethod.GET) \
+            .add_header("Authorization", "Bearer secret-key") \
+            .request()
+
+    assert result.is_ok()
+    assert len(result.unwrap()["data"]) == 500  # type: ignore[arg-type]
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages
+    assert not any("secret-key" in message for message in messages)
+    assert any("<redacted>" in message for message in messages)
+    assert all(len(message) < LOG_BODY_LIMIT + 512 for message in messages)
+
+@pytest.mark.asyncio
+async def test_identical_gets_share_one_call(local_server: TestServer, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that concurrent identical GETs are coalesced while different ones are not.
+    """
+    calls = {"count": 0}
+    original = Request._request_with_retry
+
+    async def counting(self: Request, *args: object):
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        return await original(self, *args)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(Request, "_request_with_retry", counting)
+    same = [Request(_url(local_server, "account")).set_method(HTTPMethod.GET).add_header("Authorization", "Bearer a") for _ in range(10)]
+    other = Request(_url(local_server, "account")).set_method(HTTPMethod.GET).add_header("Authorization", "Bearer b")
+    results = await asyncio.gather(*(request.request() for request in [*same, other]))
+
+    assert all(result.unwrap()["data"] == {"name": "test"} for result in results)
+    assert calls["count"] == 2
+    assert SingleFlight.in_flight() == 0
+
+def test_state_of_closed_loops_is_dropped():
+    """
+    Test that per-loop sessions and buckets do not outlive their event loop.
+    """
+    async def use() -> None:
+        SessionPool.get_session()
+        RateLimiter.get_bucket("example.com", None)
+        await SessionPool.close()
+        SessionPool.get_session()
+
+    for _ in range(3):
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(use())
+        loop.run_until_complete(SessionPool.close())
+        loop.close()
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(use())
+        assert list(SessionPool._sessions) == [loop]
+        assert list(RateLimiter._buckets) == [loop]
+        loop.run_until_complete(SessionPool.close())
+    finally:
+        loop.close()
@@ -0,0 +1,55 @@
+import pytest
+import logging
+
+from proschedio.const import ROUTES, ProviderUrl
+from proschedio.request import Url
+from proschedio.routes import RouteTemplate
+
+logger = logging.getLogger(__name__)
+
+def test_template_is_compiled_once():
+    """
+    Test that identical templates share one immutable compiled object.
+    """
+    route = RouteTemplate.compile("instances/{instance-id}/ipv6/reverse/{ipv6}")
+    assert RouteTemplate.compile("instances/{instance-id}/ipv6/reverse/{ipv6}") is route
+    assert route.placeholders == ("instance-id", "ipv6")
+    with pytest.raises(AttributeError):
+        route._template = "other"  # type: ignore[misc]
+
+def test_assign_does_not_mutate_shared_url():
+    """
+    Test that assign() leaves the shared template untouched.
+    """
+    shared = Url("https://api.vultr.com/v2/").uri("domains/{dns-domain}/records")
+    first = shared.assign("dns-domain", "example.com")
+    second = shared.assign("dns-domain", "example.org")
+
+    assert first.to_str() == "https://api.vultr.com/v2/domains/example.com/records"
+    assert second.to_str() == "https://api.vultr.com/v2/domains/example.org/records"
+    with pytest.raises(ValueError):
+        shared.to_str()
+
+def test_provider_url_uses_registered_base_url():
+    """
+    Test that ProviderUrl builds URLs from the registered base URL.
+    """
+    url = ProviderUrl("vultr").get_url_instance_by_id().assign("instance-id", "abc")
+    assert url.to_str() == "https://api.vultr.com/v2/instances/abc"
+
+    with pytest.raises(ValueError):
+        ProviderUrl("unknown")
+
+def test_route_table_accessors():
+    """
+    Test that every route in the table has a generated accessor and a lazily loaded reference.
+    """
+    provider_url = ProviderUrl("vultr")
+    for name, template in ROUTES.items():
+        url = getattr(provider_url, f"get_url_{name}")()
+        assert url.route.template == template
+
+    assert ProviderUrl.get_url_instances(provider_url).to_str() == "https://api.vultr.com/v2/instances"
+    assert "Reinstall" in ProviderUrl.describe("instance_reinstall")
+    with pytest.raises(ValueError):
+        provider_url.route("no_such_route")
@@ -0,0 +1,159 @@
+import pytest
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+from proschedio.schedule import CronTrigger, IntervalTrigger, Job, Scheduler, SQLiteJobStore
+
+logger = logging.getLogger(__name__)
+
+def test_cron_trigger_next_fire():
+    """
+    Test cron expressions, including the day-or-weekday rule and Sunday as 7.
+    """
+    start = datetime(2025, 1, 1, 12, 30, tzinfo=timezone.utc).timestamp()  # a Wednesday
+
+    def next_fire(expression: str) -> datetime:
+        fire = CronTrigger(expression, timezone.utc).next_fire(start)
+        assert fire is not None
+        return datetime.fromtimestamp(fire, timezone.utc)
+
+    assert next_fire("*/15 * * * *") == datetime(2025, 1, 1, 12, 45, tzinfo=timezone.utc)
+    assert next_fire("0 22 * * 1-5") == datetime(2025, 1, 1, 22, 0, tzinfo=timezone.utc)
+    assert next_fire("0 3 * * 7") == datetime(2025, 1, 5, 3, 0, tzinfo=timezone.utc)
+    assert next_fire("0 0 15 * 0") == datetime(2025, 1, 5, 0, 0, tzinfo=timezone.utc)
+    assert next_fire("30 4 1 3 *") == datetime(2025, 3, 1, 4, 30, tzinfo=timezone.utc)
+    with pytest.raises(ValueError):
+        CronTrigger("61 * * * *")
+
+@pytest.fixture
+def new_york_local(monkeypatch: pytest.MonkeyPatch):
+    """Fixture to make America/New_York the local time zone for the duration of a test."""
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    yield ZoneInfo("America/New_York")
+    monkeypatch.undo()
+    time.tzset()
+
+def test_cron_trigger_keeps_wall_clock_across_dst(new_york_local: ZoneInfo):
+    """
+    Test that cron times stay on the local wall clock across DST changes, with skipped times firing
+    at the jump and repeated times firing once.
+    """
+    def fires(expression: str, start: datetime, count: int, tz: ZoneInfo | None = None) -> list[datetime]:
+        trigger = CronTrigger(expression, tz)
+        moments: list[datetime] = []
+        fire = start.timestamp()
+        for _ in range(count):
+            fire = trigger.next_fire(fire)
+            assert fire is not None
+            moments.append(datetime.fromtimestamp(fire, timezone.utc))
+        return moments
+
+    new_york = new_york_local
+    spring = datetime(2025, 3, 8, 12, 0, tzinfo=new_york)
+    # 09:00 EST is 14:00 UTC, 09:00 EDT 13:00 UTC; the local default zone follows the change.
+    assert [moment.hour for moment in fires("0 9 * * *", datetime(2025, 3, 7, 12, 0, tzinfo=new_york), 3)] == [14, 13, 13]
+    berlin = ZoneInfo("Europe/Berlin")
+    assert [moment.astimezone(berlin).hour for moment in fires("0 9 * * *", datetime(2025, 3, 29, tzinfo=berlin), 3, berlin)] == [9, 9, 9]
+
+    # 02:30 does not exist on 2025-03-09: it fires at the jump, 03:00 EDT (07:00 UTC).
+    assert fires("30 2 * * *", spring, 2) == [
+        datetime(2025, 3, 9, 7, 0, tzinfo=timezone.utc),
+        datetime(2025, 3, 10, 6, 30, tzinfo=timezone.utc),
+    ]
+    # 01:30 happens twice on 2025-11-02: it fires once, at 01:30 EDT (05:30 UTC).
+    assert fires("30 1 * * *", datetime(2025, 11, 1, 12, 0, tzinfo=new_york), 2) == [
+        datetime(2025, 11, 2, 5, 30, tzinfo=timezone.utc),
+        datetime(2025, 11, 3, 6, 30, tzinfo=timezone.utc),
+    ]
+
+@pytest.mark.asyncio
+async def test_scheduler_limits_concurrency_per_job_type():
+    """
+    Test that many interval jobs run, and never more at once than their job type allows.
+    """
+    scheduler = Scheduler()
+    running = 0
+    peak = 0
+    calls: list[str] = []
+
+    @scheduler.task("halt")
+    async def halt(instance_id: str) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        calls.append(instance_id)
+
+    scheduler.set_concurrency("power", 5)
+    now = time.time()
+    for index in range(200):
+        scheduler.add_job(Job(f"halt-{index}", "halt", IntervalTrigger(0.1, now), args=[f"i-{index}"], job_type="power"))
+
+    await scheduler.start()
+    await asyncio.sleep(0.35)
+    await scheduler.shutdown()
+
+    assert peak == 5
+    assert len(set(calls)) == 200
+
+@pytest.mark.asyncio
+async def test_scheduler_resumes_from_store(tmp_path):
+    """
+    Test that a restarted scheduler keeps stored run times and skips runs missed beyond the grace time.
+    """
+    path = str(tmp_path / "jobs.sqlite3")
+    now = time.time()
+
+    store = SQLiteJobStore(path)
+    scheduler = Scheduler(store)
+    scheduler.add_job(Job("late", "touch", IntervalTrigger(3600, now - 3600 * 5 - 10), args=["late"], misfire_grace=60))
+    scheduler.add_job(Job("recent", "touch", IntervalTrigger(3600, now - 3600 - 5), args=["recent"], misfire_grace=60))
+    scheduler.get_job("late").next_run = now - 3600 * 2 - 10  # type: ignore[union-attr]
+    scheduler.get_job("recent").next_run = now - 5  # type: ignore[union-attr]
+    store.save(scheduler.jobs())
+    store.close()
+
+    touched: list[str] = []
+    restarted = Scheduler(SQLiteJobStore(path))
+    restarted.register_task("touch", touched.append)
+    # Redeclaring a job at startup keeps the run time it had before the restart.
+    restarted.add_job(Job("recent", "touch", IntervalTrigger(3600), args=["recent"], misfire_grace=60))
+    await restarted.start()
+    await asyncio.sleep(0.05)
+    await restarted.shutdown()
+
+    assert touched == ["recent"]
+    late = restarted.get_job("late")
+    assert late is not None and late.misfires == 1
+    assert late.next_run is not None and late.next_run > now
+
+@pytest.mark.asyncio
+async def test_run_state_is_saved_off_the_event_loop(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that the scheduling loop saves job state changes from a worker thread.
+    """
+    store = SQLiteJobStore(str(tmp_path / "jobs.sqlite3"))
+    threads: list[int] = []
+    save = store.save
+
+    def recording(jobs):
+        threads.append(threading.get_ident())
+        save(jobs)
+
+    scheduler = Scheduler(store)
+    scheduler.register_task("touch", lambda: None)
+    scheduler.add_job(Job("tick", "touch", IntervalTrigger(3600, time.time() + 0.01)))
+    monkeypatch.setattr(store, "save", recording)
+    await scheduler.start()
+    await asyncio.sleep(0.05)
+    await scheduler.shutdown()
+    store.close()
+
+    assert threads
+    assert threading.get_ident() not in threads
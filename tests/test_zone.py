@@ -0,0 +1,83 @@
+import pytest
+import logging
+
+from proschedio.testing import FakeVultrServer
+from proschedio.zone import Record, ZoneSync, diff_records, parse_zone
+
+logger = logging.getLogger(__name__)
+
+ZONE = """
+$ORIGIN example.com.
+$TTL 1h
+@       IN SOA ns1.example.com. admin.example.com. (
+                2024010101 ; serial
+                7200 3600 1209600 3600 )
+@           A       192.0.2.1
+            MX 10   mail            ; relative to the origin
+www  600 IN CNAME   example.com.
+txt         TXT     "v=spf1 include:_spf.example.com; ~all"
+_sip._tcp   SRV     10 60 5060 sip.example.com.
+$ORIGIN dev.example.com.
+api         A       192.0.2.10
+"""
+
+@pytest.fixture
+def fake_vultr(fake_vultr: FakeVultrServer) -> FakeVultrServer:
+    """Fixture to provide a fake Vultr API hosting one large DNS zone."""
+    fake_vultr.add("domains", {"id": "example.com", "domain": "example.com"})
+    fake_vultr.seed("domains/example.com/records", 2000, lambda index: {
+        "id": f"r-{index}", "type": "A", "name": f"host-{index}", "data": f"10.0.{index // 256}.{index % 256}", "ttl": 300, "priority": 0,
+    })
+    return fake_vultr
+
+def test_parse_zone():
+    """
+    Test reading a BIND zone file into records relative to the zone.
+    """
+    records = {(record.type, record.name): record for record in parse_zone(ZONE, "example.com")}
+
+    assert len(records) == 6
+    assert records[("A", "")].ttl == 3600
+    assert records[("MX", "")].data == "mail.example.com" and records[("MX", "")].priority == 10
+    assert records[("CNAME", "www")].ttl == 600 and records[("CNAME", "www")].data == "example.com"
+    assert records[("TXT", "txt")].data == '"v=spf1 include:_spf.example.com; ~all"'
+    assert records[("SRV", "_sip._tcp")].data == "60 5060 sip.example.com"
+    assert records[("A", "api.dev")].data == "192.0.2.10"
+
+def test_diff_pairs_replacements_into_updates():
+    """
+    Test that a changed address becomes one update, and extra duplicates are deleted.
+    """
+    live = [
+        ("1", Record("A", "www", "192.0.2.1")),
+        ("2", Record("A", "www", "192.0.2.2")),
+        ("3", Record("A", "www", "192.0.2.2")),
+        ("4", Record("TXT", "", '"old"')),
+    ]
+    desired = [Record("A", "www", "192.0.2.1", ttl=60), Record("A", "www", "192.0.2.3"), Record("MX", "", "mail.example.com", priority=5)]
+
+    diff = diff_records("example.com", desired, live)
+
+    assert sorted((change.action, change.record_id) for change in diff.changes) == [
+        ("create", None), ("delete", "2"), ("delete", "4"), ("update", "1"), ("update", "3"),
+    ]
+
+@pytest.mark.asyncio
+async def test_zone_sync_applies_minimal_changes(fake_vultr: FakeVultrServer):
+    """
+    Test that syncing a large zone only touches changed records, and a second sync is a no-op.
+    """
+    live = fake_vultr.items("domains/example.com/records").values()
+    desired = [Record.from_dict(item) for item in live][100:]
+    desired[0].ttl = 60
+    desired[1].data = "192.0.2.55"
+    desired.append(Record("TXT", "", '"hello"'))
+
+    sync = ZoneSync(max_concurrency=8)
+    report = (await sync.sync("example.com", desired)).unwrap()
+
+    assert report.ok
+    assert fake_vultr.calls[("POST", "domain_records")] == 1
+    assert fake_vultr.calls[("PATCH", "domain_record_by_id")] == 2
+    assert fake_vultr.calls[("DELETE", "domain_record_by_id")] == 100
+    assert not (await sync.diff("example.com", desired)).unwrap().has_changes